@@ -0,0 +1,318 @@
+"""
+ColorSnap Pro - App Resources
+Source definitions for the stylesheets, onboarding pages, tutorial steps and
+tooltip texts that build_app.py packs into the resource bundle
+
+Edit here; the app reads these through resource_bundle.resources(), from
+the compiled bundle when there is one and from this module otherwise.
+"""
+
+from typing import Any, Dict, List
+
+
+ICON_DIR = "assets/icons"
+
+# MARK: - Stylesheets
+
+STYLES: Dict[str, str] = {
+    "onboarding/feature": """
+    color: rgba(255, 255, 255, 230);
+    font-size: 15px;
+""",
+    "onboarding/title": """
+    color: white;
+    font-size: 28px;
+    font-weight: bold;
+""",
+    "onboarding/description": """
+    color: rgba(255, 255, 255, 200);
+    font-size: 16px;
+""",
+    "onboarding/skip_button": """
+    QPushButton {
+        background: transparent;
+        color: rgba(255, 255, 255, 180);
+        border: none;
+        padding: 12px 20px;
+        font-size: 14px;
+    }
+    QPushButton:hover {
+        color: white;
+    }
+""",
+    "onboarding/back_button": """
+    QPushButton {
+        background: rgba(255, 255, 255, 0.15);
+        color: white;
+        border: none;
+        border-radius: 28px;
+        font-size: 20px;
+        font-weight: bold;
+    }
+    QPushButton:hover {
+        background: rgba(255, 255, 255, 0.25);
+    }
+    QPushButton:disabled {
+        background: transparent;
+        color: transparent;
+    }
+""",
+    "onboarding/next_button": """
+    QPushButton {
+        background: qlineargradient(x1: 0, y1: 0, x2: 1, y2: 0,
+            stop: 0 #3B82F6, stop: 1 #8B5CF6);
+        color: white;
+        border: none;
+        border-radius: 12px;
+        font-size: 16px;
+        font-weight: bold;
+        padding: 0 32px;
+    }
+    QPushButton:hover {
+        background: qlineargradient(x1: 0, y1: 0, x2: 1, y2: 0,
+            stop: 0 #2563EB, stop: 1 #7C3AED);
+    }
+""",
+    "onboarding/window": """
+    QMainWindow {
+        background: qlineargradient(x1: 0, y1: 0, x2: 1, y2: 1,
+            stop: 0 #1a1a2e, stop: 0.5 #16213e, stop: 1 #0f3460);
+    }
+""",
+    "tutorial/title": """
+    color: white;
+    font-size: 24px;
+    font-weight: bold;
+""",
+    "tutorial/description": """
+    color: rgba(255, 255, 255, 200);
+    font-size: 16px;
+""",
+    "tutorial/back_button": """
+    QPushButton {
+        background: transparent;
+        color: rgba(255, 255, 255, 180);
+        border: none;
+        padding: 12px 24px;
+        font-size: 14px;
+    }
+    QPushButton:hover {
+        color: white;
+    }
+""",
+    "tutorial/next_button": """
+    QPushButton {
+        background: #3B82F6;
+        color: white;
+        border: none;
+        border-radius: 8px;
+        padding: 12px 32px;
+        font-size: 14px;
+        font-weight: bold;
+    }
+    QPushButton:hover {
+        background: #2563EB;
+    }
+""",
+    "tutorial/window": """
+    QMainWindow {
+        background: #0f0f1e;
+    }
+""",
+    "tooltip/title": """
+    color: white;
+    font-size: 16px;
+    font-weight: bold;
+""",
+    "tooltip/message": """
+    color: rgba(255, 255, 255, 200);
+    font-size: 14px;
+    line-height: 1.4;
+""",
+    "hint/text": """
+    color: white;
+    font-size: 13px;
+    font-weight: 500;
+""",
+    "hint/pulse_button": """
+    QPushButton {
+        background: rgba(253, 224, 71, 0.2);
+        border: 2px solid #FDE047;
+        border-radius: 25px;
+        font-size: 20px;
+    }
+    QPushButton:hover {
+        background: rgba(253, 224, 71, 0.3);
+    }
+""",
+    "overlay/card": """
+    QFrame {
+        background: rgba(30, 30, 40, 0.98);
+        border: 2px solid rgba(253, 224, 71, 0.5);
+        border-radius: 20px;
+    }
+""",
+    "overlay/title": """
+    color: white;
+    font-size: 22px;
+    font-weight: bold;
+""",
+    "overlay/subtitle": """
+    color: rgba(255, 255, 255, 180);
+    font-size: 15px;
+""",
+    "overlay/dismiss_button": """
+    QPushButton {
+        background: #FDE047;
+        color: #1a1a2e;
+        border: none;
+        border-radius: 12px;
+        padding: 14px 32px;
+        font-size: 15px;
+        font-weight: bold;
+    }
+    QPushButton:hover {
+        background: #FACC15;
+    }
+""",
+}
+
+# MARK: - Onboarding
+
+ONBOARDING_PAGES: List[Dict[str, Any]] = [
+    {
+        "icon": "📷",
+        "icon_color": "#3B82F6",
+        "title": "Welcome to ColorSnap Pro",
+        "description": "The ultimate color picking tool for designers, artists, and developers.",
+        "features": [
+            "Real-time camera color picking",
+            "Precision magnifier with crosshairs",
+            "Freeze frame for accuracy",
+        ],
+    },
+    {
+        "icon": "✨",
+        "icon_color": "#8B5CF6",
+        "title": "AI-Powered Palettes",
+        "description": "Let AI analyze any scene and generate beautiful color palettes instantly.",
+        "features": [
+            "One-tap AI palette generation",
+            "Smart color extraction",
+            "Save palettes for later use",
+        ],
+    },
+    {
+        "icon": "🎨",
+        "icon_color": "#F97316",
+        "title": "Organize Your Colors",
+        "description": "Keep all your colors organized in custom palettes for easy access.",
+        "features": [
+            "Create unlimited palettes",
+            "Copy hex codes with one tap",
+            "View RGB values instantly",
+        ],
+    },
+    {
+        "icon": "🛠️",
+        "icon_color": "#22C55E",
+        "title": "Professional Tools",
+        "description": "Advanced tools to perfect your color choices.",
+        "features": [
+            "Color harmony generator",
+            "Contrast accessibility checker",
+            "Gradient maker with CSS export",
+        ],
+    },
+    {
+        "icon": "👆",
+        "icon_color": "#EC4899",
+        "title": "How to Pick Colors",
+        "description": "It's simple! Just point, press, and capture.",
+        "features": [
+            "Press & hold to preview colors",
+            "Drag to fine-tune selection",
+            "Release to capture up to 5 colors",
+            "Tap colors to copy hex codes",
+        ],
+    },
+]
+
+TUTORIAL_STEPS: List[Dict[str, str]] = [
+    {
+        "title": "Press & Hold",
+        "description": "Press and hold anywhere on the camera preview to preview colors",
+        "icon": "👆",
+        "color": "#3B82F6",
+    },
+    {
+        "title": "Magnifier",
+        "description": "The magnifier appears above your cursor with precise crosshairs",
+        "icon": "🔍",
+        "color": "#8B5CF6",
+    },
+    {
+        "title": "Drag to Adjust",
+        "description": "Drag to fine-tune the exact color you want",
+        "icon": "↔️",
+        "color": "#3B82F6",
+    },
+    {
+        "title": "Release to Capture",
+        "description": "Release to save the color. You can capture up to 5 colors!",
+        "icon": "✓",
+        "color": "#22C55E",
+    },
+    {
+        "title": "Freeze Frame",
+        "description": "Tap Freeze Frame to pause the camera for easier picking",
+        "icon": "❄️",
+        "color": "#22C55E",
+    },
+]
+
+# MARK: - Tooltips
+
+# TooltipType value -> title, message and icon
+TOOLTIPS: Dict[str, Dict[str, str]] = {
+    "camera_press_hold": {
+        "title": "Press & Hold",
+        "message": "Press and hold anywhere to preview colors with the magnifier",
+        "icon": "hand.tap.fill",
+    },
+    "camera_freeze": {
+        "title": "Freeze Frame",
+        "message": "Tap Freeze Frame to pause the camera for precise picking",
+        "icon": "snowflake",
+    },
+    "camera_ai": {
+        "title": "AI Magic",
+        "message": "Try AI Palette to automatically generate color schemes",
+        "icon": "wand.and.stars",
+    },
+    "camera_copy": {
+        "title": "Quick Copy",
+        "message": "Tap any picked color to copy its hex code",
+        "icon": "doc.on.doc",
+    },
+    "palette_save": {
+        "title": "Save Colors",
+        "message": "Save your captured colors to a palette for later",
+        "icon": "folder.badge.plus",
+    },
+    "palette_organize": {
+        "title": "Organize",
+        "message": "Create multiple palettes to organize your projects",
+        "icon": "swatchpalette",
+    },
+    "tools_harmony": {
+        "title": "Color Harmony",
+        "message": "Generate complementary, analogous, and triadic colors",
+        "icon": "circle.hexagongrid",
+    },
+    "tools_contrast": {
+        "title": "Check Contrast",
+        "message": "Ensure your colors meet accessibility standards",
+        "icon": "textformat.size",
+    },
+}
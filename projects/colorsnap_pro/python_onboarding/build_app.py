@@ -1,26 +1,1079 @@
 """
 ColorSnap Pro - Build & Deployment Tool
 Builds standalone executables for distribution
+
+Usage:
+    python build_app.py --all                 # clean build
+    python build_app.py --all --incremental   # skip stages whose inputs are unchanged
+    python build_app.py --targets             # every target for this platform, in parallel
+    python build_app.py --targets appimage --jobs 2
+    python build_app.py --analyze             # size/import-time report + exclusion profile
+    python build_app.py --cached-onefile      # single file that extracts once to the user cache
+    python build_app.py --benchmark-launch    # onefile vs cached launcher, cold and warm
+    python build_app.py --all --optimize 2    # strip asserts and docstrings from bundled bytecode
+    python build_app.py --freeze-startup      # startup modules as one sourceless .pyz
+    python build_app.py --benchmark-imports   # startup imports: source vs pyc vs frozen
+    python build_app.py --all --deterministic --cache-dir ~/.cache/colorsnap-build
+    python build_app.py --resources           # compile styles, onboarding content and icons only
+    python build_app.py --bench --incremental # launch headless, fail on startup/RSS/size regressions
 """
 
 import sys
 import os
+import re
+import ast
+import json
+import time
+import statistics
 import shutil
+import gzip
+import tarfile
+import tempfile
+import zipfile
+import compileall
+import py_compile
+import hashlib
 import subprocess
+import threading
 import platform
+from collections import defaultdict, deque
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, ThreadPoolExecutor, wait
+from dataclasses import asdict, dataclass, field
 from pathlib import Path
-from typing import Optional, List
+from typing import Any, Callable, Deque, Dict, Iterable, Optional, List, Pattern, Tuple
 import argparse
 
+from resource_bundle import BUNDLE_NAME, ResourceBundle, compile_resources, write_bundle
+
+
+# MARK: - Build Manifest
+
+MANIFEST_NAME = "manifest.json"
+# Lines of build tool output kept for error reports
+OUTPUT_TAIL_LINES = 40
+
+
+def file_digest(path: Path) -> str:
+    """SHA-256 of a file's contents, read in 1 MB chunks"""
+    digest = hashlib.sha256()
+    with open(path, "rb") as handle:
+        for chunk in iter(lambda: handle.read(1 << 20), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def tree_fingerprint(root: Path) -> str:
+    """
+    Cheap fingerprint of a build output (file or directory)
+    
+    Hashes relative paths, sizes and modification times rather than
+    contents, so fingerprinting a large bundle costs one stat per file.
+    """
+    digest = hashlib.sha256()
+    paths = sorted(root.rglob("*")) if root.is_dir() else [root]
+    for path in paths:
+        if path.is_file():
+            stat = path.stat()
+            relative = path.relative_to(root).as_posix() if root.is_dir() else path.name
+            digest.update(f"{relative}\0{stat.st_size}\0{stat.st_mtime_ns}\n".encode())
+    return digest.hexdigest()
+
+
+def stage_key(**parts) -> str:
+    """Stable hash of everything a stage's output depends on"""
+    return hashlib.sha256(json.dumps(parts, sort_keys=True, default=str).encode()).hexdigest()
+
+
+class BuildManifest:
+    """
+    Records the key each build stage was last built with, its outputs and
+    how long it took
+    
+    A stage is fresh when its key is unchanged and its outputs still exist;
+    fresh stages are skipped and their recorded duration counts as saved.
+    """
+    
+    def __init__(self, path: Path):
+        self.path = path
+        self.stages: Dict[str, dict] = {}
+        if path.exists():
+            try:
+                self.stages = json.loads(path.read_text()).get("stages", {})
+            except (OSError, ValueError):
+                self.stages = {}
+        self.hits: List[str] = []
+        self.misses: List[str] = []
+        self.saved_seconds = 0.0
+    
+    def is_fresh(self, stage: str, key: str) -> bool:
+        entry = self.stages.get(stage)
+        if entry and entry["key"] == key and all(Path(output).exists() for output in entry["outputs"]):
+            self.hits.append(stage)
+            self.saved_seconds += entry["seconds"]
+            return True
+        self.misses.append(stage)
+        return False
+    
+    def record(self, stage: str, key: str, outputs: Iterable[Path], seconds: float):
+        self.stages[stage] = {
+            "key": key,
+            "outputs": [str(output) for output in outputs],
+            "seconds": round(seconds, 3),
+            "built_at": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        }
+        self.save()
+    
+    def save(self):
+        """Write atomically so an interrupted build never leaves a corrupt manifest"""
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        temp = self.path.with_suffix(".tmp")
+        temp.write_text(json.dumps({"stages": self.stages}, indent=2, sort_keys=True))
+        os.replace(temp, self.path)
+
+
+# MARK: - Build Output
+
+# PyInstaller log lines that start each phase, in the order phases occur
+PYINSTALLER_PHASES: List[Tuple[str, Pattern]] = [
+    ("analysis", re.compile(r"(checking|Running) Analysis|Initializing module dependency graph")),
+    ("collecting", re.compile(r"binary vs\. data reclassification|Creating base_library\.zip")),
+    ("compressing", re.compile(r"(checking|Building) (PYZ|PKG)")),
+    ("bundling", re.compile(r"(checking|Building) (EXE|COLLECT|BUNDLE)")),
+]
+REPORT_NAME = "build-report.json"
+
+
+@dataclass
+class Phase:
+    """A stretch of build tool output; started is seconds from the start of the run"""
+    name: str
+    started: float
+    seconds: float = 0.0
+    lines: int = 0
+
+
+class BuildMonitor:
+    """
+    Follows a build tool's output one line at a time
+    
+    Tracks the current phase and its timing, counts lines, bytes and
+    warnings, and keeps only the last few lines for error reports.
+    Phases only move forward, so a late log line mentioning an earlier
+    phase does not reopen it.
+    """
+    
+    def __init__(self, phases: List[Tuple[str, Pattern]] = (), tail_lines: int = OUTPUT_TAIL_LINES):
+        self.patterns = list(phases)
+        self.started = time.perf_counter()
+        self.phases: List[Phase] = [Phase("starting" if self.patterns else "running", 0.0)]
+        self.tail: Deque[str] = deque(maxlen=tail_lines)
+        self.lines = 0
+        self.bytes = 0
+        self.warnings = 0
+        self.returncode: Optional[int] = None
+        self.seconds = 0.0
+        self._next = 0
+    
+    @property
+    def phase(self) -> str:
+        return self.phases[-1].name
+    
+    def feed(self, line: str, now: Optional[float] = None) -> Optional[str]:
+        """Process one line; returns the new phase's name when this line starts one"""
+        now = time.perf_counter() if now is None else now
+        self.lines += 1
+        self.bytes += len(line) + 1
+        self.tail.append(line)
+        if "WARNING:" in line:
+            self.warnings += 1
+        
+        entered = None
+        for index in range(self._next, len(self.patterns)):
+            name, pattern = self.patterns[index]
+            if pattern.search(line):
+                self._close_phase(now)
+                self.phases.append(Phase(name, now - self.started))
+                self._next = index + 1
+                entered = name
+                break
+        self.phases[-1].lines += 1
+        return entered
+    
+    def finish(self, returncode: int, now: Optional[float] = None):
+        now = time.perf_counter() if now is None else now
+        self._close_phase(now)
+        self.returncode = returncode
+        self.seconds = now - self.started
+    
+    def _close_phase(self, now: float):
+        phase = self.phases[-1]
+        phase.seconds = now - self.started - phase.started
+    
+    def timings(self) -> str:
+        """One-line phase timing summary"""
+        return " · ".join(f"{phase.name} {phase.seconds:.1f}s" for phase in self.phases if phase.lines)
+    
+    def report(self) -> Dict[str, Any]:
+        return {
+            "returncode": self.returncode,
+            "seconds": round(self.seconds, 3),
+            "lines": self.lines,
+            "bytes": self.bytes,
+            "warnings": self.warnings,
+            "phases": [
+                {"name": phase.name, "started": round(phase.started, 3),
+                 "seconds": round(phase.seconds, 3), "lines": phase.lines}
+                for phase in self.phases if phase.lines
+            ],
+            "tail": list(self.tail),
+        }
+
+
+# MARK: - Reproducible Builds
+
+# Shared artifact cache used when --cache-dir is not given
+CACHE_DIR_ENV = "COLORSNAP_BUILD_CACHE"
+# Earliest timestamp a zip entry can carry
+ZIP_EPOCH = (1980, 1, 1, 0, 0, 0)
+
+
+def source_date_epoch(project_dir: Path) -> int:
+    """
+    SOURCE_DATE_EPOCH for a build: the environment's, else the last commit's
+    time, else the newest source file's mtime
+    """
+    if os.environ.get("SOURCE_DATE_EPOCH"):
+        return int(os.environ["SOURCE_DATE_EPOCH"])
+    try:
+        result = subprocess.run(
+            ["git", "log", "-1", "--format=%ct"], cwd=project_dir, capture_output=True, text=True, check=True
+        )
+        return int(result.stdout.strip())
+    except (OSError, subprocess.CalledProcessError, ValueError):
+        return int(max(path.stat().st_mtime for path in project_dir.glob("*.py")))
+
+
+def normalize_tree(root: Path, epoch: int):
+    """Set every file, directory and symlink under root (and root) to the same mtime"""
+    paths = list(root.rglob("*")) + [root] if root.is_dir() else [root]
+    for path in paths:
+        os.utime(path, (epoch, epoch), follow_symlinks=False)
+
+
+def content_digest(root: Path) -> str:
+    """SHA-256 over relative paths, symlink targets and file contents (sorted)"""
+    digest = hashlib.sha256()
+    paths = sorted(root.rglob("*")) if root.is_dir() else [root]
+    for path in paths:
+        relative = path.relative_to(root).as_posix() if root.is_dir() else path.name
+        if path.is_symlink():
+            digest.update(f"L {relative} -> {os.readlink(path)}\n".encode())
+        elif path.is_file():
+            digest.update(f"F {relative} {file_digest(path)}\n".encode())
+    return digest.hexdigest()
+
+
+def _reset_tar_info(info: tarfile.TarInfo, epoch: int) -> tarfile.TarInfo:
+    info.mtime = epoch
+    info.uid = info.gid = 0
+    info.uname = info.gname = ""
+    return info
+
+
+def write_tar_gz(source: Path, archive: Path, arcname: str, epoch: Optional[int] = None):
+    """
+    tar.gz of a directory with sorted members, no owner names and no gzip
+    header timestamp; with an epoch, member mtimes are set to it as well
+    """
+    with open(archive, "wb") as raw, gzip.GzipFile(fileobj=raw, mode="wb", compresslevel=6, mtime=0) as compressed, \
+            tarfile.open(fileobj=compressed, mode="w") as tar:
+        def reset(info: tarfile.TarInfo) -> tarfile.TarInfo:
+            return _reset_tar_info(info, info.mtime if epoch is None else epoch)
+        tar.add(source, arcname=arcname, filter=reset)
+
+
+class ArtifactCache:
+    """
+    Directory of build outputs addressed by stage key
+    
+    Stage keys hash a stage's input contents, toolchain and options (not
+    paths), so any checkout of the same commit with the same toolchain
+    computes the same key and can restore the outputs instead of
+    rebuilding. Entries are written to a temporary directory and renamed
+    into place, so a shared directory (e.g. a CI cache) is never seen
+    half-written. Each entry records its outputs' content digest; storing
+    a different digest under an existing key means the build is not
+    reproducible and is reported.
+    """
+    
+    def __init__(self, root: Path):
+        self.root = Path(root).expanduser()
+        self.restored = 0
+        self.stored = 0
+    
+    def entry(self, key: str) -> Path:
+        return self.root / key[:2] / key
+    
+    def restore(self, key: str, outputs: List[Path]) -> bool:
+        entry = self.entry(key)
+        if not (entry / "meta.json").exists():
+            return False
+        for output in outputs:
+            if not (entry / output.name).exists() and not (entry / output.name).is_symlink():
+                return False
+        for output in outputs:
+            _replace(entry / output.name, output)
+        self.restored += 1
+        return True
+    
+    def store(self, key: str, outputs: List[Path], meta: Dict[str, Any]) -> Optional[bool]:
+        """Add outputs under key; returns False if an existing entry differs (not reproducible)"""
+        digest = stage_key(**{output.name: content_digest(output) for output in outputs})
+        entry = self.entry(key)
+        if (entry / "meta.json").exists():
+            return json.loads((entry / "meta.json").read_text()).get("digest") == digest
+        
+        entry.parent.mkdir(parents=True, exist_ok=True)
+        temp = Path(tempfile.mkdtemp(prefix=f".{key[:12]}-", dir=entry.parent))
+        try:
+            for output in outputs:
+                _replace(output, temp / output.name)
+            (temp / "meta.json").write_text(json.dumps({**meta, "digest": digest}, indent=2, sort_keys=True))
+            os.replace(temp, entry)
+            self.stored += 1
+        except OSError:
+            # Another build stored the same key first
+            shutil.rmtree(temp, ignore_errors=True)
+        return True
+
+
+def _replace(source: Path, target: Path):
+    """Copy a file or tree over target, keeping symlinks and timestamps"""
+    if target.is_dir() and not target.is_symlink():
+        shutil.rmtree(target)
+    elif target.exists() or target.is_symlink():
+        target.unlink()
+    # Clones share blocks copy-on-write; hardlinks would tie cache entries to dist/
+    stage_tree(source, target, link=False)
+
+
+# MARK: - Staging
+
+FICLONE = 0x40049409  # Linux ioctl: share the source's blocks copy-on-write (btrfs, XFS, bcachefs)
+PARALLEL_STAGE_FILES = 64  # Trees with at least this many files are copied on a thread pool
+STAGE_WORKERS = 8
+
+
+@dataclass
+class StagingStats:
+    """What stage_tree did per file and how many bytes it really wrote"""
+    files: int = 0
+    total_bytes: int = 0
+    cloned: int = 0
+    linked: int = 0
+    copied: int = 0
+    copied_bytes: int = 0
+    seconds: float = 0.0
+    
+    def summary(self) -> str:
+        methods = [f"{count} {label}" for count, label in
+                   ((self.cloned, "reflinked"), (self.linked, "hardlinked"), (self.copied, "copied")) if count]
+        return (f"{self.files} files ({self.total_bytes / 1e6:.1f} MB): {', '.join(methods) or 'nothing'}; "
+                f"{self.copied_bytes / 1e6:.1f} MB copied in {self.seconds:.2f}s")
+
+
+class _Stager:
+    """Places one file at a time, dropping a method once the filesystem refuses it"""
+    
+    def __init__(self, link: bool):
+        self.methods = ["clone", "link", "copy"] if link else ["clone", "copy"]
+        self.stats = StagingStats()
+    
+    def place(self, source: Path, target: Path) -> str:
+        for method in [method for method in self.methods if method != "copy"]:
+            try:
+                if method == "clone":
+                    _clone_file(source, target)
+                else:
+                    os.link(source, target)
+                return method
+            except OSError:
+                # Cross-device, unsupported filesystem or no permission: same answer for the rest of the tree
+                if target.exists():
+                    target.unlink()
+                try:
+                    self.methods.remove(method)
+                except ValueError:
+                    pass  # another thread got there first
+        shutil.copy2(source, target, follow_symlinks=False)
+        return "copy"
+    
+    def count(self, method: str, size: int):
+        stats = self.stats
+        stats.files += 1
+        stats.total_bytes += size
+        if method == "clone":
+            stats.cloned += 1
+        elif method == "link":
+            stats.linked += 1
+        else:
+            stats.copied += 1
+            stats.copied_bytes += size
+
+
+def _clone_file(source: Path, target: Path):
+    """Reflink source to target (Linux FICLONE, macOS clonefile); raises OSError if unsupported"""
+    if sys.platform == "darwin":
+        import ctypes
+        libc = ctypes.CDLL(None, use_errno=True)
+        if libc.clonefile(os.fsencode(source), os.fsencode(target), 0) != 0:
+            raise OSError(ctypes.get_errno(), "clonefile failed", str(source))
+        return
+    if not sys.platform.startswith("linux"):
+        raise OSError("reflinks are not supported on this platform")
+    import fcntl
+    with open(source, "rb") as src, open(target, "wb") as dst:
+        fcntl.ioctl(dst.fileno(), FICLONE, src.fileno())
+    shutil.copystat(source, target)
+
+
+def stage_tree(source: Path, target: Path, link: bool = True, workers: Optional[int] = None) -> StagingStats:
+    """
+    Reproduce source (a file or a tree) at target without copying where possible
+    
+    Each file is reflinked (copy-on-write clone) if the filesystem supports
+    it, else hardlinked (only when link is True: the target then shares the
+    source's inode, fine for read-only inputs like an AppDir or DMG staging
+    folder), else copied. Symlinks are recreated; large trees are copied on
+    a thread pool since the copy itself runs outside the GIL.
+    """
+    started = time.perf_counter()
+    source, target = Path(source), Path(target)
+    stager = _Stager(link)
+    target.parent.mkdir(parents=True, exist_ok=True)
+    
+    if source.is_symlink() or not source.is_dir():
+        if source.is_symlink():
+            os.symlink(os.readlink(source), target)
+        else:
+            stager.count(stager.place(source, target), source.stat().st_size)
+        stager.stats.seconds = time.perf_counter() - started
+        return stager.stats
+    
+    files: List[Tuple[Path, Path, int]] = []
+    directories: List[Tuple[Path, Path]] = []
+    for root, dirnames, filenames in os.walk(source):
+        here = Path(root)
+        there = target / here.relative_to(source)
+        there.mkdir(exist_ok=True)
+        directories.append((here, there))
+        for name in dirnames + filenames:
+            path = here / name
+            if path.is_symlink():
+                os.symlink(os.readlink(path), there / name)
+            elif name in filenames:
+                files.append((path, there / name, path.stat().st_size))
+    
+    def place(item: Tuple[Path, Path, int]) -> str:
+        return stager.place(item[0], item[1])
+    
+    workers = STAGE_WORKERS if workers is None else workers
+    if workers > 1 and len(files) >= PARALLEL_STAGE_FILES:
+        # Largest first so one big library doesn't finish last on its own
+        files.sort(key=lambda item: -item[2])
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            methods = list(pool.map(place, files))
+    else:
+        methods = [place(item) for item in files]
+    for (_, _, size), method in zip(files, methods):
+        stager.count(method, size)
+    
+    # After the files, so creating them doesn't bump directory mtimes again
+    for here, there in reversed(directories):
+        shutil.copystat(here, there, follow_symlinks=False)
+    stager.stats.seconds = time.perf_counter() - started
+    return stager.stats
+
+
+# MARK: - Bundle Analysis
+
+# Exclusion profile written by --analyze and applied to every later build
+PROFILE_NAME = "build_profile.json"
+# Qt reads and writes PNG natively; JPEG is kept for photos opened through Qt
+KEEP_IMAGE_FORMATS = ("jpeg",)
+IMAGE_PLUGIN_TYPES = ("imageformats", "iconengines")
+# Bindings every PyQt6 app loads, whether or not it imports them directly
+QT_BASE_MODULES = {"PyQt6.QtCore", "PyQt6.QtGui", "PyQt6.sip"}
+# Qt libraries bundled only because an image plugin links them
+PLUGIN_LIBRARIES = {"libqpdf": "Qt6Pdf", "libqsvg": "Qt6Svg", "libqsvgicon": "Qt6Svg"}
+
+IMPORT_TIME_LINE = re.compile(r"import time:\s+(\d+) \|\s+(\d+) \|\s+(\S+)")
+MISSING_MODULE_LINE = re.compile(r"missing module named (\S+) - imported by (.*)")
+
+
+@dataclass
+class BundleEntry:
+    """One file or module in the PyInstaller analysis, attributed to a group"""
+    dest: str
+    category: str
+    name: str
+    size: int
+
+
+def toc_category(dest: str, typecode: str) -> Tuple[str, str]:
+    """(category, name) a TOC entry's size is attributed to"""
+    if typecode == "PYMODULE":
+        return "Python modules", dest.split(".")[0]
+    parts = dest.replace("\\", "/").split("/")
+    stem = parts[-1].split(".")[0]
+    if parts[:2] == ["PyQt6", "Qt6"] and len(parts) > 3:
+        if parts[2] == "plugins":
+            return "Qt plugins", f"{parts[3]}/{stem}"
+        if parts[2] == "translations":
+            return "Qt translations", stem.rsplit("_", 1)[0]
+        if parts[2] in ("lib", "bin"):
+            return "Qt libraries", stem
+    if parts[0] == "PyQt6" and len(parts) == 2 and typecode == "EXTENSION":
+        return "Qt bindings", f"PyQt6.{stem}"
+    if typecode in ("BINARY", "EXTENSION"):
+        return "Native libraries", parts[0].replace(".libs", "") if len(parts) > 1 else stem
+    return "Data", parts[0]
+
+
+def analyze_toc(toc_path: Path) -> List[BundleEntry]:
+    """
+    Every module, binary and data file in a PyInstaller Analysis TOC with
+    its size on disk
+    
+    The TOC is a Python literal, so it is parsed with ast.literal_eval;
+    lists of (dest, source, typecode) are found wherever they sit in it.
+    """
+    entries = []
+    
+    def walk(node):
+        if isinstance(node, (list, tuple)):
+            if len(node) == 3 and all(isinstance(part, str) or part is None for part in node) \
+                    and isinstance(node[2], str) and node[2].isupper():
+                dest, source, typecode = node
+                if typecode != "SYMLINK" and source and os.path.isfile(source):
+                    category, name = toc_category(dest, typecode)
+                    entries.append(BundleEntry(dest, category, name, os.path.getsize(source)))
+                return
+            for child in node:
+                walk(child)
+    
+    walk(ast.literal_eval(toc_path.read_text()))
+    return entries
+
+
+def parse_import_times(lines: Iterable[str]) -> Dict[str, float]:
+    """
+    Seconds of import time per top-level package from python -X importtime
+    
+    Self time is summed, so every module is counted once; PyQt6 bindings
+    are kept separate (PyQt6.QtWidgets, ...).
+    """
+    totals: Dict[str, float] = defaultdict(float)
+    for line in lines:
+        match = IMPORT_TIME_LINE.match(line)
+        if match:
+            module = match.group(3)
+            parts = module.split(".")
+            key = ".".join(parts[:2]) if parts[0] == "PyQt6" and len(parts) > 1 else parts[0]
+            totals[key] += int(match.group(1)) / 1e6
+    return dict(totals)
+
+
+def missing_imports(warn_path: Path, modules: Iterable[str]) -> List[Tuple[str, str]]:
+    """(missing module, importer) for top-level imports by the given modules in a warn file"""
+    modules = set(modules)
+    found = []
+    if not warn_path.exists():
+        return found
+    with open(warn_path, encoding="utf-8") as handle:
+        for line in handle:
+            match = MISSING_MODULE_LINE.match(line.strip())
+            if not match:
+                continue
+            for importer in match.group(2).split("), "):
+                name, _, kind = importer.partition(" (")
+                if name in modules and "top-level" in kind:
+                    found.append((match.group(1), name))
+    return found
+
+
+def exclusion_profile(
+    entries: List[BundleEntry],
+    used_modules: Iterable[str],
+    keep_formats: Iterable[str] = KEEP_IMAGE_FORMATS
+) -> Dict[str, Any]:
+    """
+    Qt bindings, translations and image plugins the app does not need
+    
+    Qt libraries only linked by excluded plugins are dropped with them.
+    """
+    used = set(used_modules) | QT_BASE_MODULES
+    keep_formats = tuple(keep_formats)
+    bindings = {entry.name for entry in entries if entry.category == "Qt bindings"}
+    excluded_files = []
+    kept_plugins = set()
+    
+    for entry in entries:
+        if entry.category == "Qt translations":
+            excluded_files.append(entry)
+        elif entry.category == "Qt plugins" and entry.name.split("/")[0] in IMAGE_PLUGIN_TYPES:
+            plugin = entry.name.split("/")[1]
+            if any(fmt in plugin for fmt in keep_formats):
+                kept_plugins.add(plugin)
+            else:
+                excluded_files.append(entry)
+    
+    orphaned = {
+        library for library in set(PLUGIN_LIBRARIES.values())
+        if f"PyQt6.{library.replace('Qt6', 'Qt')}" not in used
+        and not any(PLUGIN_LIBRARIES.get(plugin) == library for plugin in kept_plugins)
+    }
+    excluded_files += [
+        entry for entry in entries
+        if entry.category == "Qt libraries" and entry.name.replace("lib", "", 1) in orphaned
+    ]
+    
+    return {
+        "generated": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "platform": platform.system(),
+        "keep_image_formats": list(keep_formats),
+        "exclude_modules": sorted(bindings - used),
+        "exclude_files": sorted(entry.dest.replace("\\", "/") for entry in excluded_files),
+        "excluded_bytes": sum(entry.size for entry in excluded_files),
+    }
+
+
+def prune_spec(spec: str, patterns: List[str]) -> str:
+    """Insert a filter dropping binaries/datas that match the patterns before the PYZ step"""
+    prune = (
+        "\n# Exclusion profile (build_profile.json)\n"
+        "from fnmatch import fnmatch\n"
+        f"_excluded = {patterns!r}\n"
+        "_keep = lambda entry: not any(fnmatch(entry[0].replace('\\\\', '/'), p) for p in _excluded)\n"
+        "a.binaries = [entry for entry in a.binaries if _keep(entry)]\n"
+        "a.datas = [entry for entry in a.datas if _keep(entry)]\n"
+    )
+    marker = "\npyz = PYZ("
+    if marker not in spec:
+        raise ValueError("Unrecognised spec file: no PYZ step")
+    return spec.replace(marker, prune + marker, 1)
+
+
+def bundle_size(path: Path) -> int:
+    """Bytes on disk of a file or bundle directory (symlinks not followed)"""
+    if path.is_file():
+        return path.stat().st_size
+    return sum(item.stat().st_size for item in path.rglob("*") if item.is_file() and not item.is_symlink())
+
+
+def print_bundle_analysis(entries: List[BundleEntry], imports: Dict[str, float], top: int = 12):
+    """Size by category, largest groups and slowest imports"""
+    groups: Dict[Tuple[str, str], int] = defaultdict(int)
+    categories: Dict[str, int] = defaultdict(int)
+    for entry in entries:
+        groups[(entry.category, entry.name)] += entry.size
+        categories[entry.category] += entry.size
+    
+    mb = 1024 * 1024
+    print(f"\n📦 Bundle contents: {sum(categories.values()) / mb:.1f} MB (before compression)")
+    for category, size in sorted(categories.items(), key=lambda item: -item[1]):
+        print(f"   {category:<18} {size / mb:7.1f} MB")
+    print("\n   Largest:")
+    for (category, name), size in sorted(groups.items(), key=lambda item: -item[1])[:top]:
+        print(f"   {size / mb:7.1f} MB  {name} ({category})")
+    
+    if imports:
+        print(f"\n⏱️  Import time: {sum(imports.values()) * 1000:.0f} ms")
+        for name, seconds in sorted(imports.items(), key=lambda item: -item[1])[:top]:
+            print(f"   {seconds * 1000:7.1f} ms  {name}")
+
+
+# MARK: - Bytecode
+
+ENTRY_MODULE = "main_app_example"
+OPTIMIZE_FLAGS = {0: [], 1: ["-O"], 2: ["-OO"]}
+# Imports the entry module from the path in argv[1] and prints how long it took
+IMPORT_TIMER = (
+    "import sys, time; sys.path.insert(0, sys.argv[1]); started = time.perf_counter(); "
+    f"import {ENTRY_MODULE}; print(time.perf_counter() - started)"
+)
+# Prints the project modules importing the entry module loads
+STARTUP_MODULES = (
+    "import json, os, sys; sys.path.insert(0, sys.argv[1]); "
+    f"import {ENTRY_MODULE}; "
+    "print(json.dumps(sorted(name for name, module in sys.modules.items() "
+    "if os.path.dirname(os.path.abspath(getattr(module, '__file__', None) or '')) == sys.argv[1])))"
+)
+
+
+def startup_modules(project_dir: Path) -> List[str]:
+    """Project modules loaded at startup, found by importing the entry module in a clean interpreter"""
+    result = subprocess.run(
+        [sys.executable, "-I", "-c", STARTUP_MODULES, str(project_dir)],
+        env=dict(os.environ, QT_QPA_PLATFORM="offscreen"), capture_output=True, text=True, check=True
+    )
+    return json.loads(result.stdout)
+
+
+def imported_modules(project_dir: Path, entry: str = ENTRY_MODULE) -> List[str]:
+    """
+    Project modules reachable from the entry module through import statements
+    
+    Like PyInstaller's analysis this follows every import statement, at
+    module level or inside functions, so it is what ends up in the bundle;
+    scripts the app never imports (tests, tools) are left out.
+    """
+    found = set()
+    pending = [entry]
+    while pending:
+        name = pending.pop()
+        path = project_dir / f"{name}.py"
+        if name in found or not path.is_file():
+            continue
+        found.add(name)
+        for node in ast.walk(ast.parse(path.read_text(), str(path))):
+            if isinstance(node, ast.Import):
+                pending.extend(alias.name.split(".")[0] for alias in node.names)
+            elif isinstance(node, ast.ImportFrom) and node.level == 0 and node.module:
+                pending.append(node.module.split(".")[0])
+    return sorted(found)
+
+
+def precompile_sources(sources: Iterable[Path], levels: Iterable[int] = (0, 1, 2)) -> int:
+    """Write __pycache__ bytecode at each optimization level; returns files written"""
+    written = 0
+    for source in sources:
+        for level in levels:
+            py_compile.compile(str(source), optimize=level, doraise=True)
+            written += 1
+    return written
+
+
+def freeze_modules(project_dir: Path, modules: Iterable[str], archive: Path, optimize: int = 2) -> Path:
+    """
+    Zip app of sourceless bytecode for the given modules
+    
+    Modules are stored uncompressed as <name>.pyc at the archive root, so
+    one zipimporter reads the central directory once and every import is
+    a seek and a read. `python <archive>` runs the app. Entries carry a
+    fixed date and hash-based pycs, so the same sources give the same bytes.
+    """
+    archive.parent.mkdir(parents=True, exist_ok=True)
+    
+    def add(bundle: zipfile.ZipFile, name: str, data: bytes):
+        info = zipfile.ZipInfo(name, ZIP_EPOCH)
+        info.external_attr = 0o644 << 16
+        bundle.writestr(info, data)
+    
+    with tempfile.TemporaryDirectory() as work, zipfile.ZipFile(archive, "w", zipfile.ZIP_STORED) as bundle:
+        for name in sorted(modules):
+            source = project_dir / f"{name}.py"
+            compiled = Path(work) / f"{name}.pyc"
+            py_compile.compile(
+                str(source), cfile=str(compiled), dfile=source.name, optimize=optimize, doraise=True,
+                invalidation_mode=py_compile.PycInvalidationMode.UNCHECKED_HASH
+            )
+            add(bundle, f"{name}.pyc", compiled.read_bytes())
+        add(bundle, "__main__.py", f"from {ENTRY_MODULE} import main\nmain()\n".encode())
+    return archive
+
+
+def _time_import(flags: List[str], path: Path) -> float:
+    result = subprocess.run(
+        [sys.executable, "-I", *flags, "-c", IMPORT_TIMER, str(path)],
+        env=dict(os.environ, QT_QPA_PLATFORM="offscreen"), capture_output=True, text=True, check=True
+    )
+    return float(result.stdout)
+
+
+def benchmark_startup_imports(project_dir: Path, runs: int = 10, optimize: int = 2) -> Dict[str, float]:
+    """
+    Median seconds to import the entry module from source (compiled on
+    every run), from __pycache__ bytecode and from a frozen archive
+    
+    Each variant runs in a fresh isolated interpreter against a copy of
+    the startup modules; third-party imports are the same in all three.
+    """
+    modules = startup_modules(project_dir)
+    with tempfile.TemporaryDirectory() as work:
+        work = Path(work)
+        for folder in ("source", "pyc"):
+            (work / folder).mkdir()
+            for name in modules:
+                shutil.copy2(project_dir / f"{name}.py", work / folder)
+        compileall.compile_dir(str(work / "pyc"), optimize=[optimize], quiet=1)
+        freeze_modules(project_dir, modules, work / "startup.pyz", optimize)
+        
+        variants = {
+            "source": (["-B"], work / "source"),
+            "pyc": (OPTIMIZE_FLAGS[optimize], work / "pyc"),
+            "frozen": ([], work / "startup.pyz"),
+        }
+        return {
+            label: statistics.median(_time_import(flags, path) for _ in range(runs))
+            for label, (flags, path) in variants.items()
+        }
+
+
+# MARK: - Cached Onefile Launcher
+
+# Cache directories (versions) a launcher keeps, including its own
+LAUNCHER_KEEP_VERSIONS = 2
+# 0.1 s polls before a launcher takes over a lock left by a killed launch
+LAUNCHER_LOCK_TRIES = 300
+# Age after which a leftover .extract.* directory is considered abandoned
+LAUNCHER_STALE_MINUTES = 60
+LAUNCHER_TEMPLATE = """#!/bin/sh
+# {app} {version} launcher: unpacks the bundle appended to this script into
+# the user cache on first launch, then runs it from there.
+set -e
+APP="{app}"
+KEY="{key}"
+PAYLOAD_OFFSET={offset}
+ROOT="${{COLORSNAP_CACHE_DIR:-${{XDG_CACHE_HOME:-$HOME/.cache}}/$APP}}"
+DIR="$ROOT/$KEY"
+MARK=""
+[ -f "$DIR/.complete" ] && read -r MARK < "$DIR/.complete"
+complete() {{
+    MARK=""
+    [ -f "$DIR/.complete" ] && read -r MARK < "$DIR/.complete"
+    [ "$MARK" = "$KEY" ] && [ -x "$DIR/$APP/$APP" ]
+}}
+if ! complete; then
+    mkdir -p "$ROOT"
+    TMP=$(mktemp -d "$ROOT/.extract.XXXXXX")
+    trap 'rm -rf "$TMP"; exit 1' HUP INT TERM
+    tail -c +$((PAYLOAD_OFFSET + 1)) "$0" | tar -xzf - -C "$TMP"
+    echo "$KEY" > "$TMP/.complete"
+    # Swap under a mkdir lock; a launch that finished first wins and is reused
+    LOCK="$ROOT/.lock.$KEY"
+    TRIES=0
+    until mkdir "$LOCK" 2>/dev/null; do
+        TRIES=$((TRIES + 1))
+        # Left behind by a killed launch: the swap itself takes milliseconds
+        [ "$TRIES" -ge {lock_tries} ] && rmdir "$LOCK" 2>/dev/null && TRIES=0
+        sleep 0.1
+    done
+    if complete; then
+        rm -rf "$TMP"
+    else
+        rm -rf "$DIR"
+        mv "$TMP" "$DIR"
+    fi
+    rmdir "$LOCK"
+    trap - HUP INT TERM
+    ls -1t "$ROOT" | grep -vxF "$KEY" | tail -n +{keep} | while read -r OLD; do rm -rf "$ROOT/$OLD"; done
+    # Extractions interrupted by a kill (recent ones may still be running)
+    find "$ROOT" -maxdepth 1 -name '.extract.*' -mmin +{stale_minutes} -exec rm -rf {{}} + 2>/dev/null || true
+fi
+exec "$DIR/$APP/$APP" "$@"
+"""
+
+
+def launcher_script(app: str, version: str, digest: str, keep: int = LAUNCHER_KEEP_VERSIONS) -> bytes:
+    """
+    Shell header of a cached launcher; the payload starts right after it
+    
+    The cache directory is named after the version and the payload's hash,
+    so a rebuilt bundle never reuses a stale extraction. A launch only
+    reads the .complete marker, written after extraction finishes and
+    before the directory is renamed into place. Concurrent first launches
+    each extract privately and swap under a mkdir lock; whoever finds a
+    complete directory once it holds the lock discards its own copy.
+    """
+    fields = {
+        "app": app, "version": version, "key": f"{version}-{digest[:16]}", "keep": keep,
+        "lock_tries": LAUNCHER_LOCK_TRIES, "stale_minutes": LAUNCHER_STALE_MINUTES,
+    }
+    # The header's length includes its own offset digits, so iterate to a fixed point
+    offset = 0
+    while True:
+        header = LAUNCHER_TEMPLATE.format(offset=offset, **fields).encode()
+        if len(header) == offset:
+            return header
+        offset = len(header)
+
+
+# MARK: - Launch Benchmarks
+
+FIRST_FRAME_MARKER = "colorsnap:first-frame"  # printed by main_app_example once its window has painted
+BASELINE_NAME = "bench_baseline.json"
+BENCH_RUNS = 5
+BENCH_TOLERANCE = 0.10
+BENCH_METRICS = ("first_frame_seconds", "peak_rss_bytes", "bundle_bytes")
+
+
+@dataclass
+class LaunchSample:
+    """One headless launch: seconds to the first painted frame and the process tree's peak RSS"""
+    first_frame_seconds: float
+    peak_rss_bytes: Optional[int]
+
+
+def platform_tag() -> str:
+    """Baselines are only comparable on the same OS and architecture"""
+    return f"{platform.system()}-{platform.machine()}"
+
+
+def _max_rss_bytes(maxrss: int) -> int:
+    # ru_maxrss is in bytes on macOS and KiB elsewhere
+    return maxrss if sys.platform == "darwin" else maxrss * 1024
+
+
+def launch_once(executable: Path, env: Optional[Dict[str, str]] = None, timeout: float = 120) -> Optional[LaunchSample]:
+    """
+    Launch the app offscreen until it paints its first frame and quits
+    
+    The clock runs from spawning the process to reading FIRST_FRAME_MARKER,
+    so bootloader and unpacking time count. Peak RSS comes from wait4(),
+    which covers the child and its descendants (the onefile bootloader's
+    child included); it is None where wait4 is unavailable (Windows).
+    """
+    env = dict(os.environ, QT_QPA_PLATFORM="offscreen", COLORSNAP_QUIT_AFTER_STARTUP="1", **(env or {}))
+    output: Deque[str] = deque(maxlen=OUTPUT_TAIL_LINES)
+    first_frame = None
+    started = time.perf_counter()
+    process = subprocess.Popen([str(executable)], env=env, stdout=subprocess.PIPE,
+                               stderr=subprocess.STDOUT, text=True, errors="replace")
+    timer = threading.Timer(timeout, process.kill)
+    timer.start()
+    try:
+        for line in process.stdout:
+            if first_frame is None and line.strip() == FIRST_FRAME_MARKER:
+                first_frame = time.perf_counter() - started
+            output.append(line.rstrip("\n"))
+        process.stdout.close()
+        if hasattr(os, "wait4"):
+            _, status, usage = os.wait4(process.pid, 0)
+            process.returncode = os.waitstatus_to_exitcode(status)
+            peak_rss = _max_rss_bytes(usage.ru_maxrss)
+        else:
+            process.wait()
+            peak_rss = None
+    finally:
+        timer.cancel()
+    
+    if process.returncode != 0 or first_frame is None:
+        reason = f"exited with {process.returncode}" if process.returncode else "never painted a frame"
+        print(f"❌ {executable.name} {reason}:\n" + "\n".join(output))
+        return None
+    return LaunchSample(first_frame, peak_rss)
+
+
+def bench_executable(executable: Path, runs: int = BENCH_RUNS, env: Optional[Dict[str, str]] = None) -> Optional[Dict[str, Any]]:
+    """Median time to first frame and largest peak RSS over runs launches (after one warm-up)"""
+    samples = []
+    for _ in range(runs + 1):
+        sample = launch_once(executable, env)
+        if sample is None:
+            return None
+        samples.append(sample)
+    samples = samples[1:]
+    rss = [sample.peak_rss_bytes for sample in samples if sample.peak_rss_bytes is not None]
+    return {
+        "first_frame_seconds": statistics.median(sample.first_frame_seconds for sample in samples),
+        "peak_rss_bytes": max(rss) if rss else None,
+        "runs": [asdict(sample) for sample in samples],
+    }
+
+
+def measure_startup(executable: Path, runs: int = 3, env: Optional[Dict[str, str]] = None) -> Optional[float]:
+    """Median seconds to the first painted frame over runs launches (no warm-up, unlike bench_executable)"""
+    times = []
+    for _ in range(runs):
+        sample = launch_once(executable, env)
+        if sample is None:
+            return None
+        times.append(sample.first_frame_seconds)
+    return statistics.median(times)
+
+
+def compare_to_baseline(
+    metrics: Dict[str, Any],
+    baseline: Dict[str, Any],
+    tolerance: float = BENCH_TOLERANCE
+) -> List[Dict[str, Any]]:
+    """Per metric: baseline, current, relative change and whether it exceeds the tolerance"""
+    rows = []
+    for metric in BENCH_METRICS:
+        current, previous = metrics.get(metric), baseline.get(metric)
+        if current is None or not previous:
+            continue
+        change = current / previous - 1
+        rows.append({
+            "metric": metric, "baseline": previous, "current": current,
+            "change": change, "regressed": change > tolerance,
+        })
+    return rows
+
+
+def _format_metric(metric: str, value: float) -> str:
+    if metric.endswith("_seconds"):
+        return f"{value * 1000:.0f} ms"
+    return f"{value / 1e6:.1f} MB"
+
+
+def print_bench(rows: List[Dict[str, Any]], tolerance: float):
+    """Baseline vs current per metric, flagging regressions"""
+    print(f"\n📊 Launch benchmark vs baseline (tolerance {tolerance:.0%})")
+    for row in rows:
+        mark = "❌" if row["regressed"] else "✅"
+        print(f"   {mark} {row['metric']:<20} {_format_metric(row['metric'], row['baseline']):>10} -> "
+              f"{_format_metric(row['metric'], row['current']):>10} ({row['change']:+.1%})")
+
+
+# MARK: - Builder
 
 class AppBuilder:
-    """Builds ColorSnap Pro for distribution"""
+    """
+    Builds ColorSnap Pro for distribution
+    
+    Args:
+        incremental: Keep build/ and dist/ between runs and skip stages
+            whose inputs hash the same as last time
+        build_dir: Work directory (default build/)
+        bundle_dir: Where PyInstaller writes and packagers read the bundle
+            (default: dist_dir)
+        stream_output: Echo build tool output as it runs instead of only on failure
+        use_profile: Apply the exclusion profile written by analyze(), if any
+        optimize: Bytecode optimization level for bundled modules (PyInstaller --optimize)
+        deterministic: Reproducible outputs: SOURCE_DATE_EPOCH and PYTHONHASHSEED
+            for build tools, normalized timestamps, content-based package keys
+            (on by default when SOURCE_DATE_EPOCH is set)
+        cache_dir: Shared artifact cache (default: $COLORSNAP_BUILD_CACHE, if set)
+    """
     
-    def __init__(self):
+    def __init__(
+        self,
+        incremental: bool = False,
+        build_dir: Optional[Path] = None,
+        bundle_dir: Optional[Path] = None,
+        stream_output: bool = False,
+        use_profile: bool = True,
+        optimize: Optional[int] = None,
+        deterministic: bool = False,
+        cache_dir: Optional[Path] = None
+    ):
         self.project_dir = Path(__file__).parent
-        self.build_dir = self.project_dir / "build"
+        self.build_dir = build_dir or self.project_dir / "build"
         self.dist_dir = self.project_dir / "dist"
+        self.bundle_dir = bundle_dir or self.dist_dir
         self.version = "1.0.0"
+        self.incremental = incremental
+        self.stream_output = stream_output
+        self.use_profile = use_profile
+        self.optimize = optimize
+        self.deterministic = deterministic or bool(os.environ.get("SOURCE_DATE_EPOCH"))
+        self.epoch = source_date_epoch(self.project_dir) if self.deterministic else None
+        cache_dir = cache_dir or os.environ.get(CACHE_DIR_ENV)
+        self.artifacts = ArtifactCache(cache_dir) if cache_dir else None
+        self._manifest: Optional[BuildManifest] = None
+        self.reports: List[Dict[str, Any]] = []
         
         # App metadata
         self.app_name = "ColorSnapPro"
@@ -36,9 +1089,127 @@ class AppBuilder:
             if dir_path.exists():
                 shutil.rmtree(dir_path)
                 print(f"   Removed {dir_path}")
+        self._manifest = None
         
         print("✅ Clean complete")
     
+    # MARK: - Incremental Builds
+    
+    @property
+    def manifest(self) -> BuildManifest:
+        if self._manifest is None:
+            self._manifest = BuildManifest(self.build_dir / MANIFEST_NAME)
+        return self._manifest
+    
+    def source_files(self) -> List[Path]:
+        """Files whose contents feed the PyInstaller build: the modules the entry point imports, data and assets"""
+        files = [self.project_dir / f"{name}.py" for name in imported_modules(self.project_dir)]
+        files += [self.project_dir / "requirements.txt", self.project_dir / "README.md"]
+        assets = self.project_dir / "assets"
+        if assets.is_dir():
+            files += [path for path in assets.rglob("*") if path.is_file()]
+        return sorted(path for path in files if path.exists())
+    
+    def input_hashes(self) -> Dict[str, str]:
+        """Relative path -> SHA-256 for every build input"""
+        return {
+            path.relative_to(self.project_dir).as_posix(): file_digest(path)
+            for path in self.source_files()
+        }
+    
+    def tool_hashes(self) -> Dict[str, str]:
+        """SHA-256 of the build tooling (this script and the resource bundle writer), part of every stage key"""
+        tools = [Path(__file__), Path(__file__).with_name("resource_bundle.py")]
+        return {path.name: file_digest(path) for path in tools}
+    
+    def _is_fresh(self, stage: str, key: str, outputs: List[Path]) -> bool:
+        """
+        Report and skip a stage whose outputs are already up to date
+        
+        In incremental mode the local manifest is checked first; then the
+        artifact cache, if any, is asked to restore the outputs.
+        """
+        if self.incremental and self.manifest.is_fresh(stage, key):
+            seconds = self.manifest.stages[stage]["seconds"]
+            print(f"♻️  {stage}: inputs unchanged, skipped (saved {seconds:.1f}s)")
+            return True
+        if self.artifacts is not None and self.artifacts.restore(key, outputs):
+            self.manifest.record(stage, key, outputs, 0.0)
+            print(f"📥 {stage}: restored from artifact cache {self.artifacts.root}")
+            return True
+        return False
+    
+    def _record(self, stage: str, key: str, outputs: List[Path], seconds: float):
+        """Record a built stage in the manifest and the artifact cache"""
+        if self.deterministic:
+            for output in outputs:
+                normalize_tree(output, self.epoch)
+        self.manifest.record(stage, key, outputs, seconds)
+        if self.artifacts is not None:
+            meta = {"stage": stage, "version": self.version, "seconds": round(seconds, 3)}
+            if not self.artifacts.store(key, outputs, meta):
+                print(f"⚠️  {stage}: output differs from the cached build with the same key (not reproducible)")
+    
+    def toolchain(self) -> Dict[str, str]:
+        """Everything outside the sources that changes build outputs"""
+        try:
+            from PyInstaller import __version__ as pyinstaller_version
+        except ImportError:
+            pyinstaller_version = None
+        return {
+            "python": sys.version,
+            "platform": f"{platform.system()}-{platform.machine()}",
+            "pyinstaller": pyinstaller_version,
+            "deterministic": str(self.deterministic),
+        }
+    
+    def _portable(self, cmd: List[str]) -> List[str]:
+        """A command with the interpreter and checkout paths factored out, for stage keys"""
+        project = str(self.project_dir)
+        return [arg.replace(project, "<project>") for arg in cmd[1:] if arg != "--clean"]
+    
+    def _tool_env(self) -> Dict[str, str]:
+        env = dict(os.environ)
+        if self.deterministic:
+            env.update(SOURCE_DATE_EPOCH=str(self.epoch), PYTHONHASHSEED="0")
+        return env
+    
+    def _write_if_changed(self, path: Path, content: str) -> Path:
+        """Write a generated file only when its content changes, keeping its mtime stable"""
+        path.parent.mkdir(parents=True, exist_ok=True)
+        if not path.exists() or path.read_text() != content:
+            path.write_text(content)
+        return path
+    
+    def _package_key(self, bundle: Path) -> str:
+        """
+        Key for a packaging stage: the bundle it wraps plus the app metadata
+        
+        Deterministic builds normalize timestamps, so they key on the
+        bundle's contents; otherwise a stat fingerprint is enough.
+        """
+        return stage_key(
+            bundle=content_digest(bundle) if self.deterministic else tree_fingerprint(bundle),
+            app=[self.app_name, self.version, self.bundle_id, self.description, self.author],
+            toolchain=self.toolchain(),
+            tools=self.tool_hashes(),
+        )
+    
+    def print_cache_summary(self):
+        """Cache hits, misses and time saved in this run"""
+        manifest = self.manifest
+        if not manifest.hits and not manifest.misses:
+            return
+        print(f"\n♻️  Build cache: {len(manifest.hits)} hit(s), {len(manifest.misses)} miss(es), "
+              f"~{manifest.saved_seconds:.1f}s saved")
+        if self.artifacts is not None:
+            print(f"   📥 {self.artifacts.restored} restored from / {self.artifacts.stored} stored to "
+                  f"{self.artifacts.root}")
+        for stage in manifest.hits:
+            print(f"   ✅ {stage}")
+        for stage in manifest.misses:
+            print(f"   🔨 {stage}")
+    
     def build_pyinstaller(self, onefile: bool = False, windowed: bool = True):
         """
         Build using PyInstaller
@@ -56,13 +1227,17 @@ class AppBuilder:
             print("❌ PyInstaller not installed. Installing...")
             subprocess.run([sys.executable, "-m", "pip", "install", "pyinstaller"], check=True)
         
-        # Build command
+        # Build command (incremental builds keep PyInstaller's own analysis cache)
         cmd = [
             sys.executable, "-m", "PyInstaller",
             "--name", self.app_name,
-            "--clean",
             "--noconfirm",
+            "--distpath", str(self.bundle_dir),
+            "--workpath", str(self.build_dir / "pyinstaller"),
+            "--specpath", str(self.build_dir),
         ]
+        if not self.incremental:
+            cmd.append("--clean")
         
         if onefile:
             cmd.append("--onefile")
@@ -72,13 +1247,17 @@ class AppBuilder:
         if windowed:
             cmd.append("--windowed")
         
+        if self.optimize is not None:
+            cmd.extend(["--optimize", str(self.optimize)])
+        
         # Icon (if exists)
         icon_path = self.project_dir / "assets" / "icon.ico"
         if icon_path.exists():
             cmd.extend(["--icon", str(icon_path)])
         
         # Add data files
-        cmd.extend(["--add-data", f"README.md{os.pathsep}."])
+        cmd.extend(["--add-data", f"{self.project_dir / 'README.md'}{os.pathsep}."])
+        cmd.extend(["--add-data", f"{self.build_resources()}{os.pathsep}."])
         
         # Version info (Windows)
         if platform.system() == "Windows":
@@ -95,26 +1274,246 @@ class AppBuilder:
             plist_path = self._create_info_plist()
             cmd.extend(["--osx-entitlements-file", str(plist_path)])
         
+        # Exclusion profile from --analyze
+        profile = self.load_profile()
+        for module in profile.get("exclude_modules", []):
+            cmd.extend(["--exclude-module", module])
+        
         # Main script
         cmd.append(str(self.project_dir / "main_app_example.py"))
         
+        output = self.executable_path(onefile=True) if onefile else self.bundle_dir / self.app_name
+        stage = f"pyinstaller:{'onefile' if onefile else 'onedir'}{'' if windowed else '-console'}"
+        key = stage_key(
+            inputs=self.input_hashes(),
+            command=self._portable(cmd),
+            exclude_files=profile.get("exclude_files", []),
+            toolchain=self.toolchain(),
+            tools=self.tool_hashes(),
+        )
+        if self._is_fresh(stage, key, [output]):
+            return True
+        
+        if profile.get("exclude_files"):
+            cmd = self._pruned_spec_command(cmd, profile["exclude_files"])
+            if cmd is None:
+                return False
+            print(f"   ✂️  Excluding {len(profile['exclude_files'])} files ({PROFILE_NAME})")
+        
         # Run build
         print(f"   Running: {' '.join(cmd)}")
-        result = subprocess.run(cmd, capture_output=True, text=True)
+        started = time.perf_counter()
+        returncode, tail = self._run(cmd, stage, PYINSTALLER_PHASES)
         
-        if result.returncode != 0:
-            print(f"❌ Build failed:\n{result.stderr}")
+        if returncode != 0:
+            print("❌ Build failed:\n" + "\n".join(tail))
             return False
         
+        self._record(stage, key, [output], time.perf_counter() - started)
         print("✅ Build complete")
-        print(f"   Output: {self.dist_dir / self.app_name}")
+        print(f"   Output: {output}")
         
         return True
     
+    def build_resources(self) -> Path:
+        """
+        Compile app_resources (and assets/icons) into build/resources/colorsnap.res
+        
+        The bundle is shipped next to the app's modules; resource_bundle
+        memory-maps it at runtime instead of building the stylesheets and
+        onboarding content from Python literals.
+        """
+        output = self.build_dir / "resources" / BUNDLE_NAME
+        entries = compile_resources(self.project_dir)
+        key = stage_key(
+            entries={name: hashlib.sha256(data).hexdigest() for name, data in entries.items()},
+            tools=self.tool_hashes(),
+        )
+        if self._is_fresh("resources", key, [output]):
+            return output
+        
+        started = time.perf_counter()
+        size = write_bundle(output, entries)
+        self._record("resources", key, [output], time.perf_counter() - started)
+        print(f"🗂️  Resource bundle: {len(entries)} entries, {size / 1024:.1f} KB -> {output}")
+        return output
+    
+    def load_profile(self) -> Dict[str, Any]:
+        """The exclusion profile, or {} if there is none or use_profile is off"""
+        path = self.project_dir / PROFILE_NAME
+        if not self.use_profile or not path.exists():
+            return {}
+        return json.loads(path.read_text())
+    
+    def _pruned_spec_command(self, cmd: List[str], patterns: List[str]) -> Optional[List[str]]:
+        """
+        Turn a PyInstaller command into makespec + a filtered spec
+        
+        PyInstaller has no option to drop collected files, so the spec is
+        generated from the same options and given a filter on the Analysis
+        binaries and datas; the returned command builds that spec.
+        """
+        build_options = {"--noconfirm": 0, "--clean": 0, "--distpath": 1, "--workpath": 1}
+        spec_args, build_args = [], []
+        args = iter(cmd[3:])
+        for arg in args:
+            if arg in build_options:
+                build_args.append(arg)
+                build_args.extend(next(args) for _ in range(build_options[arg]))
+            else:
+                spec_args.append(arg)
+        
+        result = subprocess.run(
+            [sys.executable, "-m", "PyInstaller.utils.cliutils.makespec", *spec_args],
+            capture_output=True, text=True
+        )
+        if result.returncode != 0:
+            print(f"❌ Spec generation failed:\n{result.stderr[-2000:]}")
+            return None
+        
+        spec_path = self.build_dir / f"{self.app_name}.spec"
+        spec_path.write_text(prune_spec(spec_path.read_text(), patterns))
+        return cmd[:3] + [str(spec_path)] + build_args
+    
+    def executable_path(self, onefile: bool = False) -> Path:
+        """The built executable inside bundle_dir"""
+        name = self.app_name + (".exe" if platform.system() == "Windows" else "")
+        return self.bundle_dir / name if onefile else self.bundle_dir / self.app_name / name
+    
+    def _side_builder(self, work: Path, **overrides) -> "AppBuilder":
+        """Builder for a side build under work/ with this builder's settings"""
+        settings = dict(
+            incremental=self.incremental,
+            use_profile=self.use_profile,
+            optimize=self.optimize,
+            deterministic=self.deterministic,
+            cache_dir=self.artifacts.root if self.artifacts else None,
+        )
+        settings.update(overrides)
+        return AppBuilder(build_dir=work, bundle_dir=work / "dist", **settings)
+    
+    def analyze(
+        self,
+        keep_formats: Iterable[str] = KEEP_IMAGE_FORMATS,
+        runs: int = 3
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Attribute bundle size and import time, write an exclusion profile
+        and compare onedir builds without and with it
+        
+        Both builds live under build/analyze/ so the regular outputs are
+        left alone; the profile is written to build_profile.json next to
+        this script and applied to every later build.
+        """
+        print("🔍 Analyzing bundle...")
+        work = self.build_dir / "analyze"
+        builds = {label: self._side_builder(work / label, use_profile=label == "after") for label in ("before", "after")}
+        before = builds["before"]
+        if not before.build_pyinstaller():
+            return None
+        
+        analysis_dir = before.build_dir / "pyinstaller" / self.app_name
+        entries = analyze_toc(analysis_dir / "Analysis-00.toc")
+        result = subprocess.run(
+            [sys.executable, "-X", "importtime", "-c", "import main_app_example"],
+            cwd=self.project_dir, env=dict(os.environ, QT_QPA_PLATFORM="offscreen"),
+            capture_output=True, text=True
+        )
+        print_bundle_analysis(entries, parse_import_times(result.stderr.splitlines()))
+        
+        sources = [path for path in self.source_files() if path.suffix == ".py"]
+        for module, importer in missing_imports(analysis_dir / f"warn-{self.app_name}.txt",
+                                                (path.stem for path in sources)):
+            print(f"⚠️  {importer} imports {module}, which PyInstaller could not find")
+        
+        used = {f"PyQt6.{name}" for path in sources for name in re.findall(r"PyQt6\.(Qt\w+)", path.read_text())}
+        profile = exclusion_profile(entries, used, keep_formats)
+        (self.project_dir / PROFILE_NAME).write_text(json.dumps(profile, indent=2) + "\n")
+        print(f"\n✂️  Exclusion profile: {len(profile['exclude_modules'])} modules, "
+              f"{len(profile['exclude_files'])} files ({profile['excluded_bytes'] / (1024 * 1024):.1f} MB) "
+              f"-> {PROFILE_NAME}")
+        
+        if not builds["after"].build_pyinstaller():
+            return None
+        
+        comparison = {}
+        for label, builder in builds.items():
+            comparison[label] = {
+                "bytes": bundle_size(builder.bundle_dir / self.app_name),
+                "startup_seconds": measure_startup(builder.executable_path(), runs),
+            }
+        
+        print("\n📊 Before / after exclusion profile (onedir)")
+        for label, stats in comparison.items():
+            startup = stats["startup_seconds"]
+            startup_text = f"{startup * 1000:.0f} ms" if startup is not None else "failed"
+            print(f"   {label:<6}  {stats['bytes'] / (1024 * 1024):7.1f} MB   startup {startup_text}")
+        if comparison["after"]["startup_seconds"] is None:
+            print(f"❌ The pruned build does not start; delete {PROFILE_NAME} or keep more formats")
+        return {"profile": profile, **comparison}
+    
+    def _run(
+        self,
+        cmd: List[str],
+        stage: str,
+        phases: List[Tuple[str, Pattern]] = ()
+    ) -> Tuple[int, List[str]]:
+        """
+        Run a build tool, returning (exit code, last lines of output)
+        
+        Output is processed line by line as it is produced: each line goes
+        to build/logs/<stage>.log and through a BuildMonitor, and only the
+        tail stays in memory. Phase changes are printed as they happen (with
+        stream_output, every line is echoed too) and the run is added to
+        the JSON build report.
+        """
+        log_name = re.sub(r"[^\w.-]+", "-", stage) + ".log"
+        log_path = self.build_dir / "logs" / log_name
+        log_path.parent.mkdir(parents=True, exist_ok=True)
+        monitor = BuildMonitor(phases)
+        
+        with open(log_path, "w", encoding="utf-8") as log, subprocess.Popen(
+            cmd, stdout=subprocess.PIPE, stderr=subprocess.STDOUT,
+            text=True, errors="replace", bufsize=1, env=self._tool_env()
+        ) as process:
+            for line in process.stdout:
+                log.write(line)
+                line = line.rstrip("\n")
+                entered = monitor.feed(line)
+                if self.stream_output:
+                    print(f"   {line}", flush=True)
+                elif entered:
+                    print(f"   ⏱️  {entered}...", flush=True)
+        monitor.finish(process.returncode)
+        
+        print(f"   ⏱️  {monitor.timings()} ({monitor.lines:,} lines, {monitor.warnings} warnings)")
+        self._add_report({"stage": stage, "command": cmd, "log": str(log_path), **monitor.report()})
+        return process.returncode, list(monitor.tail)
+    
+    def _stage(self, source: Path, target: Path, stage: str) -> StagingStats:
+        """Stage source for a packager with stage_tree, printing and reporting what was copied"""
+        stats = stage_tree(source, target)
+        print(f"   📁 Staged {stats.summary()}")
+        self._add_report({"stage": f"{stage}:staging", "source": str(source), **asdict(stats)})
+        return stats
+    
+    def _add_report(self, entry: Dict[str, Any]):
+        """Append a tool run to build/build-report.json (rewritten atomically)"""
+        self.reports.append(entry)
+        report = {
+            "app": self.app_name,
+            "version": self.version,
+            "platform": platform.system(),
+            "runs": self.reports,
+        }
+        path = self.build_dir / REPORT_NAME
+        temp = path.with_suffix(".tmp")
+        temp.write_text(json.dumps(report, indent=2))
+        os.replace(temp, path)
+    
     def _create_version_file(self) -> Path:
         """Create version file for Windows"""
         version_file = self.build_dir / "version.txt"
-        version_file.parent.mkdir(parents=True, exist_ok=True)
         
         content = f"""VSVersionInfo(
   ffi=FixedFileInfo(
@@ -144,14 +1543,12 @@ class AppBuilder:
     VarFileInfo([VarStruct(u'Translation', [1033, 1200])])
   ]
 )"""
-        
-        version_file.write_text(content)
-        return version_file
+
+        return self._write_if_changed(version_file, content)
     
     def _create_info_plist(self) -> Path:
         """Create Info.plist for macOS"""
         plist_file = self.build_dir / "Info.plist"
-        plist_file.parent.mkdir(parents=True, exist_ok=True)
         
         plist_content = f"""<?xml version="1.0" encoding="UTF-8"?>
 <!DOCTYPE plist PUBLIC "-//Apple//DTD PLIST 1.0//EN" "http://www.apple.com/DTDs/PropertyList-1.0.dtd">
@@ -183,9 +1580,8 @@ class AppBuilder:
     <string>public.app-category.graphics-design</string>
 </dict>
 </plist>"""
-        
-        plist_file.write_text(plist_content)
-        return plist_file
+
+        return self._write_if_changed(plist_file, plist_content)
     
     def create_dmg(self):
         """Create DMG for macOS distribution"""
@@ -195,13 +1591,17 @@ class AppBuilder:
         
         print("📦 Creating DMG...")
         
-        app_path = self.dist_dir / f"{self.app_name}.app"
+        app_path = self.bundle_dir / f"{self.app_name}.app"
         if not app_path.exists():
             print(f"❌ App not found at {app_path}")
             return False
         
         dmg_name = f"{self.app_name}-{self.version}.dmg"
         dmg_path = self.dist_dir / dmg_name
+        key = self._package_key(app_path)
+        if self._is_fresh("dmg", key, [dmg_path]):
+            return True
+        started = time.perf_counter()
         
         # Create DMG using create-dmg if available
         try:
@@ -219,9 +1619,10 @@ class AppBuilder:
             ]
             
             subprocess.run(cmd, check=True)
+            self._record("dmg", key, [dmg_path], time.perf_counter() - started)
             print(f"✅ DMG created: {dmg_path}")
             return True
-            
+        
         except (subprocess.CalledProcessError, FileNotFoundError):
             # Fallback to hdiutil
             print("   Using hdiutil fallback...")
@@ -231,8 +1632,8 @@ class AppBuilder:
                 shutil.rmtree(temp_dir)
             temp_dir.mkdir(parents=True)
             
-            # Copy app to staging
-            shutil.copytree(app_path, temp_dir / app_path.name)
+            # Stage app (clones on APFS instead of a full copy)
+            self._stage(app_path, temp_dir / app_path.name, "dmg")
             
             # Create DMG
             cmd = [
@@ -245,6 +1646,7 @@ class AppBuilder:
             ]
             
             subprocess.run(cmd, check=True)
+            self._record("dmg", key, [dmg_path], time.perf_counter() - started)
             print(f"✅ DMG created: {dmg_path}")
             return True
     
@@ -262,6 +1664,12 @@ class AppBuilder:
             print("❌ Inno Setup not found. Please install from jrsoftware.org")
             return False
         
+        installer_path = self.dist_dir / f"{self.app_name}-{self.version}-Setup.exe"
+        key = self._package_key(self.bundle_dir / self.app_name)
+        if self._is_fresh("installer", key, [installer_path]):
+            return True
+        started = time.perf_counter()
+        
         # Create installer script
         iss_script = self.build_dir / "installer.iss"
         iss_content = f"""; Inno Setup Script for ColorSnap Pro
@@ -278,7 +1686,7 @@ SolidCompression=yes
 WizardStyle=modern
 
 [Files]
-Source: "{self.dist_dir / self.app_name}\\*"; DestDir: "{{app}}"; Flags: ignoreversion recursesubdirs
+Source: "{self.bundle_dir / self.app_name}\\*"; DestDir: "{{app}}"; Flags: ignoreversion recursesubdirs
 
 [Icons]
 Name: "{{group}}\\{self.app_name}"; Filename: "{{app}}\\{self.app_name}.exe"
@@ -290,17 +1698,18 @@ Name: "desktopicon"; Description: "Create a desktop shortcut"; GroupDescription:
 [Run]
 Filename: "{{app}}\\{self.app_name}.exe"; Description: "Launch {self.app_name}"; Flags: nowait postinstall skipifsilent
 """
-        
+
         iss_script.write_text(iss_content)
         
         # Run Inno Setup
-        result = subprocess.run([str(iscc_path), str(iss_script)], capture_output=True, text=True)
+        returncode, tail = self._run([str(iscc_path), str(iss_script)], "installer")
         
-        if result.returncode == 0:
-            print(f"✅ Installer created: {self.dist_dir / f'{self.app_name}-{self.version}-Setup.exe'}")
+        if returncode == 0:
+            self._record("installer", key, [installer_path], time.perf_counter() - started)
+            print(f"✅ Installer created: {installer_path}")
             return True
         else:
-            print(f"❌ Installer creation failed:\n{result.stderr}")
+            print("❌ Installer creation failed:\n" + "\n".join(tail))
             return False
     
     def create_linux_appimage(self):
@@ -318,6 +1727,12 @@ Filename: "{{app}}\\{self.app_name}.exe"; Description: "Launch {self.app_name}";
             print("❌ appimagetool not found. Install from https://appimage.org/")
             return False
         
+        output_file = self.dist_dir / f"{self.app_name}-{self.version}-x86_64.AppImage"
+        key = self._package_key(self.bundle_dir / self.app_name)
+        if self._is_fresh("appimage", key, [output_file]):
+            return True
+        started = time.perf_counter()
+        
         appdir = self.build_dir / f"{self.app_name}.AppDir"
         if appdir.exists():
             shutil.rmtree(appdir)
@@ -325,15 +1740,11 @@ Filename: "{{app}}\\{self.app_name}.exe"; Description: "Launch {self.app_name}";
         appdir.mkdir(parents=True)
         
         # Create AppDir structure
-        (appdir / "usr" / "bin").mkdir(parents=True)
         (appdir / "usr" / "share" / "applications").mkdir(parents=True)
         (appdir / "usr" / "share" / "icons" / "hicolor" / "256x256" / "apps").mkdir(parents=True)
         
-        # Copy executable
-        shutil.copy(
-            self.dist_dir / self.app_name / self.app_name,
-            appdir / "usr" / "bin" / self.app_name
-        )
+        # Stage the bundle (executable and its _internal/ libraries) as usr/bin
+        self._stage(self.bundle_dir / self.app_name, appdir / "usr" / "bin", "appimage")
         
         # Create desktop entry
         desktop_entry = f"""[Desktop Entry]
@@ -344,7 +1755,7 @@ Type=Application
 Categories=Graphics;Design;
 Comment={self.description}
 """
-        
+
         (appdir / f"{self.app_name.lower()}.desktop").write_text(desktop_entry)
         (appdir / "usr" / "share" / "applications" / f"{self.app_name.lower()}.desktop").write_text(desktop_entry)
         
@@ -354,32 +1765,166 @@ HERE="$(dirname "$(readlink -f "${{0}}")")"
 export PATH="${{HERE}}/usr/bin:${{PATH}}"
 exec "${{HERE}}/usr/bin/{self.app_name}" "$@"
 """
-        
+
         (appdir / "AppRun").write_text(apprun)
         os.chmod(appdir / "AppRun", 0o755)
         
         # Build AppImage
-        output_file = self.dist_dir / f"{self.app_name}-{self.version}-x86_64.AppImage"
-        result = subprocess.run(
-            ["appimagetool", str(appdir), str(output_file)],
-            capture_output=True,
-            text=True
-        )
+        returncode, tail = self._run(["appimagetool", str(appdir), str(output_file)], "appimage")
         
-        if result.returncode == 0:
+        if returncode == 0:
+            self._record("appimage", key, [output_file], time.perf_counter() - started)
             print(f"✅ AppImage created: {output_file}")
             return True
         else:
-            print(f"❌ AppImage creation failed:\n{result.stderr}")
+            print("❌ AppImage creation failed:\n" + "\n".join(tail))
             return False
     
+    def freeze_startup(self, optimize: Optional[int] = None) -> Path:
+        """
+        Freeze the modules loaded at startup into dist/<app>-<version>-<tag>.pyz
+        
+        The archive holds sourceless bytecode, so it only runs on the
+        Python version it was built with (the tag in its name).
+        """
+        optimize = 2 if optimize is None else optimize
+        print("🧊 Freezing startup modules...")
+        modules = startup_modules(self.project_dir)
+        archive = self.dist_dir / f"{self.app_name}-{self.version}-{sys.implementation.cache_tag}.pyz"
+        freeze_modules(self.project_dir, modules, archive, optimize)
+        print(f"✅ {len(modules)} modules (optimize={optimize}) -> {archive} "
+              f"({archive.stat().st_size / 1024:.0f} KB)")
+        return archive
+    
+    def create_cached_launcher(self):
+        """
+        Single-file launcher that extracts the onedir bundle once
+        
+        PyInstaller's --onefile unpacks everything to a new temp directory
+        on every launch. This writes dist/<app>-<version>-cached instead: a
+        shell header followed by a tar.gz of the onedir bundle, unpacked
+        into ~/.cache/<app>/<version>-<hash>/ on first launch and run from
+        there afterwards (see launcher_script). Linux and macOS only.
+        """
+        if platform.system() == "Windows":
+            print("❌ Cached launcher needs a POSIX shell (Linux/macOS)")
+            return False
+        
+        print("📦 Creating cached launcher...")
+        bundle = self.bundle_dir / self.app_name
+        if not (bundle / self.app_name).exists():
+            print(f"❌ Onedir bundle not found at {bundle}")
+            return False
+        
+        launcher = self.dist_dir / f"{self.app_name}-{self.version}-cached"
+        key = stage_key(package=self._package_key(bundle), script=LAUNCHER_TEMPLATE, keep=LAUNCHER_KEEP_VERSIONS)
+        if self._is_fresh("cached", key, [launcher]):
+            return True
+        started = time.perf_counter()
+        
+        self.build_dir.mkdir(parents=True, exist_ok=True)
+        payload = self.build_dir / f"{self.app_name}.tar.gz"
+        write_tar_gz(bundle, payload, self.app_name, self.epoch)
+        
+        launcher.parent.mkdir(parents=True, exist_ok=True)
+        with open(launcher, "wb") as out, open(payload, "rb") as source:
+            out.write(launcher_script(self.app_name, self.version, file_digest(payload)))
+            shutil.copyfileobj(source, out, 1 << 20)
+        os.chmod(launcher, 0o755)
+        payload.unlink()
+        
+        self._record("cached", key, [launcher], time.perf_counter() - started)
+        print(f"✅ Cached launcher created: {launcher} ({launcher.stat().st_size / (1024 * 1024):.1f} MB)")
+        return True
+    
+    def benchmark_launch(self, runs: int = 3) -> Optional[Dict[str, float]]:
+        """
+        Median launch time of the PyInstaller onefile build and of the cached
+        launcher with an empty (cold) and a populated (warm) cache
+        
+        Builds what is missing under build/launch/; the cache lives in a
+        temporary directory so the user's cache is untouched.
+        """
+        work = self.build_dir / "launch"
+        onefile, onedir = (self._side_builder(work / label) for label in ("onefile", "onedir"))
+        onedir.dist_dir = onedir.bundle_dir
+        if not (onefile.build_pyinstaller(onefile=True) and onedir.build_pyinstaller()
+                and onedir.create_cached_launcher()):
+            return None
+        launcher = onedir.dist_dir / f"{self.app_name}-{self.version}-cached"
+        
+        results: Dict[str, Optional[float]] = {"onefile": measure_startup(onefile.executable_path(onefile=True), runs)}
+        with tempfile.TemporaryDirectory() as cache:
+            cold = []
+            for run in range(runs):
+                cold.append(measure_startup(launcher, 1, {"COLORSNAP_CACHE_DIR": os.path.join(cache, str(run))}))
+            results["cached (cold)"] = None if None in cold else statistics.median(cold)
+            results["cached (warm)"] = measure_startup(launcher, runs, {"COLORSNAP_CACHE_DIR": os.path.join(cache, "0")})
+        return results
+    
+    def bench(
+        self,
+        runs: int = BENCH_RUNS,
+        onefile: bool = False,
+        baseline_path: Optional[Path] = None,
+        tolerance: float = BENCH_TOLERANCE,
+        update_baseline: bool = False
+    ) -> bool:
+        """
+        Build, launch the artifact headless runs times and compare with the baseline
+        
+        Median time to first frame, peak RSS and bundle size are checked
+        against this platform's entry in bench_baseline.json; a metric more
+        than tolerance above its baseline is a regression. With no entry
+        for this platform (or update_baseline) the results become the
+        baseline instead. Returns False on a regression or a failed build
+        or launch.
+        """
+        if not self.build_pyinstaller(onefile=onefile):
+            return False
+        executable = self.executable_path(onefile)
+        
+        print(f"⏱️  Launching {executable.name} {runs}x offscreen (plus one warm-up)...")
+        metrics = bench_executable(executable, runs)
+        if metrics is None:
+            return False
+        metrics["bundle_bytes"] = bundle_size(executable if onefile else executable.parent)
+        summary = {metric: metrics[metric] for metric in BENCH_METRICS}
+        
+        path = baseline_path or self.project_dir / BASELINE_NAME
+        baselines = json.loads(path.read_text()) if path.exists() else {}
+        target = f"{platform_tag()}/{'onefile' if onefile else 'onedir'}"
+        baseline = baselines.get(target)
+        self._add_report({"stage": "bench", "target": target, **metrics, "baseline": baseline})
+        
+        if baseline is None or update_baseline:
+            baselines[target] = {**summary, "toolchain": self.toolchain()}
+            path.write_text(json.dumps(baselines, indent=2, sort_keys=True) + "\n")
+            print(f"📌 Baseline for {target} written to {path.name}")
+            for metric, value in summary.items():
+                if value is not None:
+                    print(f"   {metric:<20} {_format_metric(metric, value):>10}")
+            return True
+        
+        if baseline.get("toolchain") != self.toolchain():
+            print(f"⚠️  Baseline was recorded with a different toolchain: {baseline.get('toolchain')}")
+        rows = compare_to_baseline(summary, baseline, tolerance)
+        print_bench(rows, tolerance)
+        regressions = [row["metric"] for row in rows if row["regressed"]]
+        if regressions:
+            print(f"❌ Regression in {', '.join(regressions)} (re-record with --update-baseline if intended)")
+            return False
+        print("✅ No regressions")
+        return True
+    
     def run_all(self):
         """Run complete build process"""
         print(f"🚀 Building {self.app_name} v{self.version}")
         print(f"   Platform: {platform.system()}")
         print()
         
-        self.clean()
+        if not self.incremental:
+            self.clean()
         
         if not self.build_pyinstaller():
             return False
@@ -392,6 +1937,8 @@ exec "${{HERE}}/usr/bin/{self.app_name}" "$@"
         elif platform.system() == "Linux":
             self.create_linux_appimage()
         
+        self.print_cache_summary()
+        
         print()
         print("✨ Build complete!")
         print(f"   Output directory: {self.dist_dir}")
@@ -402,6 +1949,257 @@ exec "${{HERE}}/usr/bin/{self.app_name}" "$@"
             for f in sorted(self.dist_dir.iterdir()):
                 size = f.stat().st_size / (1024 * 1024)  # MB
                 print(f"   {f.name} ({size:.1f} MB)")
+        
+        return True
+
+
+# MARK: - Build Graph
+
+PYINSTALLER_TARGETS = {
+    "onedir": {"onefile": False, "windowed": True},
+    "onefile": {"onefile": True, "windowed": True},
+    "console": {"onefile": False, "windowed": False},
+}
+PACKAGERS = {"Linux": "appimage", "Darwin": "dmg", "Windows": "installer"}
+
+
+@dataclass
+class BuildTask:
+    """
+    One target in the build graph
+    
+    kind is "pyinstaller" or a packager ("appimage", "dmg", "installer");
+    a packager wraps the bundle built by its first dependency.
+    """
+    name: str
+    kind: str
+    options: Dict[str, bool] = field(default_factory=dict)
+    deps: Tuple[str, ...] = ()
+
+
+@dataclass
+class TaskResult:
+    """Outcome of a task; started/seconds are relative to the start of the run"""
+    name: str
+    status: str  # "ok", "failed" or "skipped"
+    started: float = 0.0
+    seconds: float = 0.0
+
+
+def default_targets(system: Optional[str] = None) -> List[BuildTask]:
+    """onedir, onefile and debug console bundles plus the platform's packagers"""
+    system = system or platform.system()
+    tasks = [BuildTask(name, "pyinstaller", dict(options)) for name, options in PYINSTALLER_TARGETS.items()]
+    packager = PACKAGERS.get(system)
+    if packager:
+        tasks.append(BuildTask(packager, packager, deps=("onedir",)))
+    if system != "Windows":
+        tasks.append(BuildTask("cached", "cached", deps=("onedir",)))
+    return tasks
+
+
+class PrefixedStream:
+    """
+    Text stream that prefixes every line with a task name
+    
+    Whole lines are written and flushed together, so lines from tasks
+    running in parallel interleave but never split.
+    """
+    
+    def __init__(self, stream, prefix: str):
+        self.stream = stream
+        self.prefix = prefix
+        self._partial = ""
+    
+    def write(self, text: str) -> int:
+        lines = (self._partial + text).split("\n")
+        self._partial = lines.pop()
+        if lines:
+            self.stream.write("".join(f"{self.prefix}{line}\n" for line in lines))
+            self.stream.flush()
+        return len(text)
+    
+    def flush(self):
+        self.stream.flush()
+    
+    def close(self):
+        if self._partial:
+            self.write("\n")
+
+
+def run_task(task: BuildTask, incremental: bool = False, **builder_options) -> bool:
+    """
+    Build one task with its own work directory (build/<task>)
+    
+    PyInstaller targets write to dist/<task>; packagers read the bundle of
+    their first dependency and write the package to dist/. builder_options
+    are passed on to AppBuilder (e.g. optimize).
+    """
+    project_dir = Path(__file__).parent
+    bundle_target = task.name if task.kind == "pyinstaller" else task.deps[0]
+    builder = AppBuilder(
+        incremental=incremental,
+        build_dir=project_dir / "build" / task.name,
+        bundle_dir=project_dir / "dist" / bundle_target,
+        stream_output=True,
+        **builder_options
+    )
+    if task.kind == "pyinstaller":
+        return builder.build_pyinstaller(**task.options)
+    return bool({
+        "appimage": builder.create_linux_appimage,
+        "dmg": builder.create_dmg,
+        "installer": builder.create_installer_windows,
+        "cached": builder.create_cached_launcher,
+    }[task.kind]())
+
+
+def _run_prefixed(runner: Callable[..., bool], task: BuildTask, incremental: bool,
+                  width: int, builder_options: Dict[str, Any]) -> Tuple[bool, float, float]:
+    """Run a task with prefixed output; returns (ok, wall-clock start, end)"""
+    stdout = sys.stdout
+    sys.stdout = PrefixedStream(stdout, f"[{task.name:<{width}}] ")
+    started = time.time()
+    try:
+        ok = runner(task, incremental, **builder_options)
+    except Exception as error:
+        print(f"❌ {type(error).__name__}: {error}")
+        ok = False
+    finally:
+        sys.stdout.close()
+        sys.stdout = stdout
+    return ok, started, time.time()
+
+
+class BuildGraph:
+    """
+    Runs build tasks in dependency order, independent tasks in parallel
+    
+    Each task runs in a worker process with its own work directory and
+    its output prefixed by its name. A task whose dependency fails is
+    skipped. builder_options (AppBuilder keyword arguments such as
+    optimize) apply to every task.
+    """
+    
+    def __init__(self, tasks: Iterable[BuildTask], incremental: bool = False,
+                 builder_options: Optional[Dict[str, Any]] = None):
+        self.tasks = {task.name: task for task in tasks}
+        self.incremental = incremental
+        self.builder_options = dict(builder_options or {})
+    
+    def select(self, names: Iterable[str]) -> "BuildGraph":
+        """Graph of the named targets and everything they depend on"""
+        selected: Dict[str, BuildTask] = {}
+        stack = list(names)
+        while stack:
+            name = stack.pop()
+            if name not in self.tasks:
+                raise ValueError(f"Unknown build target: {name}")
+            if name not in selected:
+                selected[name] = self.tasks[name]
+                stack.extend(self.tasks[name].deps)
+        return BuildGraph([task for task in self.tasks.values() if task.name in selected],
+                          self.incremental, self.builder_options)
+    
+    def order(self) -> List[BuildTask]:
+        """Tasks in dependency order; raises ValueError on unknown dependencies or cycles"""
+        ordered: List[BuildTask] = []
+        state: Dict[str, str] = {}
+        
+        def visit(name: str, parent: str):
+            if name not in self.tasks:
+                raise ValueError(f"{parent} depends on unknown target {name}")
+            if state.get(name) == "visiting":
+                raise ValueError(f"Dependency cycle through {name}")
+            if name not in state:
+                state[name] = "visiting"
+                for dep in self.tasks[name].deps:
+                    visit(dep, name)
+                state[name] = "done"
+                ordered.append(self.tasks[name])
+        
+        for name in self.tasks:
+            visit(name, name)
+        return ordered
+    
+    def run(
+        self,
+        workers: Optional[int] = None,
+        runner: Callable[..., bool] = run_task
+    ) -> List[TaskResult]:
+        """
+        Run every task, returning results in dependency order
+        
+        workers=0 runs tasks one after another in this process; otherwise
+        ready tasks are submitted to a process pool as their dependencies
+        finish.
+        """
+        pending = self.order()
+        width = max((len(name) for name in self.tasks), default=0)
+        results: Dict[str, TaskResult] = {}
+        run_started = time.time()
+        
+        def finish(task: BuildTask, outcome: Tuple[bool, float, float]):
+            ok, started, finished = outcome
+            results[task.name] = TaskResult(
+                task.name, "ok" if ok else "failed", started - run_started, finished - started
+            )
+        
+        def take_ready() -> List[BuildTask]:
+            # pending is in dependency order, so skips cascade in one pass
+            ready = []
+            for task in list(pending):
+                if all(dep in results for dep in task.deps):
+                    pending.remove(task)
+                    if all(results[dep].status == "ok" for dep in task.deps):
+                        ready.append(task)
+                    else:
+                        results[task.name] = TaskResult(task.name, "skipped")
+            return ready
+        
+        if workers == 0:
+            while pending:
+                for task in take_ready():
+                    finish(task, _run_prefixed(runner, task, self.incremental, width, self.builder_options))
+        else:
+            workers = workers or min(len(pending), os.cpu_count() or 1) or 1
+            with ProcessPoolExecutor(max_workers=workers) as pool:
+                running = {}
+                while pending or running:
+                    for task in take_ready():
+                        future = pool.submit(_run_prefixed, runner, task, self.incremental, width,
+                                             self.builder_options)
+                        running[future] = task
+                    if not running:
+                        continue
+                    done, _ = wait(running, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        task = running.pop(future)
+                        try:
+                            finish(task, future.result())
+                        except Exception as error:
+                            print(f"❌ {task.name}: {type(error).__name__}: {error}")
+                            results[task.name] = TaskResult(task.name, "failed")
+        
+        return [results[task.name] for task in self.order()]
+
+
+def print_timing_summary(results: List[TaskResult]):
+    """Per-task timing with a timeline bar, wall time and parallel speedup"""
+    wall = max((result.started + result.seconds for result in results), default=0.0)
+    busy = sum(result.seconds for result in results)
+    icons = {"ok": "✅", "failed": "❌", "skipped": "⏭️ "}
+    print(f"\n📊 Build summary: {wall:.1f}s wall, {busy:.1f}s of task time"
+          + (f" ({busy / wall:.1f}x parallel)" if wall > 0 else ""))
+    width = max((len(result.name) for result in results), default=0)
+    for result in results:
+        if result.status == "skipped":
+            print(f"   {icons['skipped']} {result.name:<{width}}  skipped")
+            continue
+        start = int(30 * result.started / wall) if wall else 0
+        length = max(1, int(30 * result.seconds / wall)) if wall else 1
+        bar = " " * start + "█" * length
+        print(f"   {icons[result.status]} {result.name:<{width}}  {result.seconds:6.1f}s  |{bar:<30}|")
 
 
 def main():
@@ -413,21 +2211,126 @@ def main():
     parser.add_argument("--installer", action="store_true", help="Create installer (Windows only)")
     parser.add_argument("--appimage", action="store_true", help="Create AppImage (Linux only)")
     parser.add_argument("--all", action="store_true", help="Run complete build process")
+    parser.add_argument("--incremental", action="store_true",
+                        help="Reuse previous outputs; rebuild only stages whose inputs changed")
+    parser.add_argument("--targets", nargs="?", const="all",
+                        help="Build targets in parallel: all, or a comma list of "
+                             f"{','.join(task.name for task in default_targets())}")
+    parser.add_argument("--jobs", type=int, default=None, help="Parallel build processes (0 = serial)")
+    parser.add_argument("--analyze", action="store_true",
+                        help=f"Report bundle size and import time, write {PROFILE_NAME} and compare")
+    parser.add_argument("--keep-formats", default=",".join(KEEP_IMAGE_FORMATS),
+                        help="Qt image format plugins --analyze keeps (comma list)")
+    parser.add_argument("--no-profile", action="store_true", help=f"Build without {PROFILE_NAME}")
+    parser.add_argument("--cached-onefile", action="store_true",
+                        help="Single-file launcher that extracts once to the user cache (Linux/macOS)")
+    parser.add_argument("--benchmark-launch", action="store_true",
+                        help="Compare onefile and cached launcher startup, cold and warm")
+    parser.add_argument("--optimize", type=int, choices=sorted(OPTIMIZE_FLAGS),
+                        help="Bytecode optimization level (bundled modules, --precompile, --freeze-startup)")
+    parser.add_argument("--precompile", action="store_true",
+                        help="Write __pycache__ bytecode for the app's modules (all levels unless --optimize)")
+    parser.add_argument("--freeze-startup", action="store_true",
+                        help="Freeze startup modules into one sourceless .pyz (python <file> runs the app)")
+    parser.add_argument("--benchmark-imports", action="store_true",
+                        help="Compare startup import time from source, pyc and a frozen archive")
+    parser.add_argument("--deterministic", action="store_true",
+                        help="Reproducible build (SOURCE_DATE_EPOCH from the last commit, normalized timestamps)")
+    parser.add_argument("--bench", nargs="?", type=int, const=BENCH_RUNS, metavar="RUNS",
+                        help=f"Build, launch headless RUNS times (default {BENCH_RUNS}) and fail on "
+                             f"regressions against {BASELINE_NAME}")
+    parser.add_argument("--baseline", type=Path, help=f"Baseline file for --bench (default: {BASELINE_NAME})")
+    parser.add_argument("--tolerance", type=float, default=BENCH_TOLERANCE,
+                        help="Allowed relative increase per metric for --bench (default 0.10 = 10%%)")
+    parser.add_argument("--update-baseline", action="store_true", help="Record --bench results as the new baseline")
+    parser.add_argument("--resources", action="store_true",
+                        help=f"Compile the resource bundle ({BUNDLE_NAME}) and list its entries")
+    parser.add_argument("--cache-dir", type=Path,
+                        help=f"Shared artifact cache to restore from and store to (default: ${CACHE_DIR_ENV})")
     
     args = parser.parse_args()
     
-    builder = AppBuilder()
+    if args.deterministic:
+        # Exported so parallel targets (worker processes) build the same way
+        os.environ["SOURCE_DATE_EPOCH"] = str(source_date_epoch(Path(__file__).parent))
+    if args.cache_dir:
+        os.environ[CACHE_DIR_ENV] = str(args.cache_dir.expanduser())
+    
+    builder = AppBuilder(incremental=args.incremental, use_profile=not args.no_profile, optimize=args.optimize)
     
     if args.clean:
         builder.clean()
         return
     
+    if args.analyze:
+        keep = [fmt.strip() for fmt in args.keep_formats.split(",") if fmt.strip()]
+        result = builder.analyze(keep_formats=keep)
+        sys.exit(0 if result and result["after"]["startup_seconds"] is not None else 1)
+    
+    if args.targets:
+        graph = BuildGraph(default_targets(), incremental=args.incremental,
+                           builder_options={"optimize": args.optimize, "use_profile": not args.no_profile})
+        if args.targets != "all":
+            try:
+                graph = graph.select(name.strip() for name in args.targets.split(","))
+            except ValueError as error:
+                parser.error(str(error))
+        print(f"🚀 Building {', '.join(graph.tasks)} for {platform.system()}")
+        results = graph.run(workers=args.jobs)
+        print_timing_summary(results)
+        sys.exit(0 if all(result.status == "ok" for result in results) else 1)
+    
     if args.all:
         builder.run_all()
         return
     
+    if args.bench:
+        passed = builder.bench(args.bench, onefile=args.onefile, baseline_path=args.baseline,
+                               tolerance=args.tolerance, update_baseline=args.update_baseline)
+        if args.incremental:
+            builder.print_cache_summary()
+        sys.exit(0 if passed else 1)
+    
+    if args.resources:
+        bundle = ResourceBundle(builder.build_resources())
+        for name in bundle.names():
+            print(f"   {name:<32} {len(bundle.data(name)):>6,} B")
+        bundle.close()
+        return
+    
+    if args.precompile:
+        levels = sorted(OPTIMIZE_FLAGS) if args.optimize is None else [args.optimize]
+        sources = [path for path in builder.source_files() if path.suffix == ".py"]
+        written = precompile_sources(sources, levels)
+        print(f"✅ Precompiled {len(sources)} modules at optimization level(s) {levels} ({written} files)")
+        return
+    
+    if args.freeze_startup:
+        builder.freeze_startup(args.optimize)
+        return
+    
+    if args.benchmark_imports:
+        optimize = 2 if args.optimize is None else args.optimize
+        results = benchmark_startup_imports(builder.project_dir, optimize=optimize)
+        print(f"📊 Startup imports of {ENTRY_MODULE} (median of 10, optimize={optimize})")
+        for label, seconds in results.items():
+            print(f"   {label:>6}: {seconds * 1000:6.1f} ms ({(results['source'] - seconds) * 1000:+.1f} ms saved)")
+        return
+    
+    if args.benchmark_launch:
+        results = builder.benchmark_launch()
+        if results is None:
+            sys.exit(1)
+        print("\n📊 Launch time (median, offscreen)")
+        for label, seconds in results.items():
+            print(f"   {label:>14}: " + (f"{seconds * 1000:.0f} ms" if seconds is not None else "failed"))
+        return
+    
     # Individual builds
-    if args.dmg:
+    if args.cached_onefile:
+        if builder.build_pyinstaller():
+            builder.create_cached_launcher()
+    elif args.dmg:
         builder.build_pyinstaller()
         builder.create_dmg()
     elif args.installer:
@@ -442,6 +2345,9 @@ def main():
             onefile=args.onefile,
             windowed=not args.console
         )
+    
+    if args.incremental:
+        builder.print_cache_summary()
 
 
 if __name__ == "__main__":
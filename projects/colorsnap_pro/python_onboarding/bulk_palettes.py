@@ -0,0 +1,337 @@
+"""
+ColorSnap Pro - Bulk Palette Extraction
+Headless AI Palette extraction over folders of images, decoded and clustered in a process pool
+
+Usage:
+    python bulk_palettes.py references/ -o palettes.jsonl            # resumes if interrupted
+    find . -name "*.jpg" | python bulk_palettes.py - -o palettes.jsonl
+    python bulk_palettes.py --benchmark
+
+Each output line is one image:
+    {"path": "...", "width": 4032, "height": 3024, "colors": ["#3B82F6", ...], "weights": [0.41, ...]}
+Images that fail to decode get an "error" field instead of colors.
+
+Progress is tracked in a checkpoint file next to the output. Every line in
+it is "<output offset>\\t<path>", appended only after the output line for
+that path is flushed; on resume the output is truncated to the last
+checkpointed offset and the checkpointed paths are skipped. The checkpoint
+is removed once a run finishes, so only interrupted runs resume.
+"""
+
+import os
+import sys
+import json
+import time
+import argparse
+import tempfile
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from dataclasses import dataclass
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Set, Tuple
+
+import numpy as np
+from PIL import Image
+
+from palette_extractor import DEFAULT_SAMPLE_SIZE, PaletteExtractor, synthetic_frame
+
+
+IMAGE_EXTENSIONS = {".jpg", ".jpeg", ".png", ".webp", ".bmp", ".gif", ".tif", ".tiff"}
+# Longest side images are decoded at; JPEGs are scaled down during decoding
+DEFAULT_MAX_SIDE = 512
+# Paths sent to a worker per task
+DEFAULT_BATCH_SIZE = 8
+CHECKPOINT_SUFFIX = ".checkpoint"
+
+
+# MARK: - Input
+
+def iter_image_paths(inputs: Iterable[str], stdin=None) -> Iterator[str]:
+    """
+    Yield absolute image paths lazily
+    
+    Inputs are files, directories (walked recursively in sorted order) or
+    "-" for one path per line on stdin.
+    """
+    for source in inputs:
+        if source == "-":
+            for line in stdin or sys.stdin:
+                if line.strip():
+                    yield os.path.abspath(line.strip())
+        elif os.path.isdir(source):
+            for root, dirs, files in os.walk(source):
+                dirs.sort()
+                for name in sorted(files):
+                    if os.path.splitext(name)[1].lower() in IMAGE_EXTENSIONS:
+                        yield os.path.abspath(os.path.join(root, name))
+        else:
+            yield os.path.abspath(source)
+
+
+def _batched(paths: Iterator[str], size: int) -> Iterator[List[str]]:
+    batch = []
+    for path in paths:
+        batch.append(path)
+        if len(batch) == size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+
+# MARK: - Workers
+
+def load_image(path: str, max_side: int = DEFAULT_MAX_SIDE) -> Tuple[np.ndarray, Tuple[int, int]]:
+    """
+    Decode an image as an RGB uint8 array no larger than roughly max_side
+    
+    Returns (pixels, original (width, height)). JPEGs use Pillow's draft
+    mode so the decoder itself skips most of the DCT work.
+    """
+    with Image.open(path) as image:
+        size = image.size
+        image.draft("RGB", (max_side, max_side))
+        image = image.convert("RGB")
+        factor = max(image.size) // max_side
+        if factor > 1:
+            image = image.reduce(factor)
+        return np.asarray(image), size
+
+
+def extract_file(
+    path: str,
+    n_colors: int = 5,
+    sample_size: int = DEFAULT_SAMPLE_SIZE,
+    max_side: int = DEFAULT_MAX_SIDE
+) -> Dict[str, Any]:
+    """Palette record for one image (runs in a worker process)"""
+    try:
+        pixels, (width, height) = load_image(path, max_side)
+    except Exception as error:
+        return {"path": path, "error": f"{type(error).__name__}: {error}"}
+    
+    # A fresh seeded extractor per image keeps results independent of scheduling
+    palette = PaletteExtractor(n_colors=n_colors, sample_size=sample_size).extract(pixels)
+    return {
+        "path": path,
+        "width": width,
+        "height": height,
+        "colors": [color.hex for color in palette],
+        "weights": [round(color.weight, 4) for color in palette],
+    }
+
+
+def _extract_batch(paths: List[str], options: Dict[str, int]) -> List[Dict[str, Any]]:
+    return [extract_file(path, **options) for path in paths]
+
+
+# MARK: - Checkpoint
+
+class Checkpoint:
+    """
+    Append-only log of finished paths and the output offset after each
+    
+    The output is only ever trusted up to the last logged offset, so a
+    crash between writing a result and logging it loses that result
+    instead of duplicating it.
+    """
+    
+    def __init__(self, path: str):
+        self.path = path
+        self.done: Set[str] = set()
+        self.offset = 0
+        if os.path.exists(path):
+            with open(path, "r", encoding="utf-8") as handle:
+                for line in handle:
+                    offset, tab, done_path = line.rstrip("\n").partition("\t")
+                    if tab and offset.isdigit():
+                        self.offset = int(offset)
+                        self.done.add(done_path)
+        self._handle = open(path, "a", encoding="utf-8")
+    
+    def record(self, entries: List[Tuple[int, str]]):
+        """Log (offset, path) pairs once their output lines are flushed"""
+        self._handle.write("".join(f"{offset}\t{path}\n" for offset, path in entries))
+        self._handle.flush()
+        for offset, path in entries:
+            self.offset = offset
+            self.done.add(path)
+    
+    def close(self):
+        self._handle.close()
+
+
+# MARK: - Runner
+
+@dataclass
+class RunStats:
+    """Counts and timing for one extraction run"""
+    processed: int = 0
+    failed: int = 0
+    skipped: int = 0
+    elapsed: float = 0.0
+    
+    @property
+    def images_per_sec(self) -> float:
+        return self.processed / self.elapsed if self.elapsed > 0 else 0.0
+
+
+def run(
+    inputs: Iterable[str],
+    output: str,
+    checkpoint: Optional[str] = None,
+    workers: Optional[int] = None,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+    n_colors: int = 5,
+    sample_size: int = DEFAULT_SAMPLE_SIZE,
+    max_side: int = DEFAULT_MAX_SIDE,
+    progress_interval: float = 5.0,
+    stdin=None
+) -> RunStats:
+    """
+    Extract palettes for every input image into a JSONL file
+    
+    workers=0 runs in this process; otherwise batches of paths go to a
+    process pool with at most two batches per worker in flight, so memory
+    stays flat however many paths are streamed in. Lines are written in
+    completion order. Raises FileExistsError rather than overwrite a
+    non-empty output that has no checkpoint to resume from, and
+    FileNotFoundError if the output is missing results the checkpoint
+    records. The checkpoint is removed when the run finishes.
+    """
+    options = {"n_colors": n_colors, "sample_size": sample_size, "max_side": max_side}
+    checkpoint = checkpoint or output + CHECKPOINT_SUFFIX
+    resuming = os.path.exists(checkpoint)
+    if not resuming and os.path.exists(output) and os.path.getsize(output) > 0:
+        raise FileExistsError(f"{output} has results but no checkpoint ({checkpoint}); use --restart to overwrite it")
+    state = Checkpoint(checkpoint)
+    stats = RunStats()
+    
+    # Drop anything written after the last checkpointed result
+    if resuming:
+        if not os.path.exists(output) or os.path.getsize(output) < state.offset:
+            state.close()
+            raise FileNotFoundError(f"{output} is missing results recorded in {checkpoint}; use --restart to start over")
+        with open(output, "ab") as handle:
+            handle.truncate(state.offset)
+    out = open(output, "ab")
+    
+    def pending() -> Iterator[str]:
+        for path in iter_image_paths(inputs, stdin):
+            if path in state.done:
+                stats.skipped += 1
+            else:
+                yield path
+    
+    started = time.perf_counter()
+    last_report = started
+    
+    def write(records: List[Dict[str, Any]]):
+        nonlocal last_report
+        entries = []
+        for record in records:
+            out.write(json.dumps(record, separators=(",", ":")).encode("utf-8") + b"\n")
+            entries.append((out.tell(), record["path"]))
+            stats.processed += 1
+            stats.failed += "error" in record
+        out.flush()
+        state.record(entries)
+        
+        now = time.perf_counter()
+        if progress_interval and now - last_report >= progress_interval:
+            last_report = now
+            print(f"   {stats.processed:,} images, {stats.processed / (now - started):.1f} images/sec", flush=True)
+    
+    try:
+        batches = _batched(pending(), batch_size)
+        if workers == 0:
+            for batch in batches:
+                write(_extract_batch(batch, options))
+        else:
+            workers = workers or os.cpu_count() or 1
+            with ProcessPoolExecutor(max_workers=workers) as pool:
+                limit = 2 * workers
+                in_flight = set()
+                for batch in batches:
+                    if len(in_flight) >= limit:
+                        finished, in_flight = wait(in_flight, return_when=FIRST_COMPLETED)
+                        for future in finished:
+                            write(future.result())
+                    in_flight.add(pool.submit(_extract_batch, batch, options))
+                for future in in_flight:
+                    write(future.result())
+    finally:
+        stats.elapsed = time.perf_counter() - started
+        out.close()
+        state.close()
+    os.remove(checkpoint)
+    return stats
+
+
+# MARK: - Benchmarks
+
+def benchmark(images: int = 200, size: Tuple[int, int] = (1920, 1080), workers: Optional[int] = None) -> Dict[str, Dict[str, float]]:
+    """images/sec for synthetic JPEGs, in-process vs. process pool"""
+    results = {}
+    with tempfile.TemporaryDirectory() as folder:
+        for i in range(images):
+            Image.fromarray(synthetic_frame(*size, seed=i)).save(os.path.join(folder, f"{i:05d}.jpg"), quality=90)
+        
+        for label, worker_count in [("in-process", 0), ("process pool", workers)]:
+            output = os.path.join(folder, f"{label.replace(' ', '_')}.jsonl")
+            stats = run([folder], output, workers=worker_count, progress_interval=0)
+            results[label] = {
+                "images": stats.processed,
+                "seconds": round(stats.elapsed, 2),
+                "images_per_sec": round(stats.images_per_sec, 1),
+            }
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Extract AI palettes from folders of images")
+    parser.add_argument("inputs", nargs="*", help="Image files, folders, or - to read paths from stdin")
+    parser.add_argument("-o", "--output", default="palettes.jsonl", help="JSONL output (appended on resume)")
+    parser.add_argument("--checkpoint", help=f"Checkpoint file (default: <output>{CHECKPOINT_SUFFIX})")
+    parser.add_argument("--workers", type=int, default=None, help="Worker processes (0 = in-process)")
+    parser.add_argument("--batch-size", type=int, default=DEFAULT_BATCH_SIZE, help="Images per worker task")
+    parser.add_argument("--colors", type=int, default=5, help="Palette size")
+    parser.add_argument("--sample-size", type=int, default=DEFAULT_SAMPLE_SIZE, help="Pixels clustered per image")
+    parser.add_argument("--max-side", type=int, default=DEFAULT_MAX_SIDE, help="Longest side images are decoded at")
+    parser.add_argument("--restart", action="store_true", help="Ignore any checkpoint and start over")
+    parser.add_argument("--benchmark", action="store_true", help="Benchmark on synthetic images")
+    args = parser.parse_args()
+    
+    if args.benchmark:
+        print("📊 Bulk palette extraction (200 synthetic 1080p JPEGs)")
+        for label, stats in benchmark(workers=args.workers).items():
+            print(f"   {label:>12}: {stats['images_per_sec']:.1f} images/sec ({stats['seconds']:.2f}s)")
+        return
+    if not args.inputs:
+        parser.error("no inputs given")
+    
+    checkpoint = args.checkpoint or args.output + CHECKPOINT_SUFFIX
+    if args.restart:
+        for path in (args.output, checkpoint):
+            if os.path.exists(path):
+                os.remove(path)
+    
+    print(f"🚀 Extracting palettes -> {args.output}")
+    try:
+        stats = run(
+            args.inputs, args.output, checkpoint,
+            workers=args.workers,
+            batch_size=args.batch_size,
+            n_colors=args.colors,
+            sample_size=args.sample_size,
+            max_side=args.max_side
+        )
+    except (FileExistsError, FileNotFoundError) as error:
+        parser.error(str(error))
+    
+    status = "❌" if stats.failed else "✅"
+    print(f"\n{status} {stats.processed:,} images in {stats.elapsed:.1f}s "
+          f"({stats.images_per_sec:.1f} images/sec), {stats.failed} failed, {stats.skipped:,} already done")
+    sys.exit(1 if stats.failed else 0)
+
+
+if __name__ == "__main__":
+    main()
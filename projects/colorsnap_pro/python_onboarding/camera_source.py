@@ -0,0 +1,419 @@
+"""
+ColorSnap Pro - Camera Frame Pipeline
+Frame sources captured on a worker thread into a bounded queue that drops stale frames
+
+Usage:
+    from camera_source import open_source, CaptureThread, CameraPreview
+    
+    capture = CaptureThread(open_source("synthetic:640x480@30"))   # or an image/animation/video path
+    preview = CameraPreview()
+    preview.attach(capture)
+    capture.start()
+    ...
+    preview.frame_array()   # current frame, shared with the picker without copying
+    preview.stats()         # capture -> display latency and dropped frames
+    capture.stop()
+
+Frames are read-only H x W x 4 RGBA uint8 arrays. Nothing downstream
+copies them: the preview wraps the buffer in a QImage and the color
+sampler reads the same array. Only freezing a frame (FrameStore) copies.
+Video files are decoded with OpenCV, an optional dependency.
+"""
+
+import os
+import time
+import threading
+from collections import deque
+from dataclasses import dataclass
+from typing import Deque, Dict, Optional, Tuple
+
+import numpy as np
+from PyQt6 import sip
+from PyQt6.QtWidgets import QWidget
+from PyQt6.QtCore import QRectF, QThread, pyqtSignal
+from PyQt6.QtGui import QColor, QImage, QLinearGradient, QPainter, QPainterPath
+
+from color_space import hsl_to_rgb, to_uint8
+
+
+DEFAULT_SIZE = (640, 480)
+DEFAULT_FPS = 30.0
+# Frames the queue holds before dropping the oldest
+DEFAULT_QUEUE_SIZE = 2
+# Displayed frames kept for latency statistics
+LATENCY_WINDOW = 1024
+# Paths opened as VideoSource rather than FileSource
+VIDEO_EXTENSIONS = {".mp4", ".m4v", ".mov", ".avi", ".mkv", ".webm"}
+
+
+@dataclass
+class Frame:
+    """A captured frame and when it was captured (time.perf_counter())"""
+    index: int
+    captured: float
+    pixels: np.ndarray
+
+
+# MARK: - Sources
+
+class FrameSource:
+    """Produces frames on the capture thread; read() returns None when the source ends"""
+    fps: float = DEFAULT_FPS
+    
+    def read(self) -> Optional[np.ndarray]:
+        raise NotImplementedError
+    
+    def close(self):
+        pass
+
+
+def _read_only(pixels: np.ndarray) -> np.ndarray:
+    pixels.flags.writeable = False
+    return pixels
+
+
+class SyntheticSource(FrameSource):
+    """
+    Moving hue bands over a vertical lightness ramp; no camera needed
+    
+    The pattern is rendered once at twice the frame width and every frame
+    is a view into it, so producing a frame costs nothing.
+    """
+    
+    def __init__(self, width: int = DEFAULT_SIZE[0], height: int = DEFAULT_SIZE[1],
+                 fps: float = DEFAULT_FPS, speed: int = 4):
+        self.width = width
+        self.height = height
+        self.fps = fps
+        self.speed = speed
+        self._offset = 0
+        
+        hue = np.arange(2 * width) * 720.0 / (2 * width)
+        lightness = 0.25 + 0.5 * np.arange(height)[:, None] / max(height - 1, 1)
+        hsl = np.stack(np.broadcast_arrays(hue[None, :], 0.75, lightness), axis=-1)
+        band = np.empty((height, 2 * width, 4), dtype=np.uint8)
+        band[..., :3] = to_uint8(hsl_to_rgb(hsl))
+        band[..., 3] = 255
+        self._band = _read_only(band)
+    
+    def read(self) -> np.ndarray:
+        frame = self._band[:, self._offset:self._offset + self.width]
+        self._offset = (self._offset + self.speed) % self.width
+        return frame
+
+
+class FileSource(FrameSource):
+    """
+    Still image or animation (GIF/APNG/WebP, e.g. screenshot_tool recordings)
+    
+    Animations play at their own frame duration unless fps is given; frames
+    are decoded on the capture thread as they are needed.
+    """
+    
+    def __init__(self, path: str, fps: Optional[float] = None, loop: bool = True):
+        from PIL import Image
+        
+        self.path = path
+        self.loop = loop
+        self._image = Image.open(path)
+        self._frames = getattr(self._image, "n_frames", 1)
+        self._index = 0
+        self._still: Optional[np.ndarray] = None
+        duration = self._image.info.get("duration") or 0
+        self.fps = fps or (1000.0 / duration if self._frames > 1 and duration > 0 else DEFAULT_FPS)
+    
+    def read(self) -> Optional[np.ndarray]:
+        if self._frames == 1:
+            if self._still is None:
+                self._still = _read_only(np.asarray(self._image.convert("RGBA")))
+            return self._still
+        
+        if self._index == self._frames:
+            if not self.loop:
+                return None
+            self._index = 0
+        self._image.seek(self._index)
+        self._index += 1
+        return _read_only(np.array(self._image.convert("RGBA")))
+    
+    def close(self):
+        self._image.close()
+
+
+class VideoSource(FrameSource):
+    """
+    Video file decoded with OpenCV (pip install opencv-python-headless)
+    
+    Plays at the file's frame rate unless fps is given; frames are decoded
+    on the capture thread as they are needed.
+    """
+    
+    def __init__(self, path: str, fps: Optional[float] = None, loop: bool = True):
+        try:
+            import cv2
+        except ImportError:
+            raise ImportError(
+                f"Playing {path} needs OpenCV; install opencv-python-headless "
+                "or use an image/animation source"
+            ) from None
+        
+        self.path = path
+        self.loop = loop
+        self._cv2 = cv2
+        self._capture = cv2.VideoCapture(path)
+        if not self._capture.isOpened():
+            raise ValueError(f"Cannot decode video: {path}")
+        self.fps = fps or self._capture.get(cv2.CAP_PROP_FPS) or DEFAULT_FPS
+    
+    def read(self) -> Optional[np.ndarray]:
+        ok, frame = self._capture.read()
+        if not ok and self.loop:
+            self._capture.set(self._cv2.CAP_PROP_POS_FRAMES, 0)
+            ok, frame = self._capture.read()
+        if not ok:
+            return None
+        return _read_only(self._cv2.cvtColor(frame, self._cv2.COLOR_BGR2RGBA))
+    
+    def close(self):
+        self._capture.release()
+
+
+def open_source(spec: str = "synthetic") -> FrameSource:
+    """
+    Frame source from a spec string
+    
+    "synthetic", "synthetic:1280x720" or "synthetic:1280x720@60" for the
+    test pattern; paths with a VIDEO_EXTENSIONS suffix are videos, and any
+    other path is an image or animation.
+    """
+    if spec == "synthetic" or spec.startswith("synthetic:"):
+        _, _, options = spec.partition(":")
+        size, _, fps = options.partition("@")
+        width, height = (int(v) for v in size.split("x")) if size else DEFAULT_SIZE
+        return SyntheticSource(width, height, float(fps) if fps else DEFAULT_FPS)
+    if not os.path.exists(spec):
+        raise ValueError(f"Unknown frame source: {spec}")
+    if os.path.splitext(spec)[1].lower() in VIDEO_EXTENSIONS:
+        return VideoSource(spec)
+    return FileSource(spec)
+
+
+# MARK: - Queue
+
+class FrameQueue:
+    """
+    Bounded, thread-safe frame queue that never blocks the producer
+    
+    When full, the oldest frame is dropped. Consumers take the newest frame
+    with latest(), which discards anything older as stale.
+    """
+    
+    def __init__(self, maxsize: int = DEFAULT_QUEUE_SIZE):
+        if maxsize < 1:
+            raise ValueError("Queue size must be at least 1")
+        self.maxsize = maxsize
+        self._frames: Deque[Frame] = deque()
+        self._lock = threading.Lock()
+        self.pushed = 0
+        self.dropped = 0
+    
+    def __len__(self) -> int:
+        return len(self._frames)
+    
+    def put(self, frame: Frame) -> bool:
+        """Add a frame; returns True if the queue was empty (the consumer needs waking)"""
+        with self._lock:
+            was_empty = not self._frames
+            if len(self._frames) == self.maxsize:
+                self._frames.popleft()
+                self.dropped += 1
+            self._frames.append(frame)
+            self.pushed += 1
+        return was_empty
+    
+    def latest(self) -> Optional[Frame]:
+        """Take the newest frame, dropping older ones"""
+        with self._lock:
+            if not self._frames:
+                return None
+            frame = self._frames.pop()
+            self.dropped += len(self._frames)
+            self._frames.clear()
+        return frame
+
+
+# MARK: - Capture Thread
+
+class CaptureThread(QThread):
+    """
+    Reads a FrameSource at its frame rate into a FrameQueue
+    
+    frame_available is emitted only when a frame lands in an empty queue,
+    so a slow consumer never has a backlog of queued signals; it just
+    finds the newest frame when it gets to it.
+    """
+    frame_available = pyqtSignal()
+    
+    def __init__(self, source: FrameSource, queue_size: int = DEFAULT_QUEUE_SIZE, parent=None):
+        super().__init__(parent)
+        self.source = source
+        self.queue = FrameQueue(queue_size)
+        self._stop = threading.Event()
+    
+    def run(self):
+        interval = 1.0 / self.source.fps
+        due = time.perf_counter()
+        index = 0
+        try:
+            while not self._stop.is_set():
+                pixels = self.source.read()
+                if pixels is None:
+                    break
+                if self.queue.put(Frame(index, time.perf_counter(), pixels)):
+                    self.frame_available.emit()
+                index += 1
+                
+                due += interval
+                delay = due - time.perf_counter()
+                if delay > 0:
+                    self._stop.wait(delay)
+                else:
+                    # Behind schedule: carry on from now instead of bursting
+                    due = time.perf_counter()
+        finally:
+            self.source.close()
+    
+    def stop(self):
+        """Stop capturing and wait for the thread to exit"""
+        self._stop.set()
+        self.wait()
+
+
+# MARK: - Preview
+
+def frame_image(pixels: np.ndarray) -> QImage:
+    """QImage over an RGBA frame's buffer (no copy; keep the array alive)"""
+    height, width = pixels.shape[:2]
+    return QImage(
+        sip.voidptr(pixels.ctypes.data), width, height,
+        pixels.strides[0], QImage.Format.Format_RGBA8888
+    )
+
+
+class CameraPreview(QWidget):
+    """
+    Paints the newest captured frame, scaled to the widget
+    
+    Records capture -> display latency for every frame it paints.
+    """
+    
+    def __init__(self, radius: float = 16.0, parent=None):
+        super().__init__(parent)
+        self.radius = radius
+        self._queue: Optional[FrameQueue] = None
+        self._frame: Optional[Frame] = None
+        self._image: Optional[QImage] = None
+        self._painted_index = -1
+        self._skipped = 0
+        self._latencies: Deque[float] = deque(maxlen=LATENCY_WINDOW)
+        self._display_times: Deque[float] = deque(maxlen=LATENCY_WINDOW)
+    
+    def attach(self, capture: CaptureThread):
+        """Show frames from a capture thread"""
+        self._queue = capture.queue
+        capture.frame_available.connect(self._on_frame_available)
+    
+    def frame_array(self) -> Optional[np.ndarray]:
+        """The frame currently shown (read-only, shared)"""
+        return self._frame.pixels if self._frame else None
+    
+    def _on_frame_available(self):
+        frame = self._queue.latest()
+        if frame is None:
+            return
+        if self._frame is not None and self._frame.index != self._painted_index:
+            self._skipped += 1
+        self._frame = frame
+        self._image = frame_image(frame.pixels)
+        self.update()
+    
+    def paintEvent(self, event):
+        painter = QPainter(self)
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+        path = QPainterPath()
+        path.addRoundedRect(QRectF(self.rect()), self.radius, self.radius)
+        painter.setClipPath(path)
+        
+        if self._image is None:
+            placeholder = QLinearGradient(0, 0, self.width(), self.height())
+            placeholder.setColorAt(0, QColor("#ff6b6b"))
+            placeholder.setColorAt(0.5, QColor("#feca57"))
+            placeholder.setColorAt(1, QColor("#48dbfb"))
+            painter.fillRect(self.rect(), placeholder)
+        else:
+            painter.drawImage(QRectF(self.rect()), self._image)
+        painter.end()
+        
+        if self._frame is not None and self._frame.index != self._painted_index:
+            now = time.perf_counter()
+            self._painted_index = self._frame.index
+            self._latencies.append(now - self._frame.captured)
+            self._display_times.append(now)
+    
+    def stats(self) -> Dict[str, float]:
+        """Capture -> display latency, display rate and dropped frames"""
+        queue = self._queue
+        captured = queue.pushed if queue is not None else 0
+        dropped = (queue.dropped if queue is not None else 0) + self._skipped
+        if not self._latencies:
+            return {"captured": captured, "dropped": dropped, "median_ms": 0.0, "p95_ms": 0.0, "display_fps": 0.0}
+        
+        latencies = np.array(self._latencies) * 1000
+        display_fps = 0.0
+        if len(self._display_times) > 1:
+            span = self._display_times[-1] - self._display_times[0]
+            if span > 0:
+                display_fps = (len(self._display_times) - 1) / span
+        return {
+            "captured": captured,
+            "dropped": dropped,
+            "median_ms": round(float(np.median(latencies)), 2),
+            "p95_ms": round(float(np.percentile(latencies, 95)), 2),
+            "display_fps": round(display_fps, 1),
+        }
+
+
+# MARK: - Benchmarks
+
+def benchmark(seconds: float = 3.0, size: Tuple[int, int] = (1280, 720), fps: float = 120.0,
+              display_hz: float = 60.0) -> Dict[str, float]:
+    """Capture faster than the display refreshes and measure latency and drops"""
+    from PyQt6.QtWidgets import QApplication
+    
+    app = QApplication.instance() or QApplication([])
+    preview = CameraPreview()
+    preview.resize(640, 360)
+    preview.show()
+    capture = CaptureThread(SyntheticSource(*size, fps=fps))
+    preview.attach(capture)
+    
+    capture.start()
+    deadline = time.perf_counter() + seconds
+    while time.perf_counter() < deadline:
+        app.processEvents()
+        preview.repaint()
+        time.sleep(1.0 / display_hz)
+    capture.stop()
+    app.processEvents()
+    
+    stats = preview.stats()
+    preview.close()
+    return stats
+
+
+# Benchmark
+if __name__ == "__main__":
+    stats = benchmark()
+    print("📊 Camera pipeline (1280x720 @ 120 fps captured, 60 Hz display)")
+    print(f"   capture -> display: median {stats['median_ms']:.2f} ms, p95 {stats['p95_ms']:.2f} ms")
+    print(f"   {stats['captured']} captured, {stats['dropped']} dropped, {stats['display_fps']:.1f} fps displayed")
@@ -0,0 +1,153 @@
+"""
+ColorSnap Pro - Contrast Checker
+WCAG 2.x relative luminance and contrast ratios for single pairs or whole palettes
+
+Usage:
+    from color_contrast import contrast_ratio, contrast_matrix, wcag_masks
+    
+    contrast_ratio("#FFFFFF", "#3B82F6")   # 3.68
+    ratios = contrast_matrix(rgb_array)    # (N, N) float32
+    masks = wcag_masks(ratios)             # {"AA": bool (N, N), "AAA": ...}
+"""
+
+import time
+from typing import Dict, Iterator, Optional, Tuple, Union
+
+import numpy as np
+
+from color_space import RGB, SRGB_TO_LINEAR_LUT, hex_to_rgb, relative_luminance_scalar
+
+
+# WCAG 2.x thresholds
+AA_NORMAL = 4.5
+AA_LARGE = 3.0
+AAA_NORMAL = 7.0
+AAA_LARGE = 4.5
+
+# Rec. 709 luminance weights
+_LUMINANCE_WEIGHTS = np.array([0.2126, 0.7152, 0.0722])
+
+
+def relative_luminance(colors: np.ndarray) -> np.ndarray:
+    """Relative luminance for (..., 3) uint8 colors via the linearization LUT"""
+    colors = np.asarray(colors, dtype=np.uint8)
+    return SRGB_TO_LINEAR_LUT[colors] @ _LUMINANCE_WEIGHTS
+
+
+def contrast_ratio(first: Union[str, RGB], second: Union[str, RGB]) -> float:
+    """Contrast ratio (1-21) between two colors"""
+    first = hex_to_rgb(first) if isinstance(first, str) else tuple(first)
+    second = hex_to_rgb(second) if isinstance(second, str) else tuple(second)
+    lighter, darker = sorted((relative_luminance_scalar(first), relative_luminance_scalar(second)), reverse=True)
+    return (lighter + 0.05) / (darker + 0.05)
+
+
+def wcag_levels(ratio: float) -> Dict[str, bool]:
+    """Which WCAG levels a single ratio passes"""
+    return {
+        "AA": ratio >= AA_NORMAL,
+        "AA_large": ratio >= AA_LARGE,
+        "AAA": ratio >= AAA_NORMAL,
+        "AAA_large": ratio >= AAA_LARGE,
+    }
+
+
+# MARK: - Palette Matrices
+
+def matrix_nbytes(count: int, dtype=np.float32) -> int:
+    """Memory needed for a count x count contrast matrix"""
+    return count * count * np.dtype(dtype).itemsize
+
+
+def _log_offsets(colors: np.ndarray) -> np.ndarray:
+    """log(L + 0.05) per color; ratios become exp(|a - b|)"""
+    return np.log(relative_luminance(colors) + 0.05).astype(np.float32)
+
+
+def contrast_matrix(colors: np.ndarray, out: Optional[np.ndarray] = None) -> np.ndarray:
+    """
+    Pairwise contrast ratios for a palette in one vectorized pass
+    
+    Computed as exp(|log(La + 0.05) - log(Lb + 0.05)|) directly into a
+    single float32 (N, N) buffer, so peak memory is matrix_nbytes(N)
+    plus O(N). Pass `out` to reuse a preallocated buffer.
+    """
+    logs = _log_offsets(colors)
+    if out is None:
+        out = np.empty((len(logs), len(logs)), dtype=np.float32)
+    np.subtract(logs[:, None], logs[None, :], out=out)
+    np.abs(out, out=out)
+    np.exp(out, out=out)
+    return out
+
+
+def iter_contrast_blocks(colors: np.ndarray, block_rows: int = 1024) -> Iterator[Tuple[slice, np.ndarray]]:
+    """
+    Yield (row_slice, ratios) blocks of the contrast matrix
+    
+    Memory is bounded by block_rows x N float32 regardless of palette size.
+    The yielded buffer is reused between blocks.
+    """
+    logs = _log_offsets(colors)
+    count = len(logs)
+    buffer = np.empty((min(block_rows, count), count), dtype=np.float32)
+    
+    for start in range(0, count, block_rows):
+        stop = min(start + block_rows, count)
+        block = buffer[:stop - start]
+        np.subtract(logs[start:stop, None], logs[None, :], out=block)
+        np.abs(block, out=block)
+        np.exp(block, out=block)
+        yield slice(start, stop), block
+
+
+def wcag_masks(ratios: np.ndarray, large_text: bool = False) -> Dict[str, np.ndarray]:
+    """Boolean AA/AAA pass masks for a ratio matrix"""
+    if large_text:
+        return {"AA": ratios >= AA_LARGE, "AAA": ratios >= AAA_LARGE}
+    return {"AA": ratios >= AA_NORMAL, "AAA": ratios >= AAA_NORMAL}
+
+
+def pass_counts(colors: np.ndarray, large_text: bool = False, block_rows: int = 1024) -> Dict[str, np.ndarray]:
+    """Per color, how many palette colors it passes AA/AAA against (streams blocks)"""
+    aa_threshold, aaa_threshold = (AA_LARGE, AAA_LARGE) if large_text else (AA_NORMAL, AAA_NORMAL)
+    count = len(colors)
+    aa = np.zeros(count, dtype=np.int64)
+    aaa = np.zeros(count, dtype=np.int64)
+    
+    for rows, block in iter_contrast_blocks(colors, block_rows):
+        aa[rows] = np.count_nonzero(block >= aa_threshold, axis=1)
+        aaa[rows] = np.count_nonzero(block >= aaa_threshold, axis=1)
+    return {"AA": aa, "AAA": aaa}
+
+
+# MARK: - Benchmarks
+
+def benchmark(sizes=(256, 1024, 4096)) -> Dict[int, Dict[str, float]]:
+    """Full-matrix time and memory per palette size"""
+    rng = np.random.default_rng(0)
+    results = {}
+    for size in sizes:
+        colors = rng.integers(0, 256, (size, 3), dtype=np.uint8)
+        out = np.empty((size, size), dtype=np.float32)
+        
+        started = time.perf_counter()
+        contrast_matrix(colors, out=out)
+        masks = wcag_masks(out)
+        elapsed = time.perf_counter() - started
+        
+        results[size] = {
+            "ms": round(elapsed * 1000, 2),
+            "pairs_per_sec": round(size * size / elapsed),
+            "matrix_mb": round(matrix_nbytes(size) / 2 ** 20, 1),
+            "aa_pairs": int(masks["AA"].sum()),
+        }
+    return results
+
+
+# Benchmark
+if __name__ == "__main__":
+    print("📊 Contrast matrix")
+    for size, stats in benchmark().items():
+        print(f"   {size:>5} colors: {stats['ms']:.1f} ms ({stats['pairs_per_sec']:,} pairs/s, "
+              f"{stats['matrix_mb']} MB)")
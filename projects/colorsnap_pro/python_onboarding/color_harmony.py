@@ -0,0 +1,128 @@
+"""
+ColorSnap Pro - Color Harmony
+Complementary, analogous, triadic, tetradic and split-complementary color sets
+
+Usage:
+    from color_harmony import harmony, harmony_batch
+    
+    harmony("#3B82F6", "triadic")                 # ['#3B82F6', '#F63B82', '#82F63B']
+    harmony_batch(rgb_array, "analogous", "oklch")  # (N, 3, 3) uint8
+"""
+
+import time
+from typing import Dict, List, Union
+
+import numpy as np
+
+from color_space import (
+    RGB, hex_to_rgb, rgb_to_hex, to_unit, to_uint8,
+    rgb_to_hsl, hsl_to_rgb, rgb_to_oklch, oklch_to_rgb,
+    rgb_to_hsl_scalar, hsl_to_rgb_scalar, rgb_to_oklch_scalar, oklch_to_rgb_scalar
+)
+
+
+# Hue offsets (degrees) from the base color for each scheme
+SCHEMES: Dict[str, List[float]] = {
+    "complementary": [180.0],
+    "analogous": [-30.0, 30.0],
+    "triadic": [120.0, 240.0],
+    "tetradic": [90.0, 180.0, 270.0],
+    "split_complementary": [150.0, 210.0],
+}
+
+SPACES = ("hsl", "oklch")
+
+
+def _offsets(scheme: str) -> List[float]:
+    if scheme not in SCHEMES:
+        raise ValueError(f"Unknown harmony scheme: {scheme} (expected one of {', '.join(SCHEMES)})")
+    return SCHEMES[scheme]
+
+
+def harmony_batch(colors: np.ndarray, scheme: str, space: str = "hsl") -> np.ndarray:
+    """
+    Harmony sets for many base colors at once
+    
+    Args:
+        colors: (N, 3) uint8 RGB base colors
+        scheme: One of SCHEMES
+        space: 'hsl' or 'oklch' (perceptually even hue rotation)
+    
+    Returns:
+        (N, 1 + len(offsets), 3) uint8 array; index 0 is the base color
+    """
+    offsets = np.array([0.0] + _offsets(scheme))
+    colors = np.asarray(colors, dtype=np.uint8).reshape(-1, 3)
+    
+    if space == "hsl":
+        hsl = rgb_to_hsl(to_unit(colors))
+        rotated = np.repeat(hsl[:, None, :], len(offsets), axis=1)
+        rotated[..., 0] = (rotated[..., 0] + offsets) % 360.0
+        result = to_uint8(hsl_to_rgb(rotated))
+    elif space == "oklch":
+        lch = rgb_to_oklch(to_unit(colors))
+        rotated = np.repeat(lch[:, None, :], len(offsets), axis=1)
+        rotated[..., 2] = (rotated[..., 2] + offsets) % 360.0
+        result = to_uint8(oklch_to_rgb(rotated))
+    else:
+        raise ValueError(f"Unknown color space: {space} (expected one of {', '.join(SPACES)})")
+    
+    # Keep the base color exact rather than round-tripped
+    result[:, 0] = colors
+    return result
+
+
+def harmony(color: Union[str, RGB], scheme: str, space: str = "hsl") -> List[str]:
+    """Scalar fast path: harmony set for a single color as hex codes (base first)"""
+    rgb = hex_to_rgb(color) if isinstance(color, str) else tuple(color)
+    offsets = _offsets(scheme)
+    result = [rgb_to_hex(rgb)]
+    
+    if space == "hsl":
+        hue, saturation, lightness = rgb_to_hsl_scalar(rgb)
+        for offset in offsets:
+            result.append(rgb_to_hex(hsl_to_rgb_scalar(((hue + offset) % 360.0, saturation, lightness))))
+    elif space == "oklch":
+        lightness, chroma, hue = rgb_to_oklch_scalar(rgb)
+        for offset in offsets:
+            result.append(rgb_to_hex(oklch_to_rgb_scalar((lightness, chroma, (hue + offset) % 360.0))))
+    else:
+        raise ValueError(f"Unknown color space: {space} (expected one of {', '.join(SPACES)})")
+    
+    return result
+
+
+# MARK: - Benchmarks
+
+def benchmark(batch_size: int = 10000, scalar_count: int = 2000) -> Dict[str, Dict[str, float]]:
+    """Colors per second for the batched and scalar paths in each space"""
+    rng = np.random.default_rng(0)
+    colors = rng.integers(0, 256, (batch_size, 3), dtype=np.uint8)
+    singles = [tuple(int(c) for c in color) for color in colors[:scalar_count]]
+    
+    results = {}
+    for space in SPACES:
+        started = time.perf_counter()
+        harmony_batch(colors, "tetradic", space)
+        batch_time = time.perf_counter() - started
+        
+        started = time.perf_counter()
+        for color in singles:
+            harmony(color, "tetradic", space)
+        scalar_time = time.perf_counter() - started
+        
+        results[space] = {
+            "batch_colors_per_sec": round(batch_size / batch_time),
+            "scalar_colors_per_sec": round(scalar_count / scalar_time),
+            "scalar_us_per_color": round(scalar_time / scalar_count * 1e6, 2),
+        }
+    return results
+
+
+# Benchmark
+if __name__ == "__main__":
+    print("📊 Color harmony (tetradic)")
+    for space, stats in benchmark().items():
+        print(f"   {space:>5}: batch {stats['batch_colors_per_sec']:,} colors/s, "
+              f"scalar {stats['scalar_colors_per_sec']:,} colors/s "
+              f"({stats['scalar_us_per_color']} µs/color)")
@@ -0,0 +1,435 @@
+"""
+ColorSnap Pro - Color Space Conversions
+Vectorized sRGB, linear RGB, XYZ, CIELAB, HSL and OKLab/OKLCH conversions shared by the color tools
+
+Array functions take and return float arrays shaped (..., 3); sRGB and
+linear values are in 0-1, hue is in degrees. Most kernels accept
+dtype=np.float32 to run in single precision. 8-bit colors go through
+lookup tables (rgb8_to_linear, linear_to_rgb8) instead of evaluating the
+sRGB transfer function per channel. Scalar helpers avoid NumPy overhead
+when only one color is involved.
+
+Usage:
+    python color_space.py    # conversions/sec microbenchmarks
+"""
+
+import math
+import time
+from typing import Dict, Iterable, List, Tuple
+
+import numpy as np
+
+
+RGB = Tuple[int, int, int]
+
+
+# MARK: - Hex
+
+def hex_to_rgb(hex_code: str) -> RGB:
+    """Parse '#RRGGBB', 'RRGGBB' or '#RGB'"""
+    value = hex_code.lstrip("#")
+    if len(value) == 3:
+        value = "".join(c * 2 for c in value)
+    if len(value) != 6:
+        raise ValueError(f"Invalid hex color: {hex_code}")
+    return int(value[0:2], 16), int(value[2:4], 16), int(value[4:6], 16)
+
+
+def rgb_to_hex(rgb: Iterable[int]) -> str:
+    """Format an RGB triple as '#RRGGBB'"""
+    red, green, blue = rgb
+    return f"#{int(red):02X}{int(green):02X}{int(blue):02X}"
+
+
+# Nibble value per ASCII byte (255 = not a hex digit)
+_HEX_DIGITS = np.full(256, 255, dtype=np.uint8)
+for _digit in "0123456789ABCDEF":
+    _HEX_DIGITS[ord(_digit)] = _HEX_DIGITS[ord(_digit.lower())] = int(_digit, 16)
+
+
+def hex_to_rgb_array(hex_codes: Iterable[str]) -> np.ndarray:
+    """Parse many hex codes into an (N, 3) uint8 array"""
+    hex_codes = list(hex_codes)
+    
+    # Fast path: all '#RRGGBB', decoded as one byte buffer
+    joined = "".join(hex_codes)
+    if len(joined) == 7 * len(hex_codes) and joined.isascii():
+        chars = np.frombuffer(joined.encode("ascii"), dtype=np.uint8).reshape(-1, 7)
+        nibbles = _HEX_DIGITS[chars[:, 1:]]
+        if np.all(chars[:, 0] == ord("#")) and np.all(nibbles != 255):
+            return (nibbles[:, 0::2] << 4) | nibbles[:, 1::2]
+    
+    return np.array([hex_to_rgb(code) for code in hex_codes], dtype=np.uint8).reshape(-1, 3)
+
+
+def rgb_array_to_hex(rgb: np.ndarray) -> List[str]:
+    """Format an (N, 3) uint8 array as hex codes"""
+    packed = (rgb[..., 0].astype(np.uint32) << 16) | (rgb[..., 1].astype(np.uint32) << 8) | rgb[..., 2]
+    return [f"#{value:06X}" for value in packed.ravel().tolist()]
+
+
+def to_unit(rgb: np.ndarray, dtype=np.float64) -> np.ndarray:
+    """uint8 RGB to float 0-1"""
+    return np.asarray(rgb, dtype=dtype) / dtype(255.0)
+
+
+def to_uint8(rgb: np.ndarray) -> np.ndarray:
+    """Float 0-1 RGB to uint8, clipping out-of-gamut values"""
+    return np.clip(np.rint(rgb * 255.0), 0, 255).astype(np.uint8)
+
+
+# MARK: - sRGB Transfer Function
+
+def srgb_to_linear(rgb: np.ndarray, dtype=np.float64) -> np.ndarray:
+    rgb = np.asarray(rgb, dtype=dtype)
+    return np.where(rgb <= 0.04045, rgb / dtype(12.92), ((rgb + dtype(0.055)) / dtype(1.055)) ** dtype(2.4))
+
+
+def linear_to_srgb(linear: np.ndarray, dtype=np.float64) -> np.ndarray:
+    linear = np.clip(np.asarray(linear, dtype=dtype), 0.0, None)
+    return np.where(
+        linear <= 0.0031308, linear * dtype(12.92), dtype(1.055) * linear ** dtype(1 / 2.4) - dtype(0.055)
+    )
+
+
+def _srgb_to_linear_scalar(c: float) -> float:
+    return c / 12.92 if c <= 0.04045 else ((c + 0.055) / 1.055) ** 2.4
+
+
+def _linear_to_srgb_scalar(c: float) -> float:
+    c = max(c, 0.0)
+    return c * 12.92 if c <= 0.0031308 else 1.055 * c ** (1 / 2.4) - 0.055
+
+
+# MARK: - 8-bit Lookup Tables
+
+# Linear value for every 8-bit sRGB channel value
+SRGB_TO_LINEAR_LUT = srgb_to_linear(np.arange(256) / 255.0)
+SRGB_TO_LINEAR_LUT_F32 = SRGB_TO_LINEAR_LUT.astype(np.float32)
+
+# 8-bit sRGB value per 16-bit quantized linear value. The steepest part of
+# the curve (near black) moves less than one 8-bit step per 1/65535, so
+# this matches to_uint8(linear_to_srgb(x)) to within one level.
+LINEAR_LUT_STEPS = 65535
+LINEAR_TO_SRGB8_LUT = to_uint8(linear_to_srgb(np.arange(LINEAR_LUT_STEPS + 1) / LINEAR_LUT_STEPS))
+
+
+def rgb8_to_linear(rgb: np.ndarray, dtype=np.float64) -> np.ndarray:
+    """uint8 sRGB to linear 0-1 via the 256-entry table"""
+    table = SRGB_TO_LINEAR_LUT_F32 if dtype is np.float32 else SRGB_TO_LINEAR_LUT
+    return table[np.asarray(rgb, dtype=np.uint8)]
+
+
+def linear_to_rgb8(linear: np.ndarray) -> np.ndarray:
+    """Linear 0-1 to uint8 sRGB via the 16-bit table, clipping out-of-gamut values"""
+    scaled = np.asarray(linear) * LINEAR_LUT_STEPS + 0.5
+    np.clip(scaled, 0, LINEAR_LUT_STEPS, out=scaled)
+    return LINEAR_TO_SRGB8_LUT[scaled.astype(np.intp)]
+
+
+# MARK: - HSL
+
+def rgb_to_hsl(rgb: np.ndarray, dtype=np.float64) -> np.ndarray:
+    """RGB 0-1 to HSL (hue degrees, saturation and lightness 0-1)"""
+    rgb = np.asarray(rgb, dtype=dtype)
+    red, green, blue = rgb[..., 0], rgb[..., 1], rgb[..., 2]
+    high = rgb.max(axis=-1)
+    low = rgb.min(axis=-1)
+    chroma = high - low
+    lightness = (high + low) / dtype(2)
+    
+    safe_chroma = np.where(chroma == 0, dtype(1), chroma)
+    hue = np.select(
+        [high == red, high == green],
+        [((green - blue) / safe_chroma) % dtype(6), (blue - red) / safe_chroma + dtype(2)],
+        (red - green) / safe_chroma + dtype(4)
+    ) * dtype(60)
+    hue = np.where(chroma == 0, dtype(0), hue)
+    
+    denominator = 1 - np.abs(2 * lightness - 1)
+    saturation = np.where(denominator == 0, dtype(0), chroma / np.where(denominator == 0, dtype(1), denominator))
+    return np.stack([hue, saturation, lightness], axis=-1)
+
+
+def hsl_to_rgb(hsl: np.ndarray, dtype=np.float64) -> np.ndarray:
+    """HSL (hue degrees) to RGB 0-1"""
+    hsl = np.asarray(hsl, dtype=dtype)
+    hue, saturation, lightness = hsl[..., 0] % dtype(360), hsl[..., 1], hsl[..., 2]
+    a = saturation * np.minimum(lightness, 1 - lightness)
+    
+    def channel(n):
+        k = (n + hue / dtype(30)) % dtype(12)
+        return lightness - a * np.clip(np.minimum(k - 3, 9 - k), -1, 1)
+    
+    return np.stack([channel(0), channel(8), channel(4)], axis=-1)
+
+
+# MARK: - XYZ / CIELAB
+
+# Linear sRGB to CIE XYZ, D65 white
+_LINEAR_TO_XYZ = np.array([
+    [0.4124564, 0.3575761, 0.1804375],
+    [0.2126729, 0.7151522, 0.0721750],
+    [0.0193339, 0.1191920, 0.9503041],
+])
+_XYZ_TO_LINEAR = np.linalg.inv(_LINEAR_TO_XYZ)
+D65_WHITE = np.array([0.95047, 1.0, 1.08883])
+
+_LAB_EPSILON = (6 / 29) ** 3
+_LAB_SLOPE = 3 * (6 / 29) ** 2
+
+
+def _cast(matrix: np.ndarray, dtype) -> np.ndarray:
+    return matrix if dtype is np.float64 else matrix.astype(dtype)
+
+
+def linear_to_xyz(linear: np.ndarray, dtype=np.float64) -> np.ndarray:
+    return np.asarray(linear, dtype=dtype) @ _cast(_LINEAR_TO_XYZ.T, dtype)
+
+
+def xyz_to_linear(xyz: np.ndarray, dtype=np.float64) -> np.ndarray:
+    return np.asarray(xyz, dtype=dtype) @ _cast(_XYZ_TO_LINEAR.T, dtype)
+
+
+def xyz_to_lab(xyz: np.ndarray, dtype=np.float64) -> np.ndarray:
+    """CIE XYZ to CIELAB (L 0-100), D65 white"""
+    t = np.asarray(xyz, dtype=dtype) / _cast(D65_WHITE, dtype)
+    f = np.where(t > _LAB_EPSILON, np.cbrt(t), t / dtype(_LAB_SLOPE) + dtype(4 / 29))
+    return np.stack([
+        116 * f[..., 1] - 16,
+        500 * (f[..., 0] - f[..., 1]),
+        200 * (f[..., 1] - f[..., 2]),
+    ], axis=-1)
+
+
+def lab_to_xyz(lab: np.ndarray, dtype=np.float64) -> np.ndarray:
+    """CIELAB to CIE XYZ, D65 white"""
+    lab = np.asarray(lab, dtype=dtype)
+    fy = (lab[..., 0] + 16) / dtype(116)
+    f = np.stack([fy + lab[..., 1] / dtype(500), fy, fy - lab[..., 2] / dtype(200)], axis=-1)
+    t = np.where(f > 6 / 29, f ** 3, dtype(_LAB_SLOPE) * (f - dtype(4 / 29)))
+    return t * _cast(D65_WHITE, dtype)
+
+
+def rgb_to_lab(rgb: np.ndarray, dtype=np.float64) -> np.ndarray:
+    """RGB 0-1 to CIELAB"""
+    return xyz_to_lab(linear_to_xyz(srgb_to_linear(rgb, dtype), dtype), dtype)
+
+
+def lab_to_rgb(lab: np.ndarray, dtype=np.float64) -> np.ndarray:
+    """CIELAB to RGB 0-1 (out-of-gamut values are clipped by to_uint8)"""
+    return linear_to_srgb(xyz_to_linear(lab_to_xyz(lab, dtype), dtype), dtype)
+
+
+def rgb8_to_lab(rgb: np.ndarray, dtype=np.float64) -> np.ndarray:
+    """uint8 RGB to CIELAB, linearized through the lookup table"""
+    return xyz_to_lab(linear_to_xyz(rgb8_to_linear(rgb, dtype), dtype), dtype)
+
+
+# MARK: - OKLab / OKLCH
+
+_LINEAR_TO_LMS = np.array([
+    [0.4122214708, 0.5363325363, 0.0514459929],
+    [0.2119034982, 0.6806995451, 0.1073969566],
+    [0.0883024619, 0.2817188376, 0.6299787005],
+])
+_LMS_TO_OKLAB = np.array([
+    [0.2104542553, 0.7936177850, -0.0040720468],
+    [1.9779984951, -2.4285922050, 0.4505937099],
+    [0.0259040371, 0.7827717662, -0.8086757660],
+])
+_OKLAB_TO_LMS = np.linalg.inv(_LMS_TO_OKLAB)
+_LMS_TO_LINEAR = np.linalg.inv(_LINEAR_TO_LMS)
+
+
+def linear_to_oklab(linear: np.ndarray, dtype=np.float64) -> np.ndarray:
+    lms = np.asarray(linear, dtype=dtype) @ _cast(_LINEAR_TO_LMS.T, dtype)
+    return np.cbrt(lms) @ _cast(_LMS_TO_OKLAB.T, dtype)
+
+
+def oklab_to_linear(lab: np.ndarray, dtype=np.float64) -> np.ndarray:
+    lms = np.asarray(lab, dtype=dtype) @ _cast(_OKLAB_TO_LMS.T, dtype)
+    return (lms ** 3) @ _cast(_LMS_TO_LINEAR.T, dtype)
+
+
+def oklab_to_oklch(lab: np.ndarray) -> np.ndarray:
+    lab = np.asarray(lab, dtype=np.float64)
+    chroma = np.hypot(lab[..., 1], lab[..., 2])
+    hue = np.degrees(np.arctan2(lab[..., 2], lab[..., 1])) % 360.0
+    return np.stack([lab[..., 0], chroma, hue], axis=-1)
+
+
+def oklch_to_oklab(lch: np.ndarray) -> np.ndarray:
+    lch = np.asarray(lch, dtype=np.float64)
+    hue = np.radians(lch[..., 2])
+    return np.stack([lch[..., 0], lch[..., 1] * np.cos(hue), lch[..., 1] * np.sin(hue)], axis=-1)
+
+
+def rgb8_to_oklab(rgb: np.ndarray, dtype=np.float64) -> np.ndarray:
+    """uint8 RGB to OKLab, linearized through the lookup table"""
+    return linear_to_oklab(rgb8_to_linear(rgb, dtype), dtype)
+
+
+def rgb_to_oklch(rgb: np.ndarray) -> np.ndarray:
+    """RGB 0-1 to OKLCH (hue degrees)"""
+    return oklab_to_oklch(linear_to_oklab(srgb_to_linear(rgb)))
+
+
+def oklch_to_rgb(lch: np.ndarray) -> np.ndarray:
+    """OKLCH to RGB 0-1 (out-of-gamut values are clipped by to_uint8)"""
+    return linear_to_srgb(oklab_to_linear(oklch_to_oklab(lch)))
+
+
+# MARK: - Scalar Fast Paths
+
+def rgb_to_oklch_scalar(rgb: RGB) -> Tuple[float, float, float]:
+    """Pure-Python OKLCH for a single uint8 color"""
+    linear = [_LINEAR_LUT_LIST[c] for c in rgb]
+    lms = [math.copysign(abs(v) ** (1 / 3), v) for v in (
+        sum(m * c for m, c in zip(row, linear)) for row in _LINEAR_TO_LMS_LIST
+    )]
+    lightness, a, b = (sum(m * c for m, c in zip(row, lms)) for row in _LMS_TO_OKLAB_LIST)
+    return lightness, math.hypot(a, b), math.degrees(math.atan2(b, a)) % 360.0
+
+
+def oklch_to_rgb_scalar(lch: Tuple[float, float, float]) -> RGB:
+    """Pure-Python OKLCH to a clipped uint8 color"""
+    lightness, chroma, hue = lch
+    a, b = chroma * math.cos(math.radians(hue)), chroma * math.sin(math.radians(hue))
+    lms = [sum(m * c for m, c in zip(row, (lightness, a, b))) ** 3 for row in _OKLAB_TO_LMS_LIST]
+    linear = (sum(m * c for m, c in zip(row, lms)) for row in _LMS_TO_LINEAR_LIST)
+    return tuple(min(255, max(0, round(_linear_to_srgb_scalar(c) * 255))) for c in linear)
+
+
+def rgb_to_lab_scalar(rgb: RGB) -> Tuple[float, float, float]:
+    """Pure-Python CIELAB for a single uint8 color"""
+    linear = [_LINEAR_LUT_LIST[c] for c in rgb]
+    fx, fy, fz = (
+        t ** (1 / 3) if t > _LAB_EPSILON else t / _LAB_SLOPE + 4 / 29
+        for t in (sum(m * c for m, c in zip(row, linear)) / white
+                  for row, white in zip(_LINEAR_TO_XYZ_LIST, _D65_WHITE_LIST))
+    )
+    return 116 * fy - 16, 500 * (fx - fy), 200 * (fy - fz)
+
+
+def rgb_to_hsl_scalar(rgb: RGB) -> Tuple[float, float, float]:
+    """Pure-Python HSL for a single uint8 color, step for step as rgb_to_hsl"""
+    red, green, blue = rgb[0] / 255.0, rgb[1] / 255.0, rgb[2] / 255.0
+    high, low = max(red, green, blue), min(red, green, blue)
+    chroma = high - low
+    lightness = (high + low) / 2.0
+    if chroma == 0:
+        hue = 0.0
+    elif high == red:
+        hue = ((green - blue) / chroma) % 6.0 * 60.0
+    elif high == green:
+        hue = ((blue - red) / chroma + 2.0) * 60.0
+    else:
+        hue = ((red - green) / chroma + 4.0) * 60.0
+    denominator = 1 - abs(2 * lightness - 1)
+    saturation = 0.0 if denominator == 0 else chroma / denominator
+    return hue, saturation, lightness
+
+
+def hsl_to_rgb_scalar(hsl: Tuple[float, float, float]) -> RGB:
+    """Pure-Python HSL to a clipped uint8 color, step for step as hsl_to_rgb"""
+    hue, saturation, lightness = hsl
+    sector = hue % 360.0 / 30.0
+    a = saturation * (lightness if lightness < 1 - lightness else 1 - lightness)
+    rgb = []
+    for n in (0, 8, 4):
+        k = (n + sector) % 12.0
+        step = k - 3 if k - 3 < 9 - k else 9 - k
+        step = -1 if step < -1 else 1 if step > 1 else step
+        value = round((lightness - a * step) * 255.0)
+        rgb.append(0 if value < 0 else 255 if value > 255 else value)
+    return tuple(rgb)
+
+
+def relative_luminance_scalar(rgb: RGB) -> float:
+    """WCAG relative luminance for a single uint8 color"""
+    red, green, blue = rgb
+    return 0.2126 * _LINEAR_LUT_LIST[red] + 0.7152 * _LINEAR_LUT_LIST[green] + 0.0722 * _LINEAR_LUT_LIST[blue]
+
+
+# Plain lists for the scalar paths (indexing NumPy arrays per element is slow)
+_LINEAR_LUT_LIST = SRGB_TO_LINEAR_LUT.tolist()
+_LINEAR_TO_LMS_LIST = _LINEAR_TO_LMS.tolist()
+_LMS_TO_OKLAB_LIST = _LMS_TO_OKLAB.tolist()
+_OKLAB_TO_LMS_LIST = _OKLAB_TO_LMS.tolist()
+_LMS_TO_LINEAR_LIST = _LMS_TO_LINEAR.tolist()
+_LINEAR_TO_XYZ_LIST = _LINEAR_TO_XYZ.tolist()
+_D65_WHITE_LIST = D65_WHITE.tolist()
+
+
+# MARK: - Benchmarks
+
+def _per_second(function, count: int, repeats: int) -> int:
+    """Best-of-repeats conversions per second"""
+    best = float("inf")
+    for _ in range(repeats):
+        started = time.perf_counter()
+        function()
+        best = min(best, time.perf_counter() - started)
+    return round(count / best)
+
+
+def benchmark(array_size: int = 1_000_000, scalar_count: int = 20000, repeats: int = 3) -> Dict[str, Dict[str, int]]:
+    """
+    Conversions per second for each kernel
+    
+    Array rows convert array_size colors per call in float64 and float32.
+    Scalar rows convert scalar_count colors one call at a time, through the
+    array kernel and through the pure-Python fast path.
+    """
+    rng = np.random.default_rng(0)
+    rgb8 = rng.integers(0, 256, (array_size, 3), dtype=np.uint8)
+    unit, unit32 = to_unit(rgb8), to_unit(rgb8, np.float32)
+    linear = srgb_to_linear(unit)
+    singles = [tuple(color) for color in rgb8[:scalar_count].tolist()]
+    single_units = [np.array(color) / 255.0 for color in singles]
+    
+    arrays = {
+        "srgb_to_linear": (lambda: srgb_to_linear(unit), lambda: srgb_to_linear(unit32, np.float32)),
+        "rgb8_to_linear (LUT)": (lambda: rgb8_to_linear(rgb8), lambda: rgb8_to_linear(rgb8, np.float32)),
+        "linear_to_srgb -> uint8": (lambda: to_uint8(linear_to_srgb(linear)), None),
+        "linear_to_rgb8 (LUT)": (lambda: linear_to_rgb8(linear), None),
+        "rgb_to_hsl": (lambda: rgb_to_hsl(unit), lambda: rgb_to_hsl(unit32, np.float32)),
+        "rgb_to_lab": (lambda: rgb_to_lab(unit), lambda: rgb_to_lab(unit32, np.float32)),
+        "rgb8_to_lab (LUT)": (lambda: rgb8_to_lab(rgb8), lambda: rgb8_to_lab(rgb8, np.float32)),
+        "rgb8_to_oklab (LUT)": (lambda: rgb8_to_oklab(rgb8), lambda: rgb8_to_oklab(rgb8, np.float32)),
+    }
+    results = {}
+    for name, (run64, run32) in arrays.items():
+        results[name] = {"float64": _per_second(run64, array_size, repeats)}
+        if run32 is not None:
+            results[name]["float32"] = _per_second(run32, array_size, repeats)
+    
+    scalars = {
+        "rgb_to_hsl (scalar)": (
+            lambda: [rgb_to_hsl(color) for color in single_units],
+            lambda: [rgb_to_hsl_scalar(color) for color in singles],
+        ),
+        "rgb_to_lab (scalar)": (
+            lambda: [rgb_to_lab(color) for color in single_units],
+            lambda: [rgb_to_lab_scalar(color) for color in singles],
+        ),
+        "rgb_to_oklch (scalar)": (
+            lambda: [rgb_to_oklch(color) for color in single_units],
+            lambda: [rgb_to_oklch_scalar(color) for color in singles],
+        ),
+    }
+    for name, (via_array, fast_path) in scalars.items():
+        results[name] = {
+            "array_kernel": _per_second(via_array, scalar_count, repeats),
+            "fast_path": _per_second(fast_path, scalar_count, repeats),
+        }
+    return results
+
+
+# Benchmark
+if __name__ == "__main__":
+    print("📊 Color conversions per second")
+    for name, stats in benchmark().items():
+        columns = ", ".join(f"{key} {value:>12,}" for key, value in stats.items())
+        print(f"   {name:<24} {columns}")
@@ -0,0 +1,162 @@
+"""
+ColorSnap Pro - Frame Store
+Frozen camera frames kept in memory-mapped files instead of the Python heap
+
+Usage:
+    from frame_store import FrameStore
+    
+    store = FrameStore(max_bytes=256 * 1024 * 1024)
+    frame_id = store.freeze(frame)        # frame: H x W x C uint8 array
+    r, g, b = store.pick(frame_id, x, y)  # reads straight from the mmap
+"""
+
+import os
+import shutil
+import tempfile
+import weakref
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import List, Optional, Tuple
+
+import numpy as np
+
+
+DEFAULT_MAX_BYTES = 256 * 1024 * 1024
+
+
+@dataclass
+class StoredFrame:
+    """A frozen frame backed by a memory-mapped file"""
+    frame_id: int
+    path: str
+    array: np.memmap
+    
+    @property
+    def nbytes(self) -> int:
+        return self.array.nbytes
+
+
+class FrameStore:
+    """
+    LRU store of frozen frames under a byte budget
+    
+    Each frame lives in its own file in a private temp directory and is
+    accessed through np.memmap, so the OS pages pixels in on demand and
+    frames can be evicted without touching the Python heap.
+    """
+    
+    def __init__(self, max_bytes: int = DEFAULT_MAX_BYTES, directory: Optional[str] = None):
+        self.max_bytes = max_bytes
+        self._owns_directory = directory is None
+        self._directory = directory or tempfile.mkdtemp(prefix="colorsnap_frames_")
+        os.makedirs(self._directory, exist_ok=True)
+        if self._owns_directory:
+            # Remove leftover frame files even if close() is never called
+            self._finalizer = weakref.finalize(self, shutil.rmtree, self._directory, True)
+        
+        self._frames: "OrderedDict[int, StoredFrame]" = OrderedDict()
+        self._nbytes = 0
+        self._next_id = 1
+        self.evicted = 0
+    
+    def __len__(self) -> int:
+        return len(self._frames)
+    
+    def __contains__(self, frame_id: int) -> bool:
+        return frame_id in self._frames
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, *exc):
+        self.close()
+    
+    @property
+    def nbytes(self) -> int:
+        return self._nbytes
+    
+    @property
+    def frame_ids(self) -> List[int]:
+        """Frame ids from least to most recently used"""
+        return list(self._frames)
+    
+    # MARK: - Storing
+    
+    def freeze(self, frame: np.ndarray) -> int:
+        """Copy a frame into a new memory-mapped file and return its id"""
+        if frame.nbytes > self.max_bytes:
+            raise ValueError(
+                f"Frame of {frame.nbytes} bytes exceeds the store budget of {self.max_bytes} bytes"
+            )
+        
+        # Make room before writing so the budget is never exceeded on disk
+        while self._nbytes + frame.nbytes > self.max_bytes:
+            self._evict_oldest()
+        
+        frame_id = self._next_id
+        self._next_id += 1
+        
+        path = os.path.join(self._directory, f"frame_{frame_id}.raw")
+        array = np.memmap(path, dtype=frame.dtype, mode="w+", shape=frame.shape)
+        array[...] = frame
+        
+        self._frames[frame_id] = StoredFrame(frame_id, path, array)
+        self._nbytes += array.nbytes
+        return frame_id
+    
+    def get(self, frame_id: int) -> np.memmap:
+        """Get a stored frame (marks it as recently used)"""
+        stored = self._frames.get(frame_id)
+        if stored is None:
+            raise KeyError(f"Frame {frame_id} is not in the store")
+        self._frames.move_to_end(frame_id)
+        return stored.array
+    
+    def pick(self, frame_id: int, x: int, y: int) -> Tuple[int, int, int]:
+        """Read one pixel directly from the frame's mmap"""
+        array = self.get(frame_id)
+        red, green, blue = array[y, x, :3]
+        return int(red), int(green), int(blue)
+    
+    # MARK: - Eviction
+    
+    def remove(self, frame_id: int):
+        """Drop a frame and delete its backing file"""
+        stored = self._frames.pop(frame_id, None)
+        if stored is None:
+            return
+        self._nbytes -= stored.nbytes
+        self._release(stored)
+    
+    def _evict_oldest(self):
+        """Evict the least recently used frame"""
+        frame_id = next(iter(self._frames))
+        self.remove(frame_id)
+        self.evicted += 1
+    
+    @staticmethod
+    def _release(stored: StoredFrame):
+        mmap = getattr(stored.array, "_mmap", None)
+        stored.array = None
+        try:
+            if mmap is not None:
+                mmap.close()
+        except BufferError:
+            # Still viewed elsewhere; the mapping closes once those views go away
+            pass
+        try:
+            os.remove(stored.path)
+        except OSError:
+            # Windows keeps mapped files locked; close() removes the directory later
+            pass
+    
+    def clear(self):
+        """Remove all frames"""
+        for frame_id in list(self._frames):
+            self.remove(frame_id)
+    
+    def close(self):
+        """Remove all frames and the store's temp directory"""
+        self.clear()
+        if self._owns_directory:
+            self._finalizer()
@@ -0,0 +1,335 @@
+"""
+ColorSnap Pro - Gradient Maker
+Multi-stop gradients interpolated in sRGB, linear RGB or OKLab, with CSS/QSS export
+
+Usage:
+    from gradient_maker import gradient_ramp, render_gradient, css_gradient
+    
+    stops = [(0.0, "#3B82F6"), (0.5, "#A855F7"), (1.0, "#F97316")]
+    ramp = gradient_ramp(stops, "oklab")        # (RAMP_SIZE, 4) uint8, cached
+    image = render_gradient(stops, 600, 120)    # QImage, rendered via NumPy
+    css_gradient(stops, angle=90)               # 'linear-gradient(in oklab 90deg, ...)'
+
+Ramps are cached by stop configuration and pixel-to-ramp index maps by
+size and angle, so re-rendering while a stop is dragged only recomputes
+one small ramp and a single gather into the image buffer.
+"""
+
+import math
+import time
+from functools import lru_cache
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+from PyQt6.QtWidgets import QWidget
+from PyQt6.QtCore import Qt, QPointF, pyqtSignal
+from PyQt6.QtGui import QColor, QImage, QPainter, QPen
+
+from color_space import (
+    hex_to_rgb_array, rgb_array_to_hex, to_unit, to_uint8,
+    rgb8_to_linear, linear_to_rgb8, rgb8_to_oklab, oklab_to_linear
+)
+
+
+Stop = Tuple[float, str]
+Stops = Tuple[Stop, ...]
+
+SPACES = ("srgb", "linear", "oklab")
+RAMP_SIZE = 1024
+
+# CSS Color 4 interpolation keywords per space
+_CSS_SPACES = {"srgb": None, "linear": "srgb-linear", "oklab": "oklab"}
+
+
+def normalize_stops(stops: Sequence[Stop]) -> Stops:
+    """Sorted, clamped, hashable stops (the ramp cache key)"""
+    if len(stops) < 2:
+        raise ValueError("A gradient needs at least two stops")
+    normalized = []
+    for position, color in stops:
+        normalized.append((min(max(float(position), 0.0), 1.0), color.upper()))
+    return tuple(sorted(normalized, key=lambda stop: stop[0]))
+
+
+# MARK: - Ramps
+
+def _to_space(rgb: np.ndarray, space: str) -> np.ndarray:
+    if space == "srgb":
+        return to_unit(rgb)
+    if space == "linear":
+        return rgb8_to_linear(rgb)
+    if space == "oklab":
+        return rgb8_to_oklab(rgb)
+    raise ValueError(f"Unknown gradient space: {space} (expected one of {', '.join(SPACES)})")
+
+
+def _from_space(values: np.ndarray, space: str) -> np.ndarray:
+    if space == "srgb":
+        return to_uint8(values)
+    if space == "linear":
+        return linear_to_rgb8(values)
+    return linear_to_rgb8(oklab_to_linear(values))
+
+
+@lru_cache(maxsize=256)
+def _cached_ramp(stops: Stops, space: str, size: int) -> np.ndarray:
+    positions = np.array([position for position, _ in stops])
+    values = _to_space(hex_to_rgb_array(color for _, color in stops), space)
+    samples = np.linspace(0.0, 1.0, size)
+    
+    interpolated = np.empty((size, 3))
+    for channel in range(3):
+        interpolated[:, channel] = np.interp(samples, positions, values[:, channel])
+    
+    ramp = np.empty((size, 4), dtype=np.uint8)
+    ramp[:, :3] = _from_space(interpolated, space)
+    ramp[:, 3] = 255
+    ramp.setflags(write=False)
+    return ramp
+
+
+def gradient_ramp(stops: Sequence[Stop], space: str = "oklab", size: int = RAMP_SIZE) -> np.ndarray:
+    """Precomputed (size, 4) RGBA uint8 color ramp (read-only, cached)"""
+    if space not in SPACES:
+        raise ValueError(f"Unknown gradient space: {space} (expected one of {', '.join(SPACES)})")
+    return _cached_ramp(normalize_stops(stops), space, size)
+
+
+def clear_cache():
+    """Drop cached ramps and index maps"""
+    _cached_ramp.cache_clear()
+    _index_map.cache_clear()
+
+
+# MARK: - Rendering
+
+def _direction(angle: float) -> Tuple[float, float]:
+    """CSS angle convention: 0deg points up, 90deg points right"""
+    radians = math.radians(angle)
+    return math.sin(radians), -math.cos(radians)
+
+
+@lru_cache(maxsize=32)
+def _index_map(width: int, height: int, angle: float, size: int) -> np.ndarray:
+    """Ramp index for every pixel of a width x height linear gradient"""
+    dx, dy = _direction(angle)
+    length = abs(width * dx) + abs(height * dy)
+    xs = (np.arange(width) + 0.5 - width / 2) * dx
+    ys = (np.arange(height) + 0.5 - height / 2) * dy
+    t = (ys[:, None] + xs[None, :]) / length + 0.5
+    indices = np.clip(np.rint(t * (size - 1)), 0, size - 1).astype(np.intp)
+    indices.setflags(write=False)
+    return indices
+
+
+def render_into(buffer: np.ndarray, stops: Sequence[Stop], angle: float = 90.0,
+                space: str = "oklab", size: int = RAMP_SIZE) -> np.ndarray:
+    """Render a linear gradient into an existing (H, W, 4) uint8 buffer"""
+    height, width = buffer.shape[:2]
+    ramp = gradient_ramp(stops, space, size)
+    np.take(ramp, _index_map(width, height, float(angle), size), axis=0, out=buffer)
+    return buffer
+
+
+def image_buffer(image: QImage) -> np.ndarray:
+    """(H, W, 4) view of an RGBA8888 QImage's pixels"""
+    pointer = image.bits()
+    pointer.setsize(image.sizeInBytes())
+    rows = np.frombuffer(pointer, dtype=np.uint8).reshape(image.height(), image.bytesPerLine())
+    return rows[:, :image.width() * 4].reshape(image.height(), image.width(), 4)
+
+
+def render_gradient(stops: Sequence[Stop], width: int, height: int, angle: float = 90.0,
+                    space: str = "oklab", image: Optional[QImage] = None) -> QImage:
+    """Render a linear gradient straight into a QImage's buffer (reused if given)"""
+    if image is None or image.width() != width or image.height() != height \
+            or image.format() != QImage.Format.Format_RGBA8888:
+        image = QImage(width, height, QImage.Format.Format_RGBA8888)
+    render_into(image_buffer(image), stops, angle, space)
+    return image
+
+
+# MARK: - CSS / QSS Export
+
+def _sampled_stops(stops: Sequence[Stop], space: str, steps: int) -> List[Stop]:
+    """Evenly spaced stops sampled from the ramp (for engines that interpolate in sRGB)"""
+    ramp = gradient_ramp(stops, space)
+    positions = np.linspace(0.0, 1.0, steps)
+    indices = np.rint(positions * (len(ramp) - 1)).astype(np.intp)
+    return list(zip(positions.tolist(), rgb_array_to_hex(ramp[indices, :3])))
+
+
+def _format_position(position: float) -> str:
+    return f"{position * 100:.4g}%"
+
+
+def css_gradient(stops: Sequence[Stop], angle: float = 90.0, space: str = "oklab", steps: int = 0) -> str:
+    """
+    CSS linear-gradient() string
+    
+    With steps=0 the stops are emitted as-is with a CSS Color 4 'in <space>'
+    hint; steps > 0 bakes the ramp into that many sRGB stops instead, which
+    renders identically in browsers without interpolation-space support.
+    """
+    if space not in SPACES:
+        raise ValueError(f"Unknown gradient space: {space} (expected one of {', '.join(SPACES)})")
+    
+    if steps:
+        stop_list, prefix = _sampled_stops(stops, space, steps), ""
+    else:
+        stop_list = list(normalize_stops(stops))
+        css_space = _CSS_SPACES[space]
+        prefix = f"in {css_space} " if css_space else ""
+    
+    parts = ", ".join(f"{color} {_format_position(position)}" for position, color in stop_list)
+    return f"linear-gradient({prefix}{angle:g}deg, {parts})"
+
+
+def qss_gradient(stops: Sequence[Stop], angle: float = 90.0, space: str = "oklab", steps: int = 8) -> str:
+    """Qt stylesheet qlineargradient() string (Qt interpolates in sRGB, so non-sRGB ramps are sampled)"""
+    stop_list = list(normalize_stops(stops)) if space == "srgb" else _sampled_stops(stops, space, steps)
+    dx, dy = _direction(angle)
+    # Fit the gradient line to the unit box like CSS does
+    half = 0.5 / max(abs(dx), abs(dy))
+    corners = (0.5 - dx * half, 0.5 - dy * half, 0.5 + dx * half, 0.5 + dy * half)
+    x1, y1, x2, y2 = (round(value, 4) + 0.0 for value in corners)
+    parts = ", ".join(f"stop: {position:.4g} {color}" for position, color in stop_list)
+    return f"qlineargradient(x1: {x1:g}, y1: {y1:g}, x2: {x2:g}, y2: {y2:g}, {parts})"
+
+
+# MARK: - Preview Widget
+
+class GradientPreview(QWidget):
+    """
+    Horizontal gradient preview with draggable stop handles
+    
+    Press a handle and drag to move its stop. The preview image is reused
+    between repaints and only re-rendered when stops, space or size change.
+    """
+    stops_changed = pyqtSignal(list)
+    
+    HANDLE_RADIUS = 7
+    
+    def __init__(self, stops: Sequence[Stop], space: str = "oklab", parent=None):
+        super().__init__(parent)
+        self._stops: List[Stop] = list(normalize_stops(stops))
+        self._space = space
+        self._image: Optional[QImage] = None
+        self._dirty = True
+        self._dragging: Optional[int] = None
+        self.setMinimumHeight(64)
+        self.setAttribute(Qt.WidgetAttribute.WA_OpaquePaintEvent)
+    
+    @property
+    def stops(self) -> List[Stop]:
+        return list(self._stops)
+    
+    def set_stops(self, stops: Sequence[Stop]):
+        self._stops = list(normalize_stops(stops))
+        self._invalidate()
+    
+    def set_space(self, space: str):
+        self._space = space
+        self._invalidate()
+    
+    def _invalidate(self):
+        self._dirty = True
+        self.update()
+        self.stops_changed.emit(self.stops)
+    
+    def _bar_width(self) -> int:
+        # Inset by the handle radius so end handles are fully visible
+        return max(self.width() - self.HANDLE_RADIUS * 2, 1)
+    
+    def _bar_height(self) -> int:
+        return max(self.height() - self.HANDLE_RADIUS * 2 - 4, 1)
+    
+    def _to_position(self, x: float) -> float:
+        return min(max((x - self.HANDLE_RADIUS) / max(self._bar_width() - 1, 1), 0.0), 1.0)
+    
+    def paintEvent(self, event):
+        """Draw the cached gradient image and stop handles"""
+        width, bar_height = self._bar_width(), self._bar_height()
+        if self._dirty or self._image is None or self._image.width() != width \
+                or self._image.height() != bar_height:
+            self._image = render_gradient(self._stops, width, bar_height, 90.0, self._space, self._image)
+            self._dirty = False
+        
+        painter = QPainter(self)
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+        painter.fillRect(self.rect(), QColor("#1a1a2e"))
+        painter.drawImage(self.HANDLE_RADIUS, 0, self._image)
+        
+        pen = QPen(Qt.GlobalColor.white)
+        pen.setWidth(2)
+        painter.setPen(pen)
+        center_y = bar_height + self.HANDLE_RADIUS + 2
+        for position, color in self._stops:
+            center_x = self.HANDLE_RADIUS + position * (width - 1)
+            painter.setBrush(QColor(color))
+            painter.drawEllipse(QPointF(center_x, center_y), self.HANDLE_RADIUS, self.HANDLE_RADIUS)
+        painter.end()
+    
+    def _stop_at(self, x: float) -> Optional[int]:
+        width = max(self._bar_width() - 1, 1)
+        distances = [abs(position - self._to_position(x)) * width for position, _ in self._stops]
+        nearest = min(range(len(distances)), key=distances.__getitem__)
+        return nearest if distances[nearest] <= self.HANDLE_RADIUS * 2 else None
+    
+    def mousePressEvent(self, event):
+        if event.button() == Qt.MouseButton.LeftButton:
+            self._dragging = self._stop_at(event.position().x())
+    
+    def mouseMoveEvent(self, event):
+        if self._dragging is None:
+            return
+        position = self._to_position(event.position().x())
+        color = self._stops[self._dragging][1]
+        self._stops[self._dragging] = (position, color)
+        # Stops stay sorted, so follow the dragged handle if it passes another one
+        self._stops.sort(key=lambda stop: stop[0])
+        self._dragging = self._stops.index((position, color))
+        self._invalidate()
+    
+    def mouseReleaseEvent(self, event):
+        self._dragging = None
+
+
+# MARK: - Benchmarks
+
+def benchmark(frames: int = 240, width: int = 600, height: int = 120, space: str = "oklab") -> Dict[str, float]:
+    """Simulated stop drag: a new stop configuration is rendered every frame"""
+    buffer = np.empty((height, width, 4), dtype=np.uint8)
+    base = [(0.0, "#3B82F6"), (0.5, "#A855F7"), (1.0, "#F97316")]
+    
+    clear_cache()
+    timings = []
+    for frame in range(frames):
+        middle = 0.05 + 0.9 * frame / max(frames - 1, 1)
+        stops = [base[0], (middle, base[1][1]), base[2]]
+        started = time.perf_counter()
+        render_into(buffer, stops, 90.0, space)
+        timings.append(time.perf_counter() - started)
+    
+    # Re-rendering an unchanged configuration hits the ramp cache
+    started = time.perf_counter()
+    render_into(buffer, stops, 90.0, space)
+    cached = time.perf_counter() - started
+    
+    timings_ms = np.array(timings) * 1000
+    return {
+        "frames": frames,
+        "median_ms": round(float(np.median(timings_ms)), 3),
+        "p95_ms": round(float(np.percentile(timings_ms, 95)), 3),
+        "cached_ms": round(cached * 1000, 3),
+    }
+
+
+# Benchmark
+if __name__ == "__main__":
+    print("📊 Gradient drag rendering (600 x 120)")
+    for space in SPACES:
+        stats = benchmark(space=space)
+        status = "✅" if stats["p95_ms"] < 1000 / 60 else "❌"
+        print(f"   {status} {space:>6}: median {stats['median_ms']:.2f} ms, p95 {stats['p95_ms']:.2f} ms, "
+              f"cached {stats['cached_ms']:.2f} ms")
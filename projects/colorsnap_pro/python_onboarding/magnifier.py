@@ -0,0 +1,349 @@
+"""
+ColorSnap Pro - Magnifier
+Press-and-hold color picking with a zoomed loupe and precise crosshairs
+
+Sampling reuses preallocated patch and zoom buffers, so pointer moves never
+allocate: the N x N neighborhood is copied out of the frame buffer and
+scaled up in place, and the loupe's QImage wraps the zoom buffer directly.
+"""
+
+import time
+from collections import deque
+from typing import Deque, Dict, Optional, Tuple
+
+import numpy as np
+from PyQt6.QtWidgets import QWidget
+from PyQt6.QtCore import Qt, QEvent, QObject, QPoint, QPointF, QRect, pyqtSignal
+from PyQt6.QtGui import QColor, QImage, QMouseEvent, QPainter, QPen, QFont
+
+
+# Pointer events kept for latency statistics
+LATENCY_WINDOW = 1024
+
+
+class MagnifierSampler:
+    """
+    Samples an N x N neighborhood around a point and scales it up
+    
+    Args:
+        size: Neighborhood size in frame pixels (odd, so there is a center pixel)
+        zoom: Integer magnification of each sampled pixel
+    """
+    
+    def __init__(self, size: int = 11, zoom: int = 10):
+        if size % 2 == 0:
+            raise ValueError("Magnifier size must be odd")
+        self.size = size
+        self.zoom = zoom
+        self._radius = size // 2
+        
+        # Preallocated buffers; every sample writes into these
+        self._patch = np.zeros((size, size, 4), dtype=np.uint8)
+        self._zoom = np.zeros((size * zoom, size * zoom, 4), dtype=np.uint8)
+        self._zoom_rows = np.zeros((size, size * zoom, 4), dtype=np.uint8)
+        self._zoom_index = np.arange(size * zoom) // zoom
+        self._offsets = np.arange(-self._radius, self._radius + 1)
+        self._rows = np.empty(size, dtype=np.intp)
+        self._cols = np.empty(size, dtype=np.intp)
+        self.image = QImage(
+            self._zoom.data, size * zoom, size * zoom,
+            size * zoom * 4, QImage.Format.Format_RGBA8888
+        )
+        
+        self._frame: Optional[np.ndarray] = None
+        self._last_point: Optional[Tuple[int, int]] = None
+        self._latencies_ns: Deque[int] = deque(maxlen=LATENCY_WINDOW)
+        self._event_times: Deque[float] = deque(maxlen=LATENCY_WINDOW)
+    
+    def set_frame(self, frame: np.ndarray):
+        """Use a new frame buffer (H x W x 3/4 uint8); frozen frames are simply not replaced"""
+        if frame.ndim != 3 or frame.shape[2] not in (3, 4):
+            raise ValueError("Frame must be an H x W x 3 or H x W x 4 array")
+        if frame.shape[2] == 3:
+            self._patch[..., 3] = 255
+        self._frame = frame
+        self._last_point = None
+    
+    @property
+    def frame(self) -> Optional[np.ndarray]:
+        return self._frame
+    
+    def sample(self, x: int, y: int) -> Tuple[int, int, int]:
+        """Sample around (x, y) in frame pixels and return the center color"""
+        started = time.perf_counter_ns()
+        
+        if self._frame is not None and (x, y) != self._last_point:
+            self._read_patch(x, y)
+            self._scale_patch()
+            self._last_point = (x, y)
+        
+        self._latencies_ns.append(time.perf_counter_ns() - started)
+        self._event_times.append(time.perf_counter())
+        return self.center_color
+    
+    def _read_patch(self, x: int, y: int):
+        """Copy the neighborhood into the patch buffer, clamping at frame edges"""
+        frame = self._frame
+        height, width, channels = frame.shape
+        r = self._radius
+        target = self._patch[..., :channels]
+        
+        if r <= x < width - r and r <= y < height - r:
+            target[...] = frame[y - r:y + r + 1, x - r:x + r + 1]
+        else:
+            np.clip(self._offsets + y, 0, height - 1, out=self._rows)
+            np.clip(self._offsets + x, 0, width - 1, out=self._cols)
+            target[...] = frame[self._rows[:, None], self._cols[None, :]]
+    
+    def _scale_patch(self):
+        """Nearest-neighbor upscale of the patch into the zoom buffer, in place"""
+        np.take(self._patch, self._zoom_index, axis=1, out=self._zoom_rows, mode="clip")
+        np.take(self._zoom_rows, self._zoom_index, axis=0, out=self._zoom, mode="clip")
+    
+    @property
+    def center_color(self) -> Tuple[int, int, int]:
+        r = self._radius
+        red, green, blue = self._patch[r, r, :3]
+        return int(red), int(green), int(blue)
+    
+    def stats(self) -> Dict[str, float]:
+        """Per-event sampling latency and pointer event rate"""
+        if not self._latencies_ns:
+            return {"events": 0, "median_us": 0.0, "p95_us": 0.0, "event_hz": 0.0}
+        
+        latencies = np.fromiter(self._latencies_ns, dtype=np.int64) / 1000.0
+        event_hz = 0.0
+        if len(self._event_times) > 1:
+            span = self._event_times[-1] - self._event_times[0]
+            if span > 0:
+                event_hz = (len(self._event_times) - 1) / span
+        
+        return {
+            "events": len(latencies),
+            "median_us": round(float(np.median(latencies)), 2),
+            "p95_us": round(float(np.percentile(latencies, 95)), 2),
+            "event_hz": round(event_hz, 1),
+        }
+    
+    def reset_stats(self):
+        """Clear latency statistics"""
+        self._latencies_ns.clear()
+        self._event_times.clear()
+
+
+class MagnifierWidget(QWidget):
+    """
+    Floating loupe showing the zoomed neighborhood with crosshairs and hex code
+    """
+    
+    def __init__(self, sampler: MagnifierSampler, parent=None):
+        super().__init__(parent)
+        self.sampler = sampler
+        self._color = QColor("#000000")
+        
+        side = sampler.size * sampler.zoom
+        self.setFixedSize(side, side + 28)
+        self.setAttribute(Qt.WidgetAttribute.WA_TransparentForMouseEvents)
+        self.setAttribute(Qt.WidgetAttribute.WA_OpaquePaintEvent)
+        self.setVisible(False)
+        
+        self._label_font = QFont()
+        self._label_font.setPixelSize(12)
+        self._label_font.setBold(True)
+    
+    def follow(self, pos: QPoint, color: Tuple[int, int, int]):
+        """Move above the pointer (in parent coordinates) and repaint"""
+        self._color.setRgb(*color)
+        self.move(pos.x() - self.width() // 2, pos.y() - self.height() - 24)
+        self.update()
+    
+    def paintEvent(self, event):
+        """Draw the zoom buffer, crosshairs and hex label"""
+        painter = QPainter(self)
+        side = self.sampler.size * self.sampler.zoom
+        zoom = self.sampler.zoom
+        
+        painter.drawImage(0, 0, self.sampler.image)
+        
+        # Crosshairs around the center pixel
+        center = self.sampler.size // 2 * zoom
+        pen = QPen(QColor(255, 255, 255, 220))
+        pen.setWidth(2)
+        painter.setPen(pen)
+        painter.setBrush(Qt.BrushStyle.NoBrush)
+        painter.drawRect(center, center, zoom, zoom)
+        painter.drawLine(side // 2, 0, side // 2, center - 2)
+        painter.drawLine(side // 2, center + zoom + 2, side // 2, side)
+        painter.drawLine(0, side // 2, center - 2, side // 2)
+        painter.drawLine(center + zoom + 2, side // 2, side, side // 2)
+        
+        # Hex label
+        label_rect = QRect(0, side, side, self.height() - side)
+        painter.fillRect(label_rect, self._color)
+        luminance = 0.299 * self._color.red() + 0.587 * self._color.green() + 0.114 * self._color.blue()
+        painter.setPen(QColor("#1a1a2e") if luminance > 140 else Qt.GlobalColor.white)
+        painter.setFont(self._label_font)
+        painter.drawText(label_rect, Qt.AlignmentFlag.AlignCenter, self._color.name().upper())
+        
+        painter.end()
+
+
+class ColorPicker(QWidget):
+    """
+    Press-and-hold picker over a preview widget
+    
+    Press to show the magnifier, drag to fine-tune, release to capture.
+    The frame buffer is taken from frame_provider on press (or stays as
+    set via freeze()), so dragging samples a stable frame. The picker
+    follows the preview's resizes so it always covers it exactly.
+    """
+    color_hovered = pyqtSignal(str)
+    color_picked = pyqtSignal(str)
+    
+    def __init__(self, preview: QWidget, frame_provider=None, size: int = 11, zoom: int = 10):
+        super().__init__(preview)
+        self.preview = preview
+        self.frame_provider = frame_provider
+        self.sampler = MagnifierSampler(size, zoom)
+        self.magnifier = MagnifierWidget(self.sampler, preview)
+        self._frozen = False
+        
+        self.setGeometry(preview.rect())
+        self.setCursor(Qt.CursorShape.CrossCursor)
+        preview.installEventFilter(self)
+    
+    def freeze(self, frame: np.ndarray):
+        """Pick from a fixed frame until unfreeze() is called"""
+        self.sampler.set_frame(frame)
+        self._frozen = True
+    
+    def unfreeze(self):
+        """Go back to sampling the provider's latest frame"""
+        self._frozen = False
+    
+    def eventFilter(self, watched, event):
+        if watched is self.preview and event.type() == QEvent.Type.Resize:
+            self.setGeometry(self.preview.rect())
+        return False
+    
+    def _to_frame_coords(self, pos: QPoint) -> Tuple[int, int]:
+        """Map widget coordinates to frame pixels"""
+        frame = self.sampler.frame
+        height, width = frame.shape[:2]
+        x = int(pos.x() * width / max(self.width(), 1))
+        y = int(pos.y() * height / max(self.height(), 1))
+        return min(max(x, 0), width - 1), min(max(y, 0), height - 1)
+    
+    def _sample_at(self, pos: QPoint) -> str:
+        color = self.sampler.sample(*self._to_frame_coords(pos))
+        self.magnifier.follow(pos, color)
+        return "#{:02X}{:02X}{:02X}".format(*color)
+    
+    def mousePressEvent(self, event):
+        if event.button() != Qt.MouseButton.LeftButton:
+            return
+        if not self._frozen and self.frame_provider is not None:
+            self.sampler.set_frame(self.frame_provider())
+        if self.sampler.frame is None:
+            return
+        
+        self.magnifier.setVisible(True)
+        self.magnifier.raise_()
+        self.color_hovered.emit(self._sample_at(event.position().toPoint()))
+    
+    def mouseMoveEvent(self, event):
+        if not self.magnifier.isVisible():
+            return
+        self.color_hovered.emit(self._sample_at(event.position().toPoint()))
+    
+    def mouseReleaseEvent(self, event):
+        if not self.magnifier.isVisible():
+            return
+        self.magnifier.setVisible(False)
+        self.color_picked.emit(self._sample_at(event.position().toPoint()))
+
+
+# MARK: - Benchmarks
+
+class _PaintCounter(QObject):
+    """Counts paint events delivered to the watched widget"""
+    
+    def __init__(self, widget: QWidget):
+        super().__init__(widget)
+        self.paints = 0
+        widget.installEventFilter(self)
+    
+    def eventFilter(self, watched, event):
+        if event.type() == QEvent.Type.Paint:
+            self.paints += 1
+        return False
+
+
+def benchmark(events: int = 5000, width: int = 1920, height: int = 1080, size: int = 11, zoom: int = 10) -> Dict[str, float]:
+    """
+    Simulated pointer drag across a 1080p frame through the whole picker
+    
+    Each event is a mouse move dispatched to the ColorPicker (sampling,
+    hover signal, magnifier move) followed by a synchronous repaint of the
+    loupe, timed together; max_hz is the rate that path sustains. frames
+    counts the repaints that actually painted (the loupe sits above the
+    pointer, so near the top edge it is clipped away and skips painting).
+    """
+    from PyQt6.QtWidgets import QApplication
+    
+    app = QApplication.instance() or QApplication([])
+    rng = np.random.default_rng(0)
+    frame = rng.integers(0, 256, (height, width, 4), dtype=np.uint8)
+    
+    preview = QWidget()
+    preview.resize(width // 2, height // 2)
+    picker = ColorPicker(preview, size=size, zoom=zoom)
+    picker.freeze(frame)
+    preview.show()
+    app.processEvents()
+    paints = _PaintCounter(picker.magnifier)
+    
+    # Smooth drag path that also touches the frame edges
+    t = np.linspace(0, 4 * np.pi, events)
+    xs = (np.sin(t) * 0.5 + 0.5) * (picker.width() - 1)
+    ys = (np.cos(t * 0.7) * 0.5 + 0.5) * (picker.height() - 1)
+    
+    def mouse(kind: QEvent.Type, x: float, y: float) -> QMouseEvent:
+        point = QPointF(x, y)
+        return QMouseEvent(kind, point, picker.mapToGlobal(point), Qt.MouseButton.LeftButton,
+                           Qt.MouseButton.LeftButton, Qt.KeyboardModifier.NoModifier)
+    
+    QApplication.sendEvent(picker, mouse(QEvent.Type.MouseButtonPress, xs[0], ys[0]))
+    picker.sampler.reset_stats()
+    paints.paints = 0
+    latencies_ns = np.empty(events, dtype=np.int64)
+    for index, (x, y) in enumerate(zip(xs, ys)):
+        started = time.perf_counter_ns()
+        QApplication.sendEvent(picker, mouse(QEvent.Type.MouseMove, x, y))
+        picker.magnifier.repaint()
+        latencies_ns[index] = time.perf_counter_ns() - started
+    frames = paints.paints
+    sample_stats = picker.sampler.stats()
+    QApplication.sendEvent(picker, mouse(QEvent.Type.MouseButtonRelease, xs[-1], ys[-1]))
+    preview.close()
+    
+    latencies = latencies_ns / 1000.0
+    median_us = float(np.median(latencies))
+    return {
+        "events": events,
+        "frames": frames,
+        "median_us": round(median_us, 2),
+        "p95_us": round(float(np.percentile(latencies, 95)), 2),
+        "sample_median_us": sample_stats["median_us"],
+        "max_hz": round(1e6 / median_us, 0) if median_us else 0.0,
+    }
+
+
+# Benchmark
+if __name__ == "__main__":
+    stats = benchmark()
+    status = "✅" if stats["max_hz"] >= 120 else "❌"
+    print(f"📊 Magnifier pointer tracking ({stats['events']} move events, {stats['frames']} loupe repaints)")
+    print(f"   event + repaint: median {stats['median_us']:.1f} µs, p95 {stats['p95_us']:.1f} µs "
+          f"(sampling alone {stats['sample_median_us']:.1f} µs)")
+    print(f"   {status} sustains {stats['max_hz']:.0f} Hz pointer tracking (target 120 Hz)")
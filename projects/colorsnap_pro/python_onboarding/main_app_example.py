@@ -3,13 +3,15 @@ ColorSnap Pro - Main Application Example (Python/PyQt6)
 Example of how to integrate the onboarding system into a PyQt6 app
 """
 
+import os
 import sys
+from typing import List, Optional
 from PyQt6.QtWidgets import (
     QApplication, QMainWindow, QWidget, QVBoxLayout, QHBoxLayout,
     QLabel, QPushButton, QStackedWidget, QTabWidget, QFrame,
-    QGraphicsOpacityEffect
+    QGraphicsOpacityEffect, QLineEdit, QComboBox, QFileDialog
 )
-from PyQt6.QtCore import Qt, QTimer, QPoint
+from PyQt6.QtCore import Qt, QTimer, QPoint, QEvent, QObject, pyqtSignal
 from PyQt6.QtGui import QColor, QPalette
 
 from onboarding_manager import (
@@ -25,42 +27,210 @@ from tooltip_widget import (
     InlineHint,
     PulsingHintButton
 )
+from palette_extractor import IncrementalExtractor, qimage_to_array
+from magnifier import ColorPicker
+from frame_store import FrameStore
+from camera_source import FrameSource, CaptureThread, CameraPreview, open_source
+from color_harmony import SCHEMES, SPACES as HARMONY_SPACES, harmony
+from color_contrast import contrast_ratio, wcag_levels
+from gradient_maker import SPACES as GRADIENT_SPACES, GradientPreview, css_gradient
+from palette_library import PaletteLibrary
+from palette_grid import PaletteListModel, PaletteGridView
+from color_export import FORMATS as EXPORT_FORMATS, EXTENSIONS, copy_colors, export_palettes
+
+# Colors kept from press-and-hold picking
+MAX_PICKED_COLORS = 5
+
+# Live AI palette refresh interval; the extractor itself skips static frames
+AI_PALETTE_INTERVAL_MS = 33
+
+# Palettes fetched per page as the Palettes tab scrolls
+PALETTE_PAGE_SIZE = 200
+
+# Printed once the main window has painted (build_app.py --bench times launch to this line)
+FIRST_FRAME_MARKER = "colorsnap:first-frame"
+
+
+class ColorSwatch(QLabel):
+    """Color swatch label that reports its hex code when tapped"""
+    clicked = pyqtSignal(str)
+    
+    def mousePressEvent(self, event):
+        if event.button() == Qt.MouseButton.LeftButton and self.text():
+            self.clicked.emit(self.text())
+
+
+def add_swatch_row(layout: QVBoxLayout, count: int, on_click=None) -> List[ColorSwatch]:
+    """Add a row of hidden color swatches"""
+    row = QHBoxLayout()
+    row.setSpacing(8)
+    swatches = []
+    for _ in range(count):
+        swatch = ColorSwatch()
+        swatch.setFixedSize(72, 48)
+        swatch.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        swatch.setVisible(False)
+        if on_click is not None:
+            swatch.setCursor(Qt.CursorShape.PointingHandCursor)
+            swatch.clicked.connect(on_click)
+        row.addWidget(swatch)
+        swatches.append(swatch)
+    layout.addLayout(row)
+    return swatches
+
+
+def copy_color(hex_code: str):
+    """Copy a tapped swatch's color (hex as text, plus CSS/JSON/ASE)"""
+    copy_colors([hex_code])
+    onboarding_manager.mark_tooltip_shown(TooltipType.CAMERA_COPY)
+
+
+def show_swatches(swatches: List[ColorSwatch], hex_codes: List[str]):
+    """Fill swatches with colors, hiding unused ones"""
+    for swatch, hex_code in zip(swatches, hex_codes):
+        text_color = "#1a1a2e" if QColor(hex_code).lightness() > 128 else "white"
+        swatch.setText(hex_code)
+        swatch.setStyleSheet(f"""
+            background: {hex_code};
+            color: {text_color};
+            border-radius: 8px;
+            font-size: 11px;
+            font-weight: bold;
+        """)
+        swatch.setVisible(True)
+    for swatch in swatches[len(hex_codes):]:
+        swatch.setVisible(False)
 
 
 class CameraTab(QWidget):
     """Example camera tab"""
+    palette_saved = pyqtSignal(int)
     
-    def __init__(self, parent=None):
+    def __init__(self, library: Optional[PaletteLibrary] = None, source: Optional[FrameSource] = None, parent=None):
         super().__init__(parent)
+        self.library = library
         self._setup_ui()
+        self._start_camera(source)
         self._check_first_time()
     
     def _setup_ui(self):
         layout = QVBoxLayout(self)
         layout.setAlignment(Qt.AlignmentFlag.AlignCenter)
         
-        # Camera preview placeholder
-        self.preview = QFrame()
+        # Live camera preview
+        self.preview = CameraPreview()
         self.preview.setFixedSize(640, 480)
-        self.preview.setStyleSheet("""
-            QFrame {
-                background: qlineargradient(x1: 0, y1: 0, x2: 1, y2: 1,
-                    stop: 0 #ff6b6b, stop: 0.5 #feca57, stop: 1 #48dbfb);
-                border-radius: 16px;
-            }
-        """)
         layout.addWidget(self.preview, alignment=Qt.AlignmentFlag.AlignCenter)
         
+        # Press & hold picker with magnifier
+        self.picked_colors: List[str] = []
+        self.picker = ColorPicker(self.preview, self._current_frame)
+        self.picker.color_picked.connect(self._on_color_picked)
+        
         # Hint label
         hint = InlineHint("Press & hold anywhere to pick colors", "👆", "#3B82F6")
         layout.addWidget(hint, alignment=Qt.AlignmentFlag.AlignCenter)
         
+        # AI palette
+        self.palette_extractor = IncrementalExtractor(n_colors=5)
+        self.ai_colors: List[str] = []
+        self.ai_timer = QTimer(self)
+        self.ai_timer.setInterval(AI_PALETTE_INTERVAL_MS)
+        self.ai_timer.timeout.connect(self._generate_ai_palette)
+        
+        ai_btn = QPushButton("✨ AI Palette")
+        ai_btn.setStyleSheet("""
+            QPushButton {
+                background: #8B5CF6;
+                color: white;
+                border: none;
+                border-radius: 8px;
+                padding: 10px 24px;
+                font-size: 14px;
+                font-weight: bold;
+            }
+            QPushButton:hover { background: #7C3AED; }
+            QPushButton:checked { background: #6D28D9; border: 2px solid #C4B5FD; }
+        """)
+        ai_btn.setCursor(Qt.CursorShape.PointingHandCursor)
+        ai_btn.setCheckable(True)
+        ai_btn.toggled.connect(self._toggle_ai_palette)
+        
+        # Freeze frame
+        self.frame_store = FrameStore()
+        self.frozen_frame_id = None
+        
+        freeze_btn = QPushButton("❄️ Freeze Frame")
+        freeze_btn.setStyleSheet("""
+            QPushButton {
+                background: #3B82F6;
+                color: white;
+                border: none;
+                border-radius: 8px;
+                padding: 10px 24px;
+                font-size: 14px;
+                font-weight: bold;
+            }
+            QPushButton:hover { background: #2563EB; }
+        """)
+        freeze_btn.setCursor(Qt.CursorShape.PointingHandCursor)
+        freeze_btn.clicked.connect(self._freeze_frame)
+        
+        # Save palette
+        save_btn = QPushButton("💾 Save Palette")
+        save_btn.setStyleSheet("""
+            QPushButton {
+                background: #22C55E;
+                color: white;
+                border: none;
+                border-radius: 8px;
+                padding: 10px 24px;
+                font-size: 14px;
+                font-weight: bold;
+            }
+            QPushButton:hover { background: #16A34A; }
+        """)
+        save_btn.setCursor(Qt.CursorShape.PointingHandCursor)
+        save_btn.clicked.connect(self._save_palette)
+        save_btn.setEnabled(self.library is not None)
+        
+        actions_layout = QHBoxLayout()
+        actions_layout.setSpacing(12)
+        actions_layout.addStretch()
+        actions_layout.addWidget(ai_btn)
+        actions_layout.addWidget(freeze_btn)
+        actions_layout.addWidget(save_btn)
+        actions_layout.addStretch()
+        layout.addLayout(actions_layout)
+        
+        # Frozen frames strip
+        self.frozen_layout = QHBoxLayout()
+        self.frozen_layout.setSpacing(8)
+        self.frozen_layout.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        layout.addLayout(self.frozen_layout)
+        
+        self.swatches = add_swatch_row(layout, self.palette_extractor.n_colors, copy_color)
+        
+        # Picked colors
+        self.picked_swatches = add_swatch_row(layout, MAX_PICKED_COLORS, copy_color)
+        
         # First time overlay (initially hidden)
         self.first_time_overlay = FirstTimeOverlay(self.preview)
         
         # Tooltip manager
         self.tooltip_mgr = TooltipManagerWidget(self)
     
+    def _start_camera(self, source: Optional[FrameSource]):
+        """Capture frames on a worker thread (COLORSNAP_CAMERA picks the source)"""
+        self.capture = CaptureThread(source or open_source(os.environ.get("COLORSNAP_CAMERA", "synthetic")), parent=self)
+        self.preview.attach(self.capture)
+        self.capture.start()
+    
+    def stop_camera(self):
+        """Stop the capture thread and live AI palette"""
+        self.ai_timer.stop()
+        self.capture.stop()
+    
     def _check_first_time(self):
         """Check if we should show first-time hints"""
         if not onboarding_manager.has_picked_first_color:
@@ -75,22 +245,144 @@ class CameraTab(QWidget):
         """Show first time overlay"""
         self.first_time_overlay.setGeometry(self.preview.rect())
         self.first_time_overlay.show_overlay()
+    
+    def _current_frame(self):
+        """Current preview frame as an RGBA array (the live frame itself, not a copy)"""
+        frame = self.preview.frame_array()
+        if frame is None:
+            return qimage_to_array(self.preview.grab().toImage())
+        return frame
+    
+    def _toggle_ai_palette(self, live: bool):
+        """Start or stop keeping the AI palette in sync with the preview"""
+        if live:
+            self.palette_extractor.reset()
+            self._generate_ai_palette()
+            self.ai_timer.start()
+            onboarding_manager.mark_tooltip_shown(TooltipType.CAMERA_AI)
+        else:
+            self.ai_timer.stop()
+    
+    def _generate_ai_palette(self):
+        """Update the AI palette from the current preview frame (incrementally)"""
+        colors = [color.hex for color in self.palette_extractor.update(self._current_frame())]
+        if colors != self.ai_colors:
+            self.ai_colors = colors
+            show_swatches(self.swatches, self.ai_colors)
+    
+    def _save_palette(self):
+        """Save the AI palette and picked colors to the palette library"""
+        colors = list(dict.fromkeys(self.ai_colors + self.picked_colors))
+        if not colors or self.library is None:
+            return
+        palette_id = self.library.save_palette(f"Palette {self.library.palette_count() + 1}", colors)
+        self.palette_saved.emit(palette_id)
+        onboarding_manager.mark_tooltip_shown(TooltipType.PALETTE_SAVE)
+    
+    def _freeze_frame(self):
+        """Store the current frame and pick from it"""
+        self.frozen_frame_id = self.frame_store.freeze(self._current_frame())
+        self.picker.freeze(self.frame_store.get(self.frozen_frame_id))
+        self._update_frozen_strip()
+        onboarding_manager.mark_tooltip_shown(TooltipType.CAMERA_FREEZE)
+    
+    def _select_frozen_frame(self, frame_id):
+        """Pick from a stored frame, or go live when frame_id is None"""
+        self.frozen_frame_id = frame_id
+        if frame_id is None or frame_id not in self.frame_store:
+            self.frozen_frame_id = None
+            self.picker.unfreeze()
+        else:
+            self.picker.freeze(self.frame_store.get(frame_id))
+        self._update_frozen_strip()
+    
+    def _update_frozen_strip(self):
+        """Rebuild the frozen frame buttons (the store evicts old frames)"""
+        while self.frozen_layout.count():
+            item = self.frozen_layout.takeAt(0)
+            if item.widget():
+                item.widget().deleteLater()
+        
+        if not len(self.frame_store):
+            return
+        
+        entries = [("● Live", None)] + [
+            (f"❄️ {frame_id}", frame_id) for frame_id in sorted(self.frame_store.frame_ids)
+        ]
+        for text, frame_id in entries:
+            active = frame_id == self.frozen_frame_id
+            btn = QPushButton(text)
+            btn.setStyleSheet(f"""
+                QPushButton {{
+                    background: {'rgba(59, 130, 246, 0.3)' if active else 'transparent'};
+                    color: {'#3B82F6' if active else 'rgba(255, 255, 255, 180)'};
+                    border: 1px solid {'#3B82F6' if active else 'rgba(255, 255, 255, 0.2)'};
+                    border-radius: 12px;
+                    padding: 4px 12px;
+                    font-size: 12px;
+                }}
+            """)
+            btn.setCursor(Qt.CursorShape.PointingHandCursor)
+            btn.clicked.connect(lambda checked, f=frame_id: self._select_frozen_frame(f))
+            self.frozen_layout.addWidget(btn)
+    
+    def _on_color_picked(self, hex_code: str):
+        """Keep the last picked colors"""
+        self.picked_colors.append(hex_code)
+        del self.picked_colors[:-MAX_PICKED_COLORS]
+        show_swatches(self.picked_swatches, self.picked_colors)
+        
+        if not onboarding_manager.has_picked_first_color:
+            onboarding_manager.has_picked_first_color = True
 
 
 class PaletteTab(QWidget):
-    """Example palette tab"""
+    """Palette library tab with a virtualized palette list and near-color search"""
     
-    def __init__(self, parent=None):
+    def __init__(self, library: Optional[PaletteLibrary] = None, parent=None):
         super().__init__(parent)
+        self.library = library or PaletteLibrary()
         self._setup_ui()
+        self.reload()
     
     def _setup_ui(self):
         layout = QVBoxLayout(self)
-        layout.setAlignment(Qt.AlignmentFlag.AlignCenter)
         
         label = QLabel("🎨 Your Palettes")
         label.setStyleSheet("font-size: 24px; color: white;")
-        layout.addWidget(label)
+        layout.addWidget(label, alignment=Qt.AlignmentFlag.AlignCenter)
+        
+        # Near-color search
+        self.search_input = QLineEdit()
+        self.search_input.setPlaceholderText("Find palettes near a color, e.g. #3B82F6")
+        self.search_input.setStyleSheet("color: white; padding: 6px;")
+        self.search_input.returnPressed.connect(self._search)
+        self.search_input.textChanged.connect(self._on_search_changed)
+        layout.addWidget(self.search_input)
+        
+        self.count_label = QLabel()
+        self.count_label.setStyleSheet("color: rgba(255,255,255,0.6);")
+        layout.addWidget(self.count_label)
+        
+        # Virtualized grid; pages are fetched from the library as it scrolls
+        self.palette_model = PaletteListModel(self.library, PALETTE_PAGE_SIZE)
+        self.palette_view = PaletteGridView(self.palette_model)
+        self.palette_view.palette_activated.connect(self._copy_palette)
+        layout.addWidget(self.palette_view)
+        
+        # Export the whole library
+        export_layout = QHBoxLayout()
+        self.export_format = QComboBox()
+        self.export_format.addItems(list(EXPORT_FORMATS))
+        self.export_format.setCurrentText("json")
+        self.export_format.setStyleSheet("color: white; padding: 6px;")
+        export_btn = QPushButton("⬇️ Export All")
+        export_btn.setStyleSheet("color: white; padding: 6px 16px;")
+        export_btn.clicked.connect(self._export_all)
+        export_layout.addStretch()
+        export_layout.addWidget(self.export_format)
+        export_layout.addWidget(export_btn)
+        layout.addLayout(export_layout)
         
         # Tooltip manager
         self.tooltip_mgr = TooltipManagerWidget(self)
@@ -99,6 +391,41 @@ class PaletteTab(QWidget):
         QTimer.singleShot(500, lambda: self.tooltip_mgr.show_contextual_tooltip(
             TooltipContext.PALETTES
         ))
+    
+    def reload(self):
+        """Show the newest palettes again from the first page"""
+        self.count_label.setText(
+            f"{self.library.palette_count():,} palettes · {self.library.color_count():,} colors"
+        )
+        self.palette_model.reload()
+    
+    def _copy_palette(self, palette_id: int):
+        """Copy an activated palette's colors in every clipboard format"""
+        palettes = self.library.get_palettes([palette_id])
+        if palettes:
+            copy_colors(palettes[0].colors)
+    
+    def _export_all(self):
+        """Stream every saved palette to a file in the selected format"""
+        fmt = self.export_format.currentText()
+        path, _ = QFileDialog.getSaveFileName(self, "Export Palettes", "palettes" + EXTENSIONS[fmt])
+        if not path:
+            return
+        export_palettes(path, ((palette.name, palette.colors) for palette in self.library.iter_palettes()), fmt)
+    
+    def _on_search_changed(self, text: str):
+        """Go back to the full list when the search is cleared"""
+        if not text:
+            self.reload()
+    
+    def _search(self):
+        """Show palettes containing a color near the entered one"""
+        try:
+            matches = self.library.find_near(self.search_input.text().strip(), radius=0.05, limit=None)
+        except ValueError:
+            return
+        self.count_label.setText(f"{len(matches):,} palettes with a color near {self.search_input.text()}")
+        self.palette_model.show_palette_ids([match.palette_id for match in matches])
 
 
 class ToolsTab(QWidget):
@@ -116,6 +443,82 @@ class ToolsTab(QWidget):
         label.setStyleSheet("font-size: 24px; color: white;")
         layout.addWidget(label)
         
+        # Color harmony
+        harmony_title = QLabel("Color Harmony")
+        harmony_title.setStyleSheet("font-size: 18px; color: white; font-weight: bold;")
+        layout.addWidget(harmony_title)
+        
+        controls = QHBoxLayout()
+        self.base_color_input = QLineEdit("#3B82F6")
+        self.base_color_input.setMaxLength(7)
+        self.base_color_input.setFixedWidth(100)
+        self.harmony_scheme = QComboBox()
+        self.harmony_scheme.addItems(list(SCHEMES))
+        self.harmony_space = QComboBox()
+        self.harmony_space.addItems(list(HARMONY_SPACES))
+        for widget in (self.base_color_input, self.harmony_scheme, self.harmony_space):
+            widget.setStyleSheet("color: white; padding: 6px;")
+            controls.addWidget(widget)
+        layout.addLayout(controls)
+        
+        self.harmony_swatches = add_swatch_row(layout, 1 + max(len(o) for o in SCHEMES.values()), copy_color)
+        
+        self.base_color_input.textChanged.connect(self._update_harmony)
+        self.harmony_scheme.currentTextChanged.connect(self._update_harmony)
+        self.harmony_space.currentTextChanged.connect(self._update_harmony)
+        self._update_harmony()
+        
+        # Contrast checker
+        contrast_title = QLabel("Contrast Checker")
+        contrast_title.setStyleSheet("font-size: 18px; color: white; font-weight: bold;")
+        layout.addWidget(contrast_title)
+        
+        contrast_controls = QHBoxLayout()
+        self.text_color_input = QLineEdit("#FFFFFF")
+        self.background_color_input = QLineEdit("#3B82F6")
+        for widget in (self.text_color_input, self.background_color_input):
+            widget.setMaxLength(7)
+            widget.setFixedWidth(100)
+            widget.setStyleSheet("color: white; padding: 6px;")
+            widget.textChanged.connect(self._update_contrast)
+            contrast_controls.addWidget(widget)
+        layout.addLayout(contrast_controls)
+        
+        self.contrast_preview = QLabel("Sample Text")
+        self.contrast_preview.setFixedHeight(48)
+        self.contrast_preview.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        layout.addWidget(self.contrast_preview)
+        
+        self.contrast_result = QLabel()
+        self.contrast_result.setStyleSheet("color: white;")
+        layout.addWidget(self.contrast_result)
+        self._update_contrast()
+        
+        # Gradient maker
+        gradient_title = QLabel("Gradient Maker")
+        gradient_title.setStyleSheet("font-size: 18px; color: white; font-weight: bold;")
+        layout.addWidget(gradient_title)
+        
+        self.gradient_space = QComboBox()
+        self.gradient_space.addItems(list(GRADIENT_SPACES))
+        self.gradient_space.setCurrentText("oklab")
+        self.gradient_space.setStyleSheet("color: white; padding: 6px;")
+        layout.addWidget(self.gradient_space)
+        
+        self.gradient_preview = GradientPreview([(0.0, "#3B82F6"), (0.5, "#A855F7"), (1.0, "#F97316")])
+        self.gradient_preview.setMinimumWidth(360)
+        layout.addWidget(self.gradient_preview)
+        
+        self.gradient_css = QLabel()
+        self.gradient_css.setWordWrap(True)
+        self.gradient_css.setTextInteractionFlags(Qt.TextInteractionFlag.TextSelectableByMouse)
+        self.gradient_css.setStyleSheet("color: rgba(255,255,255,0.7); font-family: monospace;")
+        layout.addWidget(self.gradient_css)
+        
+        self.gradient_space.currentTextChanged.connect(self.gradient_preview.set_space)
+        self.gradient_preview.stops_changed.connect(self._update_gradient_css)
+        self._update_gradient_css(self.gradient_preview.stops)
+        
         # Tooltip manager
         self.tooltip_mgr = TooltipManagerWidget(self)
         
@@ -123,6 +526,39 @@ class ToolsTab(QWidget):
         QTimer.singleShot(500, lambda: self.tooltip_mgr.show_contextual_tooltip(
             TooltipContext.TOOLS
         ))
+    
+    def _update_harmony(self):
+        """Regenerate the harmony set for the entered base color"""
+        try:
+            colors = harmony(
+                self.base_color_input.text(),
+                self.harmony_scheme.currentText(),
+                self.harmony_space.currentText()
+            )
+        except ValueError:
+            return
+        show_swatches(self.harmony_swatches, colors)
+    
+    def _update_contrast(self):
+        """Show the WCAG contrast ratio for the entered text/background pair"""
+        text, background = self.text_color_input.text(), self.background_color_input.text()
+        try:
+            ratio = contrast_ratio(text, background)
+        except ValueError:
+            return
+        
+        self.contrast_preview.setStyleSheet(
+            f"background: {background}; color: {text}; font-size: 18px; border-radius: 8px;"
+        )
+        levels = wcag_levels(ratio)
+        badges = "  ".join(
+            f"{'✅' if passed else '❌'} {level.replace('_', ' ')}" for level, passed in levels.items()
+        )
+        self.contrast_result.setText(f"{ratio:.2f}:1   {badges}")
+    
+    def _update_gradient_css(self, stops):
+        """Show the CSS for the current gradient stops"""
+        self.gradient_css.setText(css_gradient(stops, space=self.gradient_space.currentText()))
 
 
 class SettingsTab(QWidget):
@@ -317,8 +753,10 @@ class MainWindow(QMainWindow):
         self.tabs.setTabPosition(QTabWidget.TabPosition.South)
         
         # Add tabs
-        self.camera_tab = CameraTab()
-        self.palette_tab = PaletteTab()
+        self.palette_library = PaletteLibrary()
+        self.camera_tab = CameraTab(self.palette_library)
+        self.palette_tab = PaletteTab(self.palette_library)
+        self.camera_tab.palette_saved.connect(lambda palette_id: self.palette_tab.reload())
         self.tools_tab = ToolsTab()
         self.settings_tab = SettingsTab()
         
@@ -351,6 +789,10 @@ class MainWindow(QMainWindow):
         
         main_layout.addWidget(self.tabs)
     
+    def closeEvent(self, event):
+        self.camera_tab.stop_camera()
+        super().closeEvent(event)
+    
     def _apply_theme(self):
         """Apply dark theme"""
         self.setStyleSheet("""
@@ -393,6 +835,27 @@ class MainWindow(QMainWindow):
         self.tutorial.show()
 
 
+class FirstFrameProbe(QObject):
+    """Prints FIRST_FRAME_MARKER after the window's first paint, then quits (startup timing)"""
+    
+    def __init__(self, window: QWidget):
+        super().__init__(window)
+        self._painted = False
+        window.installEventFilter(self)
+    
+    def eventFilter(self, watched, event):
+        if event.type() == QEvent.Type.Paint and not self._painted:
+            self._painted = True
+            # Queued, so it runs once this frame has been painted
+            QTimer.singleShot(0, self._report)
+        return False
+    
+    def _report(self):
+        print(FIRST_FRAME_MARKER, flush=True)
+        self.parent().close()
+        QApplication.quit()
+
+
 def main():
     """Main entry point"""
     app = QApplication(sys.argv)
@@ -412,6 +875,10 @@ def main():
     window = MainWindow()
     window.show()
     
+    # Startup timing (build_app.py --analyze, --bench): quit once the first frame is painted
+    if os.environ.get("COLORSNAP_QUIT_AFTER_STARTUP"):
+        FirstFrameProbe(window)
+    
     sys.exit(app.exec())
 
 
@@ -6,9 +6,21 @@ Manages onboarding state and tracks which tips/tooltips have been shown
 import json
 import os
 from enum import Enum
+from functools import lru_cache
 from typing import Optional, List, Dict, Any, Union
 from dataclasses import dataclass, asdict, field
 
+from resource_bundle import resources
+
+
+@lru_cache(maxsize=None)
+def _tooltip_texts(value: str) -> Dict[str, str]:
+    """Title/message/icon of a tooltip, decoded once per tooltip (treat as read-only)"""
+    try:
+        return resources().json(f"tooltip/{value}")
+    except KeyError:
+        return {}
+
 
 class TooltipType(Enum):
     """Types of tooltips that can be shown"""
@@ -23,45 +35,19 @@ class TooltipType(Enum):
     
     @property
     def title(self) -> str:
-        titles = {
-            TooltipType.CAMERA_PRESS_HOLD: "Press & Hold",
-            TooltipType.CAMERA_FREEZE: "Freeze Frame",
-            TooltipType.CAMERA_AI: "AI Magic",
-            TooltipType.CAMERA_COPY: "Quick Copy",
-            TooltipType.PALETTE_SAVE: "Save Colors",
-            TooltipType.PALETTE_ORGANIZE: "Organize",
-            TooltipType.TOOLS_HARMONY: "Color Harmony",
-            TooltipType.TOOLS_CONTRAST: "Check Contrast",
-        }
-        return titles.get(self, "Tip")
+        return self._texts.get("title", "Tip")
     
     @property
     def message(self) -> str:
-        messages = {
-            TooltipType.CAMERA_PRESS_HOLD: "Press and hold anywhere to preview colors with the magnifier",
-            TooltipType.CAMERA_FREEZE: "Tap Freeze Frame to pause the camera for precise picking",
-            TooltipType.CAMERA_AI: "Try AI Palette to automatically generate color schemes",
-            TooltipType.CAMERA_COPY: "Tap any picked color to copy its hex code",
-            TooltipType.PALETTE_SAVE: "Save your captured colors to a palette for later",
-            TooltipType.PALETTE_ORGANIZE: "Create multiple palettes to organize your projects",
-            TooltipType.TOOLS_HARMONY: "Generate complementary, analogous, and triadic colors",
-            TooltipType.TOOLS_CONTRAST: "Ensure your colors meet accessibility standards",
-        }
-        return messages.get(self, "")
+        return self._texts.get("message", "")
     
     @property
     def icon(self) -> str:
-        icons = {
-            TooltipType.CAMERA_PRESS_HOLD: "hand.tap.fill",
-            TooltipType.CAMERA_FREEZE: "snowflake",
-            TooltipType.CAMERA_AI: "wand.and.stars",
-            TooltipType.CAMERA_COPY: "doc.on.doc",
-            TooltipType.PALETTE_SAVE: "folder.badge.plus",
-            TooltipType.PALETTE_ORGANIZE: "swatchpalette",
-            TooltipType.TOOLS_HARMONY: "circle.hexagongrid",
-            TooltipType.TOOLS_CONTRAST: "textformat.size",
-        }
-        return icons.get(self, "info.circle")
+        return self._texts.get("icon", "info.circle")
+    
+    @property
+    def _texts(self) -> Dict[str, str]:
+        return _tooltip_texts(self.value)
 
 
 class TooltipContext(Enum):
@@ -20,6 +20,8 @@ from PyQt6.QtGui import (
 from typing import List, Callable, Optional
 import sys
 
+from resource_bundle import resources
+
 
 class OnboardingPage:
     """Data class for onboarding page content"""
@@ -137,10 +139,7 @@ class FeatureItem(QFrame):
         
         # Feature text
         label = QLabel(text)
-        label.setStyleSheet("""
-            color: rgba(255, 255, 255, 230);
-            font-size: 15px;
-        """)
+        label.setStyleSheet(resources().text("style/onboarding/feature"))
         layout.addWidget(label)
         layout.addStretch()
 
@@ -165,20 +164,13 @@ class OnboardingPageWidget(QWidget):
         
         # Title
         title = QLabel(self.page.title)
-        title.setStyleSheet("""
-            color: white;
-            font-size: 28px;
-            font-weight: bold;
-        """)
+        title.setStyleSheet(resources().text("style/onboarding/title"))
         title.setAlignment(Qt.AlignmentFlag.AlignCenter)
         layout.addWidget(title)
         
         # Description
         desc = QLabel(self.page.description)
-        desc.setStyleSheet("""
-            color: rgba(255, 255, 255, 200);
-            font-size: 16px;
-        """)
+        desc.setStyleSheet(resources().text("style/onboarding/description"))
         desc.setAlignment(Qt.AlignmentFlag.AlignCenter)
         desc.setWordWrap(True)
         layout.addWidget(desc)
@@ -218,65 +210,8 @@ class OnboardingWindow(QMainWindow):
         self._apply_gradient_background()
     
     def _setup_pages(self):
-        """Define onboarding pages"""
-        self.pages = [
-            OnboardingPage(
-                icon="📷",
-                icon_color="#3B82F6",
-                title="Welcome to ColorSnap Pro",
-                description="The ultimate color picking tool for designers, artists, and developers.",
-                features=[
-                    "Real-time camera color picking",
-                    "Precision magnifier with crosshairs",
-                    "Freeze frame for accuracy"
-                ]
-            ),
-            OnboardingPage(
-                icon="✨",
-                icon_color="#8B5CF6",
-                title="AI-Powered Palettes",
-                description="Let AI analyze any scene and generate beautiful color palettes instantly.",
-                features=[
-                    "One-tap AI palette generation",
-                    "Smart color extraction",
-                    "Save palettes for later use"
-                ]
-            ),
-            OnboardingPage(
-                icon="🎨",
-                icon_color="#F97316",
-                title="Organize Your Colors",
-                description="Keep all your colors organized in custom palettes for easy access.",
-                features=[
-                    "Create unlimited palettes",
-                    "Copy hex codes with one tap",
-                    "View RGB values instantly"
-                ]
-            ),
-            OnboardingPage(
-                icon="🛠️",
-                icon_color="#22C55E",
-                title="Professional Tools",
-                description="Advanced tools to perfect your color choices.",
-                features=[
-                    "Color harmony generator",
-                    "Contrast accessibility checker",
-                    "Gradient maker with CSS export"
-                ]
-            ),
-            OnboardingPage(
-                icon="👆",
-                icon_color="#EC4899",
-                title="How to Pick Colors",
-                description="It's simple! Just point, press, and capture.",
-                features=[
-                    "Press & hold to preview colors",
-                    "Drag to fine-tune selection",
-                    "Release to capture up to 5 colors",
-                    "Tap colors to copy hex codes"
-                ]
-            )
-        ]
+        """Load onboarding pages from the resource bundle"""
+        self.pages = [OnboardingPage(**page) for page in resources().json("onboarding/pages")]
     
     def _setup_ui(self):
         """Setup the main UI"""
@@ -292,18 +227,7 @@ class OnboardingWindow(QMainWindow):
         skip_layout.addStretch()
         
         self.skip_btn = QPushButton("Skip")
-        self.skip_btn.setStyleSheet("""
-            QPushButton {
-                background: transparent;
-                color: rgba(255, 255, 255, 180);
-                border: none;
-                padding: 12px 20px;
-                font-size: 14px;
-            }
-            QPushButton:hover {
-                color: white;
-            }
-        """)
+        self.skip_btn.setStyleSheet(resources().text("style/onboarding/skip_button"))
         self.skip_btn.setCursor(Qt.CursorShape.PointingHandCursor)
         self.skip_btn.clicked.connect(self._on_skip)
         skip_layout.addWidget(self.skip_btn)
@@ -347,23 +271,7 @@ class OnboardingWindow(QMainWindow):
         # Back button
         self.back_btn = QPushButton("←")
         self.back_btn.setFixedSize(56, 56)
-        self.back_btn.setStyleSheet("""
-            QPushButton {
-                background: rgba(255, 255, 255, 0.15);
-                color: white;
-                border: none;
-                border-radius: 28px;
-                font-size: 20px;
-                font-weight: bold;
-            }
-            QPushButton:hover {
-                background: rgba(255, 255, 255, 0.25);
-            }
-            QPushButton:disabled {
-                background: transparent;
-                color: transparent;
-            }
-        """)
+        self.back_btn.setStyleSheet(resources().text("style/onboarding/back_button"))
         self.back_btn.setCursor(Qt.CursorShape.PointingHandCursor)
         self.back_btn.clicked.connect(self._on_back)
         self.back_btn.setEnabled(False)
@@ -374,22 +282,7 @@ class OnboardingWindow(QMainWindow):
         # Next/Start button
         self.next_btn = QPushButton("Next →")
         self.next_btn.setFixedHeight(56)
-        self.next_btn.setStyleSheet("""
-            QPushButton {
-                background: qlineargradient(x1: 0, y1: 0, x2: 1, y2: 0,
-                    stop: 0 #3B82F6, stop: 1 #8B5CF6);
-                color: white;
-                border: none;
-                border-radius: 12px;
-                font-size: 16px;
-                font-weight: bold;
-                padding: 0 32px;
-            }
-            QPushButton:hover {
-                background: qlineargradient(x1: 0, y1: 0, x2: 1, y2: 0,
-                    stop: 0 #2563EB, stop: 1 #7C3AED);
-            }
-        """)
+        self.next_btn.setStyleSheet(resources().text("style/onboarding/next_button"))
         self.next_btn.setCursor(Qt.CursorShape.PointingHandCursor)
         self.next_btn.clicked.connect(self._on_next)
         nav_layout.addWidget(self.next_btn)
@@ -398,12 +291,7 @@ class OnboardingWindow(QMainWindow):
     
     def _apply_gradient_background(self):
         """Apply gradient background to window"""
-        self.setStyleSheet("""
-            QMainWindow {
-                background: qlineargradient(x1: 0, y1: 0, x2: 1, y2: 1,
-                    stop: 0 #1a1a2e, stop: 0.5 #16213e, stop: 1 #0f3460);
-            }
-        """)
+        self.setStyleSheet(resources().text("style/onboarding/window"))
     
     def _update_indicators(self):
         """Update page indicator styles"""
@@ -506,38 +394,7 @@ class TutorialWindow(QMainWindow):
         self.setMinimumSize(600, 500)
         self.resize(600, 500)
         
-        self.steps = [
-            TutorialStep(
-                title="Press & Hold",
-                description="Press and hold anywhere on the camera preview to preview colors",
-                icon="👆",
-                color="#3B82F6"
-            ),
-            TutorialStep(
-                title="Magnifier",
-                description="The magnifier appears above your cursor with precise crosshairs",
-                icon="🔍",
-                color="#8B5CF6"
-            ),
-            TutorialStep(
-                title="Drag to Adjust",
-                description="Drag to fine-tune the exact color you want",
-                icon="↔️",
-                color="#3B82F6"
-            ),
-            TutorialStep(
-                title="Release to Capture",
-                description="Release to save the color. You can capture up to 5 colors!",
-                icon="✓",
-                color="#22C55E"
-            ),
-            TutorialStep(
-                title="Freeze Frame",
-                description="Tap Freeze Frame to pause the camera for easier picking",
-                icon="❄️",
-                color="#22C55E"
-            )
-        ]
+        self.steps = [TutorialStep(**step) for step in resources().json("tutorial/steps")]
         
         self.current_step = 0
         self._setup_ui()
@@ -579,20 +436,13 @@ class TutorialWindow(QMainWindow):
         
         # Title
         self.title_label = QLabel(self.steps[0].title)
-        self.title_label.setStyleSheet("""
-            color: white;
-            font-size: 24px;
-            font-weight: bold;
-        """)
+        self.title_label.setStyleSheet(resources().text("style/tutorial/title"))
         self.title_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
         layout.addWidget(self.title_label)
         
         # Description
         self.desc_label = QLabel(self.steps[0].description)
-        self.desc_label.setStyleSheet("""
-            color: rgba(255, 255, 255, 200);
-            font-size: 16px;
-        """)
+        self.desc_label.setStyleSheet(resources().text("style/tutorial/description"))
         self.desc_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
         self.desc_label.setWordWrap(True)
         layout.addWidget(self.desc_label)
@@ -603,18 +453,7 @@ class TutorialWindow(QMainWindow):
         nav_layout = QHBoxLayout()
         
         self.back_btn = QPushButton("Back")
-        self.back_btn.setStyleSheet("""
-            QPushButton {
-                background: transparent;
-                color: rgba(255, 255, 255, 180);
-                border: none;
-                padding: 12px 24px;
-                font-size: 14px;
-            }
-            QPushButton:hover {
-                color: white;
-            }
-        """)
+        self.back_btn.setStyleSheet(resources().text("style/tutorial/back_button"))
         self.back_btn.setCursor(Qt.CursorShape.PointingHandCursor)
         self.back_btn.clicked.connect(self._on_back)
         self.back_btn.setVisible(False)
@@ -623,20 +462,7 @@ class TutorialWindow(QMainWindow):
         nav_layout.addStretch()
         
         self.next_btn = QPushButton("Next")
-        self.next_btn.setStyleSheet("""
-            QPushButton {
-                background: #3B82F6;
-                color: white;
-                border: none;
-                border-radius: 8px;
-                padding: 12px 32px;
-                font-size: 14px;
-                font-weight: bold;
-            }
-            QPushButton:hover {
-                background: #2563EB;
-            }
-        """)
+        self.next_btn.setStyleSheet(resources().text("style/tutorial/next_button"))
         self.next_btn.setCursor(Qt.CursorShape.PointingHandCursor)
         self.next_btn.clicked.connect(self._on_next)
         nav_layout.addWidget(self.next_btn)
@@ -645,11 +471,7 @@ class TutorialWindow(QMainWindow):
     
     def _apply_styles(self):
         """Apply window styles"""
-        self.setStyleSheet("""
-            QMainWindow {
-                background: #0f0f1e;
-            }
-        """)
+        self.setStyleSheet(resources().text("style/tutorial/window"))
     
     def _update_ui(self):
         """Update UI for current step"""
@@ -0,0 +1,472 @@
+"""
+ColorSnap Pro - Palette Extractor
+Dominant-color extraction for the AI Palette feature, fast enough for live preview frames
+
+Usage:
+    from palette_extractor import PaletteExtractor
+    
+    extractor = PaletteExtractor(n_colors=5)
+    palette = extractor.extract(frame)  # frame: H x W x 3/4 uint8 array
+    print([color.hex for color in palette])
+    
+    live = IncrementalExtractor(n_colors=5)
+    palette = live.update(frame)        # per preview frame; reuses work from earlier frames
+"""
+
+import time
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Tuple, Any
+
+import numpy as np
+
+
+# Pixels sampled per frame; keeps per-frame latency flat regardless of resolution
+DEFAULT_SAMPLE_SIZE = 8192
+# Per-frame latency budget for live preview (ms)
+FRAME_BUDGET_MS = 8.0
+
+
+@dataclass
+class PaletteColor:
+    """A dominant color and the share of the frame it covers"""
+    rgb: Tuple[int, int, int]
+    weight: float
+    
+    @property
+    def hex(self) -> str:
+        return "#{:02X}{:02X}{:02X}".format(*self.rgb)
+
+
+def downsample(frame: np.ndarray, sample_size: int = DEFAULT_SAMPLE_SIZE) -> np.ndarray:
+    """
+    Reduce a frame to roughly sample_size RGB pixels as a float32 (N, 3) array
+    
+    Uses a strided view, so only the sampled pixels are copied.
+    """
+    height, width = frame.shape[:2]
+    stride = max(1, int(np.sqrt(height * width / sample_size)))
+    sample = frame[::stride, ::stride, :3]
+    return sample.reshape(-1, 3).astype(np.float32)
+
+
+def _squared_distances(pixels: np.ndarray, centers: np.ndarray) -> np.ndarray:
+    """(N, K) squared distances using |x|^2 - 2x.c + |c|^2"""
+    return (
+        np.einsum("ij,ij->i", pixels, pixels)[:, None]
+        - 2.0 * pixels @ centers.T
+        + np.einsum("ij,ij->i", centers, centers)[None, :]
+    )
+
+
+def _cluster_sums(pixels: np.ndarray, labels: np.ndarray, k: int):
+    """Per-cluster pixel counts and channel sums"""
+    counts = np.bincount(labels, minlength=k)
+    sums = np.stack(
+        [np.bincount(labels, weights=pixels[:, c], minlength=k) for c in range(3)],
+        axis=1
+    ).astype(np.float32)
+    return counts, sums
+
+
+def _kmeans_plus_plus(pixels: np.ndarray, k: int, rng: np.random.Generator) -> np.ndarray:
+    """k-means++ seeding"""
+    centers = np.empty((k, 3), dtype=np.float32)
+    centers[0] = pixels[rng.integers(len(pixels))]
+    closest = _squared_distances(pixels, centers[:1])[:, 0]
+    
+    for i in range(1, k):
+        total = closest.sum()
+        if total <= 0:
+            # Fewer distinct colors than clusters
+            centers[i:] = centers[0]
+            break
+        centers[i] = pixels[rng.choice(len(pixels), p=np.maximum(closest, 0) / total)]
+        closest = np.minimum(closest, _squared_distances(pixels, centers[i:i + 1])[:, 0])
+    
+    return centers
+
+
+class PaletteExtractor:
+    """
+    Vectorized k-means palette extraction on downsampled frames
+    
+    Args:
+        n_colors: Number of palette colors
+        sample_size: Approximate pixels sampled per frame
+        max_iter: Lloyd (or mini-batch) iterations
+        mini_batch: If set, update centers from random batches of this size
+            instead of full passes over the sample
+        seed: Random seed for reproducible palettes
+    """
+    
+    def __init__(
+        self,
+        n_colors: int = 5,
+        sample_size: int = DEFAULT_SAMPLE_SIZE,
+        max_iter: int = 8,
+        mini_batch: Optional[int] = None,
+        tol: float = 1.0,
+        seed: int = 0
+    ):
+        if n_colors < 1:
+            raise ValueError("n_colors must be at least 1")
+        self.n_colors = n_colors
+        self.sample_size = sample_size
+        self.max_iter = max_iter
+        self.mini_batch = mini_batch
+        self.tol = tol
+        self._rng = np.random.default_rng(seed)
+    
+    def extract(self, frame: np.ndarray, initial_centers: Optional[np.ndarray] = None) -> List[PaletteColor]:
+        """Extract dominant colors, most common first"""
+        pixels = downsample(frame, self.sample_size)
+        centers, counts = self.cluster(pixels, initial_centers)
+        return self._to_palette(centers, counts)
+    
+    def cluster(self, pixels: np.ndarray, initial_centers: Optional[np.ndarray] = None):
+        """Run k-means on (N, 3) float32 pixels; returns (centers, counts)"""
+        k = min(self.n_colors, len(pixels))
+        if initial_centers is not None and len(initial_centers) == k:
+            centers = initial_centers.astype(np.float32, copy=True)
+        else:
+            centers = _kmeans_plus_plus(pixels, k, self._rng)
+        
+        if self.mini_batch:
+            centers = self._mini_batch_kmeans(pixels, centers)
+        else:
+            centers = self._lloyd(pixels, centers)
+        
+        labels = _squared_distances(pixels, centers).argmin(axis=1)
+        counts = np.bincount(labels, minlength=k)
+        return centers, counts
+    
+    def _lloyd(self, pixels: np.ndarray, centers: np.ndarray) -> np.ndarray:
+        """Full-batch k-means iterations"""
+        k = len(centers)
+        for _ in range(self.max_iter):
+            labels = _squared_distances(pixels, centers).argmin(axis=1)
+            counts, sums = _cluster_sums(pixels, labels, k)
+            
+            updated = centers.copy()
+            nonempty = counts > 0
+            updated[nonempty] = sums[nonempty] / counts[nonempty, None]
+            
+            shift = np.abs(updated - centers).max()
+            centers = updated
+            if shift < self.tol:
+                break
+        return centers
+    
+    def _mini_batch_kmeans(self, pixels: np.ndarray, centers: np.ndarray) -> np.ndarray:
+        """Mini-batch k-means with per-center learning rates"""
+        k = len(centers)
+        seen = np.zeros(k, dtype=np.float32)
+        batch_size = min(self.mini_batch, len(pixels))
+        
+        for _ in range(self.max_iter):
+            batch = pixels[self._rng.integers(0, len(pixels), batch_size)]
+            labels = _squared_distances(batch, centers).argmin(axis=1)
+            counts, sums = _cluster_sums(batch, labels, k)
+            
+            nonempty = counts > 0
+            seen[nonempty] += counts[nonempty]
+            rate = (counts[nonempty] / seen[nonempty]).astype(np.float32)
+            batch_means = sums[nonempty] / counts[nonempty, None]
+            centers[nonempty] += rate[:, None] * (batch_means - centers[nonempty])
+        return centers
+    
+    @staticmethod
+    def _to_palette(centers: np.ndarray, counts: np.ndarray) -> List[PaletteColor]:
+        total = max(int(counts.sum()), 1)
+        order = np.argsort(-counts, kind="stable")
+        rgb = np.clip(np.rint(centers), 0, 255).astype(np.uint8)
+        return [
+            PaletteColor(tuple(int(c) for c in rgb[i]), float(counts[i]) / total)
+            for i in order
+            if counts[i] > 0
+        ]
+
+
+# MARK: - Incremental Extraction
+
+# Floor for the scene-cut baseline (mean squared distance), so near-perfect
+# fits on flat-color frames do not turn every small change into a cut
+_MIN_BASELINE_ERROR = 16.0 ** 2
+
+
+class IncrementalExtractor:
+    """
+    Palette extraction for a live preview that reuses work between frames
+    
+    The downsampled frame is split into a grid of tiles, each with a
+    content hash of its quantized pixels and its per-cluster pixel counts
+    and sums. On each frame only tiles whose hash changed are reassigned
+    to the current centers; the centers are then updated from the summed
+    tile statistics. A full k-means pass, warm-started from the previous
+    centers, runs only on the first frame, when the centers shift by more
+    than refresh_shift, or (freshly seeded) on a scene cut.
+    
+    While nothing changes, frames are checked less and less often (doubling
+    up to max_interval frames); any change goes back to every frame.
+    
+    Args:
+        grid: Tiles per side
+        quantize_bits: Low bits dropped before hashing, so small noise
+            rarely marks a tile as changed
+        refresh_shift: Center movement (0-255 units) that triggers a full pass
+        scene_cut: How many times worse than at the last full pass the
+            centers may fit changed pixels (mean squared distance) before
+            the frame is treated as a new scene and reseeded from scratch
+        max_interval: Most frames between checks of a static scene
+    """
+    
+    def __init__(
+        self,
+        n_colors: int = 5,
+        sample_size: int = DEFAULT_SAMPLE_SIZE,
+        grid: int = 8,
+        quantize_bits: int = 3,
+        refresh_shift: float = 8.0,
+        scene_cut: float = 4.0,
+        max_interval: int = 16,
+        **extractor_options
+    ):
+        self.extractor = PaletteExtractor(n_colors=n_colors, sample_size=sample_size, **extractor_options)
+        self.grid = grid
+        self.quantize_bits = quantize_bits
+        self.refresh_shift = refresh_shift
+        self.scene_cut = scene_cut
+        self.max_interval = max_interval
+        self.counters = {"frames": 0, "skipped": 0, "unchanged": 0, "partial": 0, "full": 0, "tiles_reprocessed": 0}
+        self.reset()
+    
+    @property
+    def n_colors(self) -> int:
+        return self.extractor.n_colors
+    
+    def reset(self):
+        """Forget all cached state; the next frame gets a full extraction"""
+        self.palette: List[PaletteColor] = []
+        self.last_action = None
+        self._shape = None
+        self._centers: Optional[np.ndarray] = None
+        self._hashes: Optional[np.ndarray] = None
+        self._hash_weights: Optional[np.ndarray] = None
+        self._tile_counts: Optional[np.ndarray] = None
+        self._tile_sums: Optional[np.ndarray] = None
+        self._baseline_error = 0.0
+        self._interval = 1
+        self._countdown = 0
+    
+    def update(self, frame: np.ndarray) -> List[PaletteColor]:
+        """Palette for the next frame of a stream (may be the previous palette)"""
+        self.counters["frames"] += 1
+        if self._countdown > 0 and frame.shape == self._shape:
+            self._countdown -= 1
+            return self._finish("skipped")
+        
+        tiles = self._tiles(frame)
+        hashes = self._hash_tiles(tiles)
+        if self._centers is None:
+            return self._full(tiles, hashes)
+        
+        changed = np.flatnonzero(hashes != self._hashes)
+        if not len(changed):
+            self._interval = min(self._interval * 2, self.max_interval)
+            self._countdown = self._interval - 1
+            return self._finish("unchanged")
+        
+        self._interval = 1
+        pixels = tiles[changed].astype(np.float32)
+        counts, sums, error = self._tile_stats(pixels, self._centers)
+        if error > self.scene_cut * max(self._baseline_error, _MIN_BASELINE_ERROR):
+            # The current centers fit the new content poorly: a new scene,
+            # where warm-starting would trap k-means in a bad minimum
+            return self._full(tiles, hashes, warm=False)
+        
+        self._hashes = hashes
+        self._tile_counts[changed], self._tile_sums[changed] = counts, sums
+        self.counters["tiles_reprocessed"] += len(changed)
+        
+        counts = self._tile_counts.sum(axis=0)
+        sums = self._tile_sums.sum(axis=0)
+        centers = self._centers.copy()
+        nonempty = counts > 0
+        centers[nonempty] = sums[nonempty] / counts[nonempty, None]
+        if np.abs(centers - self._centers).max() > self.refresh_shift:
+            return self._full(tiles, hashes)
+        
+        self._centers = centers
+        self.palette = self.extractor._to_palette(centers, counts)
+        return self._finish("partial")
+    
+    def _finish(self, action: str) -> List[PaletteColor]:
+        self.last_action = action
+        self.counters[action] += 1
+        return self.palette
+    
+    def _tiles(self, frame: np.ndarray) -> np.ndarray:
+        """Strided sample of the frame as (tiles, pixels per tile, 3) uint8"""
+        height, width = frame.shape[:2]
+        stride = max(1, int(np.sqrt(height * width / self.extractor.sample_size)))
+        sample = frame[::stride, ::stride, :3]
+        rows, cols = min(self.grid, sample.shape[0]), min(self.grid, sample.shape[1])
+        tile_h, tile_w = sample.shape[0] // rows, sample.shape[1] // cols
+        sample = sample[:rows * tile_h, :cols * tile_w]
+        
+        if frame.shape != self._shape:
+            self.reset()
+            self._shape = frame.shape
+        return (
+            sample.reshape(rows, tile_h, cols, tile_w, 3)
+            .transpose(0, 2, 1, 3, 4)
+            .reshape(rows * cols, tile_h * tile_w, 3)
+        )
+    
+    def _hash_tiles(self, tiles: np.ndarray) -> np.ndarray:
+        """Per-tile 64-bit hash: random odd weights times quantized values, summed mod 2^64"""
+        values = (tiles >> self.quantize_bits).reshape(len(tiles), -1).astype(np.uint64)
+        if self._hash_weights is None or len(self._hash_weights) != values.shape[1]:
+            rng = np.random.default_rng(0)
+            self._hash_weights = rng.integers(0, 2 ** 63, values.shape[1], dtype=np.uint64) | np.uint64(1)
+        return (values * self._hash_weights).sum(axis=1)
+    
+    def _tile_stats(self, tiles: np.ndarray, centers: np.ndarray):
+        """Per-tile cluster counts (T, K), channel sums (T, K, 3) and mean squared distance"""
+        count, per_tile = tiles.shape[:2]
+        k = len(centers)
+        pixels = tiles.reshape(-1, 3)
+        distances = _squared_distances(pixels, centers)
+        labels = distances.argmin(axis=1)
+        keys = np.repeat(np.arange(count) * k, per_tile) + labels
+        counts = np.bincount(keys, minlength=count * k).reshape(count, k)
+        sums = np.stack(
+            [np.bincount(keys, weights=pixels[:, c], minlength=count * k) for c in range(3)],
+            axis=-1
+        ).reshape(count, k, 3)
+        return counts, sums, float(distances[np.arange(len(labels)), labels].mean())
+    
+    def _full(self, tiles: np.ndarray, hashes: np.ndarray, warm: bool = True) -> List[PaletteColor]:
+        """k-means over every tile, warm-started from the current centers unless warm=False"""
+        pixels = tiles.astype(np.float32)
+        centers, _ = self.extractor.cluster(pixels.reshape(-1, 3), self._centers if warm else None)
+        self._centers = centers
+        self._hashes = hashes
+        self._tile_counts, self._tile_sums, self._baseline_error = self._tile_stats(pixels, centers)
+        self.counters["tiles_reprocessed"] += len(tiles)
+        self.palette = self.extractor._to_palette(centers, self._tile_counts.sum(axis=0))
+        return self._finish("full")
+
+
+def qimage_to_array(image) -> np.ndarray:
+    """
+    Get a QImage as an H x W x 4 RGBA uint8 array
+    
+    RGBA8888 images are viewed without copying (keep the image alive while
+    using the array); other formats are converted and copied.
+    """
+    from PyQt6.QtGui import QImage
+    
+    converted = image.format() != QImage.Format.Format_RGBA8888
+    if converted:
+        image = image.convertToFormat(QImage.Format.Format_RGBA8888)
+    bits = image.constBits()
+    bits.setsize(image.sizeInBytes())
+    array = np.frombuffer(bits, dtype=np.uint8).reshape(image.height(), image.bytesPerLine() // 4, 4)
+    array = array[:, :image.width()]
+    return array.copy() if converted else array
+
+
+# MARK: - Benchmarks
+
+BENCHMARK_RESOLUTIONS = {
+    "720p": (1280, 720),
+    "1080p": (1920, 1080),
+    "4K": (3840, 2160),
+}
+
+
+def synthetic_frame(width: int, height: int, seed: int = 0) -> np.ndarray:
+    """Blocky multi-color frame with gradients and noise, resembling a camera scene"""
+    rng = np.random.default_rng(seed)
+    block_colors = rng.integers(0, 216, (6, 3), dtype=np.uint8)
+    cols = np.arange(width) * 3 // width
+    rows = np.arange(height) * 2 // height
+    frame = block_colors[rows[:, None] * 3 + cols[None, :]]
+    gradient = (np.arange(width) * 32 // width).astype(np.uint8)
+    frame += gradient[None, :, None]
+    frame += rng.integers(0, 8, frame.shape, dtype=np.uint8)
+    return frame
+
+
+def benchmark(repeats: int = 20, **extractor_options) -> Dict[str, Dict[str, Any]]:
+    """Per-frame extraction latency at 720p, 1080p and 4K"""
+    results = {}
+    for name, (width, height) in BENCHMARK_RESOLUTIONS.items():
+        frame = synthetic_frame(width, height)
+        extractor = PaletteExtractor(**extractor_options)
+        extractor.extract(frame)  # warm up
+        
+        timings = []
+        for _ in range(repeats):
+            started = time.perf_counter()
+            extractor.extract(frame)
+            timings.append((time.perf_counter() - started) * 1000)
+        
+        median = float(np.median(timings))
+        results[name] = {
+            "median_ms": round(median, 3),
+            "p95_ms": round(float(np.percentile(timings, 95)), 3),
+            "within_budget": median <= FRAME_BUDGET_MS,
+        }
+    return results
+
+
+def benchmark_incremental(seconds: float = 3.0, fps: int = 30, resolution: str = "1080p",
+                          pan: int = 6) -> Dict[str, Dict[str, Any]]:
+    """
+    CPU time per second of video, full extraction every frame vs. incremental
+    
+    "static" repeats one frame; "moving" pans across a wider scene by `pan`
+    pixels per frame. CPU is process time, so it includes BLAS threads.
+    """
+    width, height = BENCHMARK_RESOLUTIONS[resolution]
+    scene = synthetic_frame(width * 2, height)
+    frame_count = int(seconds * fps)
+    videos = {
+        "static": lambda i: scene[:, :width],
+        "moving": lambda i: scene[:, (i * pan) % width:(i * pan) % width + width],
+    }
+    
+    results = {}
+    for video, frame_at in videos.items():
+        for mode in ("full", "incremental"):
+            extractor = PaletteExtractor() if mode == "full" else IncrementalExtractor()
+            run = extractor.extract if mode == "full" else extractor.update
+            run(frame_at(0))  # warm up
+            
+            started = time.process_time()
+            for i in range(1, frame_count + 1):
+                run(frame_at(i))
+            cpu = time.process_time() - started
+            
+            stats = {"cpu_ms_per_sec": round(cpu * 1000 / seconds, 2), "cpu_percent": round(cpu * 100 / seconds, 1)}
+            if mode == "incremental":
+                stats.update({key: extractor.counters[key] for key in ("full", "partial", "unchanged", "skipped")})
+            results[f"{video}/{mode}"] = stats
+    return results
+
+
+# Benchmark
+if __name__ == "__main__":
+    for label, options in [("k-means", {}), ("mini-batch", {"mini_batch": 1024, "max_iter": 16})]:
+        print(f"📊 {label} (budget {FRAME_BUDGET_MS} ms/frame)")
+        for resolution, stats in benchmark(**options).items():
+            status = "✅" if stats["within_budget"] else "❌"
+            print(f"   {status} {resolution:>6}: median {stats['median_ms']:.2f} ms, p95 {stats['p95_ms']:.2f} ms")
+    
+    print("📊 Live preview CPU per second of 1080p video at 30 fps")
+    for name, stats in benchmark_incremental().items():
+        detail = ", ".join(f"{key} {stats[key]}" for key in ("full", "partial", "unchanged", "skipped") if key in stats)
+        print(f"   {name:>20}: {stats['cpu_ms_per_sec']:7.2f} ms/s ({stats['cpu_percent']:.1f}% of a core)"
+              + (f"  [{detail}]" if detail else ""))
@@ -0,0 +1,343 @@
+"""
+ColorSnap Pro - Palette Grid
+Virtualized model/view grid of saved palettes with swatches drawn from a pixmap atlas
+
+Usage:
+    from palette_grid import PaletteListModel, PaletteGridView
+    
+    model = PaletteListModel(library)     # pages in from the library as the view scrolls
+    view = PaletteGridView(model)
+    view.palette_activated.connect(...)
+
+Palettes are laid out as uniform cards that wrap into as many columns as fit.
+Only cards in the viewport are painted and no per-swatch widgets exist, so
+scrolling cost and widget memory do not grow with the library size.
+"""
+
+import time
+from collections import OrderedDict
+from typing import Dict, List, Optional
+
+from PyQt6.QtWidgets import QListView, QStyledItemDelegate, QStyle, QAbstractItemView
+from PyQt6.QtCore import Qt, QAbstractListModel, QModelIndex, QRect, QRectF, QSize, pyqtSignal
+from PyQt6.QtGui import QColor, QPainter, QPixmap
+
+from palette_library import Palette, PaletteLibrary
+
+
+TILE_SIZE = 28
+TILE_SPACING = 6
+CARD_SWATCHES = 5      # swatch slots on a card; with more colors the last slot shows "+N"
+CARD_PADDING = 10
+NAME_HEIGHT = 24
+CARD_WIDTH = 2 * CARD_PADDING + CARD_SWATCHES * TILE_SIZE + (CARD_SWATCHES - 1) * TILE_SPACING
+CARD_HEIGHT = 2 * CARD_PADDING + NAME_HEIGHT + TILE_SIZE
+CARD_MARGIN = 4        # empty space around each card, so cards sit 2 * CARD_MARGIN apart
+CARD_RADIUS = 8
+CARD_BACKGROUNDS = {
+    "normal": QColor(255, 255, 255, 10),
+    "hover": QColor(255, 255, 255, 22),
+    "selected": QColor(59, 130, 246, 60),
+}
+OVERFLOW_BACKGROUND = QColor(255, 255, 255, 40)
+
+
+# MARK: - Model
+
+class PaletteListModel(QAbstractListModel):
+    """
+    List model over a PaletteLibrary
+    
+    Rows are fetched a page at a time through canFetchMore/fetchMore, which
+    the view calls when it scrolls near the end of what is loaded. Search
+    results are paged in the same way from a list of palette ids.
+    """
+    ColorsRole = Qt.ItemDataRole.UserRole + 1
+    IdRole = Qt.ItemDataRole.UserRole + 2
+    
+    def __init__(self, library: PaletteLibrary, page_size: int = 200, parent=None):
+        super().__init__(parent)
+        self.library = library
+        self.page_size = page_size
+        self._palettes: List[Palette] = []
+        self._pending_ids: Optional[List[int]] = None
+        self._exhausted = False
+    
+    def reload(self):
+        """Drop loaded rows and start again from the newest palette"""
+        self.beginResetModel()
+        self._palettes = []
+        self._pending_ids = None
+        self._exhausted = False
+        self.endResetModel()
+    
+    def show_palettes(self, palettes: List[Palette]):
+        """Show a fixed set of palettes without paging"""
+        self.beginResetModel()
+        self._palettes = list(palettes)
+        self._pending_ids = None
+        self._exhausted = True
+        self.endResetModel()
+    
+    def show_palette_ids(self, palette_ids: List[int]):
+        """Show palettes by id in the given order (e.g. search results), fetched a page at a time"""
+        self.beginResetModel()
+        self._palettes = []
+        self._pending_ids = list(palette_ids)
+        self._exhausted = not self._pending_ids
+        self.endResetModel()
+    
+    def palette(self, row: int) -> Palette:
+        return self._palettes[row]
+    
+    def rowCount(self, parent=QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self._palettes)
+    
+    def data(self, index: QModelIndex, role: int = Qt.ItemDataRole.DisplayRole):
+        if not index.isValid():
+            return None
+        palette = self._palettes[index.row()]
+        if role == Qt.ItemDataRole.DisplayRole:
+            return palette.name
+        if role == self.ColorsRole:
+            return palette.colors
+        if role == self.IdRole:
+            return palette.id
+        if role == Qt.ItemDataRole.ToolTipRole:
+            return " ".join(palette.colors)
+        return None
+    
+    def canFetchMore(self, parent=QModelIndex()) -> bool:
+        return not parent.isValid() and not self._exhausted
+    
+    def fetchMore(self, parent=QModelIndex()):
+        if parent.isValid() or self._exhausted:
+            return
+        if self._pending_ids is not None:
+            page = self.library.get_palettes(self._pending_ids[:self.page_size])
+            del self._pending_ids[:self.page_size]
+            self._exhausted = not self._pending_ids
+        else:
+            before_id = self._palettes[-1].id if self._palettes else None
+            page = self.library.page(self.page_size, before_id=before_id)
+            self._exhausted = len(page) < self.page_size
+        if not page:
+            return
+        self.beginInsertRows(QModelIndex(), len(self._palettes), len(self._palettes) + len(page) - 1)
+        self._palettes.extend(page)
+        self.endInsertRows()
+
+
+# MARK: - Swatch Atlas
+
+class SwatchAtlas:
+    """
+    Rounded swatch tiles rendered once into a shared pixmap
+    
+    Each distinct color gets a slot in a fixed grid; when the atlas is full
+    the least recently used color's slot is redrawn for the new color.
+    """
+    
+    def __init__(self, tile: int = TILE_SIZE, columns: int = 32, rows: int = 32,
+                 device_pixel_ratio: float = 1.0, radius: float = 6.0):
+        self.tile = tile
+        self.columns = columns
+        self.capacity = columns * rows
+        self.radius = radius
+        self.pixmap = QPixmap(int(columns * tile * device_pixel_ratio), int(rows * tile * device_pixel_ratio))
+        self.pixmap.setDevicePixelRatio(device_pixel_ratio)
+        self.pixmap.fill(Qt.GlobalColor.transparent)
+        self._ratio = device_pixel_ratio
+        self._slots: "OrderedDict[str, int]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+    
+    def __len__(self) -> int:
+        return len(self._slots)
+    
+    def source(self, color: str) -> QRectF:
+        """Atlas rectangle (in device pixels) holding the tile for color"""
+        slot = self._slots.get(color)
+        if slot is None:
+            slot = self._allocate(color)
+            self.misses += 1
+        else:
+            self._slots.move_to_end(color)
+            self.hits += 1
+        size = self.tile * self._ratio
+        return QRectF((slot % self.columns) * size, (slot // self.columns) * size, size, size)
+    
+    def _allocate(self, color: str) -> int:
+        if len(self._slots) < self.capacity:
+            slot = len(self._slots)
+        else:
+            _, slot = self._slots.popitem(last=False)
+        self._slots[color] = slot
+        
+        x, y = (slot % self.columns) * self.tile, (slot // self.columns) * self.tile
+        painter = QPainter(self.pixmap)
+        painter.setCompositionMode(QPainter.CompositionMode.CompositionMode_Source)
+        painter.fillRect(QRect(x, y, self.tile, self.tile), Qt.GlobalColor.transparent)
+        painter.setCompositionMode(QPainter.CompositionMode.CompositionMode_SourceOver)
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+        painter.setPen(Qt.PenStyle.NoPen)
+        painter.setBrush(QColor(color))
+        painter.drawRoundedRect(QRectF(x + 0.5, y + 0.5, self.tile - 1, self.tile - 1), self.radius, self.radius)
+        painter.end()
+        return slot
+
+
+# MARK: - Delegate & View
+
+class PaletteDelegate(QStyledItemDelegate):
+    """
+    Paints a palette card: name on top, swatches blitted from the atlas below
+    
+    Palettes with more colors than the card has slots show the first ones
+    and a "+N" count of the rest in the last slot.
+    
+    The rounded card background is rendered once per state and blitted too,
+    since antialiasing it for every visible card is the costliest part of a frame.
+    """
+    
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.atlas: Optional[SwatchAtlas] = None
+        self._backgrounds: Dict[str, QPixmap] = {}
+    
+    def _background(self, state: str, ratio: float) -> QPixmap:
+        pixmap = self._backgrounds.get(state)
+        if pixmap is None:
+            pixmap = QPixmap(int(CARD_WIDTH * ratio), int(CARD_HEIGHT * ratio))
+            pixmap.setDevicePixelRatio(ratio)
+            pixmap.fill(Qt.GlobalColor.transparent)
+            painter = QPainter(pixmap)
+            painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+            painter.setPen(Qt.PenStyle.NoPen)
+            painter.setBrush(CARD_BACKGROUNDS[state])
+            painter.drawRoundedRect(QRectF(0, 0, CARD_WIDTH, CARD_HEIGHT), CARD_RADIUS, CARD_RADIUS)
+            painter.end()
+            self._backgrounds[state] = pixmap
+        return pixmap
+    
+    def sizeHint(self, option, index) -> QSize:
+        return QSize(CARD_WIDTH, CARD_HEIGHT)
+    
+    def paint(self, painter: QPainter, option, index: QModelIndex):
+        ratio = option.widget.devicePixelRatioF() if option.widget else 1.0
+        if self.atlas is None:
+            self.atlas = SwatchAtlas(device_pixel_ratio=ratio)
+        
+        rect = option.rect
+        if option.state & QStyle.StateFlag.State_Selected:
+            state = "selected"
+        elif option.state & QStyle.StateFlag.State_MouseOver:
+            state = "hover"
+        else:
+            state = "normal"
+        painter.drawPixmap(rect.topLeft(), self._background(state, ratio))
+        
+        name = index.data(Qt.ItemDataRole.DisplayRole)
+        text_rect = QRect(rect.left() + CARD_PADDING, rect.top() + CARD_PADDING,
+                          rect.width() - 2 * CARD_PADDING, NAME_HEIGHT)
+        painter.setPen(QColor("white"))
+        painter.drawText(
+            text_rect, Qt.AlignmentFlag.AlignTop | Qt.AlignmentFlag.AlignLeft,
+            option.fontMetrics.elidedText(name, Qt.TextElideMode.ElideRight, text_rect.width())
+        )
+        
+        colors = index.data(PaletteListModel.ColorsRole)
+        shown = colors if len(colors) <= CARD_SWATCHES else colors[:CARD_SWATCHES - 1]
+        top = text_rect.bottom() + 1
+        x = text_rect.left()
+        for color in shown:
+            painter.drawPixmap(QRectF(x, top, TILE_SIZE, TILE_SIZE), self.atlas.pixmap, self.atlas.source(color))
+            x += TILE_SIZE + TILE_SPACING
+        if len(shown) < len(colors):
+            tile = QRect(x, top, TILE_SIZE, TILE_SIZE)
+            painter.fillRect(tile, OVERFLOW_BACKGROUND)
+            painter.drawText(tile, Qt.AlignmentFlag.AlignCenter, f"+{len(colors) - len(shown)}")
+
+
+class PaletteGridView(QListView):
+    """Virtualized palette grid: uniform cards wrapping left to right, painted by PaletteDelegate"""
+    palette_activated = pyqtSignal(int)
+    
+    def __init__(self, model: PaletteListModel, parent=None):
+        super().__init__(parent)
+        self.setModel(model)
+        self.setItemDelegate(PaletteDelegate(self))
+        self.setFlow(QListView.Flow.LeftToRight)
+        self.setWrapping(True)
+        self.setResizeMode(QListView.ResizeMode.Adjust)
+        self.setSpacing(CARD_MARGIN)
+        # Uniform sizes let the view lay out cards without measuring each one
+        self.setUniformItemSizes(True)
+        self.setVerticalScrollMode(QAbstractItemView.ScrollMode.ScrollPerPixel)
+        self.setSelectionMode(QAbstractItemView.SelectionMode.SingleSelection)
+        self.setMouseTracking(True)
+        self.setStyleSheet("QListView { background: transparent; border: none; }")
+        self.activated.connect(lambda index: self.palette_activated.emit(index.data(PaletteListModel.IdRole)))
+    
+    def columns(self) -> int:
+        """Cards per row at the current width"""
+        return max(1, self.viewport().width() // (CARD_WIDTH + 2 * CARD_MARGIN))
+
+
+# MARK: - Benchmarks
+
+def benchmark(palettes: int = 20000, colors_per_palette: int = 5, frames: int = 240,
+              width: int = 800, height: int = 600) -> Dict[str, float]:
+    """Scroll through a library of palettes, repainting every frame"""
+    import numpy as np
+    from PyQt6.QtWidgets import QApplication
+    from color_space import rgb_array_to_hex
+    
+    app = QApplication.instance() or QApplication([])
+    rng = np.random.default_rng(0)
+    hex_codes = rgb_array_to_hex(rng.integers(0, 256, (palettes * colors_per_palette, 3), dtype=np.uint8))
+    
+    with PaletteLibrary(":memory:") as library:
+        library.save_palettes(
+            (f"Palette {i}", hex_codes[i * colors_per_palette:(i + 1) * colors_per_palette])
+            for i in range(palettes)
+        )
+        model = PaletteListModel(library, page_size=500)
+        view = PaletteGridView(model)
+        view.resize(width, height)
+        view.show()
+        app.processEvents()
+        
+        bar = view.verticalScrollBar()
+        step = height // 3
+        timings = []
+        for _ in range(frames):
+            started = time.perf_counter()
+            bar.setValue(bar.value() + step)
+            view.viewport().repaint()
+            app.processEvents()
+            timings.append(time.perf_counter() - started)
+        
+        delegate = view.itemDelegate()
+        frame_ms = np.array(timings) * 1000
+        stats = {
+            "colors": library.color_count(),
+            "palettes_loaded": model.rowCount(),
+            "columns": view.columns(),
+            "median_ms": round(float(np.median(frame_ms)), 3),
+            "p95_ms": round(float(np.percentile(frame_ms, 95)), 3),
+            "atlas_tiles": len(delegate.atlas),
+            "atlas_hit_rate": round(delegate.atlas.hits / max(delegate.atlas.hits + delegate.atlas.misses, 1), 3),
+        }
+        view.close()
+        return stats
+
+
+# Benchmark
+if __name__ == "__main__":
+    stats = benchmark()
+    status = "✅" if stats["p95_ms"] < 1000 / 60 else "❌"
+    print(f"📊 Palette grid scrolling ({stats['colors']:,} colors, {stats['palettes_loaded']:,} palettes loaded, "
+          f"{stats['columns']} columns)")
+    print(f"   {status} median {stats['median_ms']:.2f} ms, p95 {stats['p95_ms']:.2f} ms per frame (60 fps = 16.7 ms)")
+    print(f"   atlas: {stats['atlas_tiles']} tiles, {stats['atlas_hit_rate']:.0%} hit rate")
@@ -0,0 +1,334 @@
+"""
+ColorSnap Pro - Palette Library
+Local SQLite palette store with packed colors and an OKLab grid index
+
+Usage:
+    from palette_library import PaletteLibrary
+    
+    library = PaletteLibrary()                          # ~/.colorsnap_pro/palettes.db
+    palette_id = library.save_palette("Sunset", ["#F97316", "#A855F7"])
+    page = library.page(limit=50)                       # newest first
+    more = library.page(limit=50, before_id=page[-1].id)
+    matches = library.find_near("#F97415", radius=0.03)   # palettes with a close color
+"""
+
+import os
+import sqlite3
+import time
+from dataclasses import dataclass
+from typing import Dict, Iterable, Iterator, List, Optional, Sequence, Tuple, Union
+
+import numpy as np
+
+from color_space import RGB, hex_to_rgb_array, rgb_array_to_hex, rgb8_to_oklab
+
+
+DEFAULT_PATH = os.path.join(os.path.expanduser("~"), ".colorsnap_pro", "palettes.db")
+
+# OKLab grid cell edge; roughly a just-noticeable difference
+CELL_SIZE = 0.04
+_CELL_OFFSET = 128
+
+SCHEMA_VERSION = 1
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS palettes (
+    id INTEGER PRIMARY KEY,
+    name TEXT NOT NULL,
+    created REAL NOT NULL,
+    color_count INTEGER NOT NULL
+);
+CREATE TABLE IF NOT EXISTS colors (
+    palette_id INTEGER NOT NULL REFERENCES palettes(id) ON DELETE CASCADE,
+    position INTEGER NOT NULL,
+    rgb INTEGER NOT NULL,
+    cell INTEGER NOT NULL,
+    PRIMARY KEY (palette_id, position)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS colors_by_cell ON colors (cell, palette_id, rgb);
+"""
+
+
+@dataclass
+class Palette:
+    """A saved palette"""
+    id: int
+    name: str
+    colors: List[str]
+    created: float
+
+
+@dataclass
+class NearMatch:
+    """Best matching color of a palette for a near-color query"""
+    palette_id: int
+    color: str
+    distance: float
+
+
+# MARK: - Packing
+
+def pack_rgb(rgb: np.ndarray) -> np.ndarray:
+    """(N, 3) uint8 to 0xRRGGBB integers"""
+    rgb = np.asarray(rgb, dtype=np.int64).reshape(-1, 3)
+    return (rgb[:, 0] << 16) | (rgb[:, 1] << 8) | rgb[:, 2]
+
+
+def unpack_rgb(packed: np.ndarray) -> np.ndarray:
+    """0xRRGGBB integers to (N, 3) uint8"""
+    packed = np.asarray(packed, dtype=np.int64)
+    return np.stack([(packed >> 16) & 0xFF, (packed >> 8) & 0xFF, packed & 0xFF], axis=-1).astype(np.uint8)
+
+
+def _grid_coords(lab: np.ndarray) -> np.ndarray:
+    """OKLab to integer grid coordinates, offset so they are non-negative"""
+    coords = np.floor(lab / CELL_SIZE).astype(np.int64) + _CELL_OFFSET
+    return np.clip(coords, 0, 255)
+
+
+def _pack_cells(coords: np.ndarray) -> np.ndarray:
+    return (coords[..., 0] << 16) | (coords[..., 1] << 8) | coords[..., 2]
+
+
+def grid_cells(rgb: np.ndarray) -> np.ndarray:
+    """Packed OKLab grid cell for each (N, 3) uint8 color"""
+    return _pack_cells(_grid_coords(rgb8_to_oklab(rgb)))
+
+
+def _cells_within(lab: np.ndarray, radius: float) -> List[int]:
+    """All grid cells intersecting the cube of half-width radius around lab"""
+    low = _grid_coords(lab - radius)
+    high = _grid_coords(lab + radius)
+    axes = [np.arange(low[i], high[i] + 1) for i in range(3)]
+    mesh = np.stack(np.meshgrid(*axes, indexing="ij"), axis=-1).reshape(-1, 3)
+    return _pack_cells(mesh).tolist()
+
+
+# MARK: - Library
+
+class PaletteLibrary:
+    """
+    Palette store backed by SQLite
+    
+    Colors are stored as packed 0xRRGGBB integers alongside the packed
+    OKLab grid cell they fall in. A covering index on the cell column
+    turns near-color queries into a handful of index range lookups
+    followed by an exact distance check on the candidates.
+    """
+    
+    def __init__(self, path: str = DEFAULT_PATH):
+        self.path = path
+        if path != ":memory:":
+            os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        self._conn = sqlite3.connect(path)
+        self._conn.execute("PRAGMA foreign_keys = ON")
+        self._conn.execute("PRAGMA journal_mode = WAL")
+        self._conn.execute("PRAGMA synchronous = NORMAL")
+        self._migrate()
+    
+    def _migrate(self):
+        version = self._conn.execute("PRAGMA user_version").fetchone()[0]
+        if version < SCHEMA_VERSION:
+            with self._conn:
+                self._conn.executescript(_SCHEMA)
+                self._conn.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, *exc):
+        self.close()
+    
+    def close(self):
+        self._conn.close()
+    
+    # MARK: - Saving
+    
+    def save_palette(self, name: str, colors: Sequence[str]) -> int:
+        """Save one palette and return its id"""
+        return self.save_palettes([(name, colors)])[0]
+    
+    def save_palettes(self, palettes: Iterable[Tuple[str, Sequence[str]]]) -> List[int]:
+        """Save many palettes in a single transaction"""
+        palettes = list(palettes)
+        all_colors = [color for _, colors in palettes for color in colors]
+        rgb = hex_to_rgb_array(all_colors)
+        packed = pack_rgb(rgb).tolist()
+        cells = grid_cells(rgb).tolist()
+        
+        ids = []
+        rows = []
+        offset = 0
+        now = time.time()
+        with self._conn:
+            for name, colors in palettes:
+                cursor = self._conn.execute(
+                    "INSERT INTO palettes (name, created, color_count) VALUES (?, ?, ?)",
+                    (name, now, len(colors))
+                )
+                palette_id = cursor.lastrowid
+                ids.append(palette_id)
+                for position in range(len(colors)):
+                    rows.append((palette_id, position, packed[offset], cells[offset]))
+                    offset += 1
+            self._conn.executemany(
+                "INSERT INTO colors (palette_id, position, rgb, cell) VALUES (?, ?, ?, ?)", rows
+            )
+        return ids
+    
+    def rename_palette(self, palette_id: int, name: str):
+        with self._conn:
+            self._conn.execute("UPDATE palettes SET name = ? WHERE id = ?", (name, palette_id))
+    
+    def delete_palette(self, palette_id: int):
+        with self._conn:
+            self._conn.execute("DELETE FROM palettes WHERE id = ?", (palette_id,))
+    
+    # MARK: - Loading
+    
+    def palette_count(self) -> int:
+        return self._conn.execute("SELECT COUNT(*) FROM palettes").fetchone()[0]
+    
+    def color_count(self) -> int:
+        return self._conn.execute("SELECT COALESCE(SUM(color_count), 0) FROM palettes").fetchone()[0]
+    
+    def _load(self, rows: List[Tuple[int, str, float]]) -> List[Palette]:
+        """Attach colors to (id, name, created) rows with one query"""
+        if not rows:
+            return []
+        ids = [row[0] for row in rows]
+        colors: Dict[int, List[int]] = {palette_id: [] for palette_id in ids}
+        placeholders = ",".join("?" * len(ids))
+        for palette_id, rgb in self._conn.execute(
+            f"SELECT palette_id, rgb FROM colors WHERE palette_id IN ({placeholders}) "
+            "ORDER BY palette_id, position", ids
+        ):
+            colors[palette_id].append(rgb)
+        return [
+            Palette(palette_id, name, rgb_array_to_hex(unpack_rgb(colors[palette_id])), created)
+            for palette_id, name, created in rows
+        ]
+    
+    def page(self, limit: int = 50, before_id: Optional[int] = None) -> List[Palette]:
+        """
+        Newest palettes first, one page at a time
+        
+        Pass the last id of the previous page as before_id (keyset paging,
+        so deep pages cost the same as the first).
+        """
+        if before_id is None:
+            rows = self._conn.execute(
+                "SELECT id, name, created FROM palettes ORDER BY id DESC LIMIT ?", (limit,)
+            ).fetchall()
+        else:
+            rows = self._conn.execute(
+                "SELECT id, name, created FROM palettes WHERE id < ? ORDER BY id DESC LIMIT ?",
+                (before_id, limit)
+            ).fetchall()
+        return self._load(rows)
+    
+    def iter_palettes(self, page_size: int = 500) -> Iterator[Palette]:
+        """Every palette, newest first, loaded a page at a time"""
+        page = self.page(page_size)
+        while page:
+            yield from page
+            page = self.page(page_size, before_id=page[-1].id)
+    
+    def get_palettes(self, palette_ids: Sequence[int]) -> List[Palette]:
+        """Load palettes by id, in the given order"""
+        if not palette_ids:
+            return []
+        placeholders = ",".join("?" * len(palette_ids))
+        rows = self._conn.execute(
+            f"SELECT id, name, created FROM palettes WHERE id IN ({placeholders})", list(palette_ids)
+        ).fetchall()
+        by_id = {palette.id: palette for palette in self._load(rows)}
+        return [by_id[palette_id] for palette_id in palette_ids if palette_id in by_id]
+    
+    # MARK: - Near-Color Search
+    
+    def find_near(self, color: Union[str, RGB], radius: float = 0.05, limit: Optional[int] = 50) -> List[NearMatch]:
+        """
+        Palettes containing a color within radius (OKLab distance) of color
+        
+        Returns the closest color of each matching palette, nearest first;
+        at most limit of them, or all with limit=None.
+        """
+        rgb = hex_to_rgb_array([color]) if isinstance(color, str) else np.array([color], dtype=np.uint8)
+        target = rgb8_to_oklab(rgb)[0]
+        cells = _cells_within(target, radius)
+        
+        candidates = []
+        # Stay below SQLite's bound-parameter limit for large radii
+        for start in range(0, len(cells), 500):
+            chunk = cells[start:start + 500]
+            candidates += self._conn.execute(
+                f"SELECT palette_id, rgb FROM colors WHERE cell IN ({','.join('?' * len(chunk))})", chunk
+            ).fetchall()
+        if not candidates:
+            return []
+        
+        found = np.array(candidates, dtype=np.int64)
+        distances = np.linalg.norm(rgb8_to_oklab(unpack_rgb(found[:, 1])) - target, axis=-1)
+        within = distances <= radius
+        found, distances = found[within], distances[within]
+        
+        # Best color per palette, then nearest palettes first
+        order = np.lexsort((distances, found[:, 0]))
+        found, distances = found[order], distances[order]
+        first = np.ones(len(found), dtype=bool)
+        first[1:] = found[1:, 0] != found[:-1, 0]
+        found, distances = found[first], distances[first]
+        nearest = np.argsort(distances, kind="stable")[:limit]
+        
+        hex_codes = rgb_array_to_hex(unpack_rgb(found[nearest, 1]))
+        return [
+            NearMatch(int(palette_id), hex_code, round(float(distance), 5))
+            for palette_id, hex_code, distance in zip(found[nearest, 0], hex_codes, distances[nearest])
+        ]
+
+
+# MARK: - Benchmarks
+
+def benchmark(path: str = ":memory:", palettes: int = 25000, colors_per_palette: int = 5,
+              queries: int = 200) -> Dict[str, float]:
+    """Bulk insert, paging and near-color query timings"""
+    rng = np.random.default_rng(0)
+    colors = rng.integers(0, 256, (palettes * colors_per_palette, 3), dtype=np.uint8)
+    hex_codes = rgb_array_to_hex(colors)
+    entries = [
+        (f"Palette {i}", hex_codes[i * colors_per_palette:(i + 1) * colors_per_palette])
+        for i in range(palettes)
+    ]
+    
+    with PaletteLibrary(path) as library:
+        started = time.perf_counter()
+        library.save_palettes(entries)
+        insert_time = time.perf_counter() - started
+        
+        started = time.perf_counter()
+        page = library.page(50)
+        while len(page) == 50 and page[-1].id > palettes - 2000:
+            page = library.page(50, before_id=page[-1].id)
+        page_time = (time.perf_counter() - started) / 40
+        
+        targets = rgb_array_to_hex(rng.integers(0, 256, (queries, 3), dtype=np.uint8))
+        started = time.perf_counter()
+        matches = sum(len(library.find_near(target, radius=0.03)) for target in targets)
+        query_time = (time.perf_counter() - started) / queries
+        
+        return {
+            "colors": library.color_count(),
+            "insert_colors_per_sec": round(len(colors) / insert_time),
+            "page_ms": round(page_time * 1000, 3),
+            "query_ms": round(query_time * 1000, 3),
+            "avg_matches": round(matches / queries, 1),
+        }
+
+
+# Benchmark
+if __name__ == "__main__":
+    stats = benchmark()
+    print(f"📊 Palette library ({stats['colors']:,} colors)")
+    print(f"   insert: {stats['insert_colors_per_sec']:,} colors/s")
+    print(f"   page of 50: {stats['page_ms']:.2f} ms")
+    print(f"   near-color query: {stats['query_ms']:.2f} ms ({stats['avg_matches']} palettes/query)")
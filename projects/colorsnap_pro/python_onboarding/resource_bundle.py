@@ -0,0 +1,187 @@
+"""
+ColorSnap Pro - Resource Bundle
+Stylesheets, onboarding pages, tutorial steps, tooltip texts and icons packed
+into one indexed file at build time and memory-mapped at runtime
+
+Usage:
+    from resource_bundle import resources
+    
+    label.setStyleSheet(resources().text("style/onboarding/title"))
+    pages = resources().json("onboarding/pages")
+    
+    # Build time (build_app.py --resources)
+    write_bundle("build/resources/colorsnap.res", compile_resources())
+
+Format (little-endian):
+    header   b"CSRB", u16 version, u16 reserved, u32 entry count
+    index    per entry, sorted by name: u64 data offset, u32 data length,
+             u16 name length, UTF-8 name
+    data     entry payloads, back to back
+"""
+
+import json
+import mmap
+import os
+import struct
+import sys
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple, Union
+
+
+BUNDLE_NAME = "colorsnap.res"
+BUNDLE_ENV = "COLORSNAP_RESOURCES"
+MAGIC = b"CSRB"
+FORMAT_VERSION = 1
+
+_HEADER = struct.Struct("<4sHHI")
+_ENTRY = struct.Struct("<QIH")
+
+
+# MARK: - Writing
+
+def compile_resources(project_dir: Optional[Path] = None) -> Dict[str, bytes]:
+    """Entry name -> bytes for everything defined in app_resources (plus icon files)"""
+    import app_resources
+    
+    def encode(value: Any) -> bytes:
+        return json.dumps(value, ensure_ascii=False, separators=(",", ":")).encode()
+    
+    entries = {f"style/{name}": style.encode() for name, style in app_resources.STYLES.items()}
+    entries["onboarding/pages"] = encode(app_resources.ONBOARDING_PAGES)
+    entries["tutorial/steps"] = encode(app_resources.TUTORIAL_STEPS)
+    for value, texts in app_resources.TOOLTIPS.items():
+        entries[f"tooltip/{value}"] = encode(texts)
+    
+    icons = Path(project_dir or Path(__file__).parent) / app_resources.ICON_DIR
+    if icons.is_dir():
+        for path in sorted(icons.rglob("*")):
+            if path.is_file():
+                entries[f"icon/{path.relative_to(icons).as_posix()}"] = path.read_bytes()
+    return entries
+
+
+def write_bundle(path: Union[str, Path], entries: Dict[str, bytes]) -> int:
+    """Write entries as a bundle (byte-identical for the same entries); returns its size"""
+    path = Path(path)
+    names = sorted(entries)
+    encoded = [name.encode() for name in names]
+    offset = _HEADER.size + sum(_ENTRY.size + len(name) for name in encoded)
+    
+    index = []
+    for name, raw in zip(names, encoded):
+        index.append(_ENTRY.pack(offset, len(entries[name]), len(raw)) + raw)
+        offset += len(entries[name])
+    
+    path.parent.mkdir(parents=True, exist_ok=True)
+    temp = path.with_suffix(path.suffix + ".tmp")
+    with open(temp, "wb") as handle:
+        handle.write(_HEADER.pack(MAGIC, FORMAT_VERSION, 0, len(names)))
+        handle.writelines(index)
+        for name in names:
+            handle.write(entries[name])
+    os.replace(temp, path)
+    return offset
+
+
+# MARK: - Reading
+
+class Resources:
+    """Named resources; subclasses provide data() and names()"""
+    
+    def data(self, name: str) -> bytes:
+        raise NotImplementedError
+    
+    def names(self) -> List[str]:
+        raise NotImplementedError
+    
+    def __contains__(self, name: str) -> bool:
+        try:
+            self.data(name)
+        except KeyError:
+            return False
+        return True
+    
+    def text(self, name: str) -> str:
+        return self.data(name).decode()
+    
+    def json(self, name: str) -> Any:
+        return json.loads(self.data(name))
+
+
+class ResourceBundle(Resources):
+    """
+    A compiled bundle, memory-mapped
+    
+    Opening reads only the 12-byte header; the index is parsed on the first
+    lookup and an entry's bytes are copied out of the map only when it is
+    asked for, so nothing that isn't displayed is read or decoded.
+    """
+    
+    def __init__(self, path: Union[str, Path]):
+        self.path = Path(path)
+        with open(self.path, "rb") as handle:
+            self._map = mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, version, _, self._count = _HEADER.unpack_from(self._map, 0)
+        if magic != MAGIC or version != FORMAT_VERSION:
+            self._map.close()
+            raise ValueError(f"{self.path} is not a version {FORMAT_VERSION} resource bundle")
+        self._index: Optional[Dict[str, Tuple[int, int]]] = None
+    
+    def _entries(self) -> Dict[str, Tuple[int, int]]:
+        if self._index is None:
+            index = {}
+            position = _HEADER.size
+            for _ in range(self._count):
+                offset, length, name_length = _ENTRY.unpack_from(self._map, position)
+                position += _ENTRY.size
+                index[self._map[position:position + name_length].decode()] = (offset, length)
+                position += name_length
+            self._index = index
+        return self._index
+    
+    def data(self, name: str) -> bytes:
+        offset, length = self._entries()[name]
+        return self._map[offset:offset + length]
+    
+    def names(self) -> List[str]:
+        return list(self._entries())
+    
+    def close(self):
+        self._map.close()
+
+
+class SourceResources(Resources):
+    """The same entries compiled in memory from app_resources (running from a checkout)"""
+    
+    def __init__(self, project_dir: Optional[Path] = None):
+        self._entries = compile_resources(project_dir)
+    
+    def data(self, name: str) -> bytes:
+        return self._entries[name]
+    
+    def names(self) -> List[str]:
+        return sorted(self._entries)
+
+
+def find_bundle() -> Optional[Path]:
+    """$COLORSNAP_RESOURCES, else colorsnap.res in the frozen app's data dir or next to this module"""
+    candidates = [os.environ.get(BUNDLE_ENV), getattr(sys, "_MEIPASS", None), os.path.dirname(os.path.abspath(__file__))]
+    for candidate in filter(None, candidates):
+        path = Path(candidate)
+        if path.is_dir():
+            path = path / BUNDLE_NAME
+        if path.is_file():
+            return path
+    return None
+
+
+_resources: Optional[Resources] = None
+
+
+def resources() -> Resources:
+    """The app's resources: the compiled bundle if there is one, else the source definitions"""
+    global _resources
+    if _resources is None:
+        path = find_bundle()
+        _resources = ResourceBundle(path) if path else SourceResources()
+    return _resources
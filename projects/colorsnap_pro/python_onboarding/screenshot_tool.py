@@ -5,14 +5,303 @@ Captures screenshots for documentation and marketing
 
 import sys
 import os
+import time
+from collections import deque
+from dataclasses import dataclass
 from datetime import datetime
-from typing import Optional
+from typing import Optional, List, Dict, Any, Deque, Tuple
 from PyQt6.QtWidgets import (
     QApplication, QMainWindow, QWidget, QVBoxLayout, 
-    QHBoxLayout, QPushButton, QLabel, QFileDialog, QProgressBar
+    QHBoxLayout, QPushButton, QLabel, QFileDialog, QProgressBar,
+    QComboBox, QSpinBox
 )
-from PyQt6.QtCore import Qt, QTimer, QDir
-from PyQt6.QtGui import QPixmap, QScreen, QColor, QPalette
+from PyQt6.QtCore import Qt, QTimer, QDir, QObject, QThread, pyqtSignal
+from PyQt6.QtGui import QPixmap, QScreen, QColor, QPalette, QImage
+from PIL import Image
+
+
+# MARK: - Screen Recording
+
+@dataclass
+class RawFrame:
+    """A single captured frame as tightly packed RGBA8888 bytes"""
+    timestamp: float
+    width: int
+    height: int
+    data: bytes
+
+
+class FrameRingBuffer:
+    """
+    Ring buffer of raw frames capped by a byte budget.
+    When full, the oldest frames are evicted so memory never exceeds max_bytes.
+    
+    end_time is when the last frame stopped being shown (set when recording
+    stops), so the encoder knows how long the final frame lasts.
+    """
+    
+    def __init__(self, max_bytes: int = 256 * 1024 * 1024):
+        self.max_bytes = max_bytes
+        self._frames: Deque[RawFrame] = deque()
+        self._nbytes = 0
+        self.evicted = 0
+        self.end_time: Optional[float] = None
+    
+    def __len__(self) -> int:
+        return len(self._frames)
+    
+    @property
+    def nbytes(self) -> int:
+        return self._nbytes
+    
+    def push(self, frame: RawFrame):
+        """Append a frame, evicting the oldest ones if over budget"""
+        self._frames.append(frame)
+        self._nbytes += len(frame.data)
+        while self._nbytes > self.max_bytes and len(self._frames) > 1:
+            oldest = self._frames.popleft()
+            self._nbytes -= len(oldest.data)
+            self.evicted += 1
+    
+    def pop_oldest(self) -> Optional[RawFrame]:
+        """Remove and return the oldest frame"""
+        if not self._frames:
+            return None
+        frame = self._frames.popleft()
+        self._nbytes -= len(frame.data)
+        return frame
+    
+    def clear(self):
+        """Drop all frames"""
+        self._frames.clear()
+        self._nbytes = 0
+        self.end_time = None
+
+
+def _grab_frame(source: Optional[QWidget], scale: float = 1.0) -> Optional[QImage]:
+    """Grab a widget (or the whole primary screen) as an RGBA8888 image"""
+    if source is not None:
+        pixmap = source.grab()
+    else:
+        screen = QApplication.primaryScreen()
+        if not screen:
+            return None
+        pixmap = screen.grabWindow(0)
+    
+    image = pixmap.toImage()
+    if scale != 1.0:
+        image = image.scaled(
+            max(1, int(image.width() * scale)),
+            max(1, int(image.height() * scale)),
+            Qt.AspectRatioMode.IgnoreAspectRatio,
+            Qt.TransformationMode.SmoothTransformation
+        )
+    return image.convertToFormat(QImage.Format.Format_RGBA8888)
+
+
+class ScreenRecorder(QObject):
+    """
+    Grabs frames at a target FPS into a FrameRingBuffer.
+    
+    Usage:
+        recorder = ScreenRecorder(window, fps=30)
+        recorder.start()
+        ...
+        recorder.stop()
+        print(recorder.stats())
+    """
+    stopped = pyqtSignal()
+    
+    def __init__(
+        self,
+        source: Optional[QWidget] = None,
+        fps: int = 30,
+        max_bytes: int = 256 * 1024 * 1024,
+        scale: float = 1.0,
+        parent=None
+    ):
+        super().__init__(parent)
+        self.source = source
+        self.fps = fps
+        self.scale = scale
+        self.buffer = FrameRingBuffer(max_bytes)
+        
+        self._timer = QTimer(self)
+        self._timer.setTimerType(Qt.TimerType.PreciseTimer)
+        self._timer.timeout.connect(self._capture_frame)
+        
+        self._captured = 0
+        self._started_at = 0.0
+        self._last_frame_at = 0.0
+    
+    @property
+    def is_recording(self) -> bool:
+        return self._timer.isActive()
+    
+    def start(self, duration_ms: int = 0):
+        """Start recording, optionally stopping after duration_ms"""
+        self.buffer.clear()
+        self.buffer.evicted = 0
+        self._captured = 0
+        self._started_at = time.perf_counter()
+        self._last_frame_at = self._started_at
+        
+        self._timer.start(max(1, round(1000 / self.fps)))
+        self._capture_frame()
+        
+        if duration_ms > 0:
+            QTimer.singleShot(duration_ms, self.stop)
+    
+    def stop(self):
+        """Stop recording"""
+        if not self._timer.isActive():
+            return
+        self._timer.stop()
+        self.buffer.end_time = time.perf_counter()
+        self.stopped.emit()
+    
+    def _capture_frame(self):
+        """Grab one frame into the ring buffer"""
+        image = _grab_frame(self.source, self.scale)
+        if image is None:
+            self.stop()
+            return
+        
+        bits = image.constBits()
+        bits.setsize(image.sizeInBytes())
+        now = time.perf_counter()
+        self.buffer.push(RawFrame(now, image.width(), image.height(), bytes(bits)))
+        self._captured += 1
+        self._last_frame_at = now
+    
+    @property
+    def achieved_fps(self) -> float:
+        """Frames per second actually captured"""
+        elapsed = self._last_frame_at - self._started_at
+        if self._captured < 2 or elapsed <= 0:
+            return 0.0
+        return (self._captured - 1) / elapsed
+    
+    def stats(self) -> Dict[str, Any]:
+        """Get recording statistics"""
+        return {
+            "target_fps": self.fps,
+            "achieved_fps": round(self.achieved_fps, 2),
+            "frames_captured": self._captured,
+            "frames_buffered": len(self.buffer),
+            "frames_evicted": self.buffer.evicted,
+            "buffer_bytes": self.buffer.nbytes,
+        }
+
+
+class AnimationEncoder(QThread):
+    """
+    Background worker that drains a FrameRingBuffer into an APNG or
+    animated WebP file.
+    
+    Delta compression: each frame is diffed against the previous one;
+    unchanged frames are merged into the previous frame's duration and
+    changed frames are handed to the encoder, which stores only the
+    changed sub-rectangle.
+    
+    Each written frame lasts from its own capture time until the next
+    changed frame, and the last one until the buffer's end_time, so merged
+    duplicates (including trailing ones) keep their screen time. Frames
+    whose size differs from the first frame's are resized to match.
+    """
+    encoded = pyqtSignal(str, dict)
+    failed = pyqtSignal(str)
+    
+    FORMATS = {
+        "apng": ("PNG", ".png"),
+        "webp": ("WEBP", ".webp"),
+    }
+    
+    def __init__(self, buffer: FrameRingBuffer, filepath: str, fmt: str = "apng", parent=None):
+        super().__init__(parent)
+        if fmt not in self.FORMATS:
+            raise ValueError(f"Unsupported animation format: {fmt}")
+        self.buffer = buffer
+        self.filepath = filepath
+        self.fmt = fmt
+    
+    def run(self):
+        try:
+            stats = self._encode()
+        except (OSError, ValueError) as e:
+            self.failed.emit(str(e))
+            return
+        self.encoded.emit(self.filepath, stats)
+    
+    def _encode(self) -> Dict[str, Any]:
+        """Encode all buffered frames, releasing raw frames as they are consumed"""
+        started = time.perf_counter()
+        end_time = self.buffer.end_time
+        frames: List[Image.Image] = []
+        timestamps: List[float] = []
+        frames_in = 0
+        duplicates = 0
+        resized = 0
+        previous: Optional[RawFrame] = None
+        last_interval = 0.0
+        
+        while True:
+            raw = self.buffer.pop_oldest()
+            if raw is None:
+                break
+            frames_in += 1
+            if previous is not None:
+                last_interval = raw.timestamp - previous.timestamp
+            
+            same_size = previous is not None and (previous.width, previous.height) == (raw.width, raw.height)
+            if same_size and previous.data == raw.data:
+                duplicates += 1
+                previous = raw
+                continue
+            
+            image = Image.frombuffer("RGBA", (raw.width, raw.height), raw.data, "raw", "RGBA", 0, 1)
+            if frames and image.size != frames[0].size:
+                image = image.resize(frames[0].size, Image.Resampling.LANCZOS)
+                resized += 1
+            frames.append(image)
+            timestamps.append(raw.timestamp)
+            previous = raw
+        
+        if not frames:
+            raise ValueError("No frames to encode")
+        
+        # A written frame is shown from its capture until the next change; the
+        # last one until recording stopped (or one capture interval past the
+        # final raw frame if the stop time is unknown)
+        if end_time is None or end_time < previous.timestamp:
+            end_time = previous.timestamp + (last_interval or 0.1)
+        spans = zip(timestamps, timestamps[1:] + [end_time])
+        durations = [max(1, round((end - start) * 1000)) for start, end in spans]
+        
+        pil_format, _ = self.FORMATS[self.fmt]
+        options: Dict[str, Any] = {
+            "save_all": True,
+            "append_images": frames[1:],
+            "duration": durations,
+            "loop": 0,
+        }
+        if self.fmt == "webp":
+            options.update(lossless=True, minimize_size=True)
+        else:
+            options.update(disposal=0, blend=0, optimize=True)
+        
+        frames[0].save(self.filepath, pil_format, **options)
+        
+        return {
+            "format": self.fmt,
+            "frames_in": frames_in,
+            "frames_written": len(frames),
+            "duplicates_merged": duplicates,
+            "frames_resized": resized,
+            "duration_ms": sum(durations),
+            "file_bytes": os.path.getsize(self.filepath),
+            "encode_seconds": round(time.perf_counter() - started, 3),
+        }
 
 
 class ScreenshotTool(QMainWindow):
@@ -120,6 +409,44 @@ class ScreenshotTool(QMainWindow):
         self.capture_all_btn.clicked.connect(self._capture_all)
         layout.addWidget(self.capture_all_btn)
         
+        # Animated capture
+        record_layout = QHBoxLayout()
+        
+        self.record_btn = QPushButton("🎬 Record Animation")
+        self.record_btn.setStyleSheet("""
+            QPushButton {
+                background: #8B5CF6;
+                color: white;
+                border: none;
+                border-radius: 8px;
+                padding: 12px;
+                font-weight: bold;
+                font-size: 14px;
+            }
+            QPushButton:hover { background: #7C3AED; }
+            QPushButton:disabled { background: #666; }
+        """)
+        self.record_btn.clicked.connect(self._start_recording)
+        record_layout.addWidget(self.record_btn, 1)
+        
+        self.record_seconds = QSpinBox()
+        self.record_seconds.setRange(1, 60)
+        self.record_seconds.setValue(5)
+        self.record_seconds.setSuffix(" s")
+        record_layout.addWidget(self.record_seconds)
+        
+        self.record_fps = QSpinBox()
+        self.record_fps.setRange(1, 60)
+        self.record_fps.setValue(30)
+        self.record_fps.setSuffix(" fps")
+        record_layout.addWidget(self.record_fps)
+        
+        self.record_format = QComboBox()
+        self.record_format.addItems(["apng", "webp"])
+        record_layout.addWidget(self.record_format)
+        
+        layout.addLayout(record_layout)
+        
         # Progress bar
         self.progress = QProgressBar()
         self.progress.setVisible(False)
@@ -246,6 +573,52 @@ class ScreenshotTool(QMainWindow):
         self._capture_index += 1
         self._capture_next()
     
+    def _start_recording(self):
+        """Record the screen for the selected duration"""
+        self.record_btn.setEnabled(False)
+        self.status_label.setText("Recording...")
+        self.hide()
+        
+        self._recorder = ScreenRecorder(fps=self.record_fps.value(), parent=self)
+        self._recorder.stopped.connect(self._on_recording_stopped)
+        duration_ms = self.record_seconds.value() * 1000
+        QTimer.singleShot(500, lambda: self._recorder.start(duration_ms))
+    
+    def _on_recording_stopped(self):
+        """Hand captured frames to the background encoder"""
+        self.show()
+        stats = self._recorder.stats()
+        fmt = self.record_format.currentText()
+        _, ext = AnimationEncoder.FORMATS[fmt]
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        filepath = os.path.join(self.output_dir, f"recording_{timestamp}{ext}")
+        
+        self.status_label.setText(
+            f"Encoding {stats['frames_buffered']} frames "
+            f"({stats['achieved_fps']:.1f}/{stats['target_fps']} fps)..."
+        )
+        self._encoder = AnimationEncoder(self._recorder.buffer, filepath, fmt, self)
+        self._encoder.encoded.connect(
+            lambda path, enc: self._on_recording_encoded(path, stats, enc)
+        )
+        self._encoder.failed.connect(self._on_recording_failed)
+        self._encoder.start()
+    
+    def _on_recording_encoded(self, filepath: str, capture_stats: dict, encode_stats: dict):
+        """Report a finished recording"""
+        self.record_btn.setEnabled(True)
+        self.status_label.setText(
+            f"✅ Saved: {filepath}\n"
+            f"   {capture_stats['achieved_fps']:.1f} fps achieved, "
+            f"{encode_stats['frames_written']} frames written, "
+            f"{encode_stats['duplicates_merged']} duplicates merged"
+        )
+    
+    def _on_recording_failed(self, error: str):
+        """Report a failed recording"""
+        self.record_btn.setEnabled(True)
+        self.status_label.setText(f"❌ Recording failed: {error}")
+    
     def _open_folder(self):
         """Open screenshots folder"""
         import subprocess
@@ -295,6 +668,42 @@ def _do_capture_window(window: QMainWindow, output_dir: str):
     print(f"Screenshot saved: {filepath}")
 
 
+def record_app_animation(
+    app_window: QWidget,
+    output_path: str,
+    duration_ms: int = 3000,
+    fps: int = 30,
+    fmt: str = "apng",
+    max_bytes: int = 256 * 1024 * 1024
+) -> Tuple[ScreenRecorder, AnimationEncoder]:
+    """
+    Programmatically record an animated capture of an app window
+    
+    Usage:
+        from screenshot_tool import record_app_animation
+        recorder, encoder = record_app_animation(onboarding_window, "onboarding.png")
+        encoder.encoded.connect(lambda path, stats: print(path, stats))
+    """
+    output_path = os.path.expanduser(output_path)
+    os.makedirs(os.path.dirname(os.path.abspath(output_path)), exist_ok=True)
+    
+    app_window.show()
+    app_window.raise_()
+    QApplication.processEvents()
+    
+    recorder = ScreenRecorder(app_window, fps=fps, max_bytes=max_bytes, parent=app_window)
+    encoder = AnimationEncoder(recorder.buffer, output_path, fmt, app_window)
+    
+    def on_stopped():
+        print(f"Recorded: {recorder.stats()}")
+        encoder.start()
+    
+    encoder.encoded.connect(lambda path, stats: print(f"Animation saved: {path} {stats}"))
+    recorder.stopped.connect(on_stopped)
+    recorder.start(duration_ms)
+    return recorder, encoder
+
+
 # Standalone screenshot tool entry point
 def main():
     app = QApplication(sys.argv)
@@ -0,0 +1,697 @@
+"""
+Test script for the build tool's incremental build cache
+Run this to verify stage keys, the manifest and generated files work correctly (no PyInstaller needed).
+"""
+
+import io
+import sys
+import shutil
+import os
+import json
+import time
+import platform
+import subprocess
+import tempfile
+import zipfile
+from pathlib import Path
+
+# Add current directory to path
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from build_app import (
+    AppBuilder, ArtifactCache, FIRST_FRAME_MARKER, BuildGraph, BuildManifest, BuildMonitor, BuildTask, PrefixedStream,
+    PYINSTALLER_PHASES, REPORT_NAME, analyze_toc, bench_executable, compare_to_baseline, default_targets, exclusion_profile,
+    file_digest, freeze_modules, launch_once, launcher_script, missing_imports, parse_import_times, precompile_sources,
+    prune_spec, stage_key, stage_tree, tree_fingerprint
+)
+
+
+def _builder(folder: str) -> AppBuilder:
+    builder = AppBuilder(incremental=True)
+    builder.project_dir = Path(folder)
+    builder.build_dir = builder.project_dir / "build"
+    builder.dist_dir = builder.project_dir / "dist"
+    builder.bundle_dir = builder.dist_dir
+    return builder
+
+
+def _fake_runner(task: BuildTask, incremental: bool) -> bool:
+    print(f"building {task.name}")
+    time.sleep(0.05)
+    return task.name != "broken"
+
+
+def test_manifest_hits_and_misses():
+    """Test that a stage is fresh only with the same key and existing outputs"""
+    print("\n🧪 Testing Build Manifest...")
+    
+    with tempfile.TemporaryDirectory() as folder:
+        output = Path(folder) / "bundle"
+        output.write_text("v1")
+        manifest = BuildManifest(Path(folder) / "build" / "manifest.json")
+        manifest.record("pyinstaller:onedir", "abc", [output], 12.5)
+        
+        reloaded = BuildManifest(manifest.path)
+        assert reloaded.is_fresh("pyinstaller:onedir", "abc")
+        assert not reloaded.is_fresh("pyinstaller:onedir", "def"), "Changed key must rebuild"
+        output.unlink()
+        assert not reloaded.is_fresh("pyinstaller:onedir", "abc"), "Missing output must rebuild"
+        assert reloaded.hits == ["pyinstaller:onedir"] and len(reloaded.misses) == 2
+        assert reloaded.saved_seconds == 12.5
+        
+        manifest.path.write_text("{not json")
+        assert BuildManifest(manifest.path).stages == {}, "A corrupt manifest should be ignored"
+    print("   ✅ Manifest works correctly")
+
+
+def test_input_hashes_track_content():
+    """Test that stage keys follow source contents, not timestamps"""
+    print("\n🧪 Testing Input Hashing...")
+    
+    with tempfile.TemporaryDirectory() as folder:
+        builder = _builder(folder)
+        (builder.project_dir / "main_app_example.py").write_text(
+            "import os, widgets\n\ndef open_camera():\n    from camera import Camera\n"
+        )
+        (builder.project_dir / "widgets.py").write_text("from colors import RED\n")
+        (builder.project_dir / "colors.py").write_text("RED = 1\n")
+        (builder.project_dir / "camera.py").write_text("class Camera: pass\n")
+        (builder.project_dir / "bulk_tool.py").write_text("import widgets\n")
+        (builder.project_dir / "requirements.txt").write_text("PyQt6\n")
+        (builder.project_dir / "test_main.py").write_text("import main_app_example\n")
+        
+        hashes = builder.input_hashes()
+        assert set(hashes) == {"main_app_example.py", "widgets.py", "colors.py", "camera.py", "requirements.txt"}, \
+            "Only modules the entry point imports (directly, transitively or lazily) are build inputs"
+        before = stage_key(inputs=hashes, command=["--onefile"])
+        
+        os.utime(builder.project_dir / "requirements.txt", (0, 0))
+        assert stage_key(inputs=builder.input_hashes(), command=["--onefile"]) == before
+        assert stage_key(inputs=hashes, command=["--onedir"]) != before, "Options are part of the key"
+        
+        (builder.project_dir / "bulk_tool.py").write_text("import widgets, colors\n")
+        assert stage_key(inputs=builder.input_hashes(), command=["--onefile"]) == before, \
+            "Scripts the app does not import do not invalidate the bundle"
+        
+        (builder.project_dir / "requirements.txt").write_text("PyQt6>=6.5\n")
+        assert stage_key(inputs=builder.input_hashes(), command=["--onefile"]) != before
+        
+        tools = builder.tool_hashes()
+        assert tools["build_app.py"] == file_digest(Path(__file__).parent / "build_app.py"), "The build script is part of stage keys"
+        assert set(tools) == {"build_app.py", "resource_bundle.py"}
+    print("   ✅ Input hashing works correctly")
+
+
+def test_generated_files_and_bundle_fingerprint():
+    """Test generated files keep their mtime and bundle changes re-package"""
+    print("\n🧪 Testing Generated Files...")
+    
+    with tempfile.TemporaryDirectory() as folder:
+        builder = _builder(folder)
+        version_file = builder._create_version_file()
+        mtime = version_file.stat().st_mtime_ns
+        time.sleep(0.01)
+        assert builder._create_version_file().stat().st_mtime_ns == mtime, "Unchanged content is not rewritten"
+        
+        bundle = builder.dist_dir / builder.app_name
+        bundle.mkdir(parents=True)
+        (bundle / builder.app_name).write_bytes(b"\0" * 64)
+        key = builder._package_key(bundle)
+        assert builder._package_key(bundle) == key
+        assert tree_fingerprint(bundle) == tree_fingerprint(bundle)
+        
+        (bundle / "extra.so").write_bytes(b"\1")
+        assert builder._package_key(bundle) != key, "A changed bundle must be re-packaged"
+        builder.version = "1.0.1"
+        assert builder._create_version_file().stat().st_mtime_ns != mtime
+    print("   ✅ Generated files work correctly")
+
+
+def test_build_graph_order():
+    """Test dependency ordering, target selection and graph errors"""
+    print("\n🧪 Testing Build Graph...")
+    
+    graph = BuildGraph(default_targets("Linux"))
+    names = [task.name for task in graph.order()]
+    assert set(names) == {"onedir", "onefile", "console", "appimage", "cached"}
+    assert names.index("onedir") < names.index("appimage")
+    assert set(graph.select(["appimage"]).tasks) == {"appimage", "onedir"}, "Dependencies are pulled in"
+    windows = BuildGraph(default_targets("Windows")).tasks
+    assert "installer" in windows and "cached" not in windows
+    
+    for tasks in ([BuildTask("a", "pyinstaller", deps=("b",)), BuildTask("b", "pyinstaller", deps=("a",))],
+                  [BuildTask("a", "pyinstaller", deps=("missing",))]):
+        try:
+            BuildGraph(tasks).order()
+            assert False, "Should raise ValueError"
+        except ValueError:
+            pass
+    print("   ✅ Build graph works correctly")
+
+
+def test_build_graph_run():
+    """Test failures skip dependents and independent tasks run in parallel"""
+    print("\n🧪 Testing Build Graph Run...")
+    
+    tasks = [
+        BuildTask("broken", "pyinstaller"),
+        BuildTask("package", "appimage", deps=("broken",)),
+        BuildTask("repackage", "appimage", deps=("package",)),
+        BuildTask("onedir", "pyinstaller"),
+        BuildTask("onefile", "pyinstaller"),
+    ]
+    serial = {r.name: r.status for r in BuildGraph(tasks).run(workers=0, runner=_fake_runner)}
+    assert serial == {"broken": "failed", "package": "skipped", "repackage": "skipped",
+                      "onedir": "ok", "onefile": "ok"}
+    
+    results = BuildGraph(tasks[3:]).run(workers=2, runner=_fake_runner)
+    assert all(result.status == "ok" and result.seconds >= 0.05 for result in results)
+    first, second = results
+    assert first.started < second.started + second.seconds and second.started < first.started + first.seconds, \
+        "Independent tasks should overlap"
+    
+    seen = {}
+    
+    def recording_build(self, onefile=False, windowed=True):
+        seen[self.build_dir.name] = (self.optimize, self.use_profile, self.incremental, onefile)
+        return True
+    
+    original = AppBuilder.build_pyinstaller
+    AppBuilder.build_pyinstaller = recording_build
+    try:
+        options = {"optimize": 2, "use_profile": False}
+        graph = BuildGraph(default_targets("Linux"), incremental=True, builder_options=options)
+        results = graph.select(["onefile"]).run(workers=0)
+    finally:
+        AppBuilder.build_pyinstaller = original
+    assert [result.status for result in results] == ["ok"]
+    assert seen == {"onefile": (2, False, True, True)}, "Graph tasks build with the requested settings"
+    
+    out = io.StringIO()
+    stream = PrefixedStream(out, "[onedir] ")
+    stream.write("Analysis")
+    stream.write(" done\nBundling\n")
+    stream.write("tail")
+    stream.close()
+    assert out.getvalue() == "[onedir] Analysis done\n[onedir] Bundling\n[onedir] tail\n"
+    print("   ✅ Build graph runs correctly")
+
+
+def test_build_monitor_phases():
+    """Test phase detection and timing from PyInstaller log lines"""
+    print("\n🧪 Testing Build Monitor...")
+    
+    log = [
+        (0.0, "80 INFO: PyInstaller: 6.0"),
+        (0.5, "388 INFO: checking Analysis"),
+        (20.0, "20473 WARNING: Library not found: could not resolve 'libgtk-3.so.0'"),
+        (21.0, "18731 INFO: Performing binary vs. data reclassification (142 entries)"),
+        (23.0, "20599 INFO: checking PYZ"),
+        (30.0, "21412 INFO: Building PKG (CArchive) X.pkg"),
+        (70.0, "69821 INFO: checking EXE"),
+        (70.5, "70025 INFO: Running Analysis again is not a phase change"),
+    ]
+    monitor = BuildMonitor(PYINSTALLER_PHASES, tail_lines=3)
+    monitor.started = 0.0
+    entered = [monitor.feed(line, now) for now, line in log]
+    monitor.finish(0, now=71.0)
+    
+    assert entered == [None, "analysis", None, "collecting", "compressing", None, "bundling", None]
+    report = monitor.report()
+    assert [(p["name"], p["seconds"], p["lines"]) for p in report["phases"]] == [
+        ("starting", 0.5, 1), ("analysis", 20.5, 2), ("collecting", 2.0, 1),
+        ("compressing", 47.0, 2), ("bundling", 1.0, 2),
+    ]
+    assert report["lines"] == 8 and report["warnings"] == 1 and report["seconds"] == 71.0
+    assert len(report["tail"]) == 3, "Only the tail of the output is kept"
+    print(f"   ✅ {monitor.timings()}")
+
+
+def test_run_streams_to_log_and_report():
+    """Test that a tool run is logged to disk and added to the JSON report"""
+    print("\n🧪 Testing Streamed Tool Output...")
+    
+    with tempfile.TemporaryDirectory() as folder:
+        builder = _builder(folder)
+        builder.build_dir.mkdir()
+        script = "for i in range(5000): print(f'{i} INFO: checking PYZ' if i == 10 else f'{i} INFO: line')"
+        returncode, tail = builder._run([sys.executable, "-c", script], "pyinstaller:onedir", PYINSTALLER_PHASES)
+        
+        assert returncode == 0 and tail[-1] == "4999 INFO: line" and len(tail) < 5000
+        with open(builder.build_dir / "logs" / "pyinstaller-onedir.log") as handle:
+            assert sum(1 for _ in handle) == 5000, "The full output goes to the log file"
+        report = json.loads((builder.build_dir / REPORT_NAME).read_text())
+        run = report["runs"][0]
+        assert run["stage"] == "pyinstaller:onedir" and run["lines"] == 5000
+        assert [phase["name"] for phase in run["phases"]] == ["starting", "compressing"]
+    print("   ✅ Output streamed to log and report")
+
+
+def test_bundle_analysis_and_profile():
+    """Test TOC attribution and the generated exclusion profile"""
+    print("\n🧪 Testing Bundle Analysis...")
+    
+    with tempfile.TemporaryDirectory() as folder:
+        def source(name: str, size: int) -> str:
+            path = os.path.join(folder, name.replace("/", "_"))
+            with open(path, "wb") as handle:
+                handle.write(b"\0" * size)
+            return path
+        
+        toc = [
+            ["main.py"],
+            [("numpy", source("numpy.py", 50), "PYMODULE")],
+            [("PyQt6/QtCore.abi3.so", source("core", 400), "EXTENSION"),
+             ("PyQt6/QtDBus.abi3.so", source("dbus", 300), "EXTENSION"),
+             ("PyQt6/Qt6/lib/libQt6Pdf.so.6", source("pdf", 2000), "BINARY"),
+             ("PyQt6/Qt6/lib/libQt6Gui.so.6", source("gui", 3000), "BINARY"),
+             ("PyQt6/Qt6/plugins/imageformats/libqpdf.so", source("qpdf", 10), "BINARY"),
+             ("PyQt6/Qt6/plugins/imageformats/libqjpeg.so", source("qjpeg", 10), "BINARY"),
+             ("PyQt6/Qt6/plugins/platforms/libqxcb.so", source("qxcb", 10), "BINARY"),
+             ("numpy.libs/libopenblas.so", source("blas", 700), "BINARY")],
+            [("PyQt6/Qt6/translations/qtbase_de.qm", source("de", 90), "DATA"),
+             ("PyQt6/Qt6/lib/libQt6Core.so", "libQt6Core.so.6", "SYMLINK")],
+        ]
+        toc_path = Path(folder) / "Analysis-00.toc"
+        toc_path.write_text(repr(tuple(toc)))
+        entries = analyze_toc(toc_path)
+        
+        groups = {(entry.category, entry.name): entry.size for entry in entries}
+        assert groups[("Qt bindings", "PyQt6.QtDBus")] == 300
+        assert groups[("Qt plugins", "imageformats/libqpdf")] == 10
+        assert groups[("Qt translations", "qtbase")] == 90
+        assert groups[("Native libraries", "numpy")] == 700
+        assert groups[("Python modules", "numpy")] == 50
+        assert len(entries) == 10, "Symlinks and the script list are not bundle entries"
+        
+        profile = exclusion_profile(entries, {"PyQt6.QtWidgets"}, keep_formats=["jpeg"])
+        assert profile["exclude_modules"] == ["PyQt6.QtDBus"]
+        assert profile["exclude_files"] == [
+            "PyQt6/Qt6/lib/libQt6Pdf.so.6",
+            "PyQt6/Qt6/plugins/imageformats/libqpdf.so",
+            "PyQt6/Qt6/translations/qtbase_de.qm",
+        ], "Platform plugins and used libraries must stay"
+        assert profile["excluded_bytes"] == 2100
+    print("   ✅ Bundle analysis works correctly")
+
+
+def test_analysis_inputs_and_spec_pruning():
+    """Test import-time and warn-file parsing and the spec filter"""
+    print("\n🧪 Testing Analysis Helpers...")
+    
+    times = parse_import_times([
+        "import time: self [us] | cumulative | imported package",
+        "import time:      1500 |       1500 |   numpy._core",
+        "import time:       500 |       2000 | numpy",
+        "import time:      2500 |       2500 | PyQt6.QtWidgets",
+    ])
+    assert times == {"numpy": 0.002, "PyQt6.QtWidgets": 0.0025}
+    
+    with tempfile.TemporaryDirectory() as folder:
+        warn = Path(folder) / "warn.txt"
+        warn.write_text(
+            "missing module named nt - imported by shutil (conditional), os (delayed)\n"
+            "missing module named yaml - imported by palette_library (top-level), json (optional)\n"
+            "missing module named cv2 - imported by camera_source (delayed)\n"
+        )
+        assert missing_imports(warn, ["palette_library", "camera_source"]) == [("yaml", "palette_library")]
+    
+    spec = "a = Analysis(['main.py'])\npyz = PYZ(a.pure)\n"
+    pruned = prune_spec(spec, ["PyQt6/Qt6/translations/*"])
+    assert pruned.index("_excluded") < pruned.index("pyz = PYZ(")
+    
+    class Analysis:
+        binaries = [("PyQt6/Qt6/lib/libQt6Gui.so.6", "gui", "BINARY")]
+        datas = [("PyQt6\\Qt6\\translations\\qt_de.qm", "de", "DATA"), ("README.md", "readme", "DATA")]
+    
+    namespace = {"Analysis": lambda scripts: Analysis, "PYZ": lambda pure: None}
+    exec(pruned.replace("a.pure", "None"), namespace)
+    assert [entry[0] for entry in namespace["a"].datas] == ["README.md"]
+    assert len(namespace["a"].binaries) == 1
+    print("   ✅ Analysis helpers work correctly")
+
+
+def test_cached_launcher():
+    """Test the launcher extracts once, re-extracts when damaged and prunes old versions"""
+    print("\n🧪 Testing Cached Launcher...")
+    
+    header = launcher_script("App", "1.0.0", "ab" * 32)
+    assert f"PAYLOAD_OFFSET={len(header)}\n".encode() in header
+    assert b'KEY="1.0.0-abababababababab"' in header
+    if platform.system() == "Windows":
+        print("   ⏭️  Launcher needs a POSIX shell")
+        return
+    
+    with tempfile.TemporaryDirectory() as folder:
+        builder = _builder(folder)
+        app = builder.bundle_dir / builder.app_name / builder.app_name
+        app.parent.mkdir(parents=True)
+        app.write_text('#!/bin/sh\necho "ran $*"\n')
+        os.chmod(app, 0o755)
+        assert builder.create_cached_launcher()
+        launcher = builder.dist_dir / f"{builder.app_name}-{builder.version}-cached"
+        
+        cache = Path(folder) / "cache"
+        env = dict(os.environ, COLORSNAP_CACHE_DIR=str(cache))
+        launch = lambda: subprocess.run([str(launcher), "a", "b"], env=env, capture_output=True, text=True)
+        assert launch().stdout == "ran a b\n"
+        [version] = cache.iterdir()
+        extracted = version / builder.app_name / builder.app_name
+        mtime = extracted.stat().st_mtime_ns
+        time.sleep(0.01)
+        assert launch().stdout == "ran a b\n" and extracted.stat().st_mtime_ns == mtime, "Warm launch must not extract"
+        
+        (version / ".complete").write_text("partial\n")
+        assert launch().returncode == 0 and (version / ".complete").read_text().strip() == version.name
+        
+        for old in ("0.9.0-old", "0.9.1-older"):
+            (cache / old).mkdir()
+            os.utime(cache / old, (1, 1) if old.endswith("older") else (2, 2))
+        (version / ".complete").unlink()
+        launch()
+        assert sorted(path.name for path in cache.iterdir()) == sorted([version.name, "0.9.0-old"]), \
+            "Only the newest previous version is kept"
+        
+        # Interrupted extractions are removed once abandoned, running ones are left alone
+        (cache / ".extract.abandoned").mkdir()
+        os.utime(cache / ".extract.abandoned", (1, 1))
+        (cache / ".extract.running").mkdir()
+        (version / ".complete").unlink()
+        launch()
+        assert not (cache / ".extract.abandoned").exists() and (cache / ".extract.running").exists()
+    print("   ✅ Cached launcher works correctly")
+
+
+def test_cached_launcher_concurrent_cold_starts():
+    """Test simultaneous first launches all run and never delete each other's bundle"""
+    print("\n🧪 Testing Concurrent Cold Launches...")
+    
+    if platform.system() == "Windows":
+        print("   ⏭️  Launcher needs a POSIX shell")
+        return
+    
+    with tempfile.TemporaryDirectory() as folder:
+        builder = _builder(folder)
+        app = builder.bundle_dir / builder.app_name / builder.app_name
+        app.parent.mkdir(parents=True)
+        # Still running from its directory while the other launches finish extracting
+        app.write_text('#!/bin/sh\nsleep 0.5\ntest -x "$0" && echo "ran $1"\n')
+        os.chmod(app, 0o755)
+        assert builder.create_cached_launcher()
+        launcher = builder.dist_dir / f"{builder.app_name}-{builder.version}-cached"
+        
+        cache = Path(folder) / "cache"
+        env = dict(os.environ, COLORSNAP_CACHE_DIR=str(cache))
+        launches = [
+            subprocess.Popen([str(launcher), str(index)], env=env, stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True)
+            for index in range(6)
+        ]
+        for index, process in enumerate(launches):
+            out, err = process.communicate(timeout=60)
+            assert process.returncode == 0 and out == f"ran {index}\n", f"Launch {index}: {out!r} {err!r}"
+        
+        [version] = cache.iterdir()
+        assert (version / builder.app_name / builder.app_name).exists()
+        assert not (version / version.name).exists() and not list(version.glob(".extract.*")), "No nested extraction"
+    print("   ✅ Concurrent cold launches work correctly")
+
+
+def test_bytecode_freeze_and_precompile():
+    """Test the frozen archive runs sourceless and precompiling writes every level"""
+    print("\n🧪 Testing Bytecode Freezing...")
+    
+    with tempfile.TemporaryDirectory() as folder:
+        project = Path(folder) / "project"
+        project.mkdir()
+        (project / "helper.py").write_text('"""Helper docs"""\nVALUE = 42\n')
+        (project / "main_app_example.py").write_text(
+            "import helper\n"
+            "def main():\n"
+            "    assert False, 'asserts are stripped'\n"
+            "    print(helper.VALUE, helper.__doc__)\n"
+        )
+        
+        archive = freeze_modules(project, ["helper", "main_app_example"], Path(folder) / "app.pyz", optimize=2)
+        with zipfile.ZipFile(archive) as bundle:
+            assert sorted(bundle.namelist()) == ["__main__.py", "helper.pyc", "main_app_example.pyc"]
+        result = subprocess.run([sys.executable, "-I", str(archive)], capture_output=True, text=True)
+        assert result.stdout == "42 None\n", result.stderr
+        
+        written = precompile_sources([project / "helper.py"], levels=(0, 1, 2))
+        caches = sorted(path.name.split(".", 2)[-1] for path in (project / "__pycache__").iterdir())
+        assert written == 3 and len(caches) == 3
+        assert any("opt-1" in name for name in caches) and any("opt-2" in name for name in caches)
+    print("   ✅ Bytecode freezing works correctly")
+
+
+def test_deterministic_outputs_and_artifact_cache():
+    """Test deterministic packages are byte-identical and restored from the artifact cache"""
+    print("\n🧪 Testing Reproducible Builds...")
+    
+    with tempfile.TemporaryDirectory() as folder:
+        def builder() -> AppBuilder:
+            b = _builder(folder)
+            b.deterministic, b.epoch = True, 1700000000
+            b.artifacts = ArtifactCache(Path(folder) / "cache")
+            return b
+        
+        first = builder()
+        app = first.bundle_dir / first.app_name / first.app_name
+        app.parent.mkdir(parents=True)
+        app.write_text("#!/bin/sh\n")
+        launcher = first.dist_dir / f"{first.app_name}-{first.version}-cached"
+        
+        key = first._package_key(app.parent)
+        assert first.create_cached_launcher() and first.artifacts.stored == 1
+        built = file_digest(launcher)
+        assert launcher.stat().st_mtime == 1700000000, "Outputs get normalized timestamps"
+        
+        # A clean checkout: no manifest, no outputs, bundle touched
+        shutil.rmtree(first.build_dir)
+        launcher.unlink()
+        os.utime(app, (5, 5))
+        second = builder()
+        assert second._package_key(app.parent) == key, "Deterministic keys follow content, not mtimes"
+        assert second.create_cached_launcher()
+        assert second.artifacts.restored == 1 and file_digest(launcher) == built
+        
+        # Rebuilding without the cache gives the same bytes
+        shutil.rmtree(second.build_dir)
+        third = builder()
+        third.artifacts = None
+        launcher.unlink()
+        assert third.create_cached_launcher() and file_digest(launcher) == built
+        
+        parent = builder()
+        parent.optimize = 1
+        side = parent._side_builder(Path(folder) / "analyze" / "after", use_profile=False)
+        assert side.optimize == 1 and side.deterministic and side.incremental and not side.use_profile
+        assert side.artifacts.root == Path(folder) / "cache", "Side builds share the artifact cache"
+        assert side.bundle_dir == Path(folder) / "analyze" / "after" / "dist"
+        
+        cache = ArtifactCache(Path(folder) / "other")
+        assert cache.store("f" * 64, [launcher], {}) is True
+        launcher.write_bytes(b"different")
+        assert cache.store("f" * 64, [launcher], {}) is False, "A different output under a stored key is reported"
+    print("   ✅ Reproducible builds work correctly")
+
+
+def test_staging_links_and_copies():
+    """Test staging reuses file data where it can and counts bytes really copied"""
+    print("\n🧪 Testing bundle staging...")
+    
+    with tempfile.TemporaryDirectory() as folder:
+        source = Path(folder) / "ColorSnapPro"
+        (source / "_internal" / "lib").mkdir(parents=True)
+        for index in range(80):
+            (source / "_internal" / "lib" / f"mod{index}.so").write_bytes(os.urandom(100 + index))
+        (source / "ColorSnapPro").write_bytes(b"\x7fELF" + b"\0" * 1000)
+        os.chmod(source / "ColorSnapPro", 0o755)
+        os.symlink("lib/mod0.so", source / "_internal" / "libfirst.so")
+        total = sum(path.stat().st_size for path in source.rglob("*") if path.is_file() and not path.is_symlink())
+        
+        linked = stage_tree(source, Path(folder) / "AppDir" / "usr" / "bin", workers=4)
+        staged = Path(folder) / "AppDir" / "usr" / "bin"
+        assert linked.files == 81 and linked.total_bytes == total
+        assert linked.cloned + linked.linked + linked.copied == 81
+        assert linked.copied_bytes == 0, "Same filesystem: nothing copied"
+        assert os.readlink(staged / "_internal" / "libfirst.so") == "lib/mod0.so", "Symlinks are kept"
+        assert os.access(staged / "ColorSnapPro", os.X_OK)
+        assert tree_fingerprint(staged) == tree_fingerprint(source)
+        
+        # Without hardlinks the staged tree never shares an inode with the source
+        copied = stage_tree(source, Path(folder) / "copy", link=False, workers=0)
+        assert copied.linked == 0 and copied.cloned + copied.copied == 81
+        if copied.copied == 81:
+            assert copied.copied_bytes == total
+        assert (Path(folder) / "copy" / "ColorSnapPro").stat().st_ino != (source / "ColorSnapPro").stat().st_ino
+        assert tree_fingerprint(Path(folder) / "copy") == tree_fingerprint(source)
+        
+        single = stage_tree(source / "ColorSnapPro", Path(folder) / "one" / "ColorSnapPro", link=False)
+        assert single.files == 1 and "1 files" in single.summary()
+        
+        builder = _builder(folder)
+        builder._stage(source, builder.build_dir / "dmg_staging" / "ColorSnapPro.app", "dmg")
+        report = json.loads((builder.build_dir / REPORT_NAME).read_text())
+        assert report["runs"][-1]["stage"] == "dmg:staging" and report["runs"][-1]["files"] == 81
+    print("   ✅ Staging works correctly")
+
+
+def test_resource_bundle_stage():
+    """Test the resource bundle is compiled once and rebuilt only when resources change"""
+    print("\n🧪 Testing resource bundle stage...")
+    
+    with tempfile.TemporaryDirectory() as folder:
+        builder = _builder(folder)
+        bundle = builder.build_resources()
+        assert bundle.name == "colorsnap.res" and bundle.parent == builder.build_dir / "resources"
+        first = file_digest(bundle)
+        
+        builder.build_resources()
+        assert builder.manifest.hits == ["resources"]
+        
+        (Path(folder) / "assets" / "icons").mkdir(parents=True)
+        (Path(folder) / "assets" / "icons" / "app.png").write_bytes(b"\x89PNG")
+        builder.build_resources()
+        assert builder.manifest.misses == ["resources", "resources"]
+        assert file_digest(bundle) != first, "New icon is compiled in"
+    print("   ✅ Resource bundle stage works correctly")
+
+
+def test_onefile_freshness_uses_executable_name():
+    """Test an incremental onefile build is fresh when the platform's executable exists"""
+    print("\n🧪 Testing Onefile Freshness...")
+    
+    import build_app
+    original = build_app.platform.system
+    with tempfile.TemporaryDirectory() as folder:
+        (Path(folder) / "main_app_example.py").write_text("print('hi')\n")
+        builder = _builder(folder)
+        runs = []
+        
+        def fake_run(cmd, stage, phases=()):
+            runs.append(stage)
+            builder.bundle_dir.mkdir(parents=True, exist_ok=True)
+            builder.executable_path(onefile=True).write_bytes(b"MZ")
+            return 0, []
+        
+        builder._run = fake_run
+        try:
+            build_app.platform.system = lambda: "Windows"
+            assert builder.executable_path(onefile=True).name == f"{builder.app_name}.exe"
+            assert builder.build_pyinstaller(onefile=True) and builder.build_pyinstaller(onefile=True)
+        finally:
+            build_app.platform.system = original
+        assert runs == ["pyinstaller:onefile"], "The second onefile build should be skipped"
+        assert builder.manifest.hits == ["resources", "pyinstaller:onefile"]
+    print("   ✅ Onefile freshness works correctly")
+
+
+def test_bench_gate():
+    """Test launch sampling, baseline recording and the regression gate"""
+    print("\n🧪 Testing launch benchmark gate...")
+    
+    rows = compare_to_baseline(
+        {"first_frame_seconds": 0.55, "peak_rss_bytes": 100, "bundle_bytes": None},
+        {"first_frame_seconds": 0.5, "peak_rss_bytes": 120, "bundle_bytes": 10},
+        tolerance=0.05,
+    )
+    assert [row["metric"] for row in rows] == ["first_frame_seconds", "peak_rss_bytes"]
+    assert rows[0]["regressed"] and not rows[1]["regressed"]
+    assert f'FIRST_FRAME_MARKER = "{FIRST_FRAME_MARKER}"' in (Path(__file__).parent / "main_app_example.py").read_text()
+    if platform.system() == "Windows":
+        print("   ⏭️  Fake app needs a POSIX shell")
+        return
+    
+    with tempfile.TemporaryDirectory() as folder:
+        builder = _builder(folder)
+        builder.build_dir.mkdir()
+        app = builder.executable_path()
+        app.parent.mkdir(parents=True)
+        app.write_text(f'#!/bin/sh\necho starting\necho {FIRST_FRAME_MARKER}\n')
+        os.chmod(app, 0o755)
+        
+        sample = launch_once(app)
+        assert sample is not None and sample.first_frame_seconds > 0
+        assert sample.peak_rss_bytes is None or sample.peak_rss_bytes > 0
+        metrics = bench_executable(app, runs=2)
+        assert len(metrics["runs"]) == 2, "Warm-up launch is not counted"
+        
+        silent = Path(folder) / "silent"
+        silent.write_text("#!/bin/sh\necho no frame\n")
+        os.chmod(silent, 0o755)
+        assert launch_once(silent) is None, "No first frame is a failure"
+        
+        # Fake build: the first run records the baseline, the second compares against it
+        builder.build_pyinstaller = lambda onefile=False: True
+        baseline = Path(folder) / "baseline.json"
+        assert builder.bench(runs=1, baseline_path=baseline)
+        recorded = json.loads(baseline.read_text())
+        target = next(iter(recorded))
+        assert target.endswith("/onedir") and recorded[target]["bundle_bytes"] == app.stat().st_size
+        
+        # Launch times of a shell script are all noise: only the bundle size can regress here
+        recorded[target].update(first_frame_seconds=100.0, peak_rss_bytes=1 << 40)
+        baseline.write_text(json.dumps(recorded))
+        assert builder.bench(runs=1, baseline_path=baseline, tolerance=0.5)
+        recorded[target]["bundle_bytes"] = app.stat().st_size // 2
+        baseline.write_text(json.dumps(recorded))
+        assert not builder.bench(runs=1, baseline_path=baseline, tolerance=0.5), "Bundle doubled"
+        assert builder.bench(runs=1, baseline_path=baseline, update_baseline=True)
+        assert json.loads(baseline.read_text())[target]["bundle_bytes"] == app.stat().st_size
+        
+        report = json.loads((builder.build_dir / REPORT_NAME).read_text())
+        assert report["runs"][-1]["stage"] == "bench"
+    print("   ✅ Launch benchmark gate works correctly")
+
+
+def run_all_tests():
+    """Run all tests"""
+    print("=" * 60)
+    print("🚀 ColorSnap Pro Build Tool Tests")
+    print("=" * 60)
+    
+    tests = [
+        test_manifest_hits_and_misses,
+        test_input_hashes_track_content,
+        test_generated_files_and_bundle_fingerprint,
+        test_build_graph_order,
+        test_build_graph_run,
+        test_build_monitor_phases,
+        test_run_streams_to_log_and_report,
+        test_bundle_analysis_and_profile,
+        test_analysis_inputs_and_spec_pruning,
+        test_cached_launcher,
+        test_cached_launcher_concurrent_cold_starts,
+        test_bytecode_freeze_and_precompile,
+        test_deterministic_outputs_and_artifact_cache,
+        test_staging_links_and_copies,
+        test_resource_bundle_stage,
+        test_onefile_freshness_uses_executable_name,
+        test_bench_gate,
+    ]
+    
+    passed = 0
+    failed = 0
+    
+    for test in tests:
+        try:
+            test()
+            passed += 1
+        except AssertionError as e:
+            print(f"   ❌ FAILED: {e}")
+            failed += 1
+        except Exception as e:
+            print(f"   ❌ ERROR: {e}")
+            failed += 1
+    
+    print("\n" + "=" * 60)
+    print(f"📊 Results: {passed} passed, {failed} failed")
+    print("=" * 60)
+    
+    return failed == 0
+
+
+if __name__ == "__main__":
+    success = run_all_tests()
+    sys.exit(0 if success else 1)
@@ -0,0 +1,190 @@
+"""
+Test script for the camera frame pipeline (renders offscreen)
+Run this to verify frame sources, the dropping queue and capture work correctly.
+"""
+
+import sys
+import os
+import time
+import tempfile
+
+# Add current directory to path
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+import numpy as np
+from PIL import Image
+
+from camera_source import (
+    Frame, FrameQueue, SyntheticSource, FileSource, VideoSource, CaptureThread, CameraPreview, open_source
+)
+
+
+def _frame(index: int) -> Frame:
+    return Frame(index, time.perf_counter(), np.zeros((4, 4, 4), dtype=np.uint8))
+
+
+def test_queue_drops_oldest():
+    """Test that a full queue drops the oldest frame instead of blocking"""
+    print("\n🧪 Testing Frame Queue...")
+    
+    queue = FrameQueue(maxsize=2)
+    assert queue.put(_frame(0)), "First frame should wake the consumer"
+    assert not queue.put(_frame(1))
+    queue.put(_frame(2))
+    assert len(queue) == 2 and queue.dropped == 1
+    
+    assert queue.latest().index == 2
+    assert queue.dropped == 2, "Stale frame 1 should count as dropped"
+    assert queue.latest() is None and queue.pushed == 3
+    print("   ✅ Queue drops stale frames")
+
+
+def test_synthetic_source():
+    """Test the synthetic pattern: moving, read-only, no copies"""
+    print("\n🧪 Testing Synthetic Source...")
+    
+    source = open_source("synthetic:320x240@60")
+    assert isinstance(source, SyntheticSource) and source.fps == 60
+    first, second = source.read(), source.read()
+    
+    assert first.shape == (240, 320, 4) and first.dtype == np.uint8
+    assert not first.flags.writeable, "Frames are shared, so they must be read-only"
+    assert np.shares_memory(first, second), "Frames should be views into one pattern"
+    assert not np.array_equal(first, second), "Pattern should move between frames"
+    print("   ✅ Synthetic source works correctly")
+
+
+def test_file_sources():
+    """Test still images and looping animations"""
+    print("\n🧪 Testing File Sources...")
+    
+    with tempfile.TemporaryDirectory() as folder:
+        still_path = os.path.join(folder, "still.png")
+        Image.new("RGB", (32, 24), (200, 10, 10)).save(still_path)
+        still = open_source(still_path)
+        assert still.read() is still.read(), "A still image should be decoded once"
+        assert tuple(still.read()[0, 0]) == (200, 10, 10, 255)
+        still.close()
+        
+        animation_path = os.path.join(folder, "clip.png")
+        frames = [Image.new("RGB", (32, 24), (i * 80, 0, 0)) for i in range(3)]
+        frames[0].save(animation_path, save_all=True, append_images=frames[1:], duration=50)
+        clip = FileSource(animation_path, loop=False)
+        reds = []
+        while (pixels := clip.read()) is not None:
+            reds.append(int(pixels[0, 0, 0]))
+        assert reds == [0, 80, 160] and clip.fps == 20
+        clip.close()
+    
+    try:
+        open_source("/missing/camera")
+        assert False, "Should raise ValueError"
+    except ValueError:
+        pass
+    print("   ✅ File sources work correctly")
+
+
+def test_video_source():
+    """Test video files open as VideoSource, or fail clearly without OpenCV"""
+    print("\n🧪 Testing Video Source...")
+    
+    try:
+        import cv2
+    except ImportError:
+        cv2 = None
+    
+    with tempfile.TemporaryDirectory() as folder:
+        path = os.path.join(folder, "clip.avi")
+        if cv2 is None:
+            open(path, "wb").close()
+            try:
+                open_source(path)
+                assert False, "Should explain that OpenCV is needed"
+            except ImportError as error:
+                assert "opencv" in str(error).lower()
+            print("   ✅ Video source reports the missing OpenCV dependency")
+            return
+        
+        writer = cv2.VideoWriter(path, cv2.VideoWriter_fourcc(*"MJPG"), 25.0, (32, 24))
+        for blue in (0, 120, 240):
+            writer.write(np.full((24, 32, 3), (blue, 0, 0), dtype=np.uint8))
+        writer.release()
+        
+        video = open_source(path)
+        assert isinstance(video, VideoSource) and video.fps == 25.0
+        frames = [video.read() for _ in range(4)]
+        assert all(frame.shape == (24, 32, 4) and not frame.flags.writeable for frame in frames)
+        assert abs(int(frames[1][0, 0, 2]) - 120) < 10, "BGR frames are converted to RGBA"
+        assert abs(int(frames[3][0, 0, 2]) - int(frames[0][0, 0, 2])) < 10, "The video loops"
+        video.close()
+    print("   ✅ Video source works correctly")
+
+
+def test_capture_to_preview():
+    """Test capture thread -> queue -> preview, with latency and drop stats"""
+    print("\n🧪 Testing Capture Pipeline...")
+    from PyQt6.QtWidgets import QApplication
+    
+    app = QApplication.instance() or QApplication([])
+    preview = CameraPreview()
+    preview.resize(160, 120)
+    preview.show()
+    capture = CaptureThread(SyntheticSource(160, 120, fps=200))
+    preview.attach(capture)
+    
+    capture.start()
+    deadline = time.perf_counter() + 0.5
+    while time.perf_counter() < deadline:
+        app.processEvents()
+        preview.repaint()
+        time.sleep(0.02)
+    capture.stop()
+    
+    stats = preview.stats()
+    assert not capture.isRunning()
+    assert stats["captured"] > 20 and stats["dropped"] > 0, f"Expected drops at 200 fps: {stats}"
+    assert 0 < stats["median_ms"] < 100
+    assert preview.frame_array() is not None and preview.frame_array().shape == (120, 160, 4)
+    preview.close()
+    print(f"   ✅ {stats['captured']} captured, {stats['dropped']} dropped, median {stats['median_ms']} ms")
+
+
+def run_all_tests():
+    """Run all tests"""
+    print("=" * 60)
+    print("🚀 ColorSnap Pro Camera Pipeline Tests")
+    print("=" * 60)
+    
+    tests = [
+        test_queue_drops_oldest,
+        test_synthetic_source,
+        test_file_sources,
+        test_video_source,
+        test_capture_to_preview,
+    ]
+    
+    passed = 0
+    failed = 0
+    
+    for test in tests:
+        try:
+            test()
+            passed += 1
+        except AssertionError as e:
+            print(f"   ❌ FAILED: {e}")
+            failed += 1
+        except Exception as e:
+            print(f"   ❌ ERROR: {e}")
+            failed += 1
+    
+    print("\n" + "=" * 60)
+    print(f"📊 Results: {passed} passed, {failed} failed")
+    print("=" * 60)
+    
+    return failed == 0
+
+
+if __name__ == "__main__":
+    success = run_all_tests()
+    sys.exit(0 if success else 1)
@@ -0,0 +1,394 @@
+"""
+Test script for the color tools (no GUI required)
+Run this to verify color conversions and color tools work correctly.
+"""
+
+import sys
+import os
+import json
+import struct
+import tempfile
+
+# Add current directory to path
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import numpy as np
+
+from color_space import (
+    hex_to_rgb, rgb_to_hex, hex_to_rgb_array, rgb_array_to_hex,
+    to_unit, to_uint8, rgb_to_hsl, hsl_to_rgb, rgb_to_oklch, oklch_to_rgb,
+    rgb_to_oklch_scalar, rgb_to_hsl_scalar, hsl_to_rgb_scalar,
+    srgb_to_linear, linear_to_srgb, rgb8_to_linear, linear_to_rgb8,
+    rgb_to_lab, lab_to_rgb, rgb8_to_lab, rgb_to_lab_scalar, rgb8_to_oklab, linear_to_oklab
+)
+from color_harmony import SCHEMES, SPACES, harmony, harmony_batch
+from color_contrast import (
+    SRGB_TO_LINEAR_LUT, relative_luminance, contrast_ratio, wcag_levels,
+    contrast_matrix, iter_contrast_blocks, wcag_masks, pass_counts
+)
+from gradient_maker import normalize_stops, gradient_ramp, render_into, css_gradient, qss_gradient
+from color_export import (
+    FORMATS, EXTENSIONS, MIME_CSS, MIME_JSON, MIME_ASE,
+    format_colors, export_colors, export_palettes, mime_data
+)
+
+
+def _random_colors(count: int = 500) -> np.ndarray:
+    return np.random.default_rng(42).integers(0, 256, (count, 3), dtype=np.uint8)
+
+
+def test_hex_parsing():
+    """Test hex parsing and formatting"""
+    print("\n🧪 Testing Hex Parsing...")
+    
+    assert hex_to_rgb("#3B82F6") == (59, 130, 246)
+    assert hex_to_rgb("3b82f6") == (59, 130, 246)
+    assert hex_to_rgb("#FFF") == (255, 255, 255)
+    assert rgb_to_hex((59, 130, 246)) == "#3B82F6"
+    assert rgb_array_to_hex(hex_to_rgb_array(["#3B82F6", "#000000"])) == ["#3B82F6", "#000000"]
+    
+    try:
+        hex_to_rgb("#12345")
+        assert False, "Should raise ValueError"
+    except ValueError:
+        pass
+    print("   ✅ Hex parsing works correctly")
+
+
+def test_round_trips():
+    """Test HSL and OKLCH round trips"""
+    print("\n🧪 Testing Round Trips...")
+    
+    colors = _random_colors()
+    hsl_back = to_uint8(hsl_to_rgb(rgb_to_hsl(to_unit(colors))))
+    oklch_back = to_uint8(oklch_to_rgb(rgb_to_oklch(to_unit(colors))))
+    
+    assert np.array_equal(hsl_back, colors), "HSL round trip should be lossless"
+    assert np.array_equal(oklch_back, colors), "OKLCH round trip should be lossless"
+    print("   ✅ Round trips work correctly")
+
+
+def test_oklch_scalar_matches_vectorized():
+    """Test the scalar OKLCH path against the vectorized one"""
+    print("\n🧪 Testing Scalar OKLCH...")
+    
+    for color in _random_colors(50):
+        scalar = rgb_to_oklch_scalar(tuple(int(c) for c in color))
+        vector = rgb_to_oklch(to_unit(color))
+        assert np.allclose(scalar[:2], vector[:2], atol=1e-9), f"Mismatch for {color}"
+    print("   ✅ Scalar OKLCH matches")
+
+
+def test_hsl_scalar_matches_vectorized():
+    """Test the scalar HSL path gives exactly the vectorized results"""
+    print("\n🧪 Testing Scalar HSL...")
+    
+    colors = np.vstack([_random_colors(200), [[0, 0, 0], [255, 255, 255], [128, 128, 128], [255, 0, 0]]])
+    for color in colors:
+        scalar = rgb_to_hsl_scalar(tuple(int(c) for c in color))
+        vector = rgb_to_hsl(to_unit(color))
+        assert scalar == tuple(vector.tolist()), f"Mismatch for {color}"
+        for hue in (scalar[0], 359.5, 400.0):
+            back = hsl_to_rgb_scalar((hue, scalar[1], scalar[2]))
+            assert back == tuple(to_uint8(hsl_to_rgb(np.array([hue, scalar[1], scalar[2]]))).tolist())
+    print("   ✅ Scalar HSL matches")
+
+
+def test_lookup_tables_match_formulas():
+    """Test the 8-bit gamma tables against the transfer function"""
+    print("\n🧪 Testing Gamma Lookup Tables...")
+    
+    colors = _random_colors()
+    assert np.array_equal(rgb8_to_linear(colors), srgb_to_linear(to_unit(colors)))
+    assert rgb8_to_linear(colors, np.float32).dtype == np.float32
+    
+    linear = np.random.default_rng(7).random((10000, 3))
+    exact = to_uint8(linear_to_srgb(linear))
+    assert np.abs(linear_to_rgb8(linear).astype(int) - exact).max() <= 1
+    assert np.array_equal(linear_to_rgb8(rgb8_to_linear(colors)), colors), "8-bit round trip should be lossless"
+    assert linear_to_rgb8(np.array([-0.5, 1.5])).tolist() == [0, 255]
+    print("   ✅ Lookup tables match the formulas")
+
+
+def test_lab_conversions():
+    """Test CIELAB known values, round trips and precision paths"""
+    print("\n🧪 Testing CIELAB...")
+    
+    white, black = rgb8_to_lab(np.array([[255, 255, 255], [0, 0, 0]]))
+    assert np.allclose(white, [100, 0, 0], atol=0.01)
+    assert np.allclose(black, [0, 0, 0], atol=1e-9)
+    assert np.allclose(rgb8_to_lab(np.array([255, 0, 0])), [53.24, 80.09, 67.20], atol=0.01)
+    
+    colors = _random_colors()
+    lab = rgb_to_lab(to_unit(colors))
+    assert np.array_equal(to_uint8(lab_to_rgb(lab)), colors), "Lab round trip should be lossless"
+    assert np.allclose(rgb8_to_lab(colors), lab, atol=1e-9)
+    for color, expected in zip(colors[:50], lab[:50]):
+        assert np.allclose(rgb_to_lab_scalar(tuple(int(c) for c in color)), expected, atol=1e-9)
+    
+    lab32 = rgb8_to_lab(colors, np.float32)
+    assert lab32.dtype == np.float32 and np.allclose(lab32, lab, atol=1e-3)
+    oklab32 = rgb8_to_oklab(colors, np.float32)
+    assert oklab32.dtype == np.float32 and np.allclose(oklab32, linear_to_oklab(srgb_to_linear(to_unit(colors))), atol=1e-5)
+    assert rgb_to_hsl(to_unit(colors, np.float32), np.float32).dtype == np.float32
+    print("   ✅ CIELAB conversions work correctly")
+
+
+def test_harmony_known_values():
+    """Test harmony sets for a known color"""
+    print("\n🧪 Testing Harmony Values...")
+    
+    assert harmony("#FF0000", "complementary") == ["#FF0000", "#00FFFF"]
+    assert harmony("#FF0000", "triadic") == ["#FF0000", "#00FF00", "#0000FF"]
+    assert len(harmony("#3B82F6", "tetradic")) == 4
+    assert len(harmony("#3B82F6", "split_complementary", "oklch")) == 3
+    print("   ✅ Harmony values are correct")
+
+
+def test_harmony_batch_matches_scalar():
+    """Test that batched and scalar paths agree"""
+    print("\n🧪 Testing Batch vs Scalar Harmony...")
+    
+    colors = _random_colors(100)
+    for scheme in SCHEMES:
+        for space in SPACES:
+            batch = harmony_batch(colors, scheme, space)
+            assert batch.shape == (100, 1 + len(SCHEMES[scheme]), 3)
+            scalar = np.stack([
+                hex_to_rgb_array(harmony(tuple(int(c) for c in color), scheme, space))
+                for color in colors
+            ])
+            assert (batch == scalar).all(), f"{scheme}/{space} scalar and batch paths differ"
+    print("   ✅ Batch and scalar paths agree")
+
+
+def test_harmony_invalid_input():
+    """Test unknown schemes and spaces"""
+    print("\n🧪 Testing Invalid Harmony Input...")
+    
+    for call in (
+        lambda: harmony("#FF0000", "pentadic"),
+        lambda: harmony("#FF0000", "triadic", "cmyk"),
+        lambda: harmony_batch(_random_colors(2), "triadic", "cmyk"),
+    ):
+        try:
+            call()
+            assert False, "Should raise ValueError"
+        except ValueError:
+            pass
+    print("   ✅ Invalid input is rejected")
+
+
+def test_contrast_known_values():
+    """Test luminance and contrast against WCAG reference values"""
+    print("\n🧪 Testing Contrast Known Values...")
+    
+    assert len(SRGB_TO_LINEAR_LUT) == 256
+    assert np.allclose(relative_luminance(np.array([[0, 0, 0], [255, 255, 255]])), [0.0, 1.0])
+    assert abs(contrast_ratio("#FFFFFF", "#000000") - 21.0) < 1e-9
+    assert abs(contrast_ratio("#777777", "#FFFFFF") - 4.48) < 0.01
+    assert contrast_ratio("#3B82F6", "#FFFFFF") == contrast_ratio("#FFFFFF", "#3B82F6")
+    
+    levels = wcag_levels(contrast_ratio("#777777", "#FFFFFF"))
+    assert levels == {"AA": False, "AA_large": True, "AAA": False, "AAA_large": False}
+    print("   ✅ Ratios match WCAG reference values")
+
+
+def test_contrast_matrix_matches_scalar():
+    """Test the pairwise matrix, blocks and masks against the scalar path"""
+    print("\n🧪 Testing Contrast Matrix...")
+    
+    colors = _random_colors(300)
+    ratios = contrast_matrix(colors)
+    assert ratios.shape == (300, 300) and ratios.dtype == np.float32
+    assert np.allclose(ratios, ratios.T) and np.allclose(np.diag(ratios), 1.0)
+    
+    for i, j in [(0, 1), (17, 250), (299, 3)]:
+        expected = contrast_ratio(tuple(colors[i]), tuple(colors[j]))
+        assert abs(ratios[i, j] - expected) < 1e-4 * expected
+    
+    blocks = np.vstack([block.copy() for _, block in iter_contrast_blocks(colors, block_rows=64)])
+    assert np.array_equal(blocks, ratios)
+    
+    masks = wcag_masks(ratios)
+    counts = pass_counts(colors, block_rows=64)
+    assert np.array_equal(counts["AA"], masks["AA"].sum(axis=1))
+    assert np.array_equal(counts["AAA"], masks["AAA"].sum(axis=1))
+    assert np.all(wcag_masks(ratios, large_text=True)["AA"] >= masks["AA"])
+    print("   ✅ Matrix, blocks and masks agree with scalar ratios")
+
+
+def test_gradient_ramps():
+    """Test ramp endpoints, interpolation spaces and caching"""
+    print("\n🧪 Testing Gradient Ramps...")
+    
+    stops = [(1.0, "#0000ff"), (0.0, "#FF0000")]
+    assert normalize_stops(stops) == ((0.0, "#FF0000"), (1.0, "#0000FF"))
+    
+    for space in ("srgb", "linear", "oklab"):
+        ramp = gradient_ramp(stops, space, size=256)
+        assert ramp.shape == (256, 4) and not ramp.flags.writeable
+        assert tuple(ramp[0]) == (255, 0, 0, 255) and tuple(ramp[-1]) == (0, 0, 255, 255)
+    
+    # sRGB midpoint is the plain average; linear-light midpoint is brighter
+    assert tuple(gradient_ramp(stops, "srgb", size=3)[1, :3]) == (128, 0, 128)
+    assert gradient_ramp(stops, "linear", size=3)[1, 0] > 128
+    assert gradient_ramp(stops, "oklab") is gradient_ramp(list(reversed(stops)), "oklab")
+    print("   ✅ Ramps interpolate per space and are cached by stops")
+
+
+def test_gradient_render_and_export():
+    """Test buffer rendering and CSS/QSS strings"""
+    print("\n🧪 Testing Gradient Rendering...")
+    
+    stops = [(0.0, "#FF0000"), (1.0, "#0000FF")]
+    buffer = render_into(np.zeros((4, 64, 4), dtype=np.uint8), stops, 90.0, "srgb")
+    assert buffer[0, 0, 0] > 240 and buffer[0, -1, 2] > 240
+    assert np.array_equal(buffer[0], buffer[3])
+    vertical = render_into(np.zeros((64, 4, 4), dtype=np.uint8), stops, 180.0, "srgb")
+    assert vertical[0, 0, 0] > 240 and vertical[-1, 0, 2] > 240
+    
+    assert css_gradient(stops, space="srgb") == "linear-gradient(90deg, #FF0000 0%, #0000FF 100%)"
+    assert css_gradient(stops).startswith("linear-gradient(in oklab 90deg,")
+    assert css_gradient(stops, steps=5).count("#") == 5
+    assert qss_gradient(stops, space="srgb") == (
+        "qlineargradient(x1: 0, y1: 0.5, x2: 1, y2: 0.5, stop: 0 #FF0000, stop: 1 #0000FF)"
+    )
+    print("   ✅ Rendering and CSS/QSS export are correct")
+
+
+def test_hex_array_fast_path():
+    """Test the batched hex parser against the scalar one"""
+    print("\n🧪 Testing Batched Hex Parsing...")
+    
+    colors = _random_colors()
+    codes = rgb_array_to_hex(colors)
+    assert np.array_equal(hex_to_rgb_array(codes), colors)
+    assert np.array_equal(hex_to_rgb_array([code.lower() for code in codes]), colors)
+    assert hex_to_rgb_array(["#FFF", "3B82F6"]).tolist() == [[255, 255, 255], [59, 130, 246]]
+    assert hex_to_rgb_array([]).shape == (0, 3)
+    try:
+        hex_to_rgb_array(["#3B82F6", "#GG0000"])
+        assert False, "Should raise ValueError"
+    except ValueError:
+        pass
+    print("   ✅ Batched parsing matches scalar parsing")
+
+
+def test_format_colors():
+    """Test per-color text formats"""
+    print("\n🧪 Testing Color Formats...")
+    
+    colors = ["#3B82F6", "#f97316"]
+    assert format_colors(colors, "hex") == ["#3B82F6", "#F97316"]
+    assert format_colors(colors, "rgb") == ["rgb(59, 130, 246)", "rgb(249, 115, 22)"]
+    assert format_colors(colors, "hsl") == ["hsl(217, 91%, 60%)", "hsl(25, 95%, 53%)"]
+    assert format_colors(colors, "css") == ["  --color-1: #3B82F6;", "  --color-2: #F97316;"]
+    assert export_colors(colors, "css") == ":root {\n  --color-1: #3B82F6;\n  --color-2: #F97316;\n}\n"
+    assert json.loads(export_colors(colors, "json"))["colors"][0] == {
+        "hex": "#3B82F6", "rgb": [59, 130, 246], "hsl": [217, 91, 60]
+    }
+    
+    data = mime_data(["#3B82F6"])
+    assert data.text() == "#3B82F6"
+    assert all(data.hasFormat(mime) for mime in (MIME_CSS, MIME_JSON, MIME_ASE))
+    print("   ✅ Formats are correct")
+
+
+def _read_ase(path: str):
+    """Minimal ASE reader: (block count, [(name, (r, g, b))])"""
+    with open(path, "rb") as handle:
+        data = handle.read()
+    signature, _, _, count = struct.unpack_from(">4sHHI", data)
+    assert signature == b"ASEF"
+    offset, colors = 12, []
+    for _ in range(count):
+        block_type, length = struct.unpack_from(">HI", data, offset)
+        offset += 6
+        if block_type == 0x0001:
+            name_length = struct.unpack_from(">H", data, offset)[0]
+            name = data[offset + 2:offset + 2 + name_length * 2].decode("utf-16-be").rstrip("\0")
+            values_at = offset + 2 + name_length * 2
+            assert data[values_at:values_at + 4] == b"RGB "
+            colors.append((name, struct.unpack_from(">3f", data, values_at + 4)))
+        offset += length
+    assert offset == len(data)
+    return count, colors
+
+
+def test_streamed_export():
+    """Test exporting palettes to files in every format"""
+    print("\n🧪 Testing Streamed Export...")
+    
+    codes = rgb_array_to_hex(_random_colors(3000))
+    palettes = [(f"Palette {i}", codes[i * 5:(i + 1) * 5]) for i in range(600)]
+    palettes[1] = ("Pâlette ünïcode ✓", palettes[1][1])
+    
+    with tempfile.TemporaryDirectory() as directory:
+        for fmt in FORMATS:
+            path = os.path.join(directory, fmt + EXTENSIONS[fmt])
+            written = export_palettes(path, iter(palettes), fmt)
+            assert written == os.path.getsize(path), f"{fmt}: return value must be the bytes written"
+        
+        exported = json.load(open(os.path.join(directory, "json.json")))
+        assert len(exported) == 600 and [c["hex"] for c in exported[599]["colors"]] == palettes[599][1]
+        
+        count, colors = _read_ase(os.path.join(directory, "ase.ase"))
+        assert count == 600 * 7 and len(colors) == 3000
+        assert colors[7][0] == codes[7]
+        assert np.allclose(np.array(colors[7][1]) * 255, hex_to_rgb(codes[7]), atol=1e-3)
+        
+        text = open(os.path.join(directory, "hex.txt"), encoding="utf-8").read()
+        assert text.count("# Palette") == 599 and "# Pâlette ünïcode ✓" in text and codes[-1] in text
+    print("   ✅ Every format streams to a valid file")
+
+
+def run_all_tests():
+    """Run all tests"""
+    print("=" * 60)
+    print("🚀 ColorSnap Pro Color Tools Tests")
+    print("=" * 60)
+    
+    tests = [
+        test_hex_parsing,
+        test_round_trips,
+        test_oklch_scalar_matches_vectorized,
+        test_hsl_scalar_matches_vectorized,
+        test_lookup_tables_match_formulas,
+        test_lab_conversions,
+        test_harmony_known_values,
+        test_harmony_batch_matches_scalar,
+        test_harmony_invalid_input,
+        test_contrast_known_values,
+        test_contrast_matrix_matches_scalar,
+        test_gradient_ramps,
+        test_gradient_render_and_export,
+        test_hex_array_fast_path,
+        test_format_colors,
+        test_streamed_export,
+    ]
+    
+    passed = 0
+    failed = 0
+    
+    for test in tests:
+        try:
+            test()
+            passed += 1
+        except AssertionError as e:
+            print(f"   ❌ FAILED: {e}")
+            failed += 1
+        except Exception as e:
+            print(f"   ❌ ERROR: {e}")
+            failed += 1
+    
+    print("\n" + "=" * 60)
+    print(f"📊 Results: {passed} passed, {failed} failed")
+    print("=" * 60)
+    
+    return failed == 0
+
+
+if __name__ == "__main__":
+    success = run_all_tests()
+    sys.exit(0 if success else 1)
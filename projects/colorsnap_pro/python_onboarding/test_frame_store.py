@@ -0,0 +1,139 @@
+"""
+Test script for the frozen frame store (no GUI required)
+Run this to verify memory-mapped frame storage works correctly.
+"""
+
+import sys
+import os
+
+# Add current directory to path
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import numpy as np
+
+from frame_store import FrameStore
+
+
+FRAME_SHAPE = (60, 80, 4)
+FRAME_BYTES = 60 * 80 * 4
+
+
+def _frame(value: int) -> np.ndarray:
+    return np.full(FRAME_SHAPE, value, dtype=np.uint8)
+
+
+def test_freeze_and_pick():
+    """Test storing a frame and picking from it"""
+    print("\n🧪 Testing Freeze & Pick...")
+    
+    with FrameStore(max_bytes=FRAME_BYTES * 4) as store:
+        frame = _frame(0)
+        frame[10, 20] = (12, 34, 56, 255)
+        frame_id = store.freeze(frame)
+        
+        assert frame_id in store
+        assert store.pick(frame_id, 20, 10) == (12, 34, 56)
+        assert isinstance(store.get(frame_id), np.memmap), "Frames should be memory-mapped"
+        assert store.nbytes == FRAME_BYTES
+    print("   ✅ Freeze & pick works correctly")
+
+
+def test_frozen_copy():
+    """Test that stored frames do not change with the source buffer"""
+    print("\n🧪 Testing Frozen Copy...")
+    
+    with FrameStore(max_bytes=FRAME_BYTES * 4) as store:
+        frame = _frame(5)
+        frame_id = store.freeze(frame)
+        frame[...] = 99
+        
+        assert store.pick(frame_id, 0, 0) == (5, 5, 5), "Stored frame should be a copy"
+    print("   ✅ Frozen copy works correctly")
+
+
+def test_lru_eviction():
+    """Test least-recently-used eviction under the byte budget"""
+    print("\n🧪 Testing LRU Eviction...")
+    
+    with FrameStore(max_bytes=FRAME_BYTES * 3) as store:
+        first, second, third = (store.freeze(_frame(i)) for i in range(3))
+        
+        # Touch the first frame so the second becomes least recently used
+        store.pick(first, 0, 0)
+        fourth = store.freeze(_frame(3))
+        
+        assert store.frame_ids == [third, first, fourth], f"Unexpected order {store.frame_ids}"
+        assert second not in store, "Least recently used frame should be evicted"
+        assert store.evicted == 1
+        assert store.nbytes <= store.max_bytes
+    print("   ✅ LRU eviction works correctly")
+
+
+def test_oversized_frame():
+    """Test that frames larger than the budget are rejected"""
+    print("\n🧪 Testing Oversized Frame...")
+    
+    with FrameStore(max_bytes=FRAME_BYTES - 1) as store:
+        try:
+            store.freeze(_frame(0))
+            assert False, "Should raise ValueError"
+        except ValueError:
+            pass
+    print("   ✅ Oversized frames are rejected")
+
+
+def test_files_cleaned_up():
+    """Test that backing files are deleted"""
+    print("\n🧪 Testing Cleanup...")
+    
+    store = FrameStore(max_bytes=FRAME_BYTES * 2)
+    directory = store._directory
+    frame_id = store.freeze(_frame(1))
+    store.freeze(_frame(2))
+    
+    store.remove(frame_id)
+    assert len(os.listdir(directory)) == 1, "Removed frame's file should be deleted"
+    
+    store.close()
+    assert not os.path.exists(directory), "Store directory should be removed on close"
+    print("   ✅ Cleanup works correctly")
+
+
+def run_all_tests():
+    """Run all tests"""
+    print("=" * 60)
+    print("🚀 ColorSnap Pro Frame Store Tests")
+    print("=" * 60)
+    
+    tests = [
+        test_freeze_and_pick,
+        test_frozen_copy,
+        test_lru_eviction,
+        test_oversized_frame,
+        test_files_cleaned_up,
+    ]
+    
+    passed = 0
+    failed = 0
+    
+    for test in tests:
+        try:
+            test()
+            passed += 1
+        except AssertionError as e:
+            print(f"   ❌ FAILED: {e}")
+            failed += 1
+        except Exception as e:
+            print(f"   ❌ ERROR: {e}")
+            failed += 1
+    
+    print("\n" + "=" * 60)
+    print(f"📊 Results: {passed} passed, {failed} failed")
+    print("=" * 60)
+    
+    return failed == 0
+
+
+if __name__ == "__main__":
+    success = run_all_tests()
+    sys.exit(0 if success else 1)
@@ -0,0 +1,186 @@
+"""
+Test script for the magnifier color picker (renders offscreen)
+Run this to verify sampling, edge clamping and buffer reuse work correctly.
+"""
+
+import sys
+import os
+
+# Add current directory to path
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+import numpy as np
+
+from PyQt6.QtWidgets import QApplication, QWidget
+from PyQt6.QtCore import QPoint
+
+from magnifier import ColorPicker, MagnifierSampler, benchmark
+
+app = QApplication.instance() or QApplication([])
+
+
+def _gradient(height: int = 40, width: int = 60, channels: int = 4) -> np.ndarray:
+    """Frame whose red/green channels encode x/y, so every pixel is distinct"""
+    frame = np.zeros((height, width, channels), dtype=np.uint8)
+    frame[..., 0] = np.arange(width)[None, :]
+    frame[..., 1] = np.arange(height)[:, None]
+    frame[..., 2] = 7
+    if channels == 4:
+        frame[..., 3] = 200
+    return frame
+
+
+def test_center_color():
+    """Test the center color is the frame pixel under the pointer"""
+    print("\n🧪 Testing Center Color...")
+    
+    frame = _gradient()
+    sampler = MagnifierSampler(size=5, zoom=3)
+    sampler.set_frame(frame)
+    for x, y in [(30, 20), (2, 2), (0, 0), (59, 39), (59, 0)]:
+        assert sampler.sample(x, y) == tuple(int(v) for v in frame[y, x, :3]), (x, y)
+        assert sampler.center_color == (x, y, 7)
+    
+    rgb = MagnifierSampler(size=5, zoom=3)
+    rgb.set_frame(_gradient(channels=3))
+    assert rgb.sample(10, 11) == (10, 11, 7)
+    assert (rgb._patch[..., 3] == 255).all(), "RGB frames should sample as opaque"
+    print("   ✅ Center color works correctly")
+
+
+def test_edge_clamping():
+    """Test sampling near the frame edges repeats the edge pixels"""
+    print("\n🧪 Testing Edge Clamping...")
+    
+    frame = _gradient()
+    sampler = MagnifierSampler(size=5, zoom=3)
+    sampler.set_frame(frame)
+    
+    sampler.sample(0, 0)
+    patch = sampler._patch
+    assert (patch[:, :, 0] == [0, 0, 0, 1, 2]).all(), "Columns left of the frame clamp to x=0"
+    assert (patch[:, :, 1] == np.array([0, 0, 0, 1, 2])[:, None]).all(), "Rows above clamp to y=0"
+    
+    sampler.sample(59, 39)
+    assert (patch[:, :, 0] == [57, 58, 59, 59, 59]).all()
+    assert (patch[:, :, 1] == np.array([37, 38, 39, 39, 39])[:, None]).all()
+    
+    sampler.sample(30, 20)
+    assert (patch == frame[18:23, 28:33]).all(), "Interior samples copy the neighborhood as is"
+    
+    zoomed = sampler._zoom
+    assert zoomed.shape == (15, 15, 4)
+    assert (zoomed[::3, ::3] == patch).all() and (zoomed[2::3, 2::3] == patch).all()
+    print("   ✅ Edge clamping works correctly")
+
+
+def test_buffers_are_reused():
+    """Test sampling writes into the same preallocated buffers every time"""
+    print("\n🧪 Testing Buffer Reuse...")
+    
+    sampler = MagnifierSampler(size=7, zoom=4)
+    buffers = [id(sampler._patch), id(sampler._zoom), id(sampler._zoom_rows), id(sampler.image)]
+    sampler.set_frame(_gradient())
+    for x, y in [(0, 0), (30, 20), (59, 39), (3, 38)]:
+        sampler.sample(x, y)
+        assert [id(sampler._patch), id(sampler._zoom), id(sampler._zoom_rows), id(sampler.image)] == buffers
+    
+    sampler.set_frame(_gradient(channels=3))
+    sampler.sample(10, 10)
+    assert id(sampler._patch) == buffers[0] and id(sampler._zoom) == buffers[1]
+    assert sampler.image.constBits() is not None and sampler.image.width() == 28
+    print("   ✅ Buffers are reused correctly")
+
+
+def test_rejects_bad_frames():
+    """Test frames that are not H x W x 3/4 are rejected"""
+    print("\n🧪 Testing Frame Validation...")
+    
+    sampler = MagnifierSampler()
+    for frame in [np.zeros((4, 4), dtype=np.uint8), np.zeros((4, 4, 2), dtype=np.uint8)]:
+        try:
+            sampler.set_frame(frame)
+            assert False, "Should reject a frame of shape {}".format(frame.shape)
+        except ValueError:
+            pass
+    try:
+        MagnifierSampler(size=4)
+        assert False, "Should reject an even magnifier size"
+    except ValueError:
+        pass
+    print("   ✅ Frame validation works correctly")
+
+
+def test_picker_tracks_preview_size():
+    """Test the picker keeps covering the preview when the preview is resized"""
+    print("\n🧪 Testing Picker Geometry...")
+    
+    preview = QWidget()
+    preview.resize(320, 240)
+    picker = ColorPicker(preview)
+    picker.freeze(_gradient())
+    preview.show()
+    app.processEvents()
+    assert picker.geometry() == preview.rect()
+    
+    preview.resize(120, 80)
+    app.processEvents()
+    assert picker.geometry() == preview.rect(), "The picker follows the preview's size"
+    assert picker._to_frame_coords(QPoint(119, 79)) == (59, 39), "The far corner maps to the frame's last pixel"
+    assert picker._to_frame_coords(QPoint(60, 40)) == (30, 20)
+    preview.close()
+    print("   ✅ Picker geometry works correctly")
+
+
+def test_benchmark_counts_events():
+    """Test the benchmark drives every event through the picker and repaints the loupe"""
+    print("\n🧪 Testing Benchmark...")
+    
+    stats = benchmark(events=50, width=320, height=240)
+    assert stats["events"] == 50
+    assert 0 < stats["frames"] <= 50
+    assert stats["median_us"] > 0 and stats["p95_us"] >= stats["median_us"]
+    assert stats["median_us"] >= stats["sample_median_us"], "Full path includes sampling"
+    print(f"   ✅ {stats['events']} events, {stats['frames']} repaints, median {stats['median_us']:.1f} µs")
+
+
+def run_all_tests():
+    """Run all tests"""
+    print("=" * 60)
+    print("🚀 ColorSnap Pro Magnifier Tests")
+    print("=" * 60)
+    
+    tests = [
+        test_center_color,
+        test_edge_clamping,
+        test_buffers_are_reused,
+        test_rejects_bad_frames,
+        test_picker_tracks_preview_size,
+        test_benchmark_counts_events,
+    ]
+    
+    passed = 0
+    failed = 0
+    
+    for test in tests:
+        try:
+            test()
+            passed += 1
+        except AssertionError as e:
+            print(f"   ❌ FAILED: {e}")
+            failed += 1
+        except Exception as e:
+            print(f"   ❌ ERROR: {e}")
+            failed += 1
+    
+    print("\n" + "=" * 60)
+    print(f"📊 Results: {passed} passed, {failed} failed")
+    print("=" * 60)
+    
+    return failed == 0
+
+
+if __name__ == "__main__":
+    success = run_all_tests()
+    sys.exit(0 if success else 1)
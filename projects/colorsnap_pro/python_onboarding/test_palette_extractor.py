@@ -0,0 +1,353 @@
+"""
+Test script for the palette extractor (no GUI required)
+Run this to verify palette extraction works correctly.
+"""
+
+import sys
+import os
+import json
+import tempfile
+
+# Add current directory to path
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import numpy as np
+
+from palette_extractor import (
+    PaletteExtractor,
+    IncrementalExtractor,
+    downsample,
+    synthetic_frame,
+    benchmark
+)
+from bulk_palettes import run as run_bulk, load_image
+
+
+def _striped_frame(colors, width=300, height=200):
+    """Frame made of equal vertical stripes of the given colors"""
+    frame = np.zeros((height, width, 3), dtype=np.uint8)
+    stripe = width // len(colors)
+    for i, color in enumerate(colors):
+        frame[:, i * stripe:(i + 1) * stripe] = color
+    return frame
+
+
+def test_downsample():
+    """Test downsampling to the sample budget"""
+    print("\n🧪 Testing Downsampling...")
+    
+    frame = synthetic_frame(1920, 1080)
+    pixels = downsample(frame, sample_size=4096)
+    
+    assert pixels.shape[1] == 3, "Should return RGB pixels"
+    assert pixels.dtype == np.float32, "Should return float32 pixels"
+    assert 2048 <= len(pixels) <= 8192, f"Expected ~4096 pixels, got {len(pixels)}"
+    print("   ✅ Downsampling works correctly")
+
+
+def test_extract_known_colors():
+    """Test that distinct stripes are recovered"""
+    print("\n🧪 Testing Known Colors...")
+    
+    colors = [(255, 0, 0), (0, 255, 0), (0, 0, 255)]
+    palette = PaletteExtractor(n_colors=3).extract(_striped_frame(colors))
+    
+    found = sorted(color.rgb for color in palette)
+    assert found == sorted(colors), f"Expected {sorted(colors)}, got {found}"
+    assert abs(sum(color.weight for color in palette) - 1.0) < 1e-6, "Weights should sum to 1"
+    print("   ✅ Known colors extracted correctly")
+
+
+def test_weights_ordering():
+    """Test that the most common color comes first"""
+    print("\n🧪 Testing Weight Ordering...")
+    
+    frame = _striped_frame([(10, 10, 10), (10, 10, 10), (10, 10, 10), (250, 250, 0)])
+    palette = PaletteExtractor(n_colors=2).extract(frame)
+    
+    assert palette[0].rgb == (10, 10, 10), f"Dominant color should be first, got {palette[0].rgb}"
+    assert palette[0].weight > palette[1].weight
+    assert palette[0].hex == "#0A0A0A"
+    print("   ✅ Weight ordering works correctly")
+
+
+def test_rgba_input():
+    """Test that RGBA frames are accepted"""
+    print("\n🧪 Testing RGBA Input...")
+    
+    rgb = _striped_frame([(200, 40, 40), (40, 40, 200)])
+    rgba = np.dstack([rgb, np.full(rgb.shape[:2], 255, dtype=np.uint8)])
+    palette = PaletteExtractor(n_colors=2).extract(rgba)
+    
+    assert sorted(c.rgb for c in palette) == [(40, 40, 200), (200, 40, 40)]
+    print("   ✅ RGBA input works correctly")
+
+
+def test_fewer_colors_than_clusters():
+    """Test a flat frame with more clusters than colors"""
+    print("\n🧪 Testing Flat Frame...")
+    
+    frame = np.full((64, 64, 3), 128, dtype=np.uint8)
+    palette = PaletteExtractor(n_colors=5).extract(frame)
+    
+    assert palette[0].rgb == (128, 128, 128)
+    assert abs(palette[0].weight - 1.0) < 1e-6, "Single color should cover the frame"
+    print("   ✅ Flat frame works correctly")
+
+
+def test_mini_batch():
+    """Test mini-batch k-means"""
+    print("\n🧪 Testing Mini-Batch...")
+    
+    colors = [(255, 0, 0), (0, 255, 0), (0, 0, 255)]
+    extractor = PaletteExtractor(n_colors=3, mini_batch=256, max_iter=20)
+    palette = extractor.extract(_striped_frame(colors))
+    
+    for expected in colors:
+        nearest = min(palette, key=lambda c: sum((a - b) ** 2 for a, b in zip(c.rgb, expected)))
+        distance = max(abs(a - b) for a, b in zip(nearest.rgb, expected))
+        assert distance <= 8, f"Expected a center near {expected}, got {nearest.rgb}"
+    print("   ✅ Mini-batch works correctly")
+
+
+def test_warm_start():
+    """Test that initial centers are used"""
+    print("\n🧪 Testing Warm Start...")
+    
+    colors = [(255, 0, 0), (0, 0, 255)]
+    extractor = PaletteExtractor(n_colors=2, max_iter=1)
+    initial = np.array(colors, dtype=np.float32)
+    palette = extractor.extract(_striped_frame(colors), initial_centers=initial)
+    
+    assert sorted(c.rgb for c in palette) == sorted(colors)
+    print("   ✅ Warm start works correctly")
+
+
+def test_incremental_static_scene():
+    """Test that a static scene backs off and reuses the palette"""
+    print("\n🧪 Testing Incremental Static Scene...")
+    
+    frame = synthetic_frame(640, 480)
+    live = IncrementalExtractor(n_colors=4, max_interval=8)
+    first = live.update(frame)
+    assert live.last_action == "full"
+    
+    for _ in range(60):
+        assert live.update(frame) == first
+    counters = live.counters
+    assert counters["full"] == 1 and counters["partial"] == 0
+    assert counters["skipped"] > 40, f"Static frames should mostly be skipped: {counters}"
+    print(f"   ✅ {counters['skipped']} of 60 static frames skipped")
+
+
+def test_incremental_tracks_changes():
+    """Test that only changed tiles are reprocessed and palettes follow the scene"""
+    print("\n🧪 Testing Incremental Changes...")
+    
+    colors = [(255, 0, 0), (0, 255, 0), (0, 0, 255)]
+    frame = _striped_frame(colors, width=300, height=200)
+    live = IncrementalExtractor(n_colors=3, grid=4, max_interval=4)
+    live.update(frame)
+    tiles_after_first = live.counters["tiles_reprocessed"]
+    
+    # Repaint one corner: only that tile's hash changes
+    changed = frame.copy()
+    changed[:40, :60] = (250, 250, 250)
+    palette = live.update(changed)
+    assert live.last_action in ("partial", "full")
+    if live.last_action == "partial":
+        assert live.counters["tiles_reprocessed"] - tiles_after_first == 1
+    
+    # A new scene converges to the full-extraction palette
+    scene = _striped_frame([(255, 255, 0), (0, 255, 255), (255, 0, 255)], width=300, height=200)
+    for _ in range(3):
+        palette = live.update(scene)
+    expected = PaletteExtractor(n_colors=3).extract(scene)
+    assert sorted(c.rgb for c in palette) == sorted(c.rgb for c in expected)
+    print("   ✅ Incremental extraction tracks changes")
+
+
+def _write_images(folder, count, size=(640, 480)):
+    from PIL import Image
+    for i in range(count):
+        Image.fromarray(synthetic_frame(*size, seed=i)).save(os.path.join(folder, f"{i:03d}.jpg"))
+
+
+def test_bulk_extraction():
+    """Test bulk JSONL extraction with a broken image"""
+    print("\n🧪 Testing Bulk Extraction...")
+    
+    with tempfile.TemporaryDirectory() as folder:
+        _write_images(folder, 5)
+        with open(os.path.join(folder, "broken.png"), "wb") as handle:
+            handle.write(b"not an image")
+        output = os.path.join(folder, "out.jsonl")
+        
+        stats = run_bulk([folder], output, workers=0, batch_size=2, progress_interval=0)
+        with open(output) as handle:
+            records = [json.loads(line) for line in handle]
+        
+        assert stats.processed == 6 and stats.failed == 1
+        assert len(records) == 6
+        good = [r for r in records if "error" not in r]
+        assert all(len(r["colors"]) == 5 and r["width"] == 640 for r in good)
+        assert abs(sum(good[0]["weights"]) - 1) < 0.01
+        
+        pixels, size = load_image(os.path.join(folder, "000.jpg"), max_side=160)
+        assert size == (640, 480) and max(pixels.shape[:2]) <= 320
+    print("   ✅ Bulk extraction works correctly")
+
+
+def _interrupted_run(folder, output, count):
+    """Run over the first count images, then stop as if Ctrl+C was pressed"""
+    def inputs():
+        for i in range(count):
+            yield os.path.join(folder, f"{i:03d}.jpg")
+        raise KeyboardInterrupt
+    
+    try:
+        run_bulk(inputs(), output, workers=0, batch_size=1, progress_interval=0)
+        assert False, "The run should have been interrupted"
+    except KeyboardInterrupt:
+        pass
+
+
+def test_bulk_resume():
+    """Test that an interrupted run resumes from the checkpoint"""
+    print("\n🧪 Testing Bulk Resume...")
+    
+    with tempfile.TemporaryDirectory() as folder:
+        _write_images(folder, 6)
+        output = os.path.join(folder, "out.jsonl")
+        _interrupted_run(folder, output, 3)
+        assert os.path.exists(output + ".checkpoint"), "An interrupted run keeps its checkpoint"
+        
+        # Simulate a crash after a line was written but before it was checkpointed
+        with open(output, "a") as handle:
+            handle.write('{"path": "partial')
+        
+        second = run_bulk([folder], output, workers=0, progress_interval=0)
+        with open(output) as handle:
+            paths = [json.loads(line)["path"] for line in handle]
+        
+        assert second.processed == 3 and second.skipped == 3
+        assert sorted(paths) == sorted(os.path.join(folder, f"{i:03d}.jpg") for i in range(6))
+        assert not os.path.exists(output + ".checkpoint"), "A finished run removes its checkpoint"
+        
+        # A finished job does not resume into a new output
+        os.remove(output)
+        assert run_bulk([folder], output, workers=0, progress_interval=0).processed == 6
+    print("   ✅ Resume skips finished images and drops partial output")
+
+
+def test_bulk_resume_checks_output():
+    """Test resuming refuses an output that is missing or shorter than the checkpoint"""
+    print("\n🧪 Testing Bulk Resume Validation...")
+    
+    with tempfile.TemporaryDirectory() as folder:
+        _write_images(folder, 4)
+        output = os.path.join(folder, "out.jsonl")
+        _interrupted_run(folder, output, 2)
+        with open(output, "rb") as handle:
+            written = handle.read()
+        
+        with open(output, "wb") as handle:
+            handle.write(written[:-10])
+        for damage in ("shortened", "deleted"):
+            try:
+                run_bulk([folder], output, workers=0, progress_interval=0)
+                assert False, f"Should refuse to resume into a {damage} output"
+            except FileNotFoundError as error:
+                assert "--restart" in str(error)
+            if damage == "shortened":
+                with open(output, "rb") as handle:
+                    assert handle.read() == written[:-10], "A refused resume leaves the output alone"
+                os.remove(output)
+        assert not os.path.exists(output), "A refused resume does not create the output"
+    print("   ✅ Resume validates the output")
+
+
+def test_bulk_keeps_output_without_checkpoint():
+    """Test an existing output with no checkpoint is never overwritten"""
+    print("\n🧪 Testing Bulk Output Protection...")
+    
+    with tempfile.TemporaryDirectory() as folder:
+        _write_images(folder, 2)
+        output = os.path.join(folder, "existing.jsonl")
+        with open(output, "w") as handle:
+            handle.write('{"path": "from another run"}\n')
+        
+        try:
+            run_bulk([folder], output, workers=0, progress_interval=0)
+            assert False, "Should refuse to overwrite results it has no checkpoint for"
+        except FileExistsError as error:
+            assert "--restart" in str(error)
+        with open(output) as handle:
+            assert handle.read() == '{"path": "from another run"}\n', "Output must be untouched"
+        assert not os.path.exists(output + ".checkpoint"), "No checkpoint created for a refused run"
+        
+        # An empty output is fine to start into
+        empty = os.path.join(folder, "empty.jsonl")
+        open(empty, "w").close()
+        assert run_bulk([folder], empty, workers=0, progress_interval=0).processed == 2
+    print("   ✅ Existing output is protected")
+
+
+def test_benchmark():
+    """Test that the benchmark reports every resolution"""
+    print("\n🧪 Testing Benchmark...")
+    
+    results = benchmark(repeats=2)
+    for resolution in ("720p", "1080p", "4K"):
+        assert resolution in results, f"Missing {resolution}"
+        assert results[resolution]["median_ms"] > 0
+        print(f"   ✅ {resolution}: {results[resolution]['median_ms']:.2f} ms")
+
+
+def run_all_tests():
+    """Run all tests"""
+    print("=" * 60)
+    print("🚀 ColorSnap Pro Palette Extractor Tests")
+    print("=" * 60)
+    
+    tests = [
+        test_downsample,
+        test_extract_known_colors,
+        test_weights_ordering,
+        test_rgba_input,
+        test_fewer_colors_than_clusters,
+        test_mini_batch,
+        test_warm_start,
+        test_incremental_static_scene,
+        test_incremental_tracks_changes,
+        test_bulk_extraction,
+        test_bulk_resume,
+        test_bulk_resume_checks_output,
+        test_bulk_keeps_output_without_checkpoint,
+        test_benchmark,
+    ]
+    
+    passed = 0
+    failed = 0
+    
+    for test in tests:
+        try:
+            test()
+            passed += 1
+        except AssertionError as e:
+            print(f"   ❌ FAILED: {e}")
+            failed += 1
+        except Exception as e:
+            print(f"   ❌ ERROR: {e}")
+            failed += 1
+    
+    print("\n" + "=" * 60)
+    print(f"📊 Results: {passed} passed, {failed} failed")
+    print("=" * 60)
+    
+    return failed == 0
+
+
+if __name__ == "__main__":
+    success = run_all_tests()
+    sys.exit(0 if success else 1)
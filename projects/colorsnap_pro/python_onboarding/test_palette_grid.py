@@ -0,0 +1,178 @@
+"""
+Test script for the palette grid (renders offscreen)
+Run this to verify the swatch atlas, the card delegate and the grid layout work correctly.
+"""
+
+import sys
+import os
+
+# Add current directory to path
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from PyQt6.QtWidgets import QApplication, QStyle, QStyleOptionViewItem
+from PyQt6.QtCore import Qt, QRect
+from PyQt6.QtGui import QColor, QImage, QPainter
+
+from palette_library import Palette, PaletteLibrary
+from palette_grid import (
+    CARD_HEIGHT, CARD_MARGIN, CARD_PADDING, CARD_WIDTH, NAME_HEIGHT, TILE_SIZE, TILE_SPACING,
+    PaletteDelegate, PaletteGridView, PaletteListModel, SwatchAtlas
+)
+
+app = QApplication.instance() or QApplication([])
+
+COLORS = ["#FF0000", "#00FF00", "#0000FF", "#FFFF00", "#00FFFF", "#FF00FF", "#FFFFFF"]
+
+
+def _palettes(count: int):
+    return [Palette(i + 1, f"Palette {i}", COLORS[:5], 0.0) for i in range(count)]
+
+
+def _tile_color(atlas: SwatchAtlas, color: str) -> QColor:
+    """Color at the center of color's atlas tile"""
+    rect = atlas.source(color)
+    return atlas.pixmap.toImage().pixelColor(int(rect.center().x()), int(rect.center().y()))
+
+
+def test_atlas_lru_eviction():
+    """Test a full atlas reuses the least recently used color's slot"""
+    print("\n🧪 Testing Swatch Atlas Eviction...")
+    
+    atlas = SwatchAtlas(tile=10, columns=2, rows=1)
+    red = atlas.source("#FF0000")
+    green = atlas.source("#00FF00")
+    assert (atlas.misses, atlas.hits, len(atlas)) == (2, 0, 2)
+    assert red != green
+    
+    assert atlas.source("#FF0000") == red and atlas.hits == 1, "A cached color is a hit"
+    blue = atlas.source("#0000FF")
+    assert blue == green, "Green was least recently used, so blue takes its slot"
+    assert len(atlas) == 2 and atlas.misses == 3
+    assert _tile_color(atlas, "#0000FF") == QColor("#0000FF"), "The reused slot is redrawn"
+    
+    # Red is now the oldest entry, so green coming back evicts it
+    assert atlas.source("#00FF00") == red and atlas.misses == 4
+    assert _tile_color(atlas, "#00FF00") == QColor("#00FF00")
+    
+    hidpi = SwatchAtlas(tile=10, columns=2, rows=1, device_pixel_ratio=2.0)
+    hidpi.source("#FF0000")
+    second = hidpi.source("#00FF00")
+    assert (second.x(), second.width()) == (20, 20), "Atlas rectangles are in device pixels"
+    print("   ✅ Swatch atlas evicts least recently used colors")
+
+
+def test_delegate_size_and_paint():
+    """Test cards have a fixed size and paint every swatch, or a "+N" count of those that do not fit"""
+    print("\n🧪 Testing Palette Delegate...")
+    
+    delegate = PaletteDelegate()
+    with PaletteLibrary(":memory:") as library:
+        model = PaletteListModel(library)
+        model.show_palettes([Palette(1, "Brand", COLORS, 0.0), Palette(2, "Five", COLORS[:5], 0.0)])
+        option = QStyleOptionViewItem()
+        assert delegate.sizeHint(option, model.index(0)).width() == CARD_WIDTH
+        assert delegate.sizeHint(option, model.index(0)).height() == CARD_HEIGHT
+        
+        def render(row, state=QStyle.StateFlag.State_None) -> QImage:
+            image = QImage(CARD_WIDTH, CARD_HEIGHT, QImage.Format.Format_ARGB32_Premultiplied)
+            image.fill(Qt.GlobalColor.black)
+            option.rect = QRect(0, 0, CARD_WIDTH, CARD_HEIGHT)
+            option.state = QStyle.StateFlag.State_Enabled | state
+            painter = QPainter(image)
+            delegate.paint(painter, option, model.index(row))
+            painter.end()
+            return image
+        
+        top = CARD_PADDING + NAME_HEIGHT + TILE_SIZE // 2
+        
+        def slot_x(slot: int) -> int:
+            return CARD_PADDING + slot * (TILE_SIZE + TILE_SPACING) + TILE_SIZE // 2
+        
+        five = render(1)
+        for slot, color in enumerate(COLORS[:5]):
+            assert five.pixelColor(slot_x(slot), top) == QColor(color), f"Swatch {slot} should be {color}"
+        
+        delegate.atlas = None
+        image = render(0)
+        for slot, color in enumerate(COLORS[:4]):
+            assert image.pixelColor(slot_x(slot), top) == QColor(color), f"Swatch {slot} should be {color}"
+        assert len(delegate.atlas) == 4, "The last slot is the overflow marker, not a swatch"
+        marker = [image.pixelColor(x, y) for x in range(slot_x(4) - TILE_SIZE // 2, slot_x(4) + TILE_SIZE // 2)
+                  for y in range(top - TILE_SIZE // 2, top + TILE_SIZE // 2)]
+        assert QColor(COLORS[4]) not in marker
+        corner = (CARD_WIDTH - CARD_PADDING // 2, CARD_HEIGHT // 2)
+        assert marker[0] != image.pixelColor(*corner), "The marker fills the last slot"
+        assert len(set(c.rgb() for c in marker)) > 2, "The marker has a +N label on its background"
+        
+        selected = render(0, QStyle.StateFlag.State_Selected)
+        assert selected.pixelColor(*corner) != image.pixelColor(*corner), "Selection changes the background"
+        assert selected.pixelColor(slot_x(0), top) == QColor(COLORS[0])
+    print("   ✅ Palette delegate works correctly")
+
+
+def test_view_lays_out_a_grid():
+    """Test cards wrap into columns and scroll vertically"""
+    print("\n🧪 Testing Palette Grid Layout...")
+    
+    with PaletteLibrary(":memory:") as library:
+        model = PaletteListModel(library)
+        model.show_palettes(_palettes(40))
+        view = PaletteGridView(model)
+        view.resize(3 * (CARD_WIDTH + 2 * CARD_MARGIN) + 40, 300)
+        view.show()
+        app.processEvents()
+        
+        columns = view.columns()
+        assert columns == 3
+        first, second, below = (view.visualRect(model.index(row)) for row in (0, 1, columns))
+        assert first.size().width() == CARD_WIDTH and first.size().height() == CARD_HEIGHT
+        assert second.top() == first.top() and second.left() > first.right(), "Cards sit side by side"
+        assert below.left() == first.left() and below.top() > first.bottom(), "Rows wrap"
+        assert view.verticalScrollBar().maximum() > 0
+        assert view.horizontalScrollBar().maximum() == 0, "The grid only scrolls vertically"
+        
+        activated = []
+        view.palette_activated.connect(activated.append)
+        view.activated.emit(model.index(4))
+        assert activated == [5]
+        view.close()
+    print("   ✅ Palettes are laid out as a grid")
+
+
+def run_all_tests():
+    """Run all tests"""
+    print("=" * 60)
+    print("🚀 ColorSnap Pro Palette Grid Tests")
+    print("=" * 60)
+    
+    tests = [
+        test_atlas_lru_eviction,
+        test_delegate_size_and_paint,
+        test_view_lays_out_a_grid,
+    ]
+    
+    passed = 0
+    failed = 0
+    
+    for test in tests:
+        try:
+            test()
+            passed += 1
+        except AssertionError as e:
+            print(f"   ❌ FAILED: {e}")
+            failed += 1
+        except Exception as e:
+            print(f"   ❌ ERROR: {e}")
+            failed += 1
+    
+    print("\n" + "=" * 60)
+    print(f"📊 Results: {passed} passed, {failed} failed")
+    print("=" * 60)
+    
+    return failed == 0
+
+
+if __name__ == "__main__":
+    success = run_all_tests()
+    sys.exit(0 if success else 1)
@@ -0,0 +1,167 @@
+"""
+Test script for the palette library (no GUI required)
+Run this to verify palette storage, paging and near-color search work correctly.
+"""
+
+import sys
+import os
+import tempfile
+
+# Add current directory to path
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import numpy as np
+
+from color_space import rgb_array_to_hex, to_unit, srgb_to_linear, linear_to_oklab
+from palette_library import PaletteLibrary, pack_rgb, unpack_rgb
+from palette_grid import PaletteListModel
+
+
+def _random_palettes(count: int, size: int = 5, seed: int = 0):
+    colors = np.random.default_rng(seed).integers(0, 256, (count * size, 3), dtype=np.uint8)
+    hex_codes = rgb_array_to_hex(colors)
+    return colors, [(f"Palette {i}", hex_codes[i * size:(i + 1) * size]) for i in range(count)]
+
+
+def test_packing():
+    """Test packed integer colors"""
+    print("\n🧪 Testing Color Packing...")
+    
+    rgb = np.array([[59, 130, 246], [0, 0, 0], [255, 255, 255]], dtype=np.uint8)
+    packed = pack_rgb(rgb)
+    assert packed.tolist() == [0x3B82F6, 0, 0xFFFFFF]
+    assert np.array_equal(unpack_rgb(packed), rgb)
+    print("   ✅ Colors pack to 0xRRGGBB and back")
+
+
+def test_save_and_page():
+    """Test saving palettes and keyset paging on disk"""
+    print("\n🧪 Testing Save & Paging...")
+    
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "palettes.db")
+        _, palettes = _random_palettes(120)
+        with PaletteLibrary(path) as library:
+            ids = library.save_palettes(palettes)
+            assert library.palette_count() == 120 and library.color_count() == 600
+        
+        # Reopen to check persistence
+        with PaletteLibrary(path) as library:
+            seen = []
+            page = library.page(50)
+            while page:
+                seen += page
+                page = library.page(50, before_id=page[-1].id)
+            
+            assert [palette.id for palette in seen] == sorted(ids, reverse=True)
+            assert seen[-1].name == "Palette 0" and seen[-1].colors == palettes[0][1]
+            
+            library.rename_palette(ids[0], "Renamed")
+            library.delete_palette(ids[1])
+            assert library.get_palettes([ids[1], ids[0]])[0].name == "Renamed"
+            assert library.palette_count() == 119 and library.color_count() == 595
+    print("   ✅ Palettes persist and page newest first")
+
+
+def test_find_near_matches_brute_force():
+    """Test the grid index against an exhaustive distance search"""
+    print("\n🧪 Testing Near-Color Search...")
+    
+    colors, palettes = _random_palettes(400, seed=7)
+    lab = linear_to_oklab(srgb_to_linear(to_unit(colors)))
+    
+    with PaletteLibrary(":memory:") as library:
+        library.save_palettes(palettes)
+        for target, radius in [((100, 150, 200), 0.08), ((250, 20, 20), 0.05), ((0, 0, 0), 0.1)]:
+            target_lab = linear_to_oklab(srgb_to_linear(to_unit(np.array(target))))
+            distances = np.linalg.norm(lab - target_lab, axis=1)
+            expected = set((np.nonzero(distances <= radius)[0] // 5 + 1).tolist())
+            
+            matches = library.find_near(target, radius=radius, limit=10 ** 6)
+            assert {match.palette_id for match in matches} == expected
+            assert [match.distance for match in matches] == sorted(match.distance for match in matches)
+        
+        first = library.find_near(palettes[3][1][2], radius=0.01)[0]
+        assert first.palette_id == 4 and first.distance == 0.0
+        
+        everything = library.find_near((128, 128, 128), radius=2.0, limit=None)
+        assert len(everything) == 400, "limit=None returns every match"
+        assert library.find_near((128, 128, 128), radius=2.0) == everything[:50]
+    print("   ✅ Grid index finds exactly the palettes within the radius")
+
+
+def test_list_model_fetches_pages():
+    """Test that the palette list model loads rows lazily"""
+    print("\n🧪 Testing Palette List Model...")
+    
+    _, palettes = _random_palettes(250)
+    with PaletteLibrary(":memory:") as library:
+        library.save_palettes(palettes)
+        model = PaletteListModel(library, page_size=100)
+        assert model.rowCount() == 0 and model.canFetchMore()
+        
+        model.fetchMore()
+        assert model.rowCount() == 100
+        index = model.index(0)
+        assert model.data(index) == "Palette 249"
+        assert model.data(index, PaletteListModel.ColorsRole) == palettes[249][1]
+        
+        while model.canFetchMore():
+            model.fetchMore()
+        assert model.rowCount() == 250 and model.palette(249).name == "Palette 0"
+        
+        model.show_palettes(library.get_palettes([1, 2]))
+        assert model.rowCount() == 2 and not model.canFetchMore()
+        
+        # Search results are paged in by id, in the given order
+        ids = list(range(1, 251, 2)) + [9999]
+        model.show_palette_ids(ids)
+        assert model.rowCount() == 0 and model.canFetchMore()
+        model.fetchMore()
+        assert model.rowCount() == 100 and model.palette(0).id == 1 and model.palette(99).id == 199
+        model.fetchMore()
+        assert model.rowCount() == 125 and not model.canFetchMore(), "Missing ids are skipped"
+        model.show_palette_ids([])
+        assert model.rowCount() == 0 and not model.canFetchMore()
+        model.reload()
+        assert model.rowCount() == 0 and model.canFetchMore()
+    print("   ✅ Rows are fetched a page at a time")
+
+
+def run_all_tests():
+    """Run all tests"""
+    print("=" * 60)
+    print("🚀 ColorSnap Pro Palette Library Tests")
+    print("=" * 60)
+    
+    tests = [
+        test_packing,
+        test_save_and_page,
+        test_find_near_matches_brute_force,
+        test_list_model_fetches_pages,
+    ]
+    
+    passed = 0
+    failed = 0
+    
+    for test in tests:
+        try:
+            test()
+            passed += 1
+        except AssertionError as e:
+            print(f"   ❌ FAILED: {e}")
+            failed += 1
+        except Exception as e:
+            print(f"   ❌ ERROR: {e}")
+            failed += 1
+    
+    print("\n" + "=" * 60)
+    print(f"📊 Results: {passed} passed, {failed} failed")
+    print("=" * 60)
+    
+    return failed == 0
+
+
+if __name__ == "__main__":
+    success = run_all_tests()
+    sys.exit(0 if success else 1)
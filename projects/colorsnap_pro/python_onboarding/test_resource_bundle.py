@@ -0,0 +1,204 @@
+"""
+Test script for the compiled resource bundle (no GUI required)
+Run this to verify bundles round-trip, load lazily and match the source definitions.
+"""
+
+import sys
+import os
+import tempfile
+from pathlib import Path
+from typing import List
+
+# Add current directory to path
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import app_resources
+import resource_bundle
+import onboarding_manager
+from onboarding_manager import TooltipType
+from resource_bundle import (
+    BUNDLE_ENV, BUNDLE_NAME, ResourceBundle, SourceResources, compile_resources, find_bundle, write_bundle
+)
+
+
+def test_round_trip():
+    """Test every entry reads back byte for byte"""
+    print("\n🧪 Testing Round Trip...")
+    
+    entries = {"b/second": "ünïcode ✓".encode(), "a/first": b"\x00\x01binary", "empty": b""}
+    with tempfile.TemporaryDirectory() as folder:
+        path = Path(folder) / BUNDLE_NAME
+        size = write_bundle(path, entries)
+        assert path.stat().st_size == size
+        
+        bundle = ResourceBundle(path)
+        assert bundle.names() == ["a/first", "b/second", "empty"]
+        for name, data in entries.items():
+            assert bundle.data(name) == data
+        assert bundle.text("b/second") == "ünïcode ✓"
+        assert "missing" not in bundle and "empty" in bundle
+        bundle.close()
+        
+        copy = Path(folder) / "copy.res"
+        write_bundle(copy, dict(reversed(list(entries.items()))))
+        assert copy.read_bytes() == path.read_bytes(), "Same entries give the same bytes"
+    print("   ✅ Round trip works correctly")
+
+
+def test_lazy_index():
+    """Test opening reads only the header"""
+    print("\n🧪 Testing Lazy Index...")
+    
+    with tempfile.TemporaryDirectory() as folder:
+        path = Path(folder) / BUNDLE_NAME
+        write_bundle(path, compile_resources())
+        
+        bundle = ResourceBundle(path)
+        assert bundle._index is None, "Index should not be parsed on open"
+        assert bundle.json("tutorial/steps")[0]["title"] == app_resources.TUTORIAL_STEPS[0]["title"]
+        assert bundle._index is not None
+        bundle.close()
+        
+        bad = Path(folder) / "bad.res"
+        bad.write_bytes(b"NOPE" + bytes(8))
+        try:
+            ResourceBundle(bad)
+            assert False, "Should reject a file without the bundle header"
+        except ValueError:
+            pass
+    print("   ✅ Lazy index works correctly")
+
+
+def test_bundle_matches_sources():
+    """Test the compiled bundle serves exactly what the source definitions do"""
+    print("\n🧪 Testing Bundle Matches Sources...")
+    
+    sources = SourceResources()
+    assert sources.json("onboarding/pages") == app_resources.ONBOARDING_PAGES
+    assert len(sources.json("tutorial/steps")) == len(app_resources.TUTORIAL_STEPS)
+    assert sources.text("style/onboarding/window") == app_resources.STYLES["onboarding/window"]
+    
+    with tempfile.TemporaryDirectory() as folder:
+        path = Path(folder) / BUNDLE_NAME
+        write_bundle(path, compile_resources())
+        bundle = ResourceBundle(path)
+        assert bundle.names() == sources.names()
+        for name in sources.names():
+            assert bundle.data(name) == sources.data(name), name
+        bundle.close()
+    print(f"   ✅ {len(sources.names())} entries match")
+
+
+def test_icons_are_bundled():
+    """Test files under assets/icons become icon/ entries"""
+    print("\n🧪 Testing Icons...")
+    
+    with tempfile.TemporaryDirectory() as folder:
+        icons = Path(folder) / app_resources.ICON_DIR
+        (icons / "tools").mkdir(parents=True)
+        (icons / "app.png").write_bytes(b"\x89PNG fake")
+        (icons / "tools" / "harmony.svg").write_text("<svg/>")
+        
+        entries = compile_resources(Path(folder))
+        assert entries["icon/app.png"] == b"\x89PNG fake"
+        assert entries["icon/tools/harmony.svg"] == b"<svg/>"
+    print("   ✅ Icons are bundled correctly")
+
+
+def test_find_bundle_and_tooltips():
+    """Test the bundle is found through the environment and tooltips read from it"""
+    print("\n🧪 Testing Bundle Lookup...")
+    
+    previous_env = os.environ.get(BUNDLE_ENV)
+    previous = resource_bundle._resources
+    try:
+        with tempfile.TemporaryDirectory() as folder:
+            path = Path(folder) / BUNDLE_NAME
+            write_bundle(path, compile_resources())
+            os.environ[BUNDLE_ENV] = folder
+            assert find_bundle() == path
+            
+            resource_bundle._resources = None
+            onboarding_manager._tooltip_texts.cache_clear()
+            assert isinstance(resource_bundle.resources(), ResourceBundle)
+            assert TooltipType.CAMERA_FREEZE.title == "Freeze Frame"
+            assert TooltipType.CAMERA_FREEZE.icon == "snowflake"
+            resource_bundle.resources().close()
+    finally:
+        if previous_env is None:
+            os.environ.pop(BUNDLE_ENV, None)
+        else:
+            os.environ[BUNDLE_ENV] = previous_env
+        resource_bundle._resources = previous
+        onboarding_manager._tooltip_texts.cache_clear()
+    print("   ✅ Bundle lookup works correctly")
+
+
+def test_tooltip_texts_decoded_once():
+    """Test each tooltip's texts are decoded on first use and then cached"""
+    print("\n🧪 Testing Tooltip Text Cache...")
+    
+    class CountingResources(SourceResources):
+        def __init__(self):
+            super().__init__()
+            self.decoded: List[str] = []
+        
+        def json(self, name: str):
+            self.decoded.append(name)
+            return super().json(name)
+    
+    previous = resource_bundle._resources
+    counting = CountingResources()
+    try:
+        resource_bundle._resources = counting
+        onboarding_manager._tooltip_texts.cache_clear()
+        for _ in range(3):
+            assert TooltipType.TOOLS_HARMONY.title == app_resources.TOOLTIPS["tools_harmony"]["title"]
+            assert TooltipType.TOOLS_HARMONY.message and TooltipType.TOOLS_HARMONY.icon
+            assert TooltipType.CAMERA_AI.icon == app_resources.TOOLTIPS["camera_ai"]["icon"]
+        assert sorted(counting.decoded) == ["tooltip/camera_ai", "tooltip/tools_harmony"]
+    finally:
+        resource_bundle._resources = previous
+        onboarding_manager._tooltip_texts.cache_clear()
+    print("   ✅ Tooltip texts are decoded once")
+
+
+def run_all_tests():
+    """Run all tests"""
+    print("=" * 60)
+    print("🚀 ColorSnap Pro Resource Bundle Tests")
+    print("=" * 60)
+    
+    tests = [
+        test_round_trip,
+        test_lazy_index,
+        test_bundle_matches_sources,
+        test_icons_are_bundled,
+        test_find_bundle_and_tooltips,
+        test_tooltip_texts_decoded_once,
+    ]
+    
+    passed = 0
+    failed = 0
+    
+    for test in tests:
+        try:
+            test()
+            passed += 1
+        except AssertionError as e:
+            print(f"   ❌ FAILED: {e}")
+            failed += 1
+        except Exception as e:
+            print(f"   ❌ ERROR: {e}")
+            failed += 1
+    
+    print("\n" + "=" * 60)
+    print(f"📊 Results: {passed} passed, {failed} failed")
+    print("=" * 60)
+    
+    return failed == 0
+
+
+if __name__ == "__main__":
+    success = run_all_tests()
+    sys.exit(0 if success else 1)
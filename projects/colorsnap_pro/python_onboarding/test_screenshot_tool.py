@@ -0,0 +1,171 @@
+"""
+Test script for screen recording (no display required)
+Run this to verify the frame ring buffer and animation encoder work correctly.
+"""
+
+import sys
+import os
+import tempfile
+
+# Add current directory to path
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from PIL import Image
+
+from screenshot_tool import RawFrame, FrameRingBuffer, AnimationEncoder
+
+
+def _raw(timestamp: float, value: int, width: int = 8, height: int = 6) -> RawFrame:
+    return RawFrame(timestamp, width, height, bytes([value, 0, 0, 255]) * (width * height))
+
+
+def _durations(path: str) -> list:
+    with Image.open(path) as image:
+        durations = []
+        for index in range(image.n_frames):
+            image.seek(index)
+            durations.append(image.info["duration"])
+        return durations
+
+
+def test_ring_buffer_eviction():
+    """Test the buffer evicts the oldest frames to stay under max_bytes"""
+    print("\n🧪 Testing Ring Buffer Eviction...")
+    
+    frame_bytes = len(_raw(0, 0).data)
+    buffer = FrameRingBuffer(max_bytes=frame_bytes * 3)
+    for index in range(5):
+        buffer.push(_raw(index, index))
+        assert buffer.nbytes <= buffer.max_bytes
+    
+    assert len(buffer) == 3
+    assert buffer.evicted == 2
+    assert buffer.nbytes == frame_bytes * 3
+    assert [buffer.pop_oldest().timestamp for _ in range(3)] == [2, 3, 4]
+    assert buffer.pop_oldest() is None and buffer.nbytes == 0
+    
+    tiny = FrameRingBuffer(max_bytes=1)
+    tiny.push(_raw(0, 0))
+    tiny.push(_raw(1, 1))
+    assert len(tiny) == 1 and tiny.pop_oldest().timestamp == 1, "The newest frame is always kept"
+    
+    tiny.end_time = 5.0
+    tiny.clear()
+    assert tiny.end_time is None
+    print("   ✅ Ring buffer eviction works correctly")
+
+
+def test_duplicates_merged_with_durations():
+    """Test duplicate frames, including trailing ones, extend the frame they repeat"""
+    print("\n🧪 Testing Duplicate Merging...")
+    
+    buffer = FrameRingBuffer()
+    for timestamp, value in [(0.0, 10), (0.1, 10), (0.2, 10), (0.3, 20), (0.4, 30), (0.5, 30), (0.6, 30)]:
+        buffer.push(_raw(timestamp, value))
+    buffer.end_time = 0.7
+    
+    with tempfile.TemporaryDirectory() as folder:
+        path = os.path.join(folder, "recording.png")
+        stats = AnimationEncoder(buffer, path, "apng")._encode()
+        
+        assert stats["frames_in"] == 7
+        assert stats["frames_written"] == 3
+        assert stats["duplicates_merged"] == 4
+        assert stats["duration_ms"] == 700, "Recording length must be preserved"
+        assert _durations(path) == [300, 100, 300]
+        assert len(buffer) == 0, "Raw frames are released as they are encoded"
+    print("   ✅ Duplicate merging works correctly")
+
+
+def test_last_frame_without_end_time():
+    """Test the last frame lasts one capture interval past the final raw frame when the stop time is unknown"""
+    print("\n🧪 Testing Last Frame Duration...")
+    
+    buffer = FrameRingBuffer()
+    for timestamp, value in [(0.0, 1), (0.05, 2), (0.10, 2), (0.15, 2)]:
+        buffer.push(_raw(timestamp, value))
+    
+    with tempfile.TemporaryDirectory() as folder:
+        path = os.path.join(folder, "recording.png")
+        stats = AnimationEncoder(buffer, path, "apng")._encode()
+        assert _durations(path) == [50, 150]
+        assert stats["duration_ms"] == 200
+    print("   ✅ Last frame duration works correctly")
+
+
+def test_mismatched_sizes_are_resized():
+    """Test frames of a different size are resized to the first frame's size"""
+    print("\n🧪 Testing Frame Sizes...")
+    
+    buffer = FrameRingBuffer()
+    buffer.push(_raw(0.0, 10))
+    buffer.push(_raw(0.1, 20, width=16, height=12))
+    buffer.push(_raw(0.2, 30))
+    buffer.end_time = 0.3
+    
+    with tempfile.TemporaryDirectory() as folder:
+        path = os.path.join(folder, "recording.png")
+        stats = AnimationEncoder(buffer, path, "apng")._encode()
+        assert stats["frames_resized"] == 1
+        assert stats["frames_written"] == 3
+        with Image.open(path) as image:
+            assert image.size == (8, 6)
+            image.seek(1)
+            assert image.convert("RGBA").getpixel((4, 3)) == (20, 0, 0, 255)
+    print("   ✅ Frame sizes work correctly")
+
+
+def test_empty_buffer_rejected():
+    """Test encoding an empty buffer fails instead of writing an empty file"""
+    print("\n🧪 Testing Empty Buffer...")
+    
+    with tempfile.TemporaryDirectory() as folder:
+        path = os.path.join(folder, "recording.png")
+        try:
+            AnimationEncoder(FrameRingBuffer(), path, "apng")._encode()
+            assert False, "Should reject an empty buffer"
+        except ValueError:
+            pass
+        assert not os.path.exists(path)
+    print("   ✅ Empty buffer is rejected")
+
+
+def run_all_tests():
+    """Run all tests"""
+    print("=" * 60)
+    print("🚀 ColorSnap Pro Screen Recording Tests")
+    print("=" * 60)
+    
+    tests = [
+        test_ring_buffer_eviction,
+        test_duplicates_merged_with_durations,
+        test_last_frame_without_end_time,
+        test_mismatched_sizes_are_resized,
+        test_empty_buffer_rejected,
+    ]
+    
+    passed = 0
+    failed = 0
+    
+    for test in tests:
+        try:
+            test()
+            passed += 1
+        except AssertionError as e:
+            print(f"   ❌ FAILED: {e}")
+            failed += 1
+        except Exception as e:
+            print(f"   ❌ ERROR: {e}")
+            failed += 1
+    
+    print("\n" + "=" * 60)
+    print(f"📊 Results: {passed} passed, {failed} failed")
+    print("=" * 60)
+    
+    return failed == 0
+
+
+if __name__ == "__main__":
+    success = run_all_tests()
+    sys.exit(0 if success else 1)
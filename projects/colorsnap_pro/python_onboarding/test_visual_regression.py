@@ -0,0 +1,190 @@
+"""
+Test script for the visual regression tool (no display required)
+Run this to verify image diffs, thresholds and the screen registry work correctly.
+"""
+
+import sys
+import os
+import tempfile
+from pathlib import Path
+
+# Add current directory to path
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+import numpy as np
+from PIL import Image
+
+import app_resources
+import visual_regression
+from visual_regression import compare_all, compare_screen, diff_images
+
+
+def _image(width: int = 20, height: int = 10, value: int = 100) -> np.ndarray:
+    image = np.full((height, width, 4), value, dtype=np.uint8)
+    image[..., 3] = 255
+    return image
+
+
+def _save(folder: Path, name: str, image: np.ndarray) -> str:
+    path = folder / name
+    Image.fromarray(image, "RGBA").save(path)
+    return str(path)
+
+
+def test_diff_tolerance():
+    """Test per-channel differences within the tolerance are ignored"""
+    print("\n🧪 Testing Diff Tolerance...")
+    
+    golden = _image()
+    actual = golden.copy()
+    actual[0, 0, 0] += 8
+    actual[1, 1, 2] += 9
+    actual[2, 2, 1] -= 50
+    
+    delta, mask = diff_images(golden, actual, tolerance=8)
+    assert delta[0, 0] == 8 and delta[1, 1] == 9 and delta[2, 2] == 50
+    assert not mask[0, 0], "A delta equal to the tolerance is unchanged"
+    assert mask[1, 1] and mask[2, 2]
+    assert mask.sum() == 2
+    
+    _, strict = diff_images(golden, actual, tolerance=0)
+    assert strict.sum() == 3
+    print("   ✅ Diff tolerance works correctly")
+
+
+def test_compare_max_diff():
+    """Test a screen passes or fails on the fraction of changed pixels and writes a heatmap"""
+    print("\n🧪 Testing Max Diff Ratio...")
+    
+    with tempfile.TemporaryDirectory() as folder:
+        folder = Path(folder)
+        golden = _image()
+        actual = golden.copy()
+        actual[0, :2, :3] = 255   # 2 of 200 pixels changed
+        golden_path = _save(folder, "golden.png", golden)
+        actual_path = _save(folder, "actual.png", actual)
+        
+        result = compare_screen("screen", golden_path, actual_path, str(folder), max_diff_ratio=0.01)
+        assert result.passed and result.diff_ratio == 0.01
+        assert result.max_delta == 155
+        assert result.heatmap and os.path.exists(result.heatmap), "Changed pixels get a heatmap even when passing"
+        
+        result = compare_screen("screen", golden_path, actual_path, str(folder), max_diff_ratio=0.005)
+        assert not result.passed and result.error is None
+        
+        result = compare_screen("same", golden_path, golden_path, str(folder))
+        assert result.passed and result.diff_ratio == 0.0 and result.heatmap is None
+    print("   ✅ Max diff ratio works correctly")
+
+
+def test_compare_size_mismatch_and_missing():
+    """Test a different size or a missing golden fails with an error instead of a diff"""
+    print("\n🧪 Testing Size Mismatch...")
+    
+    with tempfile.TemporaryDirectory() as folder:
+        folder = Path(folder)
+        golden_path = _save(folder, "golden.png", _image(20, 10))
+        actual_path = _save(folder, "actual.png", _image(21, 10))
+        
+        result = compare_screen("screen", golden_path, actual_path, str(folder))
+        assert not result.passed
+        assert result.error == "size mismatch: golden 20x10, actual 21x10"
+        assert result.heatmap is None
+        
+        result = compare_screen("screen", str(folder / "none.png"), actual_path, str(folder))
+        assert not result.passed and result.error == "missing golden image"
+    print("   ✅ Size mismatch works correctly")
+
+
+def test_compare_all_clears_old_heatmaps():
+    """Test heatmaps from a previous run are removed before comparing"""
+    print("\n🧪 Testing Heatmap Cleanup...")
+    
+    with tempfile.TemporaryDirectory() as folder:
+        folder = Path(folder)
+        goldens = folder / "goldens"
+        actual = folder / "actual"
+        diffs = folder / "diffs"
+        for directory in (goldens, actual, diffs):
+            directory.mkdir()
+        
+        changed = _image()
+        changed[:, :, 0] = 0
+        _save(goldens, "a.png", _image())
+        _save(goldens, "b.png", _image())
+        rendered = {"a": Path(_save(actual, "a.png", _image())), "b": Path(_save(actual, "b.png", changed))}
+        (diffs / "old_diff.png").write_bytes(b"stale")
+        (diffs / "notes.txt").write_text("kept")
+        
+        results = compare_all(rendered, goldens, diffs, workers=1)
+        assert [r.passed for r in results] == [True, False]
+        assert sorted(p.name for p in diffs.iterdir()) == ["b_diff.png", "notes.txt"]
+    print("   ✅ Heatmap cleanup works correctly")
+
+
+def test_default_screens_registered_without_windows():
+    """Test default screens come from the resource definitions without building windows"""
+    print("\n🧪 Testing Default Screens...")
+    
+    import onboarding_view
+    from onboarding_manager import TooltipType
+    
+    def no_windows(*args, **kwargs):
+        raise AssertionError("Registering screens should not build windows")
+    
+    previous = dict(visual_regression.SCREENS)
+    windows = onboarding_view.OnboardingWindow, onboarding_view.TutorialWindow
+    try:
+        onboarding_view.OnboardingWindow = onboarding_view.TutorialWindow = no_windows
+        visual_regression.SCREENS.clear()
+        visual_regression._register_default_screens()
+        names = set(visual_regression.SCREENS)
+        assert len([n for n in names if n.startswith("onboarding_")]) == len(app_resources.ONBOARDING_PAGES)
+        assert len([n for n in names if n.startswith("tutorial_")]) == len(app_resources.TUTORIAL_STEPS)
+        assert len([n for n in names if n.startswith("tooltip_")]) == len(TooltipType)
+    finally:
+        onboarding_view.OnboardingWindow, onboarding_view.TutorialWindow = windows
+        visual_regression.SCREENS.clear()
+        visual_regression.SCREENS.update(previous)
+    print(f"   ✅ {len(names)} screens registered")
+
+
+def run_all_tests():
+    """Run all tests"""
+    print("=" * 60)
+    print("🚀 ColorSnap Pro Visual Regression Tests")
+    print("=" * 60)
+    
+    tests = [
+        test_diff_tolerance,
+        test_compare_max_diff,
+        test_compare_size_mismatch_and_missing,
+        test_compare_all_clears_old_heatmaps,
+        test_default_screens_registered_without_windows,
+    ]
+    
+    passed = 0
+    failed = 0
+    
+    for test in tests:
+        try:
+            test()
+            passed += 1
+        except AssertionError as e:
+            print(f"   ❌ FAILED: {e}")
+            failed += 1
+        except Exception as e:
+            print(f"   ❌ ERROR: {e}")
+            failed += 1
+    
+    print("\n" + "=" * 60)
+    print(f"📊 Results: {passed} passed, {failed} failed")
+    print("=" * 60)
+    
+    return failed == 0
+
+
+if __name__ == "__main__":
+    success = run_all_tests()
+    sys.exit(0 if success else 1)
@@ -5,13 +5,14 @@ Contextual tooltips and hints for the application
 
 from PyQt6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QLabel, 
-    QPushButton, QGraphicsDropShadowEffect, QApplication
+    QPushButton, QGraphicsDropShadowEffect, QApplication, QFrame
 )
 from PyQt6.QtCore import Qt, QTimer, pyqtSignal, QPoint, QPropertyAnimation, QEasingCurve
 from PyQt6.QtGui import QColor, QFont, QIcon
 from typing import Optional, Callable
 
 from onboarding_manager import TooltipType, TooltipContext, onboarding_manager
+from resource_bundle import resources
 
 
 class TooltipWidget(QWidget):
@@ -53,11 +54,7 @@ class TooltipWidget(QWidget):
         
         # Title
         self.title_label = QLabel(self.tooltip.title)
-        self.title_label.setStyleSheet("""
-            color: white;
-            font-size: 16px;
-            font-weight: bold;
-        """)
+        self.title_label.setStyleSheet(resources().text("style/tooltip/title"))
         header.addWidget(self.title_label)
         header.addStretch()
         
@@ -65,11 +62,7 @@ class TooltipWidget(QWidget):
         
         # Message
         self.message_label = QLabel(self.tooltip.message)
-        self.message_label.setStyleSheet("""
-            color: rgba(255, 255, 255, 200);
-            font-size: 14px;
-            line-height: 1.4;
-        """)
+        self.message_label.setStyleSheet(resources().text("style/tooltip/message"))
         self.message_label.setWordWrap(True)
         self.message_label.setMinimumWidth(250)
         layout.addWidget(self.message_label)
@@ -208,11 +201,7 @@ class InlineHint(QWidget):
         
         # Text
         text_label = QLabel(text)
-        text_label.setStyleSheet("""
-            color: white;
-            font-size: 13px;
-            font-weight: 500;
-        """)
+        text_label.setStyleSheet(resources().text("style/hint/text"))
         layout.addWidget(text_label)
     
     def show_with_animation(self):
@@ -236,17 +225,7 @@ class PulsingHintButton(QPushButton):
     def __init__(self, icon: str = "👆", parent=None):
         super().__init__(icon, parent)
         self.setFixedSize(50, 50)
-        self.setStyleSheet("""
-            QPushButton {
-                background: rgba(253, 224, 71, 0.2);
-                border: 2px solid #FDE047;
-                border-radius: 25px;
-                font-size: 20px;
-            }
-            QPushButton:hover {
-                background: rgba(253, 224, 71, 0.3);
-            }
-        """)
+        self.setStyleSheet(resources().text("style/hint/pulse_button"))
         self.setCursor(Qt.CursorShape.PointingHandCursor)
         
         # Pulsing animation
@@ -360,13 +339,7 @@ class FirstTimeOverlay(QWidget):
         
         # Hint card
         self.card = QFrame(self)
-        self.card.setStyleSheet("""
-            QFrame {
-                background: rgba(30, 30, 40, 0.98);
-                border: 2px solid rgba(253, 224, 71, 0.5);
-                border-radius: 20px;
-            }
-        """)
+        self.card.setStyleSheet(resources().text("style/overlay/card"))
         
         layout = QVBoxLayout(self.card)
         layout.setSpacing(16)
@@ -380,20 +353,13 @@ class FirstTimeOverlay(QWidget):
         
         # Title
         title = QLabel("Press & Hold to Pick Colors")
-        title.setStyleSheet("""
-            color: white;
-            font-size: 22px;
-            font-weight: bold;
-        """)
+        title.setStyleSheet(resources().text("style/overlay/title"))
         title.setAlignment(Qt.AlignmentFlag.AlignCenter)
         layout.addWidget(title)
         
         # Subtitle
         subtitle = QLabel("Drag to adjust, release to capture")
-        subtitle.setStyleSheet("""
-            color: rgba(255, 255, 255, 180);
-            font-size: 15px;
-        """)
+        subtitle.setStyleSheet(resources().text("style/overlay/subtitle"))
         subtitle.setAlignment(Qt.AlignmentFlag.AlignCenter)
         layout.addWidget(subtitle)
         
@@ -413,20 +379,7 @@ class FirstTimeOverlay(QWidget):
         
         # Dismiss button
         dismiss_btn = QPushButton("Got it!")
-        dismiss_btn.setStyleSheet("""
-            QPushButton {
-                background: #FDE047;
-                color: #1a1a2e;
-                border: none;
-                border-radius: 12px;
-                padding: 14px 32px;
-                font-size: 15px;
-                font-weight: bold;
-            }
-            QPushButton:hover {
-                background: #FACC15;
-            }
-        """)
+        dismiss_btn.setStyleSheet(resources().text("style/overlay/dismiss_button"))
         dismiss_btn.setCursor(Qt.CursorShape.PointingHandCursor)
         dismiss_btn.clicked.connect(self._on_dismiss)
         
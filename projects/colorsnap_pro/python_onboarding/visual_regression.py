@@ -0,0 +1,281 @@
+"""
+ColorSnap Pro - Visual Regression Tool
+Renders every registered screen and compares it against golden images
+
+Usage:
+    python visual_regression.py            # compare against goldens
+    python visual_regression.py --update   # accept current rendering as golden
+"""
+
+import os
+import sys
+import time
+import argparse
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Any
+
+import numpy as np
+from PIL import Image
+
+
+PROJECT_DIR = Path(__file__).parent
+GOLDEN_DIR = PROJECT_DIR / "visual_goldens"
+REPORT_DIR = PROJECT_DIR / "build" / "visual_regression"
+
+# Per-channel difference (0-255) below which a pixel counts as unchanged
+DEFAULT_TOLERANCE = 8
+# Fraction of changed pixels allowed before a screen fails
+DEFAULT_MAX_DIFF_RATIO = 0.001
+
+
+# MARK: - Screen Registry
+
+# name -> factory returning a ready-to-render widget
+SCREENS: Dict[str, Callable[[], Any]] = {}
+
+
+def register_screen(name: str):
+    """
+    Register a screen factory for visual regression
+    
+    Usage:
+        @register_screen("settings")
+        def settings_screen():
+            return SettingsTab()
+    """
+    def decorator(factory: Callable[[], Any]):
+        SCREENS[name] = factory
+        return factory
+    return decorator
+
+
+def _register_default_screens():
+    """Register onboarding, tutorial and tooltip screens"""
+    from app_resources import ONBOARDING_PAGES, TUTORIAL_STEPS
+    from onboarding_manager import TooltipType
+    from onboarding_view import OnboardingWindow, TutorialWindow
+    from tooltip_widget import TooltipWidget
+    
+    def onboarding_page(index: int):
+        def factory():
+            window = OnboardingWindow()
+            window.current_page = index
+            window.stack.setCurrentIndex(index)
+            window._update_indicators()
+            window._update_buttons()
+            return window
+        return factory
+    
+    def tutorial_step(index: int):
+        def factory():
+            window = TutorialWindow()
+            window.current_step = index
+            window._update_ui()
+            return window
+        return factory
+    
+    # Counts come from the resource definitions; windows are only built when rendered
+    for i in range(len(ONBOARDING_PAGES)):
+        register_screen(f"onboarding_{i + 1:02d}")(onboarding_page(i))
+    
+    for i in range(len(TUTORIAL_STEPS)):
+        register_screen(f"tutorial_{i + 1:02d}")(tutorial_step(i))
+    
+    for tooltip in TooltipType:
+        register_screen(f"tooltip_{tooltip.value}")(lambda t=tooltip: TooltipWidget(t))
+
+
+def render_screens(output_dir: Path, names: Optional[List[str]] = None) -> Dict[str, Path]:
+    """Render registered screens to PNG files (requires a QApplication)"""
+    from PyQt6.QtWidgets import QApplication
+    
+    output_dir.mkdir(parents=True, exist_ok=True)
+    rendered = {}
+    
+    for name in names or sorted(SCREENS):
+        widget = SCREENS[name]()
+        widget.show()
+        QApplication.processEvents()
+        
+        path = output_dir / f"{name}.png"
+        widget.grab().save(str(path), "PNG")
+        rendered[name] = path
+        
+        widget.close()
+        widget.deleteLater()
+    
+    QApplication.processEvents()
+    return rendered
+
+
+# MARK: - Comparison
+
+@dataclass
+class ComparisonResult:
+    """Result of comparing one screen against its golden image"""
+    name: str
+    passed: bool
+    diff_ratio: float = 0.0
+    max_delta: int = 0
+    heatmap: Optional[str] = None
+    error: Optional[str] = None
+
+
+def _load_rgba(path: Path) -> np.ndarray:
+    with Image.open(path) as image:
+        return np.asarray(image.convert("RGBA"))
+
+
+def diff_images(golden: np.ndarray, actual: np.ndarray, tolerance: int = DEFAULT_TOLERANCE):
+    """
+    Vectorized per-pixel diff of two RGBA arrays
+    
+    Returns (delta, mask): the largest per-channel difference per pixel,
+    and the boolean mask of pixels whose delta exceeds the tolerance.
+    """
+    delta = np.abs(golden.astype(np.int16) - actual.astype(np.int16)).max(axis=2).astype(np.uint8)
+    return delta, delta > tolerance
+
+
+def diff_heatmap(actual: np.ndarray, delta: np.ndarray, mask: np.ndarray) -> np.ndarray:
+    """Dimmed grayscale of the actual image with changed pixels from yellow (small) to red (large)"""
+    base = (actual[..., :3].mean(axis=2) * 0.35).astype(np.uint8)
+    heat = np.repeat(base[..., None], 3, axis=2)
+    heat[mask, 0] = 255
+    heat[mask, 1] = 255 - delta[mask]
+    heat[mask, 2] = 0
+    return heat
+
+
+def compare_screen(
+    name: str,
+    golden_path: str,
+    actual_path: str,
+    diff_dir: str,
+    tolerance: int = DEFAULT_TOLERANCE,
+    max_diff_ratio: float = DEFAULT_MAX_DIFF_RATIO
+) -> ComparisonResult:
+    """Compare one rendered screen against its golden (runs in a worker process)"""
+    if not os.path.exists(golden_path):
+        return ComparisonResult(name, False, error="missing golden image")
+    
+    golden = _load_rgba(Path(golden_path))
+    actual = _load_rgba(Path(actual_path))
+    if golden.shape != actual.shape:
+        return ComparisonResult(
+            name, False,
+            error=f"size mismatch: golden {golden.shape[1]}x{golden.shape[0]}, "
+                  f"actual {actual.shape[1]}x{actual.shape[0]}"
+        )
+    
+    delta, mask = diff_images(golden, actual, tolerance)
+    diff_ratio = float(mask.mean())
+    passed = diff_ratio <= max_diff_ratio
+    
+    heatmap = None
+    if mask.any():
+        heatmap = os.path.join(diff_dir, f"{name}_diff.png")
+        Image.fromarray(diff_heatmap(actual, delta, mask), "RGB").save(heatmap)
+    
+    return ComparisonResult(name, passed, diff_ratio, int(delta.max()), heatmap)
+
+
+def compare_all(
+    rendered: Dict[str, Path],
+    golden_dir: Path = GOLDEN_DIR,
+    diff_dir: Path = REPORT_DIR / "diffs",
+    tolerance: int = DEFAULT_TOLERANCE,
+    max_diff_ratio: float = DEFAULT_MAX_DIFF_RATIO,
+    workers: Optional[int] = None
+) -> List[ComparisonResult]:
+    """Compare all rendered screens against goldens in a process pool"""
+    diff_dir.mkdir(parents=True, exist_ok=True)
+    
+    # Heatmaps from earlier runs would otherwise look like current failures
+    for stale in diff_dir.glob("*_diff.png"):
+        stale.unlink()
+    
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        futures = [
+            pool.submit(
+                compare_screen, name, str(golden_dir / path.name), str(path),
+                str(diff_dir), tolerance, max_diff_ratio
+            )
+            for name, path in sorted(rendered.items())
+        ]
+        return [future.result() for future in futures]
+
+
+def update_goldens(rendered: Dict[str, Path], golden_dir: Path = GOLDEN_DIR):
+    """Accept rendered screens as the new goldens"""
+    golden_dir.mkdir(parents=True, exist_ok=True)
+    for path in rendered.values():
+        os.replace(path, golden_dir / path.name)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="ColorSnap Pro visual regression")
+    parser.add_argument("screens", nargs="*", help="Screens to check (default: all)")
+    parser.add_argument("--update", action="store_true", help="Write current rendering as golden images")
+    parser.add_argument("--tolerance", type=int, default=DEFAULT_TOLERANCE, help="Per-channel tolerance (0-255)")
+    parser.add_argument("--max-diff", type=float, default=DEFAULT_MAX_DIFF_RATIO, help="Allowed fraction of changed pixels")
+    parser.add_argument("--workers", type=int, default=None, help="Comparison worker processes")
+    parser.add_argument("--list", action="store_true", help="List registered screens")
+    args = parser.parse_args()
+    
+    # Render without a visible display unless one was requested explicitly
+    os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+    from PyQt6.QtWidgets import QApplication
+    app = QApplication(sys.argv[:1])
+    app.setStyle("Fusion")
+    
+    _register_default_screens()
+    
+    if args.list:
+        for name in sorted(SCREENS):
+            print(name)
+        return
+    
+    unknown = [name for name in args.screens if name not in SCREENS]
+    if unknown:
+        print(f"❌ Unknown screens: {', '.join(unknown)}")
+        sys.exit(2)
+    
+    started = time.perf_counter()
+    rendered = render_screens(REPORT_DIR / "actual", args.screens or None)
+    render_time = time.perf_counter() - started
+    
+    if args.update:
+        update_goldens(rendered)
+        print(f"✅ Updated {len(rendered)} golden images in {GOLDEN_DIR}")
+        return
+    
+    started = time.perf_counter()
+    results = compare_all(
+        rendered,
+        tolerance=args.tolerance,
+        max_diff_ratio=args.max_diff,
+        workers=args.workers
+    )
+    compare_time = time.perf_counter() - started
+    
+    failed = [r for r in results if not r.passed]
+    for result in results:
+        if result.passed:
+            print(f"   ✅ {result.name}")
+        elif result.error:
+            print(f"   ❌ {result.name}: {result.error}")
+        else:
+            print(f"   ❌ {result.name}: {result.diff_ratio:.2%} pixels changed "
+                  f"(max delta {result.max_delta}) -> {result.heatmap}")
+    
+    print(f"\n📊 {len(results) - len(failed)} passed, {len(failed)} failed "
+          f"(render {render_time:.2f}s, compare {compare_time:.2f}s)")
+    
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()